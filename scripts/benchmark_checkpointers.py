@@ -0,0 +1,105 @@
+"""Compare checkpointer write throughput on a batch-shaped workload.
+
+Usage:
+    uv run python scripts/benchmark_checkpointers.py          # 5000 steps
+    uv run python scripts/benchmark_checkpointers.py 20000    # 20000 steps
+
+Each step is one ``save_step`` of a small ``values`` dict, spread over runs
+of 10 steps each — the shape a large ``runner.map`` writes. The numbers are
+the write path only; reads are timed separately as one ``get_state`` per run.
+The second table writes every run from its own task at once, the way a
+``runner.map`` with high ``max_concurrency`` does.
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from hypergraph.checkpointers import LogCheckpointer, ShardedSqliteCheckpointer, SqliteCheckpointer, StepRecord, StepStatus, WorkflowStatus
+
+STEPS_PER_RUN = 10
+
+
+def make_steps(total: int) -> list[StepRecord]:
+    return [
+        StepRecord(
+            run_id=f"run-{i // STEPS_PER_RUN}",
+            superstep=i % STEPS_PER_RUN,
+            node_name=f"node-{i % STEPS_PER_RUN}",
+            index=i % STEPS_PER_RUN,
+            status=StepStatus.COMPLETED,
+            input_versions={"x": 1},
+            values={"doc_id": f"doc-{i}", "score": i / total, "labels": ["a", "b", "c"]},
+            duration_ms=1.0,
+        )
+        for i in range(total)
+    ]
+
+
+async def measure(checkpointer, steps: list[StepRecord]) -> tuple[float, float]:
+    run_ids = list(dict.fromkeys(step.run_id for step in steps))
+    start = time.perf_counter()
+    for run_id in run_ids:
+        await checkpointer.create_run(run_id)
+    for step in steps:
+        await checkpointer.save_step(step)
+    for run_id in run_ids:
+        await checkpointer.update_run_status(run_id, WorkflowStatus.COMPLETED)
+    write = time.perf_counter() - start
+    start = time.perf_counter()
+    for run_id in run_ids:
+        await checkpointer.get_state(run_id)
+    read = time.perf_counter() - start
+    await checkpointer.close()
+    return write, read
+
+
+async def measure_concurrent(checkpointer, steps: list[StepRecord]) -> float:
+    by_run: dict[str, list[StepRecord]] = {}
+    for step in steps:
+        by_run.setdefault(step.run_id, []).append(step)
+
+    async def write_run(run_id: str, run_steps: list[StepRecord]) -> None:
+        await checkpointer.create_run(run_id)
+        for step in run_steps:
+            await checkpointer.save_step(step)
+        await checkpointer.update_run_status(run_id, WorkflowStatus.COMPLETED)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(write_run(run_id, run_steps) for run_id, run_steps in by_run.items()))
+    write = time.perf_counter() - start
+    await checkpointer.close()
+    return write
+
+
+async def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    steps = make_steps(total)
+    with tempfile.TemporaryDirectory() as tmp:
+        backends = {
+            "sqlite": lambda: SqliteCheckpointer(Path(tmp) / "runs.db"),
+            "sqlite latest": lambda: SqliteCheckpointer(Path(tmp) / "runs-latest.db", retention="latest"),
+            "sqlite deferred": lambda: SqliteCheckpointer(Path(tmp) / "runs-deferred.db", search_index="deferred"),
+            "log": lambda: LogCheckpointer(Path(tmp) / "runs-log"),
+            "log latest": lambda: LogCheckpointer(Path(tmp) / "runs-log-latest", retention="latest"),
+        }
+        print(f"{'backend':<16} {'steps/s':>10} {'write s':>9} {'read s':>9}")
+        for label, make in backends.items():
+            write, read = await measure(make(), steps)
+            print(f"{label:<16} {total / write:>10.0f} {write:>9.3f} {read:>9.3f}")
+
+        concurrent = {
+            "sqlite": lambda: SqliteCheckpointer(Path(tmp) / "concurrent.db"),
+            "sqlite 4 shards": lambda: ShardedSqliteCheckpointer(Path(tmp) / "concurrent-4", shards=4),
+            "sqlite 8 shards": lambda: ShardedSqliteCheckpointer(Path(tmp) / "concurrent-8", shards=8),
+        }
+        print(f"\n{'concurrent runs':<16} {'steps/s':>10} {'write s':>9}")
+        for label, make in concurrent.items():
+            write = await measure_concurrent(make(), steps)
+            print(f"{label:<16} {total / write:>10.0f} {write:>9.3f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+"""Time HyperTable.insert and HyperTable.sync over a LanceDB store.
+
+Usage:
+    uv run python scripts/benchmark_hypertable_writes.py                 # 10000 and 100000 rows
+    uv run python scripts/benchmark_hypertable_writes.py 20000           # one size
+
+Each row runs a one-node graph, so the numbers are dominated by the store
+work per row: the existing-row lookup and the parent-row write. ``insert``
+fills an empty table; ``sync`` then re-sends the same rows (every row is
+unchanged) and finally re-sends them with one source value edited per
+hundred rows.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from hypergraph import Graph, node
+from hypergraph.materialization import LanceDBStore
+
+
+@node(output_name="length")
+def length(text: str) -> int:
+    return len(text)
+
+
+def make_rows(total: int, *, edit_every: int = 0) -> list[dict[str, str]]:
+    return [{"doc_id": f"doc-{i}", "text": f"document {i}" + (" (edited)" if edit_every and i % edit_every == 0 else "")} for i in range(total)]
+
+
+def measure(path: Path, total: int) -> dict[str, float]:
+    table = Graph([length]).as_table(identity="doc_id", store=LanceDBStore(str(path)))
+    timings: dict[str, float] = {}
+    for label, rows, write in (
+        ("insert", make_rows(total), table.insert),
+        ("sync unchanged", make_rows(total), table.sync),
+        ("sync 1% edited", make_rows(total, edit_every=100), table.sync),
+    ):
+        start = time.perf_counter()
+        write(rows)
+        timings[label] = time.perf_counter() - start
+    return timings
+
+
+def main() -> None:
+    sizes = [int(sys.argv[1])] if len(sys.argv) > 1 else [10_000, 100_000]
+    print(f"{'rows':>8} {'operation':<16} {'rows/s':>10} {'seconds':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for total in sizes:
+            for label, seconds in measure(Path(tmp) / f"table-{total}", total).items():
+                print(f"{total:>8} {label:<16} {total / seconds:>10.0f} {seconds:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Compare LanceDBStore.write_rows against the previous per-cell Arrow construction.
+
+Usage:
+    uv run python scripts/benchmark_lancedb_write_rows.py              # 10000 rows, 768-dim vectors
+    uv run python scripts/benchmark_lancedb_write_rows.py 50000 1536   # rows, vector dim
+
+The first table times only building the Arrow table from dict rows, the
+part ``write_rows`` changed. The second times whole ``write_rows`` calls,
+including LanceDB's append, for dict rows and for a prebuilt ``pa.Table``.
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+
+from hypergraph.materialization._lancedb_store import LanceDBStore, _column_array
+from hypergraph.materialization._schema import ColumnSpec, TableSpec
+
+
+def make_spec(dim: int) -> TableSpec:
+    return TableSpec(
+        name="docs",
+        identity="doc_id",
+        columns=[
+            ColumnSpec("doc_id", role="identity", arrow_type=pa.utf8()),
+            ColumnSpec("text", role="source", arrow_type=pa.utf8()),
+            ColumnSpec("word_count", role="derived", arrow_type=pa.int64()),
+            ColumnSpec("score", role="derived", arrow_type=pa.float64()),
+            ColumnSpec("vector", role="derived", arrow_type=pa.list_(pa.float32(), dim)),
+            ColumnSpec("_write_gen", role="internal", arrow_type=pa.int64()),
+            ColumnSpec("_status", role="internal", arrow_type=pa.utf8()),
+            ColumnSpec("_row_fingerprint", role="internal", arrow_type=pa.utf8()),
+            ColumnSpec("_error", role="internal", arrow_type=pa.utf8()),
+        ],
+    )
+
+
+def make_rows(total: int, dim: int) -> list[dict[str, Any]]:
+    rng = random.Random(0)
+    return [
+        {
+            "doc_id": f"doc-{i}",
+            "text": f"document number {i}",
+            "word_count": 3,
+            "score": rng.random(),
+            "vector": [rng.random() for _ in range(dim)],
+            "_write_gen": 1,
+            "_status": "complete",
+            "_row_fingerprint": f"fp-{i}",
+        }
+        for i in range(total)
+    ]
+
+
+def per_cell_table(rows: list[dict[str, Any]], schema: pa.Schema) -> pa.Table:
+    """The construction ``write_rows`` used before: one array per cell, one batch per row."""
+    record_batches: list[pa.RecordBatch] = []
+    for row in rows:
+        for field_obj in schema:
+            if field_obj.name not in row:
+                row[field_obj.name] = None
+        arrays = []
+        for field_obj in schema:
+            val = row.get(field_obj.name)
+            if val is None:
+                arrays.append(pa.array([None], type=field_obj.type))
+            elif pa.types.is_list(field_obj.type) and isinstance(val, list):
+                inner_arr = pa.array(val, type=field_obj.type.value_type)
+                arrays.append(pa.array([inner_arr], type=field_obj.type))
+            else:
+                arrays.append(pa.array([val], type=field_obj.type))
+        record_batches.append(pa.record_batch(arrays, schema=schema))
+    return pa.Table.from_batches(record_batches, schema=schema)
+
+
+def columnar_table(rows: list[dict[str, Any]], schema: pa.Schema) -> pa.Table:
+    return pa.Table.from_arrays([_column_array([row.get(f.name) for row in rows], f.type) for f in schema], schema=schema)
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    dim = int(sys.argv[2]) if len(sys.argv) > 2 else 768
+    rows = make_rows(total, dim)
+    schema = pa.schema([pa.field(c.name, c.arrow_type) for c in make_spec(dim).columns])
+
+    print(f"{total} rows, {dim}-dim vectors\n")
+    print(f"{'arrow construction':<22} {'rows/s':>10} {'seconds':>9}")
+    for label, build in (("per-cell (previous)", per_cell_table), ("columnar", columnar_table)):
+        seconds = timed(build, [dict(row) for row in rows], schema)
+        print(f"{label:<22} {total / seconds:>10.0f} {seconds:>9.3f}")
+
+    print(f"\n{'write_rows':<22} {'rows/s':>10} {'seconds':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        prebuilt = columnar_table(rows, schema)
+        for label, payload in (("dict rows", rows), ("prebuilt pa.Table", prebuilt)):
+            store = LanceDBStore(str(Path(tmp) / label.replace(" ", "-")))
+            store.open(make_spec(dim), [])
+            seconds = timed(store.write_rows, "docs", payload)
+            print(f"{label:<22} {total / seconds:>10.0f} {seconds:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Compare LanceDBStore.search_many against one LanceDBStore.search per query.
+
+Usage:
+    uv run python scripts/benchmark_search_many.py                  # 20000 rows, 1000 queries, 128-dim
+    uv run python scripts/benchmark_search_many.py 100000 5000 768  # rows, queries, vector dim
+
+Every query carries the same metadata filter (half the rows match). Both
+paths are timed without an ANN index (exact search) and then with an IVF-PQ
+index. Recall@10 is measured against a brute-force NumPy search over the
+filtered rows.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import lancedb
+import numpy as np
+import pyarrow as pa
+from lancedb.index import IvfPq
+
+from hypergraph.materialization._lancedb_store import LanceDBStore
+from hypergraph.materialization._schema import ColumnSpec, TableSpec
+
+K = 10
+WHERE = [("shard", "eq", 0)]
+
+
+def make_spec(dim: int) -> TableSpec:
+    return TableSpec(
+        name="docs",
+        identity="doc_id",
+        columns=[
+            ColumnSpec("doc_id", role="identity", arrow_type=pa.utf8()),
+            ColumnSpec("shard", role="source", arrow_type=pa.int64()),
+            ColumnSpec("vector", role="derived", arrow_type=pa.list_(pa.float32(), dim)),
+            ColumnSpec("_write_gen", role="internal", arrow_type=pa.int64()),
+        ],
+    )
+
+
+def exact_neighbours(vectors: np.ndarray, shards: np.ndarray, queries: np.ndarray) -> list[set[int]]:
+    candidates = np.flatnonzero(shards == 0)
+    distances = ((queries[:, None, :] - vectors[None, candidates, :]) ** 2).sum(axis=2)
+    nearest = np.argsort(distances, axis=1)[:, :K]
+    return [set(candidates[row].tolist()) for row in nearest]
+
+
+def recall(found: list[list[str]], truth: list[set[int]]) -> float:
+    hits = sum(len({int(doc_id[4:]) for doc_id in ids} & expected) for ids, expected in zip(found, truth, strict=True))
+    return hits / (K * len(truth))
+
+
+def single(store: LanceDBStore, queries: np.ndarray) -> list[list[str]]:
+    return [
+        [hit["doc_id"] for hit in store.search("docs", query_vector=query.tolist(), vector_column="vector", where=WHERE, limit=K)]
+        for query in queries
+    ]
+
+
+def batched(store: LanceDBStore, queries: np.ndarray) -> list[list[str]]:
+    hits = store.search_many("docs", queries, vector_column="vector", where=WHERE, limit=K, columns=["doc_id"])
+    found: list[list[str]] = [[] for _ in range(len(queries))]
+    for position, doc_id in zip(hits.column("_query").to_pylist(), hits.column("doc_id").to_pylist(), strict=True):
+        found[position].append(doc_id)
+    return found
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    queries_total = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    dim = int(sys.argv[3]) if len(sys.argv) > 3 else 128
+    rng = np.random.default_rng(0)
+    vectors = rng.random((total, dim), dtype=np.float32)
+    shards = np.arange(total) % 2
+    queries = rng.random((queries_total, dim), dtype=np.float32)
+    truth = exact_neighbours(vectors, shards, queries)
+
+    print(f"{total} rows, {queries_total} queries, {dim}-dim vectors, k={K}\n")
+    print(f"{'index':<8} {'path':<14} {'queries/s':>10} {'seconds':>9} {'recall@10':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = LanceDBStore(str(Path(tmp) / "store"))
+        store.open(make_spec(dim), [])
+        store.write_rows(
+            "docs",
+            [{"doc_id": f"doc-{i}", "shard": int(shards[i]), "vector": vectors[i].tolist(), "_write_gen": 1} for i in range(total)],
+        )
+        for label in ("none", "ivf_pq"):
+            if label == "ivf_pq":
+                config = IvfPq(distance_type="l2", num_partitions=max(1, total // 4096), num_sub_vectors=dim // 8)
+                lancedb.connect(str(Path(tmp) / "store")).open_table("docs").create_index("vector", config=config)
+            for path, search in (("single-query", single), ("search_many", batched)):
+                start = time.perf_counter()
+                found = search(store, queries)
+                seconds = time.perf_counter() - start
+                print(f"{label:<8} {path:<14} {queries_total / seconds:>10.0f} {seconds:>9.3f} {recall(found, truth):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
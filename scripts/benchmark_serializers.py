@@ -0,0 +1,82 @@
+"""Benchmark checkpoint value serializers on representative step payloads.
+
+Usage:
+    uv run --extra msgpack python scripts/benchmark_serializers.py        # 200 rounds
+    uv run --extra msgpack python scripts/benchmark_serializers.py 50     # 50 rounds
+
+Each payload is one step's ``values`` dict. JSON cannot store NumPy arrays,
+so its payloads carry ``tolist()`` copies — the shape a JSON-only store
+forces on a node that returns embeddings today.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from hypergraph.checkpointers import JsonSerializer, MsgpackSerializer, PickleSerializer
+
+# ---------------------------------------------------------------------------
+# Payloads
+# ---------------------------------------------------------------------------
+
+
+def make_payloads() -> dict[str, dict]:
+    rng = np.random.default_rng(0)
+    text = " ".join(f"token{i % 997}" for i in range(200_000))
+    return {
+        "scalars": {"doc_id": "doc-0001", "score": 0.87, "labels": ["a", "b", "c"], "meta": {"page": 3, "lang": "en"}},
+        "text_blob": {"doc_id": "doc-0001", "text": text},
+        "embeddings_1k_x_768": {"ids": list(range(1000)), "embeddings": rng.random((1000, 768), dtype=np.float32)},
+        "chunks_with_vectors": {
+            "chunks": [{"text": text[i * 2000 : (i + 1) * 2000], "vector": rng.random(384, dtype=np.float32)} for i in range(100)]
+        },
+    }
+
+
+def jsonable(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {key: jsonable(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [jsonable(item) for item in value]
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+
+def measure(serializer, payload, rounds: int) -> tuple[float, float, int]:
+    blob = serializer.serialize(payload)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        serializer.serialize(payload)
+    encode = (time.perf_counter() - start) / rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        serializer.deserialize(blob)
+    decode = (time.perf_counter() - start) / rounds
+    return encode, decode, len(blob)
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    serializers = {
+        "json": JsonSerializer(),
+        "pickle": PickleSerializer(allow_pickle=True),
+        "msgpack": MsgpackSerializer(),
+        "msgpack+zstd3": MsgpackSerializer(zstd_level=3),
+    }
+    print(f"{'payload':<22} {'serializer':<14} {'encode ms':>10} {'decode ms':>10} {'size KiB':>10}")
+    for name, payload in make_payloads().items():
+        for label, serializer in serializers.items():
+            value = jsonable(payload) if label == "json" else payload
+            encode, decode, size = measure(serializer, value, rounds)
+            print(f"{name:<22} {label:<14} {encode * 1000:>10.3f} {decode * 1000:>10.3f} {size / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -80,6 +80,8 @@ from hypergraph.host import (
     HostError,
     HostRuntime,
     ItemKeyError,
+    NodeLatenciesReadModel,
+    NodeLatencyReadModel,
     NodeTimingReadModel,
     NodeTimingsReadModel,
     PauseReadModel,
@@ -259,6 +261,8 @@ __all__ = [
     "PauseReadModel",
     "NodeTimingsReadModel",
     "NodeTimingReadModel",
+    "NodeLatenciesReadModel",
+    "NodeLatencyReadModel",
     "RunTimingReadModel",
     "StepTimingReadModel",
     "RUN_READ_STATUS_VALUES",
@@ -1,14 +1,17 @@
 """Checkpointer package for run persistence.
 
-Provides the ``Checkpointer`` ABC, ``SqliteCheckpointer`` implementation,
-and supporting types for durable workflow execution.
+Provides the ``Checkpointer`` ABC, the ``SqliteCheckpointer``,
+``ShardedSqliteCheckpointer``, and ``LogCheckpointer`` implementations, and
+supporting types for durable workflow execution.
 """
 
 from hypergraph.checkpointers.base import Checkpointer, CheckpointPolicy
 from hypergraph.checkpointers.inspection import RunInspector, SqliteRunInspector
+from hypergraph.checkpointers.log import LogCheckpointer, LogCorruptionError, LogLockedError
 from hypergraph.checkpointers.memory import MemoryCheckpointer
 from hypergraph.checkpointers.protocols import SyncCheckpointerProtocol
-from hypergraph.checkpointers.serializers import JsonSerializer, PickleSerializer, Serializer
+from hypergraph.checkpointers.serializers import JsonSerializer, MsgpackSerializer, PickleSerializer, Serializer
+from hypergraph.checkpointers.sharded import ShardedSqliteCheckpointer
 from hypergraph.checkpointers.sqlite import SqliteCheckpointer
 from hypergraph.checkpointers.types import (
     AnswerRejectedError,
@@ -19,8 +22,10 @@ from hypergraph.checkpointers.types import (
     AttemptStatus,
     BoundaryState,
     Checkpoint,
+    CompactionReport,
     LineageRow,
     LineageView,
+    MemoryFootprint,
     NodeBoundary,
     PauseAlreadySettledError,
     PauseSettlementError,
@@ -29,6 +34,7 @@ from hypergraph.checkpointers.types import (
     Run,
     RunTable,
     RunTotals,
+    SearchResults,
     StalePauseError,
     StepRecord,
     StepStatus,
@@ -48,10 +54,16 @@ __all__ = [
     "Checkpointer",
     "CheckpointPolicy",
     "Checkpoint",
+    "CompactionReport",
     "JsonSerializer",
     "LineageRow",
     "LineageView",
+    "LogCheckpointer",
+    "LogCorruptionError",
+    "LogLockedError",
     "MemoryCheckpointer",
+    "MemoryFootprint",
+    "MsgpackSerializer",
     "NodeBoundary",
     "PauseAlreadySettledError",
     "PauseSettlementError",
@@ -62,7 +74,9 @@ __all__ = [
     "RunInspector",
     "RunTable",
     "RunTotals",
+    "SearchResults",
     "Serializer",
+    "ShardedSqliteCheckpointer",
     "SqliteCheckpointer",
     "SqliteRunInspector",
     "StalePauseError",
@@ -0,0 +1,86 @@
+"""Cold archive for runs expired by ``SqliteCheckpointer.compact(archive=...)``.
+
+Expiry deletes a run for good. Passing ``archive`` copies each expiring run
+tree into a second SQLite file first — the runs rows, their steps, attempt
+ledger, node boundaries, pause slots, and any shared value blobs the steps
+reference — so the hot store stays small while old runs remain readable:
+the archive carries the checkpointer's own schema, and
+``SqliteCheckpointer(archive_path)`` opens it like any other store.
+
+The copy commits on its own connection BEFORE the hot store's delete
+commits. A crash in between leaves a run in both files, never in neither;
+the next compaction expires it again and the inserts skip the rows the
+archive already holds. Foreign keys stay off on the archive connection
+because expiry is leaf-first: a fork or retry is archived before the run it
+names as its source. Host bookkeeping (submissions, update logs, commands)
+is not archived — it describes the live queue, not the run's result.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from hypergraph.checkpointers._migrate import ensure_schema
+
+#: ``(table, SELECT)`` per expiring chunk of run ids, in insert order. Blobs
+#: go before the steps that reference them: the archive's refcount triggers
+#: count a step's references as it lands, so blobs start at zero.
+ARCHIVE_SELECTS: tuple[tuple[str, str], ...] = (
+    ("runs", "SELECT * FROM runs WHERE id IN ({ids})"),
+    ("attempt_series", "SELECT * FROM attempt_series WHERE run_id IN ({ids})"),
+    ("attempt_records", "SELECT * FROM attempt_records WHERE series_id IN (SELECT id FROM attempt_series WHERE run_id IN ({ids}))"),
+    (
+        "value_blobs",
+        "SELECT digest, data FROM value_blobs WHERE digest IN ("
+        "SELECT j.value FROM steps s, json_each(s.value_refs) j WHERE s.run_id IN ({ids}) AND j.type = 'text')",
+    ),
+    ("steps", "SELECT * FROM steps WHERE run_id IN ({ids})"),
+    ("pending_nodes", "SELECT * FROM pending_nodes WHERE run_id IN ({ids})"),
+    ("pause_slots", "SELECT * FROM pause_slots WHERE run_id IN ({ids})"),
+)
+
+#: One table's rows read from the hot store: ``(table, columns, rows)``.
+ArchiveRows = tuple[str, Sequence[str], Sequence[Sequence[Any]]]
+
+
+class RunArchive:
+    """A sqlite3 connection to the cold archive file, schema ensured on open."""
+
+    def __init__(self, path: str | Path) -> None:
+        import sqlite3
+
+        self.path = os.fspath(path)
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            ensure_schema(conn)
+            conn.execute("PRAGMA foreign_keys=OFF")
+        except BaseException:
+            conn.close()
+            raise
+        self._conn = conn
+
+    def write(self, tables: Sequence[ArchiveRows]) -> int:
+        """Insert one chunk's rows in one transaction; return the runs added."""
+        conn = self._conn
+        added = 0
+        try:
+            conn.execute("BEGIN")
+            for table, columns, rows in tables:
+                if not rows:
+                    continue
+                sql = f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+                cursor = conn.executemany(sql, rows)
+                if table == "runs":
+                    added += cursor.rowcount
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return added
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,232 @@
+"""Append deltas for growing list values (``SqliteCheckpointer(delta_values=...)``).
+
+A chat loop's ``messages`` or an accumulating result list grows by a few
+items each superstep, and every step stores the whole list again: a
+2,000-turn conversation writes about two million messages. With deltas on,
+a list that only grew since the previous step of the same run wrote the
+same key stores just the new items, plus a reference to that base step in
+``steps.value_refs``::
+
+    {"messages": {"run": "chat-1", "base": [41, "reply"], "len": 82, "sha": "9f2c..."}}
+
+``len`` and ``sha`` describe the base value the tail extends. The digest is
+a running sha256 over each item's serialized bytes, so the writer gets the
+prefix digest and the full digest in one pass, and a reader rebuilding a
+chain extends the digest by the tail alone. A reader that finds a base whose
+digest does not match refuses to guess and raises.
+
+Growth is detected against the last list this process persisted under the
+key for the run — nothing is read back. A process that has not written the
+run yet (a resume elsewhere, a restart) simply writes a full value first.
+Every ``DELTA_KEYFRAME_INTERVAL``-th version is written in full, so
+rebuilding a value reads at most that many steps.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from hypergraph.checkpointers.serializers import Serializer
+
+DeltaValues = bool | Collection[str] | Callable[[str, Any], bool]
+
+#: Longest chain of deltas before a value is written in full again.
+DELTA_KEYFRAME_INTERVAL = 16
+
+#: Runs whose last written lists are remembered; the least recently written
+#: run is forgotten first and its next step writes full values.
+_TRACKED_RUNS = 1024
+
+# One step's values, by its natural key.
+DELTA_BASE_SQL = "SELECT values_data, value_refs FROM steps WHERE run_id = ? AND superstep = ? AND node_name = ?"
+
+
+@dataclass(frozen=True, slots=True)
+class DeltaRef:
+    """A decoded step value stored as ``tail`` appended to an earlier step's value."""
+
+    run_id: str
+    superstep: int
+    node_name: str
+    length: int
+    digest: str
+    tail: list[Any]
+
+    @classmethod
+    def from_entry(cls, entry: dict[str, Any], tail: Any) -> DeltaRef:
+        superstep, node_name = entry["base"]
+        return cls(entry["run"], int(superstep), node_name, int(entry["len"]), entry["sha"], list(tail))
+
+    @property
+    def base_params(self) -> tuple[str, int, str]:
+        return self.run_id, self.superstep, self.node_name
+
+
+@dataclass(frozen=True, slots=True)
+class _Base:
+    """The last list a run persisted under one key."""
+
+    superstep: int
+    node_name: str
+    length: int
+    digest: str
+    depth: int
+
+
+def check_delta_values(delta_values: DeltaValues, retention: str) -> DeltaValues:
+    if delta_values is False:
+        return delta_values
+    if isinstance(delta_values, str) or not (isinstance(delta_values, bool | Collection) or callable(delta_values)):
+        raise ValueError(
+            f"delta_values must be a bool, a collection of output names, or a predicate, got {delta_values!r}.\n\n"
+            "How to fix:\n"
+            "  delta_values=True                                  # every list output\n"
+            '  delta_values=["messages"]                          # these outputs only\n'
+            "  delta_values=lambda name, value: name.endswith('_log')  # decide per output"
+        )
+    if retention != "full":
+        raise ValueError(
+            f'delta_values needs retention="full", got retention={retention!r}.\n\n'
+            "A delta names the earlier step it extends, and pruned retention deletes those steps.\n\n"
+            "How to fix:\n"
+            '  Keep retention="full", or drop delta_values and use dedupe_values=True'
+        )
+    return delta_values
+
+
+def _hash_items(hasher: Any, serializer: Serializer, items: Sequence[Any]) -> None:
+    for item in items:
+        data = serializer.serialize(item)
+        hasher.update(len(data).to_bytes(8, "big"))
+        hasher.update(data)
+
+
+class DeltaEncoder:
+    """Write side: cuts a step's grown lists down to their tails.
+
+    Remembers, per run and key, the last list persisted (where, how long,
+    its digest, and how many deltas deep it is). ``encode`` runs inside the
+    write transaction; a rolled-back write must ``clear`` what it taught.
+    """
+
+    def __init__(self, delta_values: DeltaValues, serializer: Serializer) -> None:
+        self._select = delta_values
+        self._serializer = serializer
+        self._bases: OrderedDict[str, dict[str, _Base]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _selects(self, key: str, value: Any) -> bool:
+        if type(value) is not list:
+            return False
+        if self._select is True:
+            return True
+        if callable(self._select):
+            return bool(self._select(key, value))
+        return key in self._select
+
+    def encode(self, run_id: str, superstep: int, node_name: str, values: dict[str, Any] | None) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+        """``(values, refs)``: each grown list cut to its tail, and the ``value_refs`` entries naming its base."""
+        if not values:
+            return values, {}
+        with self._lock:
+            known = self._bases.get(run_id, {})
+            learned: dict[str, _Base] = {}
+            refs: dict[str, Any] = {}
+            out = values
+            for key, value in values.items():
+                if not self._selects(key, value):
+                    continue
+                base = known.get(key)
+                if base is not None and (
+                    base.depth >= DELTA_KEYFRAME_INTERVAL
+                    or base.length == 0
+                    or base.length > len(value)
+                    or (base.superstep, base.node_name) == (superstep, node_name)
+                ):
+                    base = None
+                hasher = hashlib.sha256()
+                extended: _Base | None = None
+                if base is None:
+                    _hash_items(hasher, self._serializer, value)
+                else:
+                    _hash_items(hasher, self._serializer, value[: base.length])
+                    if hasher.hexdigest() == base.digest:
+                        extended = base
+                    _hash_items(hasher, self._serializer, value[base.length :])
+                if extended is not None:
+                    if out is values:
+                        out = dict(values)
+                    out[key] = value[extended.length :]
+                    refs[key] = {"run": run_id, "base": [extended.superstep, extended.node_name], "len": extended.length, "sha": extended.digest}
+                depth = extended.depth + 1 if extended is not None else 0
+                learned[key] = _Base(superstep, node_name, len(value), hasher.hexdigest(), depth)
+            if learned:
+                self._bases[run_id] = {**known, **learned}
+                self._bases.move_to_end(run_id)
+                while len(self._bases) > _TRACKED_RUNS:
+                    self._bases.popitem(last=False)
+        return out, refs
+
+    def forget(self, run_id: str) -> None:
+        """Drop what is known about ``run_id`` (it finished, or its steps are gone)."""
+        with self._lock:
+            self._bases.pop(run_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bases.clear()
+
+
+class DeltaChains:
+    """Read side: rebuilds ``DeltaRef`` values for one read.
+
+    Rebuilt values are remembered by digest for the rest of the read, so
+    ``get_steps`` over a long conversation reads each base once instead of
+    walking every step's chain back to its keyframe.
+    """
+
+    def __init__(self, serializer: Serializer) -> None:
+        self._serializer = serializer
+        self._values: dict[str, tuple[list[Any], Any]] = {}
+
+    def knows(self, ref: DeltaRef) -> bool:
+        return ref.digest in self._values
+
+    def add_keyframe(self, ref: DeltaRef, value: Any) -> None:
+        """Remember ``value``, the full value ``ref`` names as its base."""
+        if type(value) is not list:
+            raise _broken_chain(ref, f"its base holds a {type(value).__name__}, not a list")
+        hasher = hashlib.sha256()
+        _hash_items(hasher, self._serializer, value)
+        self._values[hasher.hexdigest()] = (value, hasher)
+        if not self.knows(ref):
+            raise _broken_chain(ref, "its base no longer holds the value it extended")
+
+    def rebuild(self, links: Sequence[DeltaRef]) -> list[Any]:
+        """The full value of ``links[0]``; ``links[-1]`` names a base already known."""
+        full: list[Any] = []
+        for link in reversed(links):
+            if not self.knows(link):
+                raise _broken_chain(link, "its base no longer holds the value it extended")
+            base, hasher = self._values[link.digest]
+            if len(base) != link.length:
+                raise _broken_chain(link, f"its base holds {len(base)} items, not {link.length}")
+            full = [*base, *link.tail]
+            hasher = hasher.copy()
+            _hash_items(hasher, self._serializer, link.tail)
+            self._values[hasher.hexdigest()] = (full, hasher)
+        # Remembered values stay private to this read: each occurrence gets its own copy.
+        return copy.deepcopy(full)
+
+
+def _broken_chain(ref: DeltaRef, reason: str) -> RuntimeError:
+    return RuntimeError(
+        f"Cannot rebuild a delta-encoded value of run {ref.run_id!r}: {reason} "
+        f"(base step: superstep {ref.superstep}, node {ref.node_name!r}). The step was rewritten after a later step extended it."
+    )
@@ -28,6 +28,12 @@ def detect_schema_version(conn: Any) -> int:
 
 def create_v6_schema(conn: Any) -> None:
     """Create a fresh v6 schema on an empty database."""
+    # Incremental mode lets ``compact()`` hand freed pages back to the OS in
+    # bounded slices instead of rewriting the whole file with a blocking
+    # VACUUM. A connection that already switched to WAL has written the file
+    # header, which pins the mode; rebuilding a still-empty file is free.
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    conn.execute("VACUUM")
     conn.execute(_CREATE_RUNS)
     conn.execute(_CREATE_STEPS)
     conn.execute(_CREATE_ATTEMPT_SERIES)
@@ -132,10 +138,30 @@ CREATE TABLE IF NOT EXISTS steps (
     created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now')),
     completed_at TEXT,
     attempt_series_id TEXT REFERENCES attempt_series(id),
+    value_refs TEXT,
+    value_keys TEXT,
     UNIQUE(run_id, superstep, node_name)
 )
 """
 
+# Content-addressed step values (``SqliteCheckpointer(dedupe_values=True)``):
+# ``value_refs`` maps an output name to the digest of the ``value_blobs`` row
+# holding its serialized value; ``values_data`` keeps the key with a ``null``
+# placeholder so the step's key order survives. NULL for every inline step.
+# An entry may instead be an object naming an earlier step whose list the
+# inline value extends (``delta_values``, see ``_delta``); the refcount
+# triggers match digests only, so they pass those by.
+#
+# ``value_keys`` is the JSON list of output names a step's ``values_data``
+# holds, so a keyed read (``get_state(run_id, keys=[...])``) can skip every
+# step that wrote none of the requested keys without deserializing it. NULL
+# for a step with no values, and for steps written before the column existed
+# — readers treat those as "unknown" and decode them.
+_STEPS_ADDED_COLUMNS = (
+    ("value_refs", "value_refs TEXT"),
+    ("value_keys", "value_keys TEXT"),
+)
+
 _RUNS_COPY_COLS = (
     "id, graph_name, status, duration_ms, node_count, error_count, created_at, completed_at, "
     "parent_run_id, forked_from, fork_superstep, retry_of, retry_index, config"
@@ -558,6 +584,53 @@ def _ensure_pause_slot_objects(conn: Any) -> None:
     conn.execute("CREATE INDEX IF NOT EXISTS idx_pause_slots_run ON pause_slots(run_id)")
 
 
+# === Content-addressed value blobs ===
+#
+# One row per distinct serialized step value, keyed by the sha256 of its
+# bytes. ``refs`` counts the step rows whose ``value_refs`` name the blob; the
+# triggers below keep it true on every insert, upsert, and delete of a step,
+# so retention and ``compact()`` need no bookkeeping of their own. A digest
+# named twice by one step counts once (``IN`` collapses duplicates) on both
+# the increment and the decrement side. Blobs whose count reaches zero are
+# collected by the checkpointer after it prunes steps, never by a trigger: a
+# retention pass deletes the rows it folds before it writes their baseline,
+# and the baseline re-references the very blobs the delete released.
+
+_CREATE_VALUE_BLOBS = """
+CREATE TABLE IF NOT EXISTS value_blobs (
+    digest TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    refs INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+_VALUE_REFS_INCREMENT = "UPDATE value_blobs SET refs = refs + 1 WHERE digest IN (SELECT value FROM json_each(new.value_refs));"
+_VALUE_REFS_DECREMENT = "UPDATE value_blobs SET refs = refs - 1 WHERE digest IN (SELECT value FROM json_each(old.value_refs));"
+
+
+def _ensure_value_blob_objects(conn: Any) -> None:
+    """Ensure the value-blob table, its refcount triggers, and the GC index exist."""
+    conn.execute(_CREATE_VALUE_BLOBS)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_value_blobs_unreferenced ON value_blobs(digest) WHERE refs <= 0")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS value_blobs_step_insert AFTER INSERT ON steps WHEN new.value_refs IS NOT NULL BEGIN
+            {_VALUE_REFS_INCREMENT}
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS value_blobs_step_update AFTER UPDATE OF value_refs ON steps
+        WHEN old.value_refs IS NOT new.value_refs BEGIN
+            {_VALUE_REFS_INCREMENT}
+            {_VALUE_REFS_DECREMENT}
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS value_blobs_step_delete AFTER DELETE ON steps WHEN old.value_refs IS NOT NULL BEGIN
+            {_VALUE_REFS_DECREMENT}
+        END
+    """)
+
+
 def _create_host_indexes(conn: Any) -> None:
     conn.execute("CREATE INDEX IF NOT EXISTS idx_host_submissions_state ON host_submissions(state)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_host_submissions_definition ON host_submissions(definition_name)")
@@ -567,6 +640,8 @@ def _create_host_indexes(conn: Any) -> None:
     # order; the same shape ``start_at`` eligibility uses for delayed starts.
     conn.execute("CREATE INDEX IF NOT EXISTS idx_host_commands_due ON host_commands(verb, applied_at, due_at)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_host_batches_workflow ON host_batches(workflow_id)")
+    # ``compact()`` walks terminal runs oldest-finished first.
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_completed ON runs(completed_at)")
 
 
 # Columns appended to host_submissions after the initial v6 cut (tickets
@@ -603,6 +678,344 @@ _HOST_COMMANDS_ADDED_COLUMNS = (
 )
 
 
+# Batch census projection (issue #386 follow-up). ``host_batch_children`` holds
+# one row per Batch child with its CURRENT counts bucket, and
+# ``host_batch_census`` holds the per-Batch counter for every bucket. Both are
+# pure projections of ``host_submissions.state`` and ``runs.status``: triggers
+# recompute them inside the transaction that changes either column, so no
+# writer path can forget them and a reader never sees a census the rows do not
+# support. That is what lets a Batch listing read its counts without joining
+# and bucketing every child of every listed Batch.
+#
+# ``_CHILD_BUCKET_SQL`` is THE bucket ladder (``host.client._child_bucket``)
+# stated over stored row values; the two must move together.
+_CHILD_BUCKET_SQL = """
+    CASE
+        WHEN r.status IN ('completed', 'failed', 'partial', 'stopped') THEN r.status
+        WHEN s.state = 'exhausted' THEN 'recovery_exhausted'
+        WHEN s.state = 'paused' THEN 'paused'
+        WHEN r.id IS NOT NULL AND s.state = 'claimed' THEN 'active'
+        WHEN r.id IS NOT NULL AND s.state = 'finished' THEN 'abandoned'
+        WHEN r.id IS NOT NULL THEN 'queued'
+        WHEN s.state = 'finished' THEN 'unstarted'
+        ELSE 'queued'
+    END
+"""
+
+_CREATE_BATCH_CHILDREN = """
+CREATE TABLE IF NOT EXISTS host_batch_children (
+    workflow_id TEXT PRIMARY KEY,
+    batch_id TEXT NOT NULL,
+    item_key TEXT NOT NULL,
+    -- The child submission's rowid: children are inserted in manifest order,
+    -- so this is the manifest position a paginated item listing walks.
+    ordinal INTEGER NOT NULL,
+    bucket TEXT NOT NULL
+)
+"""
+
+_CREATE_BATCH_CENSUS = """
+CREATE TABLE IF NOT EXISTS host_batch_census (
+    batch_id TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    n INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (batch_id, bucket)
+)
+"""
+
+
+def _project_child_sql(workflow_id: str) -> str:
+    """INSERT the projected row for one child submission, if it is a Batch child."""
+    return (
+        "INSERT OR IGNORE INTO host_batch_children (workflow_id, batch_id, item_key, ordinal, bucket) "
+        f"SELECT s.workflow_id, s.batch_id, s.item_key, s.rowid, {_CHILD_BUCKET_SQL} "
+        f"FROM host_submissions s LEFT JOIN runs r ON r.id = s.workflow_id WHERE s.workflow_id = {workflow_id} AND s.batch_id IS NOT NULL"
+    )
+
+
+def _rebucket_child_sql(workflow_id: str) -> str:
+    """UPDATE one projected child's bucket from its current rows."""
+    return (
+        f"UPDATE host_batch_children SET bucket = (SELECT {_CHILD_BUCKET_SQL} "
+        "FROM host_submissions s LEFT JOIN runs r ON r.id = s.workflow_id WHERE s.workflow_id = host_batch_children.workflow_id) "
+        f"WHERE workflow_id = {workflow_id}"
+    )
+
+
+_CENSUS_INCREMENT_SQL = (
+    "INSERT INTO host_batch_census (batch_id, bucket, n) VALUES (new.batch_id, new.bucket, 1) ON CONFLICT(batch_id, bucket) DO UPDATE SET n = n + 1"
+)
+_CENSUS_DECREMENT_SQL = "UPDATE host_batch_census SET n = n - 1 WHERE batch_id = old.batch_id AND bucket = old.bucket"
+
+
+def _ensure_batch_census_objects(conn: Any) -> None:
+    """Ensure the Batch census projection and its triggers exist.
+
+    Backfills from the current rows only when the projection is created, so
+    a Home that held Batches before the projection existed opens with a
+    census that already agrees with its children; later opens skip the scan.
+    """
+    existed = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'host_batch_children'").fetchone() is not None
+    conn.execute(_CREATE_BATCH_CHILDREN)
+    conn.execute(_CREATE_BATCH_CENSUS)
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_host_batch_children_item ON host_batch_children(batch_id, item_key)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_host_batch_children_ordinal ON host_batch_children(batch_id, ordinal)")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS host_batch_children_count_insert AFTER INSERT ON host_batch_children BEGIN
+            {_CENSUS_INCREMENT_SQL};
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS host_batch_children_count_update AFTER UPDATE OF bucket ON host_batch_children
+        WHEN old.bucket != new.bucket BEGIN
+            {_CENSUS_DECREMENT_SQL};
+            {_CENSUS_INCREMENT_SQL};
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS host_batch_children_count_delete AFTER DELETE ON host_batch_children BEGIN
+            {_CENSUS_DECREMENT_SQL};
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS host_batch_children_project AFTER INSERT ON host_submissions
+        WHEN new.batch_id IS NOT NULL BEGIN
+            {_project_child_sql("new.workflow_id")};
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS host_batch_children_state AFTER UPDATE OF state ON host_submissions
+        WHEN new.batch_id IS NOT NULL BEGIN
+            {_rebucket_child_sql("new.workflow_id")};
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS host_batch_children_forget AFTER DELETE ON host_submissions BEGIN
+            DELETE FROM host_batch_children WHERE workflow_id = old.workflow_id;
+        END
+    """)
+    # A child's runs row appears, changes status, or (a history-less claimed
+    # run reset for a fresh start) disappears: each moves its bucket.
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS host_batch_children_run_insert AFTER INSERT ON runs BEGIN
+            {_rebucket_child_sql("new.id")};
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS host_batch_children_run_status AFTER UPDATE OF status ON runs BEGIN
+            {_rebucket_child_sql("new.id")};
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS host_batch_children_run_delete AFTER DELETE ON runs BEGIN
+            {_rebucket_child_sql("old.id")};
+        END
+    """)
+    if not existed:
+        conn.execute(
+            "INSERT OR IGNORE INTO host_batch_children (workflow_id, batch_id, item_key, ordinal, bucket) "
+            f"SELECT s.workflow_id, s.batch_id, s.item_key, s.rowid, {_CHILD_BUCKET_SQL} "
+            "FROM host_submissions s LEFT JOIN runs r ON r.id = s.workflow_id WHERE s.batch_id IS NOT NULL ORDER BY s.rowid"
+        )
+
+
+# Durable node-timing rollups. ``node_timings()`` answers for a selection of
+# Runs by folding their step rows, which is exact but grows with every step
+# of every covered run; a dashboard asking "what are this Definition's node
+# latencies?" should not rescan history to learn it. These tables keep that
+# answer up to date instead, per (Definition, node), inside the transaction
+# that writes the step — the same trigger discipline as the Batch census.
+#
+# ``host_run_definitions`` maps every run a Host Run drove (its own runs row,
+# nested graphs, map items) to the Definition it was submitted under, so the
+# step triggers attribute a nested step with one primary-key lookup instead
+# of walking ``parent_run_id`` (triggers cannot recurse over a CTE).
+#
+# ``host_node_timing`` holds count/sum/min/max; ``host_node_timing_sketch``
+# holds a log-bucketed latency histogram (the DDSketch construction): bucket
+# k covers ``(MIN * GAMMA**(k-1), MIN * GAMMA**k]`` milliseconds, so any
+# quantile read back from it is within ``(GAMMA - 1) / (GAMMA + 1)`` (about
+# 1%) of the true value, and two sketches merge by adding counts.
+# ``host_timing_buckets`` is the static bound table the triggers look the
+# bucket up in, because ``ln()`` is an optional SQLite build feature; the
+# lookup is one seek on its ``upper_ms`` index, not a scan of the bounds.
+#
+# Rollups are lifetime aggregates: retention and ``compact()`` delete step
+# rows, never what those steps already contributed. An upserted step (the
+# same run, superstep, and node written again) swaps its old contribution
+# for the new one; min/max stay the extremes ever observed.
+TIMING_SKETCH_GAMMA = 1.02
+TIMING_SKETCH_MIN_MS = 0.001
+_TIMING_SKETCH_BUCKETS = 1400  # MIN * GAMMA**1400 is about 11 days
+
+# Mirrors ``sqlite._PUBLIC_STEP_FILTER`` for one trigger row; the two must
+# move together.
+_PUBLIC_TIMING_STEP = "{row}.node_name != '__retained_state__' AND ({row}.node_type IS NULL OR {row}.node_type != 'RetentionBaseline')"
+
+_CREATE_RUN_DEFINITIONS = """
+CREATE TABLE IF NOT EXISTS host_run_definitions (
+    run_id TEXT PRIMARY KEY,
+    definition_name TEXT NOT NULL
+)
+"""
+
+_CREATE_NODE_TIMING = """
+CREATE TABLE IF NOT EXISTS host_node_timing (
+    definition_name TEXT NOT NULL,
+    node_name TEXT NOT NULL,
+    executions INTEGER NOT NULL DEFAULT 0,
+    cached INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0,
+    total_ms REAL NOT NULL DEFAULT 0.0,
+    -- Executions that actually ran (not cache hits) and their time: the
+    -- denominator of an honest average, and what the sketch holds.
+    ran INTEGER NOT NULL DEFAULT 0,
+    ran_ms REAL NOT NULL DEFAULT 0.0,
+    min_ms REAL,
+    max_ms REAL,
+    PRIMARY KEY (definition_name, node_name)
+)
+"""
+
+_CREATE_NODE_TIMING_SKETCH = """
+CREATE TABLE IF NOT EXISTS host_node_timing_sketch (
+    definition_name TEXT NOT NULL,
+    node_name TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    n INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (definition_name, node_name, bucket)
+)
+"""
+
+_CREATE_TIMING_BUCKETS = "CREATE TABLE IF NOT EXISTS host_timing_buckets (bucket INTEGER PRIMARY KEY, upper_ms REAL NOT NULL)"
+_CREATE_TIMING_BUCKET_BOUNDS = "CREATE UNIQUE INDEX IF NOT EXISTS idx_host_timing_buckets_upper ON host_timing_buckets(upper_ms)"
+_TIMING_TRIGGERS = ("host_node_timing_step_insert", "host_node_timing_step_update")
+
+
+def _timing_bucket_sql(row: str) -> str:
+    """The sketch bucket for ``{row}.duration_ms``; overflow lands in the last one.
+
+    Bounds grow with the bucket number, so the first bound at or above the
+    duration, read in ``upper_ms`` index order, is the bucket.
+    """
+    return (
+        f"COALESCE((SELECT bucket FROM host_timing_buckets WHERE upper_ms >= {row}.duration_ms ORDER BY upper_ms LIMIT 1), "
+        "(SELECT MAX(bucket) FROM host_timing_buckets))"
+    )
+
+
+def _add_step_timing_sql(row: str, *, source: str | None = None, condition: str = "1") -> list[str]:
+    """Fold step row(s) into their Definition's rollup and sketch.
+
+    ``row`` names the step (``new`` in a trigger); ``source`` replaces the
+    single-row lookup when the backfill folds every existing step at once.
+    """
+    source = source or f"host_run_definitions d WHERE d.run_id = {row}.run_id"
+    ran_ms = f"CASE WHEN {row}.cached THEN NULL ELSE {row}.duration_ms END"
+    return [
+        "INSERT INTO host_node_timing (definition_name, node_name, executions, cached, errors, total_ms, ran, ran_ms, min_ms, max_ms) "
+        f"SELECT d.definition_name, {row}.node_name, 1, {row}.cached != 0, {row}.error IS NOT NULL, {row}.duration_ms, "
+        f"{row}.cached = 0, COALESCE({ran_ms}, 0.0), {ran_ms}, {ran_ms} FROM {source} AND {condition} "
+        "ON CONFLICT(definition_name, node_name) DO UPDATE SET "
+        "executions = executions + 1, cached = cached + excluded.cached, errors = errors + excluded.errors, "
+        "total_ms = total_ms + excluded.total_ms, ran = ran + excluded.ran, ran_ms = ran_ms + excluded.ran_ms, "
+        "min_ms = CASE WHEN excluded.min_ms IS NULL THEN min_ms WHEN min_ms IS NULL OR excluded.min_ms < min_ms THEN excluded.min_ms ELSE min_ms END, "
+        "max_ms = CASE WHEN excluded.max_ms IS NULL THEN max_ms WHEN max_ms IS NULL OR excluded.max_ms > max_ms THEN excluded.max_ms ELSE max_ms END",
+        "INSERT INTO host_node_timing_sketch (definition_name, node_name, bucket, n) "
+        f"SELECT d.definition_name, {row}.node_name, {_timing_bucket_sql(row)}, 1 FROM {source} AND {condition} AND {row}.cached = 0 "
+        "ON CONFLICT(definition_name, node_name, bucket) DO UPDATE SET n = n + 1",
+    ]
+
+
+def _remove_step_timing_sql(row: str, *, condition: str) -> list[str]:
+    """Take one step row's contribution back out (its upsert is replacing it)."""
+    definition = f"(SELECT definition_name FROM host_run_definitions WHERE run_id = {row}.run_id)"
+    return [
+        f"UPDATE host_node_timing SET executions = executions - 1, cached = cached - ({row}.cached != 0), "
+        f"errors = errors - ({row}.error IS NOT NULL), total_ms = total_ms - {row}.duration_ms, ran = ran - ({row}.cached = 0), "
+        f"ran_ms = ran_ms - CASE WHEN {row}.cached THEN 0.0 ELSE {row}.duration_ms END "
+        f"WHERE definition_name = {definition} AND node_name = {row}.node_name AND {condition}",
+        f"UPDATE host_node_timing_sketch SET n = n - 1 WHERE definition_name = {definition} AND node_name = {row}.node_name "
+        f"AND bucket = {_timing_bucket_sql(row)} AND {row}.cached = 0 AND {condition}",
+    ]
+
+
+def _trigger_body(statements: list[str]) -> str:
+    return "".join(f"{statement};\n" for statement in statements)
+
+
+def _ensure_node_timing_objects(conn: Any) -> None:
+    """Ensure the node-timing rollups and their triggers exist.
+
+    Like the Batch census, backfills only when the rollups are created: a
+    Home that already held Host Runs opens with rollups that agree with the
+    step rows it still has.
+    """
+    existed = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'host_node_timing'").fetchone() is not None
+    conn.execute(_CREATE_RUN_DEFINITIONS)
+    conn.execute(_CREATE_NODE_TIMING)
+    conn.execute(_CREATE_NODE_TIMING_SKETCH)
+    conn.execute(_CREATE_TIMING_BUCKETS)
+    if conn.execute("SELECT 1 FROM host_timing_buckets LIMIT 1").fetchone() is None:
+        conn.executemany(
+            "INSERT INTO host_timing_buckets (bucket, upper_ms) VALUES (?, ?)",
+            [(k, TIMING_SKETCH_MIN_MS * TIMING_SKETCH_GAMMA**k) for k in range(_TIMING_SKETCH_BUCKETS + 1)],
+        )
+    conn.execute(_CREATE_TIMING_BUCKET_BOUNDS)
+    # Triggers written with the older MIN(bucket) scan are replaced below.
+    for name in _TIMING_TRIGGERS:
+        stale = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?", (name,)).fetchone()
+        if stale is not None and "MIN(bucket)" in stale[0]:
+            conn.execute(f"DROP TRIGGER {name}")
+    # A run belongs to the Definition its own submission names, else to its
+    # parent's: parents are written before the runs they spawn.
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS host_run_definitions_project AFTER INSERT ON runs BEGIN
+            INSERT OR IGNORE INTO host_run_definitions (run_id, definition_name)
+            SELECT new.id, definition_name FROM (
+                SELECT COALESCE(
+                    (SELECT definition_name FROM host_submissions WHERE workflow_id = new.id),
+                    (SELECT definition_name FROM host_run_definitions WHERE run_id = new.parent_run_id)
+                ) AS definition_name
+            ) WHERE definition_name IS NOT NULL;
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS host_run_definitions_forget AFTER DELETE ON runs BEGIN
+            DELETE FROM host_run_definitions WHERE run_id = old.id;
+        END
+    """)
+    new_public = _PUBLIC_TIMING_STEP.format(row="new")
+    old_public = _PUBLIC_TIMING_STEP.format(row="old")
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS host_node_timing_step_insert AFTER INSERT ON steps WHEN {new_public} BEGIN
+            {_trigger_body(_add_step_timing_sql("new"))}
+        END
+    """)
+    # One trigger, so the old contribution is removed before the new one
+    # lands (two triggers on one event fire in an unspecified order).
+    changed = (
+        "old.duration_ms IS NOT new.duration_ms OR old.cached IS NOT new.cached OR old.error IS NOT new.error OR old.node_type IS NOT new.node_type"
+    )
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS host_node_timing_step_update AFTER UPDATE ON steps WHEN {changed} BEGIN
+            {_trigger_body(_remove_step_timing_sql("old", condition=f"({old_public})"))}
+            {_trigger_body(_add_step_timing_sql("new", condition=f"({new_public})"))}
+        END
+    """)
+    if not existed:
+        conn.execute(
+            "INSERT OR IGNORE INTO host_run_definitions (run_id, definition_name) "
+            "WITH RECURSIVE lineage(run_id, definition_name) AS ("
+            "SELECT r.id, s.definition_name FROM runs r JOIN host_submissions s ON s.workflow_id = r.id "
+            "UNION SELECT r.id, l.definition_name FROM runs r JOIN lineage l ON r.parent_run_id = l.run_id) "
+            "SELECT run_id, definition_name FROM lineage"
+        )
+        backfill = "steps s JOIN host_run_definitions d ON d.run_id = s.run_id WHERE 1"
+        for statement in _add_step_timing_sql("s", source=backfill, condition=_PUBLIC_TIMING_STEP.format(row="s")):
+            conn.execute(statement)
+
+
 def _add_missing_columns(conn: Any, table: str, columns: tuple[tuple[str, str], ...]) -> None:
     """ALTER in every one of ``columns`` the table does not already carry."""
     existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()}
@@ -626,12 +1039,16 @@ def _ensure_v6_objects(conn: Any) -> None:
     conn.execute(_CREATE_BATCH_UPDATES)
     conn.execute(_CREATE_HOST_SETTINGS)
     _add_missing_columns(conn, "runs", _RUNS_ADDED_COLUMNS)
+    _add_missing_columns(conn, "steps", _STEPS_ADDED_COLUMNS)
     _add_missing_columns(conn, "host_submissions", _HOST_SUBMISSIONS_ADDED_COLUMNS)
     _add_missing_columns(conn, "host_batches", _HOST_BATCHES_ADDED_COLUMNS)
     _add_missing_columns(conn, "host_commands", _HOST_COMMANDS_ADDED_COLUMNS)
     _create_host_indexes(conn)
+    _ensure_batch_census_objects(conn)
+    _ensure_node_timing_objects(conn)
     _ensure_pending_node_objects(conn)
     _ensure_pause_slot_objects(conn)
+    _ensure_value_blob_objects(conn)
     conn.commit()
 
 
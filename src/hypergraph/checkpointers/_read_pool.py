@@ -0,0 +1,180 @@
+"""Read-only connection pools for the SQLite checkpointer.
+
+A store has ONE writer connection per flavor (the aiosqlite connection behind
+``_txn_lock`` and the sqlite3 connection behind ``_sync_lock``), and every
+write stays there. Before these pools every read waited on the same lock, so
+a dashboard polling ``client.list`` queued in front of the step commits of
+the runs it was watching. WAL lets readers proceed beside a writer; these
+pools give pure reads their own connections so they do.
+
+Each borrow is one read transaction (``BEGIN`` … ``ROLLBACK``): a read that
+issues several statements sees one snapshot, exactly as it did when the
+writer's lock kept commits out for its duration. Connections are opened
+lazily up to ``size`` and set ``query_only`` so a read path that drifts into
+a write fails loudly instead of racing the writer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from typing import Any
+
+
+def check_pool_size(size: int) -> int:
+    if isinstance(size, bool) or not isinstance(size, int) or size < 0:
+        raise ValueError(
+            f"read_connections must be an int >= 0, got {size!r}.\n\n"
+            "How to fix:\n"
+            "  read_connections=4  # reads use up to 4 connections beside the writer\n"
+            "  read_connections=0  # every read shares the writer connection"
+        )
+    return size
+
+
+class WriterLock:
+    """The sync writer's reentrant lock, able to tell whether this thread holds it.
+
+    A read issued while the caller already holds the writer lock must stay on
+    the writer connection to see the lock holder's view. ``threading.RLock``
+    only answers "who owns me" through a private method, so ownership is
+    tracked here next to the lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._owner: int | None = None
+        self._depth = 0
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        if not self._lock.acquire(blocking, timeout):
+            return False
+        self._owner = threading.get_ident()
+        self._depth += 1
+        return True
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self._owner = None
+        self._lock.release()
+
+    def held_by_current_thread(self) -> bool:
+        return self._owner == threading.get_ident()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
+
+
+class SyncReadPool:
+    """Up to ``size`` sqlite3 connections, each lent to one thread at a time."""
+
+    def __init__(self, connect: Callable[[], Any], size: int) -> None:
+        self._connect = connect
+        self._size = size
+        self._idle: list[Any] = []
+        self._opened = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def _take(self) -> Any | None:
+        with self._cond:
+            while not self._idle and self._opened >= self._size:
+                self._cond.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._opened += 1
+            return None
+
+    def _give_back(self, conn: Any | None) -> None:
+        with self._cond:
+            if conn is None or self._closed:
+                self._opened -= 1
+                if conn is not None:
+                    with contextlib.suppress(Exception):
+                        conn.close()
+            else:
+                self._idle.append(conn)
+            self._cond.notify()
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[Any]:
+        conn = self._take()
+        try:
+            if conn is None:
+                conn = self._connect()
+            conn.execute("BEGIN")
+        except BaseException:
+            # A connection that cannot start a read is closed, not lent again.
+            if conn is not None:
+                with contextlib.suppress(Exception):
+                    conn.close()
+            self._give_back(None)
+            raise
+        try:
+            yield conn
+        finally:
+            with contextlib.suppress(Exception):
+                conn.rollback()
+            self._give_back(conn)
+
+    def close(self) -> None:
+        """Close idle connections now; borrowed ones close when returned."""
+        with self._cond:
+            self._closed = True
+            for conn in self._idle:
+                with contextlib.suppress(Exception):
+                    conn.close()
+            self._opened -= len(self._idle)
+            self._idle.clear()
+
+    def idle_connections(self) -> list[Any]:
+        return list(self._idle)
+
+
+class AsyncReadPool:
+    """Up to ``size`` aiosqlite connections, each lent to one borrower at a time."""
+
+    def __init__(self, connect: Callable[[], Awaitable[Any]], size: int) -> None:
+        self._connect = connect
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[Any] = []
+        self._closed = False
+
+    @contextlib.asynccontextmanager
+    async def connection(self) -> AsyncIterator[Any]:
+        async with self._slots:
+            conn = self._idle.pop() if self._idle else await self._connect()
+            try:
+                await conn.execute("BEGIN")
+            except BaseException:
+                # See SyncReadPool.connection: a failed BEGIN retires the connection.
+                with contextlib.suppress(Exception):
+                    await conn.close()
+                raise
+            try:
+                yield conn
+            finally:
+                with contextlib.suppress(Exception):
+                    await conn.rollback()
+                if self._closed:
+                    with contextlib.suppress(Exception):
+                        await conn.close()
+                else:
+                    self._idle.append(conn)
+
+    async def close(self) -> None:
+        """Close idle connections now; borrowed ones close when returned."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            with contextlib.suppress(Exception):
+                await conn.close()
+
+    def idle_connections(self) -> list[Any]:
+        return list(self._idle)
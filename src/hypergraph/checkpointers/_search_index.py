@@ -0,0 +1,256 @@
+"""Step search index modes for the SQLite checkpointer.
+
+``steps_fts`` mirrors ``steps.node_name`` and ``steps.error`` for
+``search``. In ``"eager"`` mode (the default, and what every store created
+before modes existed runs) the triggers from ``_migrate._create_fts`` index
+each step inside the transaction that writes it, whether or not anything
+ever searches.
+
+``"deferred"`` and ``"off"`` drop the insert trigger, so a step commit
+touches no FTS pages. The index then covers every step id up to a
+high-water mark in ``search_index_state``, and a catch-up pass indexes the
+rows above it in id order, advancing the mark in the same transaction.
+``"deferred"`` runs that pass on a background thread; ``"off"`` only when
+asked (``index_search``).
+
+Rows at or below the mark were indexed with the values they held at the
+time, so the update and delete triggers stay — guarded to those rows, the
+only ones they can keep exact. A row above the mark is indexed with
+whatever it holds when the pass reaches it. Step ids are AUTOINCREMENT and
+never reused, so the mark never covers a row the index has not seen.
+
+The mode is a property of the store, recorded beside the mark: opening with
+an explicit mode switches it (one transaction that also swaps the
+triggers), and opening without one adopts the stored mode. Writers never
+consult it — they follow whichever triggers the store holds.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any, Literal
+
+from hypergraph.checkpointers._migrate import _create_fts
+
+SearchIndexMode = Literal["eager", "deferred", "off"]
+
+SEARCH_INDEX_MODES: tuple[str, ...] = ("eager", "deferred", "off")
+
+SEARCH_INDEX_BATCH_SIZE = 1000
+
+logger = logging.getLogger("hypergraph.checkpointers")
+
+_CREATE_SEARCH_INDEX_STATE = """
+CREATE TABLE IF NOT EXISTS search_index_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    mode TEXT NOT NULL,
+    indexed_through INTEGER NOT NULL
+)
+"""
+
+_FTS_TRIGGERS = ("steps_fts_insert", "steps_fts_update", "steps_fts_delete")
+
+_MARK_GUARD = "old.id <= (SELECT indexed_through FROM search_index_state WHERE id = 1)"
+
+_GUARDED_TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS steps_fts_update AFTER UPDATE OF node_name, error ON steps
+    WHEN {_MARK_GUARD} BEGIN
+        INSERT INTO steps_fts(steps_fts, rowid, node_name, error)
+        VALUES ('delete', old.id, old.node_name, old.error);
+        INSERT INTO steps_fts(rowid, node_name, error)
+        VALUES (new.id, new.node_name, new.error);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS steps_fts_delete AFTER DELETE ON steps
+    WHEN {_MARK_GUARD} BEGIN
+        INSERT INTO steps_fts(steps_fts, rowid, node_name, error)
+        VALUES ('delete', old.id, old.node_name, old.error);
+    END
+    """,
+)
+
+_STATE_SQL = "SELECT mode, indexed_through FROM search_index_state WHERE id = 1"
+_MAX_ID_SQL = "SELECT COALESCE(MAX(id), 0) FROM steps"
+# The last id of the next batch: the index catches up in id order, so the
+# mark only ever moves past rows it has indexed.
+_BATCH_END_SQL = "SELECT MAX(id) FROM (SELECT id FROM steps WHERE id > ? ORDER BY id LIMIT ?)"
+_INDEX_RANGE_SQL = "INSERT INTO steps_fts(rowid, node_name, error) SELECT id, node_name, error FROM steps WHERE id > ? AND id <= ?"
+_ADVANCE_SQL = "UPDATE search_index_state SET indexed_through = ? WHERE id = 1"
+
+# Steps ``search`` cannot see yet. Zero in eager mode, where the mark is not
+# maintained; a range scan over the unindexed tail of the rowid otherwise.
+# Callers append their own filter on ``s``.
+SEARCH_LAG_SQL = "SELECT COUNT(*) FROM search_index_state st JOIN steps s ON s.id > st.indexed_through WHERE st.id = 1 AND st.mode != 'eager'"
+
+
+def check_search_index(mode: str | None) -> str | None:
+    if mode is not None and mode not in SEARCH_INDEX_MODES:
+        raise ValueError(
+            f"search_index must be one of {list(SEARCH_INDEX_MODES)} or None, got {mode!r}.\n\n"
+            "How to fix:\n"
+            '  search_index="eager"     # index each step as it is written (default)\n'
+            '  search_index="deferred"  # index in the background; search reports the lag\n'
+            '  search_index="off"       # index only when index_search() is called'
+        )
+    return mode
+
+
+def apply_search_index_mode(conn: Any, mode: str | None) -> str:
+    """Switch the store to ``mode`` (None: keep the stored one); return the effective mode.
+
+    Runs on a sqlite3 connection right after ``ensure_schema``. Opening in
+    the mode the store already has is a single read.
+    """
+    conn.execute(_CREATE_SEARCH_INDEX_STATE)
+    row = conn.execute(_STATE_SQL).fetchone()
+    current = row[0] if row is not None else "eager"
+    if mode is None or mode == current:
+        return current
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if current == "eager":
+            # Everything written so far was indexed by the eager triggers.
+            for name in _FTS_TRIGGERS:
+                conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            for sql in _GUARDED_TRIGGERS:
+                conn.execute(sql)
+            (through,) = conn.execute(_MAX_ID_SQL).fetchone()
+            conn.execute("INSERT OR REPLACE INTO search_index_state (id, mode, indexed_through) VALUES (1, ?, ?)", (mode, through))
+        elif mode == "eager":
+            (through,) = conn.execute(_MAX_ID_SQL).fetchone()
+            conn.execute(_INDEX_RANGE_SQL, (row[1], through))
+            for name in _FTS_TRIGGERS:
+                conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            _create_fts(conn)
+            conn.execute("UPDATE search_index_state SET mode = ?, indexed_through = ? WHERE id = 1", (mode, through))
+        else:
+            conn.execute("UPDATE search_index_state SET mode = ? WHERE id = 1", (mode,))
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return mode
+
+
+def index_batch_sync(conn: Any, batch_size: int) -> int:
+    """Index the next ``batch_size`` unindexed steps in one transaction; return how many."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute(_STATE_SQL).fetchone()
+        if row is None or row[0] == "eager":
+            conn.rollback()
+            return 0
+        indexed_through = row[1]
+        (end,) = conn.execute(_BATCH_END_SQL, (indexed_through, batch_size)).fetchone()
+        if end is None:
+            conn.rollback()
+            return 0
+        cursor = conn.execute(_INDEX_RANGE_SQL, (indexed_through, end))
+        conn.execute(_ADVANCE_SQL, (end,))
+        conn.commit()
+        return cursor.rowcount
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+async def index_batch(db: Any, batch_size: int) -> int:
+    """Async mirror of ``index_batch_sync`` over an aiosqlite connection."""
+    await db.execute("BEGIN IMMEDIATE")
+    try:
+        cursor = await db.execute(_STATE_SQL)
+        row = await cursor.fetchone()
+        if row is None or row[0] == "eager":
+            await db.rollback()
+            return 0
+        indexed_through = row[1]
+        cursor = await db.execute(_BATCH_END_SQL, (indexed_through, batch_size))
+        (end,) = await cursor.fetchone()
+        if end is None:
+            await db.rollback()
+            return 0
+        cursor = await db.execute(_INDEX_RANGE_SQL, (indexed_through, end))
+        await db.execute(_ADVANCE_SQL, (end,))
+        await db.commit()
+        return cursor.rowcount
+    except BaseException:
+        await db.rollback()
+        raise
+
+
+class SearchIndexer:
+    """Background thread that keeps a deferred search index caught up.
+
+    Wakes every ``interval`` seconds and indexes in ``batch_size`` slices on
+    its own connection, so each slice holds the write lock about as long as
+    one step commit. A failed pass (typically a writer holding the lock past
+    the busy timeout) is logged and retried on the next wake.
+    """
+
+    def __init__(self, connect: Callable[[], Any], *, interval: float, batch_size: int = SEARCH_INDEX_BATCH_SIZE) -> None:
+        self._connect = connect
+        self._interval = interval
+        self._batch_size = batch_size
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        # ``catch_up`` tickets: requested by callers, served by passes that
+        # started after the request.
+        self._passes = threading.Condition()
+        self._requested = 0
+        self._served = 0
+        self._thread = threading.Thread(target=self._run, name="hypergraph-search-index", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        conn = None
+        try:
+            while True:
+                self._wake.wait(self._interval)
+                if self._stop.is_set():
+                    break
+                self._wake.clear()
+                with self._passes:
+                    serving = self._requested
+                try:
+                    if conn is None:
+                        conn = self._connect()
+                    while not self._stop.is_set() and index_batch_sync(conn, self._batch_size) == self._batch_size:
+                        pass
+                except Exception:
+                    logger.warning("Deferred search indexing failed; retrying in %.1fs", self._interval, exc_info=True)
+                else:
+                    with self._passes:
+                        self._served = serving
+                        self._passes.notify_all()
+        finally:
+            if conn is not None:
+                conn.close()
+            with self._passes:
+                self._passes.notify_all()
+
+    def catch_up(self, timeout: float | None = None) -> bool:
+        """Run a pass now and wait for it; ``False`` if it did not finish in time.
+
+        The pass starts after this call, so every step committed before it is
+        indexed when this returns ``True``.
+        """
+        with self._passes:
+            self._requested += 1
+            ticket = self._requested
+            self._wake.set()
+            self._passes.wait_for(lambda: self._served >= ticket or not self._thread.is_alive(), timeout)
+            return self._served >= ticket
+
+    def stop(self) -> None:
+        """Ask the thread to exit after its current slice, without waiting."""
+        self._stop.set()
+        self._wake.set()
+
+    def close(self) -> None:
+        self.stop()
+        self._thread.join()
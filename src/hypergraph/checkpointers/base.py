@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import uuid
 from abc import ABC, abstractmethod
-from collections.abc import Collection
+from collections.abc import Collection, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Literal
@@ -412,10 +412,18 @@ class Checkpointer(ABC):
     # === Read Operations ===
 
     @abstractmethod
-    async def get_state(self, run_id: str, *, superstep: int | None = None) -> dict[str, Any]:
+    async def get_state(
+        self,
+        run_id: str,
+        *,
+        superstep: int | None = None,
+        keys: Sequence[str] | None = None,
+    ) -> dict[str, Any]:
         """Get accumulated state through a superstep.
 
         State is computed by folding step values. superstep=None means latest.
+        ``keys`` narrows the result to those outputs (absent ones are omitted);
+        backends may use it to avoid decoding values nobody asked for.
         """
         ...
 
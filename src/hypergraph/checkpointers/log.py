@@ -0,0 +1,824 @@
+"""Append-only, log-structured checkpointer for write-heavy workloads.
+
+``LogCheckpointer`` keeps the whole index in memory — it IS a
+``MemoryCheckpointer`` — and makes it durable by appending every mutation to
+segment files. A write is one length-prefixed, CRC-checked frame appended to
+the current segment: no B-tree, no FTS trigger, no retention query. Opening
+the directory replays the segments to rebuild the index.
+
+Layout of ``path/``::
+
+    000000000007.snapshot   live state as of the end of segment 7
+    000000000008.log        frames appended since
+    000000000009.log        the segment being written
+
+Every file starts with ``_MAGIC``. A frame is ``<u32 body length><u32 crc32>``
+then the body: ``<u32 header length>``, a JSON header listing the frame's
+operations, and the serialized value blobs those operations point into. One
+checkpointer call is one frame, so a torn write loses the whole call and never
+half of it.
+
+Retention prunes the in-memory index exactly as ``MemoryCheckpointer`` does and
+journals the drops; compaction then rewrites the live state into a snapshot
+and deletes the segments it covers, reclaiming what retention released.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Literal
+
+from hypergraph.checkpointers.base import CheckpointPolicy
+from hypergraph.checkpointers.memory import MemoryCheckpointer
+from hypergraph.checkpointers.serializers import JsonSerializer, Serializer
+from hypergraph.checkpointers.types import (
+    NO_RUN_TOTALS,
+    AttemptError,
+    AttemptRecord,
+    AttemptSeries,
+    AttemptStatus,
+    PauseSlot,
+    PendingNode,
+    Run,
+    RunTotals,
+    StepRecord,
+    StepStatus,
+    WorkflowStatus,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows only
+    fcntl = None  # type: ignore[assignment]
+
+_MAGIC = b"HGLOG\x00\x00\x01"
+_FRAME_HEAD = struct.Struct("<II")
+_HEADER_LEN = struct.Struct("<I")
+_SEGMENT_SUFFIX = ".log"
+_SNAPSHOT_SUFFIX = ".snapshot"
+_LOCK_SUFFIX = ".lock"
+_SNAPSHOT_OPS_PER_FRAME = 1024
+_DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+_DEFAULT_COMPACT_MIN_BYTES = 256 * 1024 * 1024
+
+_ENTITY_TYPES: dict[str, type] = {
+    "run": Run,
+    "step": StepRecord,
+    "pending": PendingNode,
+    "pause": PauseSlot,
+    "series": AttemptSeries,
+    "attempt": AttemptRecord,
+}
+_DATETIME_FIELDS = frozenset(
+    {"created_at", "completed_at", "dispatched_at", "settled_at", "opened_at", "deadline_at", "closed_at", "started_at", "retry_not_before"}
+)
+_ENUM_FIELDS: dict[str, dict[str, type]] = {
+    "run": {"status": WorkflowStatus},
+    "step": {"status": StepStatus},
+    "attempt": {"status": AttemptStatus},
+}
+# Not journaled as fields: step values travel as a serializer blob, and a
+# run's pause slot is derived from the pause journal on read.
+_BLOB_FIELDS = frozenset({"values", "pause_slot"})
+
+#: ``(kind, JSON-safe data, serialized blob or None)`` — one journaled mutation.
+_Op = tuple[str, Any, bytes | None]
+
+
+class LogCorruptionError(RuntimeError):
+    """A sealed segment or snapshot failed its CRC check.
+
+    Only the segment being written can end in a torn frame — that one is
+    truncated to its last intact frame on open. Damage anywhere else means
+    committed history is unreadable, so opening refuses rather than silently
+    rebuilding a state with holes in it.
+    """
+
+
+class LogLockedError(RuntimeError):
+    """Another ``LogCheckpointer`` already writes this directory.
+
+    Two writers would interleave frames in one segment and each would replay
+    a history the other never saw, so a second open is refused outright.
+    """
+
+
+def _encode_entity(entity: Any) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    for item in fields(entity):
+        if item.name in _BLOB_FIELDS:
+            continue
+        value = getattr(entity, item.name)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, (WorkflowStatus, StepStatus, AttemptStatus)):
+            value = value.value
+        elif isinstance(value, AttemptError):
+            value = {"type_name": value.type_name, "message": value.message}
+        elif isinstance(value, tuple):
+            value = list(value)
+        data[item.name] = value
+    return data
+
+
+def _decode_entity(kind: str, data: dict[str, Any], **extra: Any) -> Any:
+    enums = _ENUM_FIELDS.get(kind, {})
+    kwargs: dict[str, Any] = {}
+    for name, value in data.items():
+        if value is not None:
+            if name in _DATETIME_FIELDS:
+                value = datetime.fromisoformat(value)
+            elif name in enums:
+                value = enums[name](value)
+            elif kind == "attempt" and name == "error":
+                value = AttemptError(**value)
+            elif kind == "pause" and name == "options":
+                value = tuple(value)
+        kwargs[name] = value
+    return _ENTITY_TYPES[kind](**kwargs, **extra)
+
+
+def _encode_frame(ops: Sequence[_Op]) -> bytes:
+    header: list[list[Any]] = []
+    blobs: list[bytes] = []
+    offset = 0
+    for kind, data, blob in ops:
+        span = None
+        if blob is not None:
+            span = [offset, len(blob)]
+            blobs.append(blob)
+            offset += len(blob)
+        header.append([kind, data, span])
+    head = json.dumps(header, separators=(",", ":")).encode()
+    body = b"".join([_HEADER_LEN.pack(len(head)), head, *blobs])
+    return _FRAME_HEAD.pack(len(body), zlib.crc32(body)) + body
+
+
+def _read_frames(data: bytes) -> tuple[list[list[_Op]], int]:
+    """Decode the intact frames of one file; also return where they end.
+
+    The end offset is ``len(data)`` for a clean file and the start of the
+    first torn or corrupt frame otherwise.
+    """
+    if not data.startswith(_MAGIC):
+        return [], 0
+    frames: list[list[_Op]] = []
+    view = memoryview(data)
+    offset = len(_MAGIC)
+    while offset + _FRAME_HEAD.size <= len(data):
+        length, crc = _FRAME_HEAD.unpack_from(data, offset)
+        start = offset + _FRAME_HEAD.size
+        body = view[start : start + length]
+        if len(body) < length or zlib.crc32(body) != crc:
+            break
+        (head_len,) = _HEADER_LEN.unpack_from(body)
+        head_end = _HEADER_LEN.size + head_len
+        header = json.loads(bytes(body[_HEADER_LEN.size : head_end]))
+        frames.append(
+            [
+                (kind, op_data, None if span is None else bytes(body[head_end + span[0] : head_end + span[0] + span[1]]))
+                for kind, op_data, span in header
+            ]
+        )
+        offset = start + length
+    return frames, offset
+
+
+def _seq_files(directory: Path, suffix: str) -> list[tuple[int, Path]]:
+    return sorted((int(path.name[: -len(suffix)]), path) for path in directory.glob(f"*{suffix}") if path.name[: -len(suffix)].isdigit())
+
+
+def _seq_path(directory: Path, seq: int, suffix: str) -> Path:
+    return directory / f"{seq:012d}{suffix}"
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Make a rename or unlink in ``directory`` durable (no-op where unsupported)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class LogCheckpointer(MemoryCheckpointer):
+    """Durable checkpointer backed by append-only segment files.
+
+    Built for batch workloads that mostly write and rarely query: a
+    ``save_step`` is one buffered append, and every read is served from the
+    in-memory index. The trade is memory — the whole retained history lives
+    in the process — and single ownership: one checkpointer writes a
+    directory at a time, enforced by an exclusive lock on ``<path>.lock``
+    (``LogLockedError`` for a second writer).
+
+    Args:
+        path: Directory holding the segments (created if missing).
+        durability: Shorthand for ``CheckpointPolicy(durability=...)``.
+        retention: Shorthand for ``CheckpointPolicy(retention=...)``.
+        policy: Full checkpoint policy (mutually exclusive with the shorthands).
+        serializer: Encodes step values and run inputs. Default ``JsonSerializer``.
+        segment_bytes: Roll to a new segment once the current one reaches this size.
+        fsync_interval: Seconds between ``fsync`` calls. Every frame is handed
+            to the OS as it is written, so a process crash loses nothing that
+            returned. A frame is fsynced by a later write once the interval
+            has passed, or by a timer when no write comes, so a power loss
+            can lose up to this window of commits. ``0`` fsyncs every commit;
+            ``None`` fsyncs only on roll and close.
+        compact_min_bytes: Compact in the background once the log holds at
+            least this many bytes and twice what the last compaction kept.
+            ``None`` compacts only when ``compact()`` is called.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        durability: Literal["sync", "async", "exit"] | None = None,
+        retention: Literal["full", "latest", "windowed"] | None = None,
+        policy: CheckpointPolicy | None = None,
+        serializer: Serializer | None = None,
+        segment_bytes: int = _DEFAULT_SEGMENT_BYTES,
+        fsync_interval: float | None = 0.05,
+        compact_min_bytes: int | None = _DEFAULT_COMPACT_MIN_BYTES,
+    ):
+        if policy is not None and (durability is not None or retention is not None):
+            raise ValueError("Cannot pass both 'policy' and 'durability'/'retention'. Use one or the other.")
+        if segment_bytes <= 0:
+            raise ValueError("segment_bytes must be greater than 0")
+        if fsync_interval is not None and fsync_interval < 0:
+            raise ValueError("fsync_interval must be >= 0 or None")
+        super().__init__()
+        if policy is None and (durability is not None or retention is not None):
+            policy = CheckpointPolicy(durability=durability or "async", retention=retention or "full")
+        if policy is not None:
+            self.policy = policy
+        self._dir = Path(path)
+        self._serializer = serializer or JsonSerializer()
+        self._segment_bytes = segment_bytes
+        self._fsync_interval = fsync_interval
+        self._compact_min_bytes = compact_min_bytes
+        self._retention_ops: list[_Op] = []
+        self._file: BinaryIO | None = None
+        self._seq = 0
+        self._segment_size = 0
+        self._last_fsync = time.monotonic()
+        # Frames written since the last fsync, and the timer that fsyncs them
+        # when no later write does. Both belong to the writer thread.
+        self._unsynced = False
+        self._fsync_timer: threading.Timer | None = None
+        # Byte accounting is shared with the compaction thread.
+        self._bytes_lock = threading.Lock()
+        self._log_bytes = 0
+        self._live_bytes = 0
+        self._compactor: ThreadPoolExecutor | None = None
+        self._compaction: Future[int] | None = None
+        # Segment IO (write, fsync, roll) runs on this one thread, so a commit
+        # never blocks the event loop and frames land in submission order.
+        self._writer: ThreadPoolExecutor | None = None
+        self._lock_fd: int | None = None
+        self._lock()
+        try:
+            self._load()
+        except BaseException:
+            self._unlock()
+            raise
+
+    # === Ownership ===
+
+    def _lock(self) -> None:
+        """Take the directory's exclusive writer lock; raise LogLockedError if held."""
+        self._dir.parent.mkdir(parents=True, exist_ok=True)
+        path = self._dir.with_name(self._dir.name + _LOCK_SUFFIX)
+        fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o644)
+        if fcntl is not None:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                raise LogLockedError(
+                    f"Checkpoint log {self._dir} is already open for writing (lock file {path}).\n\n"
+                    "How to fix: close the other LogCheckpointer on this directory first, or give this one its own directory."
+                ) from None
+        self._lock_fd = fd
+
+    def _unlock(self) -> None:
+        if self._lock_fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    # === Journal ===
+
+    def _op(self, kind: str, entity: Any) -> _Op:
+        if kind == "step":
+            values = entity.values
+            return kind, _encode_entity(entity), None if values is None else self._serializer.serialize(values)
+        return kind, _encode_entity(entity), None
+
+    def _inputs_op(self, run_id: str, inputs: dict[str, Any]) -> _Op:
+        return "inputs", run_id, self._serializer.serialize(inputs)
+
+    def _segment_writer(self) -> ThreadPoolExecutor:
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hypergraph-log-write")
+        return self._writer
+
+    def _drain_writer(self) -> None:
+        """Block until every submitted segment operation has finished."""
+        if self._writer is not None:
+            self._writer.submit(lambda: None).result()
+
+    async def _commit(self, ops: Sequence[_Op]) -> None:
+        """Append one call's mutations, plus whatever retention dropped, as one frame.
+
+        The index is already updated when this runs. The frame is handed to
+        the writer thread before the first await, so frames reach the log in
+        the order their index updates happened. If the append itself fails,
+        the index is rebuilt from disk so memory never claims a write the log
+        does not hold.
+        """
+        ops = [*ops, *self._retention_ops]
+        self._retention_ops = []
+        if not ops:
+            return
+        if self._file is None:
+            raise RuntimeError("LogCheckpointer is closed")
+        frame = _encode_frame(ops)
+        try:
+            await asyncio.wrap_future(self._segment_writer().submit(self._append, frame))
+        except OSError:
+            self._drain_writer()
+            self._reload()
+            raise
+        self._maybe_compact()
+
+    def _append(self, frame: bytes) -> None:
+        if self._file is None:
+            raise RuntimeError("LogCheckpointer is closed")
+        self._file.write(frame)
+        self._file.flush()
+        self._segment_size += len(frame)
+        with self._bytes_lock:
+            self._log_bytes += len(frame)
+        if self._fsync_interval is not None:
+            self._unsynced = True
+            delay = self._last_fsync + self._fsync_interval - time.monotonic()
+            if delay <= 0:
+                self._fsync()
+            elif self._fsync_timer is None:
+                self._fsync_timer = threading.Timer(delay, self._fsync_later)
+                self._fsync_timer.daemon = True
+                self._fsync_timer.start()
+        if self._segment_size >= self._segment_bytes:
+            self._roll()
+
+    def _fsync(self) -> None:
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = False
+        self._last_fsync = time.monotonic()
+
+    def _fsync_later(self) -> None:
+        """Timer thread: queue the deferred fsync behind any frames already submitted."""
+        writer = self._writer
+        if writer is not None:
+            # Closed in the meantime: sealing the segment fsynced it.
+            with contextlib.suppress(RuntimeError):
+                writer.submit(self._deferred_fsync)
+
+    def _deferred_fsync(self) -> None:
+        self._fsync_timer = None
+        self._fsync()
+
+    def _open_segment(self, seq: int) -> None:
+        path = _seq_path(self._dir, seq, _SEGMENT_SUFFIX)
+        self._file = open(path, "ab")  # noqa: SIM115 — held open for the checkpointer's lifetime
+        size = self._file.tell()
+        if size < len(_MAGIC):
+            self._file.truncate(0)
+            self._file.write(_MAGIC)
+            self._file.flush()
+            size = len(_MAGIC)
+            with self._bytes_lock:
+                self._log_bytes += size
+        self._seq = seq
+        self._segment_size = size
+
+    def _seal_segment(self) -> None:
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = False
+        self._file.close()
+        self._file = None
+
+    def _roll(self) -> int:
+        """Seal the current segment and start the next one; return the sealed seq."""
+        sealed = self._seq
+        self._seal_segment()
+        self._open_segment(sealed + 1)
+        _fsync_dir(self._dir)
+        self._last_fsync = time.monotonic()
+        return sealed
+
+    # === Replay ===
+
+    def _load(self) -> None:
+        self._dir.mkdir(parents=True, exist_ok=True)
+        for stray in self._dir.glob("*.tmp"):
+            stray.unlink()
+        snapshots = _seq_files(self._dir, _SNAPSHOT_SUFFIX)
+        base = snapshots[-1][0] if snapshots else -1
+        # A crash between writing a snapshot and deleting what it covers.
+        superseded = [path for _, path in snapshots[:-1]]
+        superseded.extend(path for seq, path in _seq_files(self._dir, _SEGMENT_SUFFIX) if seq <= base)
+        for path in superseded:
+            path.unlink()
+        log_bytes = self._replay(snapshots[-1][1], sealed=True) if snapshots else 0
+        self._live_bytes = log_bytes
+        segments = _seq_files(self._dir, _SEGMENT_SUFFIX)
+        for position, (_, path) in enumerate(segments):
+            log_bytes += self._replay(path, sealed=position < len(segments) - 1)
+        self._log_bytes = log_bytes
+        self._open_segment(segments[-1][0] if segments else base + 1)
+
+    def _replay(self, path: Path, *, sealed: bool) -> int:
+        """Apply one file's frames; return the bytes it keeps."""
+        data = path.read_bytes()
+        frames, end = _read_frames(data)
+        if end < len(data):
+            if sealed:
+                raise LogCorruptionError(f"Checkpoint log {path} is corrupt at byte {end} of {len(data)}")
+            # A torn final frame: the call that wrote it never returned.
+            with open(path, "r+b") as handle:
+                handle.truncate(end)
+        for frame in frames:
+            for kind, payload, blob in frame:
+                self._apply(kind, payload, blob)
+        return end
+
+    def _apply(self, kind: str, data: Any, blob: bytes | None) -> None:
+        if kind == "step":
+            record = _decode_entity(kind, data, values=None if blob is None else self._serializer.deserialize(blob))
+            self._put_step(record)
+        elif kind == "step_drop":
+            run_id, superstep, node_name = data
+            self._drop_step(run_id, (superstep, node_name))
+        elif kind == "run":
+            run = _decode_entity(kind, data)
+            self._runs[run.id] = run
+        elif kind == "inputs":
+            self._run_inputs[data] = self._serializer.deserialize(blob)
+        elif kind == "pending":
+            boundary = _decode_entity(kind, data)
+            self._pending_nodes.setdefault(boundary.run_id, {})[(boundary.superstep, boundary.node_name)] = boundary
+        elif kind == "pending_drop":
+            run_id, superstep, node_name = data
+            self._pending_nodes.get(run_id, {}).pop((superstep, node_name), None)
+        elif kind == "pause":
+            slot = _decode_entity(kind, data)
+            occurrences = self._pause_slots.setdefault(slot.run_id, [])
+            position = next((i for i, item in enumerate(occurrences) if item.pause_id == slot.pause_id), None)
+            if position is None:
+                occurrences.append(slot)
+            else:
+                occurrences[position] = slot
+        elif kind == "series":
+            series = _decode_entity(kind, data)
+            self._attempt_series[series.id] = series
+            self._attempt_records.setdefault(series.id, {})
+        elif kind == "series_drop":
+            self._attempt_series.pop(data, None)
+            self._attempt_records.pop(data, None)
+        elif kind == "attempt":
+            record = _decode_entity(kind, data)
+            self._attempt_records.setdefault(record.series_id, {})[record.attempt_number] = record
+        else:
+            raise LogCorruptionError(f"Unknown checkpoint log operation {kind!r}")
+
+    def _reload(self) -> None:
+        """Rebuild the index from disk after a failed append."""
+        self._wait_for_compaction()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._clear()
+        self._retention_ops = []
+        self._load()
+
+    # === Compaction ===
+
+    def _capture(self) -> list[tuple[str, Any]]:
+        """Every live entity, captured without copying any of them.
+
+        Entities are immutable and replaced rather than edited, so these
+        references stay a consistent snapshot while writes continue.
+        """
+        entities: list[tuple[str, Any]] = [("run", run) for run in self._runs.values()]
+        entities.extend(("inputs", item) for item in self._run_inputs.items())
+        for steps in self._steps.values():
+            entities.extend(("step", record) for record in steps.values())
+        for boundaries in self._pending_nodes.values():
+            entities.extend(("pending", boundary) for boundary in boundaries.values())
+        for occurrences in self._pause_slots.values():
+            entities.extend(("pause", slot) for slot in occurrences)
+        entities.extend(("series", series) for series in self._attempt_series.values())
+        for records in self._attempt_records.values():
+            entities.extend(("attempt", record) for record in records.values())
+        return entities
+
+    def _snapshot_frames(self, entities: list[tuple[str, Any]]) -> Iterator[bytes]:
+        for start in range(0, len(entities), _SNAPSHOT_OPS_PER_FRAME):
+            chunk = entities[start : start + _SNAPSHOT_OPS_PER_FRAME]
+            yield _encode_frame([self._inputs_op(*entity) if kind == "inputs" else self._op(kind, entity) for kind, entity in chunk])
+
+    def _write_snapshot(self, seq: int, entities: list[tuple[str, Any]]) -> int:
+        """Write snapshot ``seq``, drop what it supersedes; return bytes reclaimed."""
+        target = _seq_path(self._dir, seq, _SNAPSHOT_SUFFIX)
+        tmp = target.with_name(target.name + ".tmp")
+        with open(tmp, "wb") as handle:
+            handle.write(_MAGIC)
+            for frame in self._snapshot_frames(entities):
+                handle.write(frame)
+            handle.flush()
+            os.fsync(handle.fileno())
+            size = handle.tell()
+        os.replace(tmp, target)
+        _fsync_dir(self._dir)
+        removed = 0
+        for old_seq, path in [*_seq_files(self._dir, _SEGMENT_SUFFIX), *_seq_files(self._dir, _SNAPSHOT_SUFFIX)]:
+            if old_seq < seq or (old_seq == seq and path.suffix == _SEGMENT_SUFFIX):
+                removed += path.stat().st_size
+                path.unlink()
+        with self._bytes_lock:
+            self._log_bytes += size - removed
+            self._live_bytes = size
+        return removed - size
+
+    def _start_compaction(self) -> Future[int]:
+        """Seal the current segment and snapshot everything up to it off-thread.
+
+        The capture happens first: every frame already submitted lands before
+        the roll and is reflected in it, every later frame lands after it.
+        """
+        entities = self._capture()
+        boundary = self._segment_writer().submit(self._roll)
+        if self._compactor is None:
+            self._compactor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hypergraph-log-compact")
+        self._compaction = self._compactor.submit(lambda: self._write_snapshot(boundary.result(), entities))
+        return self._compaction
+
+    def _maybe_compact(self) -> None:
+        if self._compact_min_bytes is None or (self._compaction is not None and not self._compaction.done()):
+            return
+        with self._bytes_lock:
+            due = self._log_bytes >= max(self._compact_min_bytes, 2 * self._live_bytes)
+        if due:
+            self._start_compaction()
+
+    def _wait_for_compaction(self) -> None:
+        if self._compaction is not None:
+            try:
+                self._compaction.result()
+            finally:
+                self._compaction = None
+
+    async def compact(self) -> int:
+        """Rewrite the live state as a snapshot and delete the segments it covers.
+
+        Returns the bytes reclaimed. Writes keep appending while the snapshot
+        is written; only the sealed segments it replaces are removed.
+        """
+        if self._compaction is not None:
+            await asyncio.wrap_future(self._compaction)
+        return await asyncio.wrap_future(self._start_compaction())
+
+    @property
+    def log_bytes(self) -> int:
+        """Bytes the segments and current snapshot occupy on disk."""
+        with self._bytes_lock:
+            return self._log_bytes
+
+    async def close(self) -> None:
+        """Finish any compaction, fsync, and release the segment file and the directory lock."""
+        if self._compaction is not None:
+            await asyncio.wrap_future(self._compaction)
+            self._compaction = None
+        if self._compactor is not None:
+            self._compactor.shutdown()
+            self._compactor = None
+        timer = self._fsync_timer
+        if timer is not None:
+            timer.cancel()
+        if self._writer is not None:
+            await asyncio.wrap_future(self._writer.submit(self._seal_segment))
+            self._writer.shutdown()
+            self._writer = None
+        else:
+            self._seal_segment()
+        self._unlock()
+
+    # === Retention ===
+
+    def _apply_retention_policy(self, run_id: str) -> None:
+        """Prune exactly as memory does, staging the drops for this call's frame."""
+        if self.policy.retention == "full":
+            return
+        steps_before = dict(self._steps.get(run_id, {}))
+        pending_before = set(self._pending_nodes.get(run_id, {}))
+        self._retention_ops = []
+        super()._apply_retention_policy(run_id)
+        steps_after = self._steps.get(run_id, {})
+        pending_after = self._pending_nodes.get(run_id, {})
+        ops: list[_Op] = [("step_drop", [run_id, *key], None) for key in steps_before if key not in steps_after]
+        ops.extend(self._op("step", record) for key, record in steps_after.items() if steps_before.get(key) is not record)
+        ops.extend(("pending_drop", [run_id, *key], None) for key in pending_before if key not in pending_after)
+        self._retention_ops = [*ops, *self._retention_ops]
+
+    def _prune_attempt_series_for_dropped(self, dropped: list[StepRecord]) -> None:
+        candidates = [record.attempt_series_id for record in dropped if record.attempt_series_id is not None]
+        super()._prune_attempt_series_for_dropped(dropped)
+        self._retention_ops.extend(("series_drop", series_id, None) for series_id in candidates if series_id not in self._attempt_series)
+
+    # === Writes ===
+    #
+    # Each override lets MemoryCheckpointer validate and apply the call, then
+    # journals the entities it produced. Validation failures raise before
+    # anything is written, and no override awaits between applying the call
+    # and handing its frame to the writer thread.
+
+    async def save_step(self, record: StepRecord) -> None:
+        await super().save_step(record)
+        await self._commit([self._op("step", record)])
+
+    async def record_pending_nodes(self, boundaries: Sequence[PendingNode]) -> None:
+        await super().record_pending_nodes(boundaries)
+        stored = [self._pending_nodes[b.run_id][(b.superstep, b.node_name)] for b in boundaries]
+        await self._commit([self._op("pending", boundary) for boundary, kept in zip(boundaries, stored, strict=True) if kept is boundary])
+
+    async def record_pause(
+        self,
+        slot: PauseSlot,
+        *,
+        step_records: Sequence[StepRecord] = (),
+        totals: RunTotals = NO_RUN_TOTALS,
+    ) -> None:
+        await super().record_pause(slot, step_records=step_records, totals=totals)
+        ops = [self._op("step", record) for record in step_records]
+        if any(item is slot for item in self._pause_slots.get(slot.run_id, [])):
+            ops.append(self._op("pause", slot))
+        ops.append(self._op("run", self._runs[slot.run_id]))
+        await self._commit(ops)
+
+    async def settle_pause(self, run_id: str, *, pause_id: str | None = None, value: Any) -> PauseSlot:
+        settled = await super().settle_pause(run_id, pause_id=pause_id, value=value)
+        await self._commit([self._op("pause", settled)])
+        return settled
+
+    async def create_run(
+        self,
+        run_id: str,
+        *,
+        graph_name: str | None = None,
+        parent_run_id: str | None = None,
+        forked_from: str | None = None,
+        fork_superstep: int | None = None,
+        retry_of: str | None = None,
+        retry_index: int | None = None,
+        config: dict[str, Any] | None = None,
+        inputs: dict[str, Any] | None = None,
+    ) -> Run:
+        had_inputs = run_id in self._run_inputs
+        run = await super().create_run(
+            run_id,
+            graph_name=graph_name,
+            parent_run_id=parent_run_id,
+            forked_from=forked_from,
+            fork_superstep=fork_superstep,
+            retry_of=retry_of,
+            retry_index=retry_index,
+            config=config,
+            inputs=inputs,
+        )
+        ops = [self._op("run", run)]
+        if not had_inputs and run_id in self._run_inputs:
+            ops.append(self._inputs_op(run_id, self._run_inputs[run_id]))
+        await self._commit(ops)
+        return run
+
+    async def update_run_status(
+        self,
+        run_id: str,
+        status: WorkflowStatus,
+        *,
+        duration_ms: float | None = None,
+        node_count: int | None = None,
+        error_count: int | None = None,
+    ) -> None:
+        await super().update_run_status(run_id, status, duration_ms=duration_ms, node_count=node_count, error_count=error_count)
+        await self._commit([self._op("run", self._runs[run_id])])
+
+    # === Attempt Ledger ===
+
+    async def open_attempt_series(
+        self,
+        run_id: str,
+        node_name: str,
+        *,
+        policy_fingerprint: str,
+        max_attempts: int,
+        deadline_at: datetime | None = None,
+    ) -> AttemptSeries:
+        series = await super().open_attempt_series(
+            run_id,
+            node_name,
+            policy_fingerprint=policy_fingerprint,
+            max_attempts=max_attempts,
+            deadline_at=deadline_at,
+        )
+        await self._commit([self._op("series", series)])
+        return series
+
+    async def begin_attempt(
+        self,
+        series_id: str,
+        *,
+        policy_fingerprint: str,
+        scheduled_superstep: int,
+    ) -> AttemptRecord:
+        record = await super().begin_attempt(series_id, policy_fingerprint=policy_fingerprint, scheduled_superstep=scheduled_superstep)
+        await self._commit([self._op("attempt", record)])
+        return record
+
+    async def record_attempt_outcome(
+        self,
+        series_id: str,
+        attempt_number: int,
+        status: AttemptStatus,
+        *,
+        error: AttemptError | None = None,
+        retry_not_before: datetime | None = None,
+        sampled_delay: float | None = None,
+    ) -> AttemptRecord:
+        record = await super().record_attempt_outcome(
+            series_id,
+            attempt_number,
+            status,
+            error=error,
+            retry_not_before=retry_not_before,
+            sampled_delay=sampled_delay,
+        )
+        await self._commit([self._op("attempt", record)])
+        return record
+
+    async def record_attempt_deadline(self, series_id: str, attempt_number: int) -> AttemptRecord:
+        record = await super().record_attempt_deadline(series_id, attempt_number)
+        await self._commit([self._op("attempt", record)])
+        return record
+
+    async def close_attempt_series(
+        self,
+        series_id: str,
+        attempt_number: int,
+        status: AttemptStatus,
+        *,
+        step_record: StepRecord,
+        error: AttemptError | None = None,
+    ) -> None:
+        await super().close_attempt_series(series_id, attempt_number, status, step_record=step_record, error=error)
+        ops = [self._op("step", step_record)]
+        # Retention may already have dropped the series along with its step.
+        record = self._attempt_records.get(series_id, {}).get(attempt_number)
+        if record is not None:
+            ops.append(self._op("attempt", record))
+        series = self._attempt_series.get(series_id)
+        if series is not None:
+            ops.append(self._op("series", series))
+        await self._commit(ops)
+
+    async def resolve_stranded_attempts(self, series_id: str) -> list[AttemptRecord]:
+        records = await super().resolve_stranded_attempts(series_id)
+        await self._commit([self._op("attempt", record) for record in records])
+        return records
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import bisect
+import sys
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator, MutableMapping, Sequence
 from dataclasses import replace
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from hypergraph.checkpointers.base import (
@@ -29,6 +32,7 @@ from hypergraph.checkpointers.types import (
     AttemptRecord,
     AttemptSeries,
     AttemptStatus,
+    MemoryFootprint,
     NodeBoundary,
     PauseSlot,
     PendingNode,
@@ -44,35 +48,268 @@ _BASELINE_NODE_NAME = "__retained_state__"
 _BASELINE_NODE_TYPE = "RetentionBaseline"
 
 
+_TERMINAL_STATUSES = frozenset({WorkflowStatus.COMPLETED, WorkflowStatus.FAILED, WorkflowStatus.PARTIAL, WorkflowStatus.STOPPED})
+
+
 def _step_sort_key(record: StepRecord) -> tuple[datetime, datetime, int, str]:
     completed_or_created = record.completed_at or record.created_at
     return (completed_or_created, record.created_at, record.index, record.node_name)
 
 
+def _approx_size(value: Any, seen: set[int] | None = None) -> int:
+    """``sys.getsizeof`` summed through containers, each object counted once."""
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value, 64)
+    if isinstance(value, dict):
+        size += sum(_approx_size(key, seen) + _approx_size(item, seen) for key, item in value.items())
+    elif isinstance(value, list | tuple | set | frozenset):
+        size += sum(_approx_size(item, seen) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += _approx_size(vars(value), seen)
+    return size
+
+
+def _step_bytes(record: StepRecord) -> int:
+    return sys.getsizeof(record) + _approx_size(record.values) + _approx_size(record.input_versions)
+
+
+class _RunSteps(MutableMapping[tuple[int, str], StepRecord]):
+    """One run's steps by ``(superstep, node_name)``, also kept in fold order.
+
+    Each arrival is placed with a bisect instead of re-sorting on every
+    read. ``state()`` is the fold of every step, kept between reads: steps
+    that arrived in order since the last read (the runner's normal case)
+    are folded onto it; an upsert, an out-of-order arrival, or a drop
+    means a full refold on next use.
+    """
+
+    __slots__ = ("_records", "_order", "_state", "_folded")
+
+    def __init__(self, records: Iterable[StepRecord] = ()) -> None:
+        self._records: dict[tuple[int, str], StepRecord] = {}
+        self._order: list[tuple[tuple[datetime, datetime, int, str], tuple[int, str]]] = []
+        self._state: dict[str, Any] | None = None
+        self._folded = 0
+        for record in records:
+            self[record.superstep, record.node_name] = record
+
+    def __getitem__(self, key: tuple[int, str]) -> StepRecord:
+        return self._records[key]
+
+    def __iter__(self) -> Iterator[tuple[int, str]]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __setitem__(self, key: tuple[int, str], record: StepRecord) -> None:
+        if key in self._records:
+            del self[key]
+        entry = (_step_sort_key(record), key)
+        if self._order and entry < self._order[-1]:
+            bisect.insort(self._order, entry)
+            self._state = None
+        else:
+            self._order.append(entry)
+        self._records[key] = record
+
+    def __delitem__(self, key: tuple[int, str]) -> None:
+        record = self._records.pop(key)
+        del self._order[bisect.bisect_left(self._order, (_step_sort_key(record), key))]
+        self._state = None
+
+    def ordered(self) -> list[StepRecord]:
+        """Every step in fold order."""
+        return [self._records[key] for _, key in self._order]
+
+    def state(self) -> dict[str, Any]:
+        """The fold of every step. Shared: callers copy before handing it out."""
+        if self._state is None:
+            self._state, self._folded = {}, 0
+        for _, key in self._order[self._folded :]:
+            values = self._records[key].values
+            if values:
+                self._state.update(values)
+        self._folded = len(self._order)
+        return self._state
+
+
 class MemoryCheckpointer(Checkpointer):
     """Simple async-only checkpointer backed by in-process memory.
 
     Attempt-ledger note: memory has no StepRecord buffering layer, so attempt
     reservations are immediate by nature. Its durability domain is the
     process — the ledger survives in-process resume, not process exit.
+
+    By default nothing is ever dropped. A long-lived service (pause/resume
+    behind a web handler, say) bounds the footprint by evicting finished
+    work: a root run and every run nested under it go together, once the
+    root has reached a terminal status. Active and paused runs are never
+    evicted.
+
+    Args:
+        max_runs: Finished root runs to keep; the least recently used
+            (finished or read) is evicted first.
+        max_bytes: Evict least recently used finished runs while the
+            estimated footprint (see ``footprint()``) is above this.
+        ttl: Evict a finished root run this long after it finished.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, max_runs: int | None = None, max_bytes: int | None = None, ttl: timedelta | None = None) -> None:
         super().__init__()
+        for name, limit in (("max_runs", max_runs), ("max_bytes", max_bytes)):
+            if limit is not None and limit < 0:
+                raise ValueError(
+                    f"{name} must be >= 0 or None, got {limit!r}.\n\nHow to fix:\n  Pass a non-negative limit, or None to keep every finished run"
+                )
         self._runs: dict[str, Run] = {}
         #: run_id -> the graph-boundary values that run started from.
         self._run_inputs: dict[str, dict[str, Any]] = {}
-        self._steps: dict[str, dict[tuple[int, str], StepRecord]] = {}
+        self._steps: dict[str, _RunSteps] = {}
         self._attempt_series: dict[str, AttemptSeries] = {}
         self._attempt_records: dict[str, dict[int, AttemptRecord]] = {}
         self._pending_nodes: dict[str, dict[tuple[int, str], PendingNode]] = {}
         # Insertion-ordered per run: the LAST entry is the current occurrence.
         self._pause_slots: dict[str, list[PauseSlot]] = {}
+        self._max_runs = max_runs
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._bytes = 0
+        self._input_bytes: dict[str, int] = {}
+        # Sized once on arrival (only when a byte budget needs a running
+        # total): a value mutated in place later must not skew it.
+        self._step_sizes: dict[str, dict[tuple[int, str], int]] = {}
+        self._evicted_runs = 0
+        # Eviction bookkeeping. Only ``create_run``/``open_attempt_series``
+        # feed the tree and series indexes — a checkpointer that never evicts
+        # (``LogCheckpointer`` replaying its log) never consults them.
+        self._children: dict[str, list[str]] = {}
+        self._run_series: dict[str, list[str]] = {}
+        #: Finished root runs, least recently used first -> when they finished.
+        self._finished: OrderedDict[str, datetime] = OrderedDict()
+        self._finish_times: deque[tuple[datetime, str]] = deque()
+
+    # === Step index ===
+
+    def _put_step(self, record: StepRecord) -> None:
+        key = (record.superstep, record.node_name)
+        run_steps = self._steps.get(record.run_id)
+        if run_steps is None:
+            run_steps = self._steps[record.run_id] = _RunSteps()
+        run_steps[key] = record
+        if self._max_bytes is not None:
+            sizes = self._step_sizes.setdefault(record.run_id, {})
+            size = _step_bytes(record)
+            self._bytes += size - sizes.get(key, 0)
+            sizes[key] = size
+
+    def _drop_step(self, run_id: str, key: tuple[int, str]) -> None:
+        run_steps = self._steps.get(run_id)
+        if run_steps is not None and run_steps.pop(key, None) is not None:
+            self._bytes -= self._step_sizes.get(run_id, {}).pop(key, 0)
+
+    def _replace_steps(self, run_id: str, records: Iterable[StepRecord]) -> None:
+        run_steps = self._steps[run_id] = _RunSteps(records)
+        if self._max_bytes is not None:
+            sizes = {key: _step_bytes(record) for key, record in run_steps.items()}
+            self._bytes += sum(sizes.values()) - sum(self._step_sizes.get(run_id, {}).values())
+            self._step_sizes[run_id] = sizes
+
+    def _clear(self) -> None:
+        """Forget everything (``LogCheckpointer`` rebuilds from disk after this)."""
+        for index in (self._runs, self._run_inputs, self._steps, self._attempt_series, self._attempt_records, self._pending_nodes, self._pause_slots):
+            index.clear()
+        for bookkeeping in (self._input_bytes, self._step_sizes, self._children, self._run_series, self._finished, self._finish_times):
+            bookkeeping.clear()
+        self._bytes = 0
+
+    def footprint(self) -> MemoryFootprint:
+        """Runs and steps held, their estimated size, and how many runs were evicted.
+
+        With ``max_bytes`` the size is the running total eviction works
+        from; without it, it is measured now, by walking everything held.
+        """
+        size = self._bytes
+        if self._max_bytes is None:
+            size = sum(_step_bytes(record) for run_steps in self._steps.values() for record in run_steps.values())
+            size += sum(_approx_size(inputs) for inputs in self._run_inputs.values())
+        return MemoryFootprint(
+            runs=len(self._runs),
+            steps=sum(len(run_steps) for run_steps in self._steps.values()),
+            bytes=size,
+            evicted_runs=self._evicted_runs,
+        )
+
+    # === Eviction ===
+
+    def _touch(self, run_id: str) -> None:
+        if run_id in self._finished:
+            self._finished.move_to_end(run_id)
+
+    def _track_finish(self, run: Run) -> None:
+        """Make a root run evictable once it is terminal; a resumed one is not."""
+        if run.status in _TERMINAL_STATUSES and (run.parent_run_id is None or run.parent_run_id not in self._runs):
+            finished_at = run.completed_at or datetime.now(timezone.utc)
+            self._finished[run.id] = finished_at
+            self._finished.move_to_end(run.id)
+            if self._ttl is not None:
+                self._finish_times.append((finished_at, run.id))
+        else:
+            self._finished.pop(run.id, None)
+
+    def _tree(self, run_id: str) -> list[str]:
+        tree = [run_id]
+        for current in tree:
+            tree.extend(self._children.get(current, ()))
+        return tree
+
+    def _evict_tree(self, root_id: str) -> bool:
+        """Drop a finished root and everything nested under it; False if any run is still live."""
+        tree = self._tree(root_id)
+        if any((run := self._runs.get(run_id)) is not None and run.status not in _TERMINAL_STATUSES for run_id in tree):
+            return False
+        for run_id in tree:
+            if self._runs.pop(run_id, None) is not None:
+                self._evicted_runs += 1
+            self._run_inputs.pop(run_id, None)
+            self._bytes -= self._input_bytes.pop(run_id, 0)
+            self._steps.pop(run_id, None)
+            self._bytes -= sum(self._step_sizes.pop(run_id, {}).values())
+            self._pending_nodes.pop(run_id, None)
+            self._pause_slots.pop(run_id, None)
+            self._children.pop(run_id, None)
+            for series_id in self._run_series.pop(run_id, ()):
+                self._attempt_series.pop(series_id, None)
+                self._attempt_records.pop(series_id, None)
+        self._finished.pop(root_id, None)
+        return True
+
+    def _evict(self) -> None:
+        """Apply ``ttl``, then ``max_runs`` and ``max_bytes``, to finished root runs."""
+        if self._ttl is not None:
+            cutoff = datetime.now(timezone.utc) - self._ttl
+            while self._finish_times and self._finish_times[0][0] <= cutoff:
+                finished_at, run_id = self._finish_times.popleft()
+                if self._finished.get(run_id) == finished_at:
+                    self._evict_tree(run_id)
+
+        def over() -> bool:
+            return (self._max_runs is not None and len(self._finished) > self._max_runs) or (
+                self._max_bytes is not None and self._bytes > self._max_bytes
+            )
+
+        if over():
+            for run_id in list(self._finished):
+                if self._evict_tree(run_id) and not over():
+                    break
 
     async def save_step(self, record: StepRecord) -> None:
-        run_steps = self._steps.setdefault(record.run_id, {})
-        run_steps[(record.superstep, record.node_name)] = record
+        self._put_step(record)
         self._apply_retention_policy(record.run_id)
+        self._evict()
 
     # === Pending node boundaries (PRD 0013) ===
 
@@ -138,14 +375,14 @@ class MemoryCheckpointer(Checkpointer):
         WHOLE stored row alone, question included.
         """
         for record in step_records:
-            run_steps = self._steps.setdefault(record.run_id, {})
-            run_steps[(record.superstep, record.node_name)] = record
+            self._put_step(record)
         if step_records:
             self._apply_retention_policy(slot.run_id)
         occurrences = self._pause_slots.setdefault(slot.run_id, [])
         if not any(item.pause_id == slot.pause_id for item in occurrences):
             occurrences.append(slot)
         self._apply_run_status(slot.run_id, WorkflowStatus.PAUSED, totals)
+        self._evict()
 
     async def get_pause_slot(self, run_id: str, *, pause_id: str | None = None) -> PauseSlot | None:
         """The run's current pause occurrence, or a named earlier one."""
@@ -193,6 +430,11 @@ class MemoryCheckpointer(Checkpointer):
         # only the interrupt answer and must not clobber the originals.
         if inputs and run_id not in self._run_inputs:
             self._run_inputs[run_id] = dict(inputs)
+            if self._max_bytes is not None:
+                self._input_bytes[run_id] = _approx_size(self._run_inputs[run_id])
+                self._bytes += self._input_bytes[run_id]
+        if existing is None and parent_run_id is not None:
+            self._children.setdefault(parent_run_id, []).append(run_id)
         run = Run(
             id=run_id,
             status=WorkflowStatus.ACTIVE,
@@ -210,6 +452,7 @@ class MemoryCheckpointer(Checkpointer):
             completed_at=None,
         )
         self._runs[run_id] = run
+        self._finished.pop(run_id, None)
         return run
 
     async def update_run_status(
@@ -222,6 +465,7 @@ class MemoryCheckpointer(Checkpointer):
         error_count: int | None = None,
     ) -> None:
         self._apply_run_status(run_id, status, RunTotals(duration_ms, node_count, error_count))
+        self._evict()
 
     def _apply_run_status(self, run_id: str, status: WorkflowStatus, totals: RunTotals) -> None:
         """Write one status transition. Deliberately NOT a coroutine.
@@ -240,26 +484,37 @@ class MemoryCheckpointer(Checkpointer):
             duration_ms=totals.duration_ms if totals.duration_ms is not None else existing.duration_ms,
             node_count=totals.node_count if totals.node_count is not None else existing.node_count,
             error_count=totals.error_count if totals.error_count is not None else existing.error_count,
-            completed_at=(
-                datetime.now(timezone.utc)
-                if status in {WorkflowStatus.COMPLETED, WorkflowStatus.FAILED, WorkflowStatus.PARTIAL, WorkflowStatus.STOPPED}
-                else None
-            ),
+            completed_at=datetime.now(timezone.utc) if status in _TERMINAL_STATUSES else None,
         )
+        self._track_finish(self._runs[run_id])
 
     async def get_run_inputs(self, run_id: str) -> dict[str, Any]:
         """The graph-boundary values this run started from."""
         return dict(self._run_inputs.get(run_id, {}))
 
-    async def get_state(self, run_id: str, *, superstep: int | None = None) -> dict[str, Any]:
-        state: dict[str, Any] = {}
-        records = list(self._steps.get(run_id, {}).values())
-        if superstep is not None:
-            records = [record for record in records if record.superstep <= superstep]
-        for step in sorted(records, key=_step_sort_key):
-            if step.values:
-                state.update(step.values)
-        return state
+    async def get_state(
+        self,
+        run_id: str,
+        *,
+        superstep: int | None = None,
+        keys: Sequence[str] | None = None,
+    ) -> dict[str, Any]:
+        """Folded state: O(keys) from the run's cached fold, a walk of its steps with ``superstep``."""
+        self._touch(run_id)
+        run_steps = self._steps.get(run_id)
+        if not run_steps:
+            return {}
+        if superstep is None:
+            state = run_steps.state()
+        else:
+            state = _merge_state([record for record in run_steps.ordered() if record.superstep <= superstep], presorted=True)
+        if keys is not None:
+            return {key: state[key] for key in dict.fromkeys(keys) if key in state}
+        return dict(state)
+
+    async def get_states(self, run_ids: Sequence[str], *, keys: Sequence[str] | None = None) -> dict[str, dict[str, Any]]:
+        """Folded state for several runs at once. Runs with no steps are absent."""
+        return {run_id: await self.get_state(run_id, keys=keys) for run_id in run_ids if self._steps.get(run_id)}
 
     async def get_steps(
         self,
@@ -268,18 +523,20 @@ class MemoryCheckpointer(Checkpointer):
         superstep: int | None = None,
         show_internal: bool = False,
     ) -> list[StepRecord]:
-        run_steps = self._steps.get(run_id, {})
-        records = list(run_steps.values())
+        self._touch(run_id)
+        run_steps = self._steps.get(run_id)
+        records = run_steps.ordered() if run_steps is not None else []
         if superstep is not None:
             records = [record for record in records if record.superstep <= superstep]
         if not show_internal:
             records = [record for record in records if record.node_name != _BASELINE_NODE_NAME and record.node_type != _BASELINE_NODE_TYPE]
-        return sorted(records, key=_step_sort_key)
+        return records
 
     async def get_run_async(self, run_id: str) -> Run | None:
         run = self._runs.get(run_id)
         if run is None:
             return None
+        self._touch(run_id)
         occurrences = self._pause_slots.get(run_id)
         if not occurrences:
             return run
@@ -350,6 +607,7 @@ class MemoryCheckpointer(Checkpointer):
         )
         self._attempt_series[series.id] = series
         self._attempt_records[series.id] = {}
+        self._run_series.setdefault(run_id, []).append(series.id)
         return series
 
     async def get_attempt_series(self, series_id: str) -> AttemptSeries | None:
@@ -453,12 +711,12 @@ class MemoryCheckpointer(Checkpointer):
         # write here. The attempt settle and series close below are pure dict
         # assignments, so a step-write failure leaves the series open with the
         # attempt unsettled — the atomic-close outcome.
-        run_steps = self._steps.setdefault(step_record.run_id, {})
-        run_steps[(step_record.superstep, step_record.node_name)] = step_record
+        self._put_step(step_record)
         if settle:
             records[attempt_number] = replace(record, status=status, completed_at=now, error=error)  # type: ignore[assignment,type-var]
         self._attempt_series[series_id] = replace(series, closed_at=now, committed_superstep=step_record.superstep)
         self._apply_retention_policy(step_record.run_id)
+        self._evict()
 
     async def resolve_stranded_attempts(self, series_id: str) -> list[AttemptRecord]:
         _require_series(self._attempt_series.get(series_id), series_id)
@@ -506,7 +764,7 @@ class MemoryCheckpointer(Checkpointer):
             return
 
         if retention == "latest":
-            ordered = sorted(run_steps.values(), key=_step_sort_key)
+            ordered = run_steps.ordered()
             latest_by_node: dict[str, StepRecord] = {}
             for record in ordered:
                 if record.node_name == _BASELINE_NODE_NAME:
@@ -520,13 +778,13 @@ class MemoryCheckpointer(Checkpointer):
                 baseline_superstep=(min((record.superstep for record in kept), default=0) - 1),
             )
             retained = [*([baseline] if baseline is not None else []), *kept]
-            self._steps[run_id] = {(record.superstep, record.node_name): record for record in retained}
+            self._replace_steps(run_id, retained)
             self._prune_pending_nodes_for_dropped(run_id, dropped)
             self._prune_attempt_series_for_dropped(dropped)
             return
 
         if retention == "windowed" and self.policy.window is not None:
-            ordered = sorted(run_steps.values(), key=_step_sort_key)
+            ordered = run_steps.ordered()
             non_baseline = [record for record in ordered if record.node_name != _BASELINE_NODE_NAME]
             if not non_baseline:
                 return
@@ -538,14 +796,14 @@ class MemoryCheckpointer(Checkpointer):
             dropped = [record for record in ordered if record.node_name == _BASELINE_NODE_NAME or record.superstep < cutoff]
             baseline = _make_baseline_record(run_id, dropped, baseline_superstep=cutoff - 1)
             retained = [*([baseline] if baseline is not None else []), *kept]
-            self._steps[run_id] = {(record.superstep, record.node_name): record for record in retained}
+            self._replace_steps(run_id, retained)
             self._prune_pending_nodes_for_dropped(run_id, dropped)
             self._prune_attempt_series_for_dropped(dropped)
 
 
-def _merge_state(records: list[StepRecord]) -> dict[str, Any]:
+def _merge_state(records: list[StepRecord], *, presorted: bool = False) -> dict[str, Any]:
     state: dict[str, Any] = {}
-    for record in sorted(records, key=_step_sort_key):
+    for record in records if presorted else sorted(records, key=_step_sort_key):
         if record.values:
             state.update(record.values)
     return state
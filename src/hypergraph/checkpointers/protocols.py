@@ -22,6 +22,7 @@ which additionally requires every method of the seam to exist and be callable.
 
 from __future__ import annotations
 
+import inspect
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
@@ -60,6 +61,26 @@ def probe_seam(checkpointer: object | None, protocol: type, methods: Sequence[st
     return all(callable(getattr(checkpointer, name, None)) for name in methods)
 
 
+def state_keys_kwargs(method: Any, keys: Sequence[str] | None) -> dict[str, Any]:
+    """``{"keys": keys}`` when the state read ``method`` accepts it, else ``{}``.
+
+    ``keys`` joined ``get_state``/``state``/``get_states`` after third-party
+    checkpointers already implemented them. Checked by signature, like
+    ``TableStore.supports_projection``: a method that predates the parameter
+    is called the old way and returns the whole state, which the caller
+    narrows itself. ``keys=None`` never needs the parameter.
+    """
+    if keys is None:
+        return {}
+    try:
+        params = inspect.signature(method).parameters.values()
+    except (TypeError, ValueError):
+        return {}
+    if any(param.name == "keys" or param.kind is inspect.Parameter.VAR_KEYWORD for param in params):
+        return {"keys": keys}
+    return {}
+
+
 @runtime_checkable
 class SyncCheckpointerProtocol(Protocol):
     """Sync write operations for checkpointers used with SyncRunner.
@@ -176,3 +197,24 @@ class SyncPauseSlotProtocol(Protocol):
     def get_pause_slot_sync(self, run_id: str, *, pause_id: str | None = None) -> PauseSlot | None: ...
 
     def settle_pause_sync(self, run_id: str, *, pause_id: str | None = None, value: Any) -> PauseSlot: ...
+
+
+@runtime_checkable
+class BulkStateProtocol(Protocol):
+    """Async several-runs-at-once state fold — optional.
+
+    A resumed ``runner.map`` restores every completed child from its folded
+    state. One ``get_state`` per child is one round trip each; a checkpointer
+    with this seam answers a whole chunk of children in one. Runs with no
+    steps may be absent from the result — callers read them as ``{}``.
+    ``keys`` narrows each state to the outputs the caller will actually read.
+    """
+
+    async def get_states(self, run_ids: Sequence[str], *, keys: Sequence[str] | None = None) -> dict[str, dict[str, Any]]: ...
+
+
+@runtime_checkable
+class SyncBulkStateProtocol(Protocol):
+    """Sync mirror of :class:`BulkStateProtocol`."""
+
+    def get_states_sync(self, run_ids: Sequence[str], *, keys: Sequence[str] | None = None) -> dict[str, dict[str, Any]]: ...
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
+import struct
+import sys
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -84,3 +87,155 @@ class PickleSerializer(Serializer):
         import pickle
 
         return pickle.loads(data)  # noqa: S301
+
+
+# MsgpackSerializer blob layout. The first byte says how the rest is framed;
+# neither tag can open a JSON document, so a store that switches from
+# JsonSerializer keeps reading the rows it already wrote. A plain frame is
+# ``tag | u32 body length | msgpack body | padding | buffers``. The buffer
+# region starts at the first 64-byte boundary after the body, and buffer
+# offsets count from the start of that region, not from the frame's first
+# byte; each offset is itself a multiple of 64, so every buffer still sits on
+# a 64-byte boundary of the frame. A zstd blob is the tag followed by a whole
+# compressed plain frame, which decompresses to the same layout.
+_TAG_PLAIN = 0x00
+_TAG_ZSTD = 0x01
+_EXT_NDARRAY = 1
+_EXT_ARROW = 2
+_BUFFER_ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _BUFFER_ALIGNMENT) * _BUFFER_ALIGNMENT
+
+
+class MsgpackSerializer(Serializer):
+    """Binary msgpack serializer with out-of-band array buffers.
+
+    Plain values (dicts, lists, str, bytes, numbers) are msgpack-encoded.
+    NumPy arrays and pyarrow Tables/RecordBatches are written as raw buffers
+    AFTER the msgpack body, 64-byte aligned, and referenced from it — so an
+    embedding matrix costs its ``nbytes`` rather than a JSON list of floats,
+    and decoding wraps the stored bytes (``np.frombuffer``, Arrow IPC)
+    instead of copying them. Restored arrays are therefore READ-ONLY views;
+    ``.copy()`` one to mutate it.
+
+    Pydantic models and dataclasses are stored as dicts, exactly as
+    ``JsonSerializer`` stores them. Tuples come back as lists.
+
+    Args:
+        zstd_level: Compress blobs of at least ``compress_min_bytes`` with
+            zstd at this level (requires ``zstandard``). None (default)
+            stores them uncompressed, which keeps array buffers zero-copy.
+        compress_min_bytes: Smaller blobs are never compressed — the frame
+            overhead outweighs the gain.
+        lossy: Fall back to ``str()`` for unsupported types instead of
+            raising ``TypeError``.
+
+    Requires ``msgpack``: ``pip install 'hypergraph-ai[msgpack]'``.
+    """
+
+    def __init__(self, *, zstd_level: int | None = None, compress_min_bytes: int = 1024, lossy: bool = False):
+        try:
+            import msgpack
+        except ImportError:
+            raise ImportError("MsgpackSerializer requires msgpack. Install it with: pip install 'hypergraph-ai[msgpack]'") from None
+        if zstd_level is not None:
+            try:
+                import zstandard
+            except ImportError:
+                raise ImportError(
+                    "MsgpackSerializer(zstd_level=...) requires zstandard. Install it with: pip install 'hypergraph-ai[msgpack]'"
+                ) from None
+            self._compressor = zstandard.ZstdCompressor(level=zstd_level)
+            self._decompressor = zstandard.ZstdDecompressor()
+        else:
+            self._compressor = None
+            self._decompressor = None
+        self._msgpack = msgpack
+        self._compress_min_bytes = compress_min_bytes
+        self._lossy = lossy
+
+    def serialize(self, value: Any) -> bytes:
+        buffers: list[tuple[int, Any]] = []
+        cursor = 0
+
+        def place(buffer: Any) -> int:
+            nonlocal cursor
+            start = _align(cursor)
+            buffers.append((start, buffer))
+            cursor = start + len(buffer)
+            return start
+
+        def default(obj: Any) -> Any:
+            np = sys.modules.get("numpy")
+            if np is not None and isinstance(obj, np.ndarray):
+                if obj.dtype.hasobject:
+                    return obj.tolist()
+                array = np.ascontiguousarray(obj)
+                raw = memoryview(array).cast("B") if array.nbytes else b""
+                header = [place(raw), array.nbytes, np.lib.format.dtype_to_descr(array.dtype), list(array.shape)]
+                return self._msgpack.ExtType(_EXT_NDARRAY, self._msgpack.packb(header))
+            if np is not None and isinstance(obj, np.generic):
+                return obj.item()
+            pa = sys.modules.get("pyarrow")
+            if pa is not None and isinstance(obj, (pa.Table, pa.RecordBatch)):
+                sink = pa.BufferOutputStream()
+                with pa.ipc.new_stream(sink, obj.schema) as writer:
+                    writer.write(obj)
+                raw = memoryview(sink.getvalue())
+                kind = "table" if isinstance(obj, pa.Table) else "batch"
+                return self._msgpack.ExtType(_EXT_ARROW, self._msgpack.packb([place(raw), len(raw), kind]))
+            if hasattr(obj, "model_dump"):
+                return obj.model_dump()
+            if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+                return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+            if self._lossy:
+                return str(obj)
+            raise TypeError(f"Object of type {type(obj).__name__} is not msgpack serializable")
+
+        body = self._msgpack.packb(value, default=default, use_bin_type=True)
+        head = struct.pack("<BI", _TAG_PLAIN, len(body))
+        region = _align(len(head) + len(body))
+        parts = [head, body, b"\0" * (region - len(head) - len(body))]
+        end = 0
+        for start, buffer in buffers:
+            parts.append(b"\0" * (start - end))
+            parts.append(buffer)
+            end = start + len(buffer)
+        frame = b"".join(parts)
+        if self._compressor is not None and len(frame) >= self._compress_min_bytes:
+            return bytes([_TAG_ZSTD]) + self._compressor.compress(frame)
+        return frame
+
+    def deserialize(self, data: bytes) -> Any:
+        if not data or data[0] not in (_TAG_PLAIN, _TAG_ZSTD):
+            return json.loads(bytes(data).decode("utf-8"))
+        frame = memoryview(data)
+        if data[0] == _TAG_ZSTD:
+            if self._decompressor is None:
+                import zstandard
+
+                self._decompressor = zstandard.ZstdDecompressor()
+            frame = memoryview(self._decompressor.decompress(frame[1:]))
+        _, body_len = struct.unpack_from("<BI", frame)
+        head = struct.calcsize("<BI")
+        region = frame[_align(head + body_len) :]
+
+        def ext_hook(code: int, ext: bytes) -> Any:
+            if code == _EXT_NDARRAY:
+                import numpy as np
+
+                start, nbytes, descr, shape = self._msgpack.unpackb(ext)
+                dtype = np.lib.format.descr_to_dtype(descr)
+                count = nbytes // dtype.itemsize if dtype.itemsize else 0
+                return np.frombuffer(region, dtype=dtype, count=count, offset=start).reshape(shape)
+            if code == _EXT_ARROW:
+                import pyarrow as pa
+
+                start, nbytes, kind = self._msgpack.unpackb(ext)
+                reader = pa.ipc.open_stream(pa.py_buffer(region[start : start + nbytes]))
+                return reader.read_all() if kind == "table" else reader.read_next_batch()
+            return self._msgpack.ExtType(code, ext)
+
+        return self._msgpack.unpackb(frame[head : head + body_len], ext_hook=ext_hook, raw=False, strict_map_key=False)
@@ -0,0 +1,568 @@
+"""Sharded SQLite checkpointer: runs spread across N database files.
+
+One ``SqliteCheckpointer`` commits every write through one WAL writer, so a
+``runner.map`` with thousands of concurrent children queues all their step
+writes behind a single lock. ``ShardedSqliteCheckpointer`` hashes each run
+id onto one of N ``SqliteCheckpointer`` shards — separate files, separate
+writers — so writes for runs on different shards commit in parallel.
+
+Everything about one run (its row, steps, attempt ledger, pending nodes,
+pause slots) lives on that run's shard, so every per-run operation is one
+ordinary transaction on one shard. Runs are placed by their own id, not by
+their root workflow: a map's children are exactly the writes worth
+spreading, and ``parent_run_id`` / ``child_run_id`` carry no foreign key
+since schema v5, so nesting may cross shards. ``forked_from`` and
+``retry_of`` do reference their source run, so a fork or retry is placed
+on its source's shard instead; the few runs that do not sit on their hash
+shard are recorded in ``placement.db`` beside the shards, which every
+``create_run`` consults so a fork made by another process is found too.
+Queries over many runs — ``list_runs``, ``count_runs``, ``search_async``,
+``get_states``, lineage — fan out to every shard concurrently and merge.
+
+The shard count is part of the layout: each file is named
+``shard-<i>-of-<n>.db``, and opening a directory with a different count
+raises instead of silently routing runs to the wrong file.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import re
+import sqlite3
+import threading
+import zlib
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Literal
+
+from hypergraph.checkpointers._delta import DeltaValues
+from hypergraph.checkpointers._search_index import SearchIndexMode
+from hypergraph.checkpointers.base import _UNSET, Checkpointer, CheckpointPolicy
+from hypergraph.checkpointers.serializers import Serializer
+from hypergraph.checkpointers.sqlite import SqliteCheckpointer, _lineage_parent_id, _lineage_rows
+from hypergraph.checkpointers.types import (
+    NO_RUN_TOTALS,
+    AttemptError,
+    AttemptRecord,
+    AttemptSeries,
+    AttemptStatus,
+    LineageView,
+    NodeBoundary,
+    PauseSlot,
+    PendingNode,
+    Run,
+    RunTable,
+    RunTotals,
+    SearchResults,
+    StepRecord,
+    StepTable,
+    WorkflowStatus,
+)
+
+_SHARD_FILE = re.compile(r"shard-(\d+)-of-(\d+)\.db")
+
+_PLACEMENT_FILE = "placement.db"
+# Run ids per registry ``IN (...)`` query, under SQLite's host-parameter limit.
+_PLACEMENT_LOOKUP_BATCH = 500
+_CREATE_PLACEMENTS = "CREATE TABLE IF NOT EXISTS placements (run_id TEXT PRIMARY KEY, shard INTEGER NOT NULL)"
+
+
+def _shard_file(index: int, count: int) -> str:
+    return f"shard-{index:03d}-of-{count:03d}.db"
+
+
+def _check_shard_count(shards: int) -> int:
+    if isinstance(shards, bool) or not isinstance(shards, int) or shards < 1:
+        raise ValueError(f"shards must be an int >= 1, got {shards!r}.\n\nHow to fix:\n  shards=4  # four database files, four writers")
+    return shards
+
+
+def _check_layout(directory: Path, shards: int) -> None:
+    """Refuse a directory laid out for a different shard count."""
+    counts = {int(match.group(2)) for item in directory.iterdir() if (match := _SHARD_FILE.fullmatch(item.name))}
+    stale = counts - {shards}
+    if stale:
+        raise ValueError(
+            f"{directory} holds a {sorted(stale)[0]}-shard checkpointer; opening it with shards={shards} "
+            "would look for every run in the wrong file.\n\n"
+            "How to fix:\n"
+            f"  ShardedSqliteCheckpointer({str(directory)!r}, shards={sorted(stale)[0]})"
+        )
+
+
+def _step_time(step: StepRecord) -> tuple[datetime, datetime]:
+    """Sort key matching SQLite's ``_STEP_TIME_ORDER_DESC`` (newest first when reversed)."""
+    return (step.completed_at or step.created_at, step.created_at)
+
+
+def _take(items: Iterable[Any], limit: int | None) -> list[Any]:
+    return list(items if limit is None else itertools.islice(items, limit))
+
+
+class ShardedSqliteCheckpointer(Checkpointer):
+    """SQLite run persistence spread over ``shards`` files for parallel writes.
+
+    Best for: one machine running large ``runner.map`` jobs or many
+    concurrent workflows, where a single database file's writer lock is the
+    bottleneck. Every shard is an ordinary ``SqliteCheckpointer``, so each
+    file can still be opened and inspected on its own.
+
+    Like ``LogCheckpointer`` it is async-only: ``AsyncRunner`` works,
+    ``SyncRunner`` does not. ``compact()`` is not offered — TTL expiry walks
+    a run's whole tree and its fork dependents, which may span shards.
+
+    Args:
+        path: Directory holding the shard files (created if missing).
+        shards: Number of database files (default 4). Fixed once the
+            directory has been written.
+        durability, retention, policy, serializer, read_connections,
+            dedupe_values, search_index, delta_values: Passed to every
+            shard (see ``SqliteCheckpointer``). ``read_connections`` is per
+            shard.
+
+    Example::
+
+        checkpointer = ShardedSqliteCheckpointer("./runs", shards=8)
+        runner = AsyncRunner(checkpointer=checkpointer)
+        await runner.map(graph, {"doc": docs}, map_over="doc", workflow_id="ingest")
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        shards: int = 4,
+        durability: Literal["sync", "async", "exit"] | None = None,
+        retention: Literal["full", "latest", "windowed"] | None = None,
+        policy: CheckpointPolicy | None = None,
+        serializer: Serializer | None = None,
+        read_connections: int = 2,
+        dedupe_values: bool = False,
+        search_index: SearchIndexMode | None = None,
+        delta_values: DeltaValues = False,
+    ):
+        shards = _check_shard_count(shards)
+        self._path = Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+        _check_layout(self._path, shards)
+        self._shards = tuple(
+            SqliteCheckpointer(
+                self._path / _shard_file(index, shards),
+                durability=durability,
+                retention=retention,
+                policy=policy,
+                serializer=serializer,
+                read_connections=read_connections,
+                dedupe_values=dedupe_values,
+                search_index=search_index,
+                delta_values=delta_values,
+            )
+            for index in range(shards)
+        )
+        super().__init__(policy=self._shards[0].policy)
+        # Attempt-ledger calls after ``open_attempt_series`` name only the
+        # series; remember which shard holds each one this process has seen.
+        self._series_shards: dict[str, SqliteCheckpointer] = {}
+        self._placements: dict[str, int] = {}
+        self._placement_conn: sqlite3.Connection | None = None
+        self._placement_lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"ShardedSqliteCheckpointer({str(self._path)!r}, shards={len(self._shards)})"
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def shards(self) -> tuple[SqliteCheckpointer, ...]:
+        """The shard checkpointers, in file order."""
+        return self._shards
+
+    def shard_for(self, run_id: str) -> SqliteCheckpointer:
+        """The shard that holds ``run_id``: its fork source's, else a stable crc32 of the id.
+
+        Reads the placement registry on the calling thread when this process
+        has not seen ``run_id``; async callers route through a worker thread.
+        """
+        index = self._placements.get(run_id)
+        if index is None:
+            index = self._lookup_placements([run_id]).get(run_id, self._hash_index(run_id))
+        return self._shards[index]
+
+    def _hash_index(self, run_id: str) -> int:
+        return zlib.crc32(run_id.encode()) % len(self._shards)
+
+    # === Placement registry ===
+    #
+    # Written only when a fork or retry lands away from its own hash shard.
+    # Another process on the same directory may pin runs this one has never
+    # seen, so a run missing from ``_placements`` is looked up before it
+    # falls back to its hash shard. Registry IO runs in a worker thread.
+
+    def _placement_db(self) -> sqlite3.Connection:
+        if self._placement_conn is None:
+            conn = sqlite3.connect(self._path / _PLACEMENT_FILE, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_CREATE_PLACEMENTS)
+            conn.commit()
+            self._placement_conn = conn
+        return self._placement_conn
+
+    def _lookup_placements(self, run_ids: Sequence[str]) -> dict[str, int]:
+        """Pinned shards for ``run_ids`` from the registry, remembered once found."""
+        found: dict[str, int] = {}
+        with self._placement_lock:
+            db = self._placement_db()
+            for start in range(0, len(run_ids), _PLACEMENT_LOOKUP_BATCH):
+                batch = run_ids[start : start + _PLACEMENT_LOOKUP_BATCH]
+                marks = ", ".join("?" * len(batch))
+                found.update(db.execute(f"SELECT run_id, shard FROM placements WHERE run_id IN ({marks})", batch))
+        self._placements.update(found)
+        return found
+
+    def _pin(self, run_id: str, index: int) -> None:
+        with self._placement_lock:
+            db = self._placement_db()
+            db.execute("INSERT OR REPLACE INTO placements (run_id, shard) VALUES (?, ?)", (run_id, index))
+            db.commit()
+        self._placements[run_id] = index
+
+    async def _shard(self, run_id: str) -> SqliteCheckpointer:
+        """``shard_for`` with the registry read kept off the event loop."""
+        index = self._placements.get(run_id)
+        if index is None:
+            found = await asyncio.to_thread(self._lookup_placements, [run_id])
+            index = found.get(run_id, self._hash_index(run_id))
+        return self._shards[index]
+
+    async def _place(self, run_id: str, source_run_id: str | None) -> SqliteCheckpointer:
+        """Place a new run: on the shard of the run it forks or retries, else its hash shard."""
+        shard = await self._shard(run_id if source_run_id is None else source_run_id)
+        index = self._shards.index(shard)
+        if source_run_id is not None and index != self._hash_index(run_id):
+            await asyncio.to_thread(self._pin, run_id, index)
+        else:
+            # Created here, so final: later calls skip the registry.
+            self._placements[run_id] = index
+        return shard
+
+    async def _group(self, run_ids: Sequence[str]) -> dict[SqliteCheckpointer, list[str]]:
+        unseen = [run_id for run_id in dict.fromkeys(run_ids) if run_id not in self._placements]
+        if unseen:
+            await asyncio.to_thread(self._lookup_placements, unseen)
+        groups: dict[SqliteCheckpointer, list[str]] = {}
+        for run_id in run_ids:
+            groups.setdefault(self._shards[self._placements.get(run_id, self._hash_index(run_id))], []).append(run_id)
+        return groups
+
+    async def _series_shard(self, series_id: str) -> SqliteCheckpointer:
+        shard = self._series_shards.get(series_id)
+        if shard is not None:
+            return shard
+        found = await asyncio.gather(*(shard.get_attempt_series(series_id) for shard in self._shards))
+        for shard, series in zip(self._shards, found, strict=True):
+            if series is not None:
+                self._series_shards[series_id] = shard
+                return shard
+        # Unknown everywhere: any shard answers with the usual unknown-series
+        # result or error.
+        return self._shards[0]
+
+    def _remember_series(self, shard: SqliteCheckpointer, series: AttemptSeries | None) -> AttemptSeries | None:
+        if series is not None:
+            self._series_shards[series.id] = shard
+        return series
+
+    # === Write Operations ===
+
+    async def save_step(self, record: StepRecord) -> None:
+        await (await self._shard(record.run_id)).save_step(record)
+
+    async def create_run(
+        self,
+        run_id: str,
+        *,
+        graph_name: str | None = None,
+        parent_run_id: str | None = None,
+        forked_from: str | None = None,
+        fork_superstep: int | None = None,
+        retry_of: str | None = None,
+        retry_index: int | None = None,
+        config: dict[str, Any] | None = None,
+        inputs: dict[str, Any] | None = None,
+    ) -> Run:
+        shard = await self._place(run_id, forked_from or retry_of)
+        return await shard.create_run(
+            run_id,
+            graph_name=graph_name,
+            parent_run_id=parent_run_id,
+            forked_from=forked_from,
+            fork_superstep=fork_superstep,
+            retry_of=retry_of,
+            retry_index=retry_index,
+            config=config,
+            inputs=inputs,
+        )
+
+    async def update_run_status(
+        self,
+        run_id: str,
+        status: WorkflowStatus,
+        *,
+        duration_ms: float | None = None,
+        node_count: int | None = None,
+        error_count: int | None = None,
+    ) -> None:
+        await (await self._shard(run_id)).update_run_status(
+            run_id,
+            status,
+            duration_ms=duration_ms,
+            node_count=node_count,
+            error_count=error_count,
+        )
+
+    async def record_pending_nodes(self, boundaries: Sequence[PendingNode]) -> None:
+        groups = await self._group([boundary.run_id for boundary in boundaries])
+        shard_of = {run_id: shard for shard, run_ids in groups.items() for run_id in run_ids}
+        by_shard: dict[SqliteCheckpointer, list[PendingNode]] = {}
+        for boundary in boundaries:
+            by_shard.setdefault(shard_of[boundary.run_id], []).append(boundary)
+        await asyncio.gather(*(shard.record_pending_nodes(group) for shard, group in by_shard.items()))
+
+    async def record_pause(
+        self,
+        slot: PauseSlot,
+        *,
+        step_records: Sequence[StepRecord] = (),
+        totals: RunTotals = NO_RUN_TOTALS,
+    ) -> None:
+        await (await self._shard(slot.run_id)).record_pause(slot, step_records=step_records, totals=totals)
+
+    async def settle_pause(self, run_id: str, *, pause_id: str | None = None, value: Any) -> PauseSlot:
+        return await (await self._shard(run_id)).settle_pause(run_id, pause_id=pause_id, value=value)
+
+    # === Read Operations ===
+
+    async def get_state(
+        self,
+        run_id: str,
+        *,
+        superstep: int | None = None,
+        keys: Sequence[str] | None = None,
+    ) -> dict[str, Any]:
+        return await (await self._shard(run_id)).get_state(run_id, superstep=superstep, keys=keys)
+
+    async def get_states(self, run_ids: Sequence[str], *, keys: Sequence[str] | None = None) -> dict[str, dict[str, Any]]:
+        """Fold several runs' states, one bulk read per shard, concurrently."""
+        groups = await self._group(run_ids)
+        parts = await asyncio.gather(*(shard.get_states(ids, keys=keys) for shard, ids in groups.items()))
+        states: dict[str, dict[str, Any]] = {}
+        for part in parts:
+            states.update(part)
+        return states
+
+    async def get_steps(
+        self,
+        run_id: str,
+        *,
+        superstep: int | None = None,
+        show_internal: bool = False,
+    ) -> list[StepRecord]:
+        return await (await self._shard(run_id)).get_steps(run_id, superstep=superstep, show_internal=show_internal)
+
+    async def get_run_inputs(self, run_id: str) -> dict[str, Any]:
+        return await (await self._shard(run_id)).get_run_inputs(run_id)
+
+    async def get_run_async(self, run_id: str) -> Run | None:
+        return await (await self._shard(run_id)).get_run_async(run_id)
+
+    async def get_node_boundaries(self, run_id: str) -> list[NodeBoundary]:
+        return await (await self._shard(run_id)).get_node_boundaries(run_id)
+
+    async def get_pause_slot(self, run_id: str, *, pause_id: str | None = None) -> PauseSlot | None:
+        return await (await self._shard(run_id)).get_pause_slot(run_id, pause_id=pause_id)
+
+    async def list_runs(
+        self,
+        *,
+        status: WorkflowStatus | None = None,
+        graph_name: str | None = None,
+        since: datetime | None = None,
+        parent_run_id: str | None | object = _UNSET,
+        limit: int | None = 100,
+    ) -> list[Run]:
+        """List runs across every shard, newest first.
+
+        Each shard returns at most ``limit`` of its own newest matches, and
+        the sorted lists are merged, so no shard is read past what could
+        make the final page.
+        """
+        filters: dict[str, Any] = {"status": status, "graph_name": graph_name, "since": since, "limit": limit}
+        if parent_run_id is not _UNSET:
+            filters["parent_run_id"] = parent_run_id
+        pages = await asyncio.gather(*(shard.list_runs(**filters) for shard in self._shards))
+        return RunTable(_take(heapq.merge(*pages, key=lambda run: run.created_at, reverse=True), limit))
+
+    async def count_runs(
+        self,
+        *,
+        status: WorkflowStatus | None = None,
+        parent_run_id: str | None | object = _UNSET,
+        retry_of: str | None = None,
+    ) -> int:
+        counts = await asyncio.gather(*(shard.count_runs(status=status, parent_run_id=parent_run_id, retry_of=retry_of) for shard in self._shards))
+        return sum(counts)
+
+    async def search_async(self, query: str, *, field: str | None = None, limit: int = 20) -> SearchResults:
+        """Search every shard's step index; ``lag`` sums the shards' lag."""
+        pages = await asyncio.gather(*(shard.search_async(query, field=field, limit=limit) for shard in self._shards))
+        merged = heapq.merge(*pages, key=_step_time, reverse=True)
+        return SearchResults(_take(merged, limit), lag=sum(page.lag for page in pages))
+
+    async def lineage_async(
+        self,
+        workflow_id: str,
+        *,
+        include_steps: bool = True,
+        max_runs: int = 200,
+    ) -> LineageView:
+        """Fork/retry lineage for a workflow id, gathered across shards.
+
+        Same tree as ``SqliteCheckpointer.lineage``: the root ancestor and
+        every fork or retry descendant, each hop asking all shards at once.
+        """
+        selected = await self.get_run_async(workflow_id)
+        if selected is None:
+            raise ValueError(f"Unknown workflow_id: {workflow_id!r}")
+
+        root = selected
+        seen_ancestors = {root.id}
+        while (parent_id := _lineage_parent_id(root)) is not None:
+            parent = await self.get_run_async(parent_id)
+            if parent is None or parent.id in seen_ancestors:
+                break
+            root = parent
+            seen_ancestors.add(root.id)
+
+        run_by_id: dict[str, Run] = {root.id: root}
+        children_by_parent: dict[str, list[Run]] = {}
+        queue: list[str] = [root.id]
+        while queue and len(run_by_id) < max_runs:
+            parent_id = queue.pop(0)
+            hops = await asyncio.gather(*(shard._lineage_children(parent_id, max_runs) for shard in self._shards))
+            children = _take(heapq.merge(*hops, key=lambda run: run.created_at), max_runs)
+            children_by_parent[parent_id] = children
+            for child in children:
+                if child.id in run_by_id:
+                    continue
+                run_by_id[child.id] = child
+                if len(run_by_id) >= max_runs:
+                    break
+                queue.append(child.id)
+
+        rows = _lineage_rows(root, children_by_parent, workflow_id)
+        steps_by_run: dict[str, StepTable] | None = None
+        if include_steps:
+            steps = await asyncio.gather(*(self.get_steps(row.run.id) for row in rows))
+            steps_by_run = {row.run.id: StepTable(run_steps) for row, run_steps in zip(rows, steps, strict=True)}
+        return LineageView(rows, selected_run_id=workflow_id, root_run_id=root.id, steps_by_run=steps_by_run)
+
+    # === Attempt Ledger ===
+
+    async def open_attempt_series(
+        self,
+        run_id: str,
+        node_name: str,
+        *,
+        policy_fingerprint: str,
+        max_attempts: int,
+        deadline_at: datetime | None = None,
+    ) -> AttemptSeries:
+        shard = await self._shard(run_id)
+        series = await shard.open_attempt_series(
+            run_id,
+            node_name,
+            policy_fingerprint=policy_fingerprint,
+            max_attempts=max_attempts,
+            deadline_at=deadline_at,
+        )
+        self._remember_series(shard, series)
+        return series
+
+    async def get_attempt_series(self, series_id: str) -> AttemptSeries | None:
+        return await (await self._series_shard(series_id)).get_attempt_series(series_id)
+
+    async def get_open_attempt_series(self, run_id: str, node_name: str) -> AttemptSeries | None:
+        shard = await self._shard(run_id)
+        return self._remember_series(shard, await shard.get_open_attempt_series(run_id, node_name))
+
+    async def get_attempt_records(self, series_id: str) -> list[AttemptRecord]:
+        return await (await self._series_shard(series_id)).get_attempt_records(series_id)
+
+    async def remaining_attempts(self, series_id: str) -> int:
+        return await (await self._series_shard(series_id)).remaining_attempts(series_id)
+
+    async def begin_attempt(
+        self,
+        series_id: str,
+        *,
+        policy_fingerprint: str,
+        scheduled_superstep: int,
+    ) -> AttemptRecord:
+        shard = await self._series_shard(series_id)
+        return await shard.begin_attempt(series_id, policy_fingerprint=policy_fingerprint, scheduled_superstep=scheduled_superstep)
+
+    async def record_attempt_outcome(
+        self,
+        series_id: str,
+        attempt_number: int,
+        status: AttemptStatus,
+        *,
+        error: AttemptError | None = None,
+        retry_not_before: datetime | None = None,
+        sampled_delay: float | None = None,
+    ) -> AttemptRecord:
+        shard = await self._series_shard(series_id)
+        return await shard.record_attempt_outcome(
+            series_id,
+            attempt_number,
+            status,
+            error=error,
+            retry_not_before=retry_not_before,
+            sampled_delay=sampled_delay,
+        )
+
+    async def record_attempt_deadline(self, series_id: str, attempt_number: int) -> AttemptRecord:
+        return await (await self._series_shard(series_id)).record_attempt_deadline(series_id, attempt_number)
+
+    async def close_attempt_series(
+        self,
+        series_id: str,
+        attempt_number: int,
+        status: AttemptStatus,
+        *,
+        step_record: StepRecord,
+        error: AttemptError | None = None,
+    ) -> None:
+        shard = await self._series_shard(series_id)
+        await shard.close_attempt_series(series_id, attempt_number, status, step_record=step_record, error=error)
+
+    async def resolve_stranded_attempts(self, series_id: str) -> list[AttemptRecord]:
+        return await (await self._series_shard(series_id)).resolve_stranded_attempts(series_id)
+
+    # === Lifecycle ===
+
+    async def initialize(self) -> None:
+        await asyncio.gather(*(shard.initialize() for shard in self._shards))
+
+    async def close(self) -> None:
+        await asyncio.gather(*(shard.close() for shard in self._shards))
+        self._series_shards.clear()
+        with self._placement_lock:
+            if self._placement_conn is not None:
+                self._placement_conn.close()
+                self._placement_conn = None
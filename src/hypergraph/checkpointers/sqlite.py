@@ -4,16 +4,29 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import hashlib
 import json
-import threading
 import uuid
-from collections.abc import Iterable, Iterator, Sequence
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Literal
 
+from hypergraph.checkpointers._archive import ARCHIVE_SELECTS, ArchiveRows, RunArchive
+from hypergraph.checkpointers._delta import DELTA_BASE_SQL, DeltaChains, DeltaEncoder, DeltaRef, DeltaValues, check_delta_values
 from hypergraph.checkpointers._migrate import ensure_schema
+from hypergraph.checkpointers._read_pool import AsyncReadPool, SyncReadPool, WriterLock, check_pool_size
+from hypergraph.checkpointers._search_index import (
+    SEARCH_INDEX_BATCH_SIZE,
+    SEARCH_LAG_SQL,
+    SearchIndexer,
+    SearchIndexMode,
+    apply_search_index_mode,
+    check_search_index,
+    index_batch,
+    index_batch_sync,
+)
 from hypergraph.checkpointers.base import (
     _UNSET,
     Checkpointer,
@@ -43,6 +56,7 @@ from hypergraph.checkpointers.types import (
     AttemptSeries,
     AttemptStatus,
     Checkpoint,
+    CompactionReport,
     LineageRow,
     LineageView,
     NodeBoundary,
@@ -51,6 +65,7 @@ from hypergraph.checkpointers.types import (
     Run,
     RunTable,
     RunTotals,
+    SearchResults,
     StepRecord,
     StepStatus,
     StepTable,
@@ -65,7 +80,7 @@ _RUNS_COLS = (
 )
 _STEPS_COLS = (
     "id, run_id, step_index, superstep, node_name, node_type, status, duration_ms, cached, error, decision, "
-    "input_versions, values_data, child_run_id, created_at, completed_at, partial, attempt_series_id"
+    "input_versions, values_data, child_run_id, created_at, completed_at, partial, attempt_series_id, value_refs"
 )
 _STEP_TIME_ORDER = "COALESCE(completed_at, created_at), created_at, id"
 _STEP_TIME_ORDER_DESC = "COALESCE(completed_at, created_at) DESC, created_at DESC, id DESC"
@@ -79,7 +94,10 @@ _PUBLIC_STEP_FILTER = f"node_name != '{_RETENTION_BASELINE_NODE_NAME}' AND (node
 _PUBLIC_STEP_FILTER_WITH_ALIAS = (
     f"s.node_name != '{_RETENTION_BASELINE_NODE_NAME}' AND (s.node_type IS NULL OR s.node_type != '{_RETENTION_BASELINE_NODE_TYPE}')"
 )
-_RETENTION_ROW_COLS = "id, step_index, superstep, node_name, values_data, created_at, completed_at, attempt_series_id"
+_LINEAGE_CHILDREN_SQL = f"SELECT {_RUNS_COLS} FROM runs WHERE forked_from = ? OR retry_of = ? ORDER BY created_at ASC LIMIT ?"
+# Public steps ``search`` cannot see yet (see ``_search_index``).
+_SEARCH_LAG_SQL = f"{SEARCH_LAG_SQL} AND {_PUBLIC_STEP_FILTER_WITH_ALIAS}"
+_RETENTION_ROW_COLS = "id, step_index, superstep, node_name, values_data, created_at, completed_at, attempt_series_id, value_refs"
 _DELETE_BATCH_SIZE = 500
 # Two binds per row plus the run id — stays under the 999-variable floor.
 _PENDING_DELETE_BATCH_SIZE = 400
@@ -127,8 +145,8 @@ _STEP_UPSERT_SQL = """
         run_id, superstep, node_name, step_index, status,
         input_versions, values_data, duration_ms, cached,
         decision, error, node_type, created_at, completed_at, child_run_id, partial,
-        attempt_series_id
-    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        attempt_series_id, value_refs, value_keys
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     ON CONFLICT(run_id, superstep, node_name) DO UPDATE SET
         status = excluded.status,
         values_data = excluded.values_data,
@@ -139,7 +157,9 @@ _STEP_UPSERT_SQL = """
         node_type = excluded.node_type,
         completed_at = excluded.completed_at,
         partial = excluded.partial,
-        attempt_series_id = excluded.attempt_series_id
+        attempt_series_id = excluded.attempt_series_id,
+        value_refs = excluded.value_refs,
+        value_keys = excluded.value_keys
 """
 
 # === Attempt-ledger SQL (shared by async and sync paths) ===
@@ -175,6 +195,229 @@ _ATTEMPT_LIVE_SQL = f"SELECT {_ATTEMPT_RECORD_COLS} FROM attempt_records WHERE s
 _ATTEMPT_MAX_NUMBER_SQL = "SELECT COALESCE(MAX(attempt_number), 0) FROM attempt_records WHERE series_id = ?"
 _RUN_EXISTS_SQL = "SELECT 1 FROM runs WHERE id = ?"
 
+#: How far the nested-run walk descends before it stops. A parent chain is
+#: a tree by construction; the bound is what makes a corrupted store return
+#: a bounded answer instead of spinning.
+_MAX_RUN_NESTING_DEPTH = 32
+
+
+def _descendant_runs_query(root_ids: Sequence[str]) -> tuple[str, list[Any]]:
+    """Every run reachable from ``root_ids`` through ``runs.parent_run_id``.
+
+    A Host Run is only the OUTERMOST run of the work it drove: a nested
+    graph node, and every item of a ``map``, commits its own runs row with
+    the parent recorded. Their step records are as durable as the parent's,
+    and a join that only matched ``runs.id = host_submissions.workflow_id``
+    threw them away — which is exactly the per-node evidence a fan-out is
+    worth reading — and the same tree is what ``compact()`` expires as one
+    unit. ``UNION`` (not ``UNION ALL``) plus the depth bound keeps a
+    malformed parent cycle finite.
+    """
+    placeholders = ", ".join("?" for _ in root_ids)
+    return (
+        f"""
+        WITH RECURSIVE descendants(id, root_id, depth) AS (
+            SELECT id, id, 0 FROM runs WHERE id IN ({placeholders})
+            UNION
+            SELECT child.id, parent.root_id, parent.depth + 1
+            FROM runs child JOIN descendants parent ON child.parent_run_id = parent.id
+            WHERE parent.depth < ?
+        )
+        SELECT id, root_id FROM descendants
+        """,
+        [*root_ids, _MAX_RUN_NESTING_DEPTH],
+    )
+
+
+# === Compaction (CheckpointPolicy.ttl) ===
+#
+# Expiry removes WHOLE runs — a root run and every nested run under it —
+# never a slice of one, so no surviving reader can observe a run with its
+# journal half gone. A root is expirable when it is terminal, finished before
+# the ttl cutoff, owns its lineage (its parent, if any, lives in another
+# store), and no surviving run forks or retries from it: the fork/retry FKs
+# are enforced, and a source must outlive the runs that name it. A chain of
+# reruns therefore expires leaf-first, one pass uncovering the next source.
+
+#: Statuses a run can expire from: exactly those ``_run_status_update``
+#: stamps ``completed_at`` for. An active or paused run never expires.
+_TERMINAL_RUN_STATUS_VALUES = ("completed", "failed", "partial", "stopped")
+#: Root runs expired per transaction. Each batch is one short write
+#: transaction; the write lock is released between batches so a live
+#: runner's step commits interleave instead of queueing behind the sweep.
+_COMPACT_BATCH_SIZE = 100
+#: Freed pages returned to the OS per ``incremental_vacuum`` call, for the
+#: same reason: bounded slices, never a whole-file rewrite under the lock.
+_VACUUM_PAGE_BUDGET = 2048
+#: ``incremental_vacuum`` slices per ``compact()`` call. Whatever is left on
+#: the freelist past this shows up in ``report.free_bytes`` for the next call.
+_VACUUM_MAX_SLICES = 64
+#: Per-run rows removed with an expired run, children before the runs row.
+#: ``steps`` goes before ``attempt_series`` because a step links its series.
+_EXPIRE_RUN_DELETES = (
+    ("attempts", "DELETE FROM attempt_records WHERE series_id IN (SELECT id FROM attempt_series WHERE run_id IN ({ids}))"),
+    ("steps", "DELETE FROM steps WHERE run_id IN ({ids})"),
+    ("attempts", "DELETE FROM attempt_series WHERE run_id IN ({ids})"),
+    ("boundaries", "DELETE FROM pending_nodes WHERE run_id IN ({ids})"),
+    ("pauses", "DELETE FROM pause_slots WHERE run_id IN ({ids})"),
+)
+_DELETE_RUNS_SQL = "DELETE FROM runs WHERE id IN ({ids})"
+_REFERRING_RUNS_SQL = "SELECT id, forked_from, retry_of FROM runs WHERE {column} IN ({ids})"
+
+
+def _expired_roots_query(cutoff: str, limit: int, extra: str = "") -> tuple[str, list[Any]]:
+    """Oldest-first expirable root runs; ``extra`` narrows the candidates."""
+    statuses = ", ".join("?" for _ in _TERMINAL_RUN_STATUS_VALUES)
+    return (
+        "SELECT r.id FROM runs r "
+        f"WHERE r.completed_at IS NOT NULL AND r.completed_at <= ? AND r.status IN ({statuses}) "
+        "AND (r.parent_run_id IS NULL OR NOT EXISTS (SELECT 1 FROM runs p WHERE p.id = r.parent_run_id)) "
+        "AND NOT EXISTS (SELECT 1 FROM runs x WHERE x.forked_from = r.id) "
+        f"AND NOT EXISTS (SELECT 1 FROM runs x WHERE x.retry_of = r.id){extra} "
+        "ORDER BY r.completed_at, r.id LIMIT ?",
+        [cutoff, *_TERMINAL_RUN_STATUS_VALUES, limit],
+    )
+
+
+def _ttl_cutoff(ttl: timedelta | None, now: datetime | None) -> str | None:
+    """The ``completed_at`` at or before which a run has outlived ``ttl``."""
+    if ttl is None:
+        return None
+    if now is None:
+        now = datetime.now(timezone.utc)
+    elif now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    return (now.astimezone(timezone.utc) - ttl).isoformat(timespec="microseconds")
+
+
+def _surviving_trees(
+    tree: Sequence[tuple[str, str]], referrers: Iterable[tuple[str, str | None, str | None]]
+) -> tuple[dict[str, list[str]], set[str]]:
+    """Group ``(run_id, root_id)`` pairs by root; also return the pinned roots.
+
+    A tree is pinned when a run OUTSIDE it forks or retries from a run inside
+    it — the roots query already rules that out for the root itself, this
+    catches it for nested runs. Pinned trees are left out of the grouping.
+    """
+    root_of = dict(tree)
+    pinned = {
+        root_of[source]
+        for run_id, forked_from, retry_of in referrers
+        if run_id not in root_of
+        for source in (forked_from, retry_of)
+        if source in root_of
+    }
+    trees: dict[str, list[str]] = {}
+    for run_id, root_id in tree:
+        if root_id not in pinned:
+            trees.setdefault(root_id, []).append(run_id)
+    return trees, pinned
+
+
+def _compaction_report(counts: dict[str, int], *, transactions: int, bytes_reclaimed: int, free_bytes: int, complete: bool) -> CompactionReport:
+    return CompactionReport(
+        runs_deleted=counts.get("runs", 0),
+        steps_deleted=counts.get("steps", 0),
+        log_rows_deleted=counts.get("logs", 0),
+        batches_deleted=counts.get("batches", 0),
+        blobs_deleted=counts.get("blobs", 0),
+        runs_archived=counts.get("archived", 0),
+        transactions=transactions,
+        bytes_reclaimed=bytes_reclaimed,
+        free_bytes=free_bytes,
+        complete=complete,
+    )
+
+
+# === Content-addressed step values (dedupe_values=True) ===
+#
+# A step output whose serialized bytes reach ``_DEDUPE_MIN_BYTES`` is stored
+# once in ``value_blobs`` under the sha256 of those bytes and named from
+# ``steps.value_refs``; smaller values stay inline, where a blob row would
+# cost more than it saves. The ``messages`` list a chat loop re-emits every
+# superstep, or the document every map item carries, is then written once
+# per distinct value rather than once per step. Triggers keep each blob's
+# ``refs`` count (see ``_migrate``); the paths that prune steps collect the
+# blobs left at zero in the same transaction that released them.
+#
+# Readers fold a referenced value as a ``_BlobRef`` placeholder and decode
+# only what survives the fold, so ``get_state`` over a thousand supersteps of
+# one growing list decodes the last list, not all thousand.
+
+_DEDUPE_MIN_BYTES = 64
+_VALUE_BLOB_INSERT_SQL = "INSERT INTO value_blobs (digest, data) VALUES (?, ?) ON CONFLICT(digest) DO NOTHING"
+_VALUE_BLOB_SELECT_SQL = "SELECT digest, data FROM value_blobs WHERE digest IN ({placeholders})"
+_VALUE_BLOB_GC_SQL = "DELETE FROM value_blobs WHERE refs <= 0"
+# Keyed state reads select ``values_data`` only for a step whose
+# ``value_keys`` names one of the requested keys (bound once, as a JSON list);
+# every other step comes back with a NULL blob, so SQLite never pages its
+# values in. A NULL ``value_keys`` is a legacy step of unknown shape: read it.
+_KEYED_VALUES_COL = (
+    "CASE WHEN value_keys IS NULL OR EXISTS ("
+    "SELECT 1 FROM json_each(value_keys) WHERE value IN (SELECT value FROM json_each(?))"
+    ") THEN values_data END"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _BlobRef:
+    """A decoded step value that still lives in ``value_blobs``."""
+
+    digest: str
+
+
+def _blob_digests(values_dicts: Iterable[dict[str, Any] | None]) -> list[str]:
+    """Distinct digests still referenced by ``values_dicts``, first-seen order."""
+    return list(dict.fromkeys(value.digest for values in values_dicts if values for value in values.values() if isinstance(value, _BlobRef)))
+
+
+def _has_delta_refs(values_dicts: Iterable[dict[str, Any] | None]) -> bool:
+    return any(isinstance(value, DeltaRef) for values in values_dicts if values for value in values.values())
+
+
+def _value_blob_batches(digests: Sequence[str]) -> Iterator[tuple[str, list[str]]]:
+    """Yield ``(sql, params)`` selecting ``digests`` under the variable floor."""
+    for start in range(0, len(digests), _MAX_SQL_VARIABLES):
+        chunk = list(digests[start : start + _MAX_SQL_VARIABLES])
+        yield _VALUE_BLOB_SELECT_SQL.format(placeholders=", ".join("?" for _ in chunk)), chunk
+
+
+def _value_keys_json(values: dict[str, Any] | None) -> str | None:
+    """The ``value_keys`` column for one step's values (NULL when it wrote none)."""
+    return json.dumps(list(values)) if values is not None else None
+
+
+def _state_query(run_id: str, superstep: int | None, keys: Sequence[str] | None) -> tuple[str, list[Any]]:
+    """``(sql, params)`` for one run's state rows, ``superstep`` bounded.
+
+    Unkeyed rows are ``(values_data, value_refs)`` in fold order. Keyed rows
+    are ``(run_id, values_data, value_refs, value_keys)`` newest first, with
+    ``values_data`` NULL for every step that wrote none of ``keys``.
+    """
+    bound = " AND superstep <= ?" if superstep is not None else ""
+    params: list[Any] = [run_id] if superstep is None else [run_id, superstep]
+    if keys is None:
+        return f"SELECT values_data, value_refs FROM steps WHERE run_id = ?{bound} ORDER BY {_STEP_TIME_ORDER}", params
+    return (
+        f"SELECT run_id, {_KEYED_VALUES_COL}, value_refs, value_keys FROM steps WHERE run_id = ?{bound} ORDER BY {_STEP_TIME_ORDER_DESC}",
+        [json.dumps(list(keys)), *params],
+    )
+
+
+def _states_query(chunk: Sequence[str], keys: Sequence[str] | None) -> tuple[str, list[Any]]:
+    """``(sql, params)`` for several runs' state rows; see ``_state_query``."""
+    placeholders = ",".join("?" * len(chunk))
+    if keys is None:
+        return (
+            f"SELECT run_id, values_data, value_refs FROM steps WHERE run_id IN ({placeholders}) ORDER BY run_id, {_STEP_TIME_ORDER}",
+            list(chunk),
+        )
+    return (
+        f"SELECT run_id, {_KEYED_VALUES_COL}, value_refs, value_keys FROM steps "
+        f"WHERE run_id IN ({placeholders}) ORDER BY run_id, {_STEP_TIME_ORDER_DESC}",
+        [json.dumps(list(keys)), *chunk],
+    )
+
 
 @dataclass(frozen=True, slots=True)
 class _RetentionRow:
@@ -186,6 +429,7 @@ class _RetentionRow:
     created_at: str | None
     completed_at: str | None
     attempt_series_id: str | None
+    value_refs: str | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -198,7 +442,7 @@ class _RetentionPlan:
 def _decode_retention_rows(rows: Sequence[tuple[Any, ...]]) -> tuple[_RetentionRow, ...]:
     decoded: list[_RetentionRow] = []
     for row in rows:
-        row_id, step_index, superstep, node_name, values_data, created_at, completed_at, attempt_series_id = row
+        row_id, step_index, superstep, node_name, values_data, created_at, completed_at, attempt_series_id, value_refs = row
         decoded.append(
             _RetentionRow(
                 id=int(row_id),
@@ -209,6 +453,7 @@ def _decode_retention_rows(rows: Sequence[tuple[Any, ...]]) -> tuple[_RetentionR
                 created_at=created_at,
                 completed_at=completed_at,
                 attempt_series_id=attempt_series_id,
+                value_refs=value_refs,
             )
         )
     return tuple(decoded)
@@ -489,6 +734,30 @@ def _lineage_parent_id(run: Run) -> str | None:
     return run.forked_from or run.retry_of
 
 
+def _lineage_rows(root: Run, children_by_parent: dict[str, list[Run]], selected_run_id: str) -> list[LineageRow]:
+    """Lay a fork/retry tree out as ``git log --graph``-style lineage rows."""
+    rows: list[LineageRow] = [LineageRow(lane="● ", run=root, depth=0, is_selected=(root.id == selected_run_id))]
+
+    def _walk(parent_id: str, *, flags: list[bool], depth: int) -> None:
+        children = children_by_parent.get(parent_id, [])
+        for idx, child in enumerate(children):
+            has_next = idx < len(children) - 1
+            prefix = "".join("│  " if flag else "   " for flag in flags)
+            lane = f"{prefix}{'├─ ' if has_next else '└─ '}"
+            rows.append(
+                LineageRow(
+                    lane=lane,
+                    run=child,
+                    depth=depth,
+                    is_selected=(child.id == selected_run_id),
+                )
+            )
+            _walk(child.id, flags=[*flags, has_next], depth=depth + 1)
+
+    _walk(root.id, flags=[], depth=1)
+    return rows
+
+
 def _require_aiosqlite() -> Any:
     """Import aiosqlite with a clear error message if not installed."""
     try:
@@ -510,6 +779,27 @@ class SqliteCheckpointer(Checkpointer):
         retention: What to keep — "full" (default), "latest", or "windowed".
         policy: Full CheckpointPolicy (overrides durability/retention if given).
         serializer: Value serializer (default: JSON).
+        read_connections: Read-only connections that pure reads (``get_state``,
+            ``runs``, ``list_runs``, ...) borrow so they never wait behind a
+            step commit (default 4). ``0`` routes every read through the
+            writer connection. In-memory databases always do.
+        dedupe_values: Store each step output of 64 serialized bytes or more
+            once, keyed by its content, and reference it from every step and
+            run that emits the same value (default False). Reads resolve the
+            references transparently; a store can switch either way in place.
+        search_index: How ``search`` stays current — ``"eager"`` indexes each
+            step in the transaction that writes it, ``"deferred"`` leaves step
+            commits untouched and catches the index up on a background thread,
+            ``"off"`` only when ``index_search`` is called. The mode belongs
+            to the store: passing one switches it, ``None`` (default) keeps
+            the stored mode, and a new store starts ``"eager"``.
+        delta_values: Store a list output that only grew since the run's
+            previous step wrote it as the appended items plus a reference to
+            that step, instead of the whole list again (default False).
+            ``True`` covers every list output; a collection of names, or a
+            ``(name, value) -> bool`` predicate, narrows it. Reads rebuild the
+            full values; every 16th version is stored whole. Needs
+            ``retention="full"``.
 
     Example::
 
@@ -530,6 +820,10 @@ class SqliteCheckpointer(Checkpointer):
         retention: Literal["full", "latest", "windowed"] | None = None,
         policy: CheckpointPolicy | None = None,
         serializer: Serializer | None = None,
+        read_connections: int = 4,
+        dedupe_values: bool = False,
+        search_index: SearchIndexMode | None = None,
+        delta_values: DeltaValues = False,
     ):
         if policy is not None and (durability is not None or retention is not None):
             raise ValueError("Cannot pass both 'policy' and 'durability'/'retention'. Use one or the other.")
@@ -549,12 +843,28 @@ class SqliteCheckpointer(Checkpointer):
             self._connect_path = f"file:{shared_name}?mode=memory&cache=shared"
             self._connect_uri = True
         self._serializer = serializer or JsonSerializer()
+        self._dedupe_values = dedupe_values
+        delta_values = check_delta_values(delta_values, self.policy.retention)
+        self._delta_encoder = DeltaEncoder(delta_values, self._serializer) if delta_values else None
+        self._search_index_request = check_search_index(search_index)
+        self._search_index: str | None = None
+        self._search_indexer: SearchIndexer | None = None
         self._db: Any = None
         self._sync_conn: Any = None
-        self._sync_lock = threading.RLock()
+        self._sync_lock = WriterLock()
         self._init_lock: asyncio.Lock | None = None
         self._async_txn_lock: asyncio.Lock | None = None
         self._aiosqlite = _require_aiosqlite()
+        # A shared-cache memory database has no WAL, so a second connection
+        # would only contend on the cache's table locks: reads stay on the writer.
+        in_memory = self._is_memory or "mode=memory" in self._connect_path
+        read_connections = check_pool_size(read_connections)
+        self._read_connections = 0 if in_memory else read_connections
+        self._sync_read_pool: SyncReadPool | None = None
+        self._async_read_pool: AsyncReadPool | None = None
+
+    # Seconds between background catch-up passes in ``search_index="deferred"``.
+    _search_index_interval = 1.0
 
     def __del__(self) -> None:
         """Best-effort cleanup for forgotten checkpointers.
@@ -574,18 +884,28 @@ class SqliteCheckpointer(Checkpointer):
                 finally:
                     sync_lock.release()
 
-        db = getattr(self, "_db", None)
-        if db is None:
-            return
+        sync_read_pool = getattr(self, "_sync_read_pool", None)
+        if sync_read_pool is not None:
+            with contextlib.suppress(Exception):
+                sync_read_pool.close()
 
-        with contextlib.suppress(Exception):
-            raw_conn = getattr(db, "_connection", None)
-            if raw_conn is not None:
-                raw_conn.close()
-                db._connection = None
+        search_indexer = getattr(self, "_search_indexer", None)
+        if search_indexer is not None:
+            search_indexer.stop()
 
-        with contextlib.suppress(Exception):
-            db._running = False
+        async_read_pool = getattr(self, "_async_read_pool", None)
+        for db in [getattr(self, "_db", None), *(async_read_pool.idle_connections() if async_read_pool is not None else ())]:
+            if db is None:
+                continue
+
+            with contextlib.suppress(Exception):
+                raw_conn = getattr(db, "_connection", None)
+                if raw_conn is not None:
+                    raw_conn.close()
+                    db._connection = None
+
+            with contextlib.suppress(Exception):
+                db._running = False
 
     def _db_stats(self) -> dict[str, Any]:
         """Gather quick DB stats for display (uses sync connection)."""
@@ -701,15 +1021,39 @@ class SqliteCheckpointer(Checkpointer):
             conn = sqlite3.connect(self._connect_path, uri=self._connect_uri)
             try:
                 ensure_schema(conn)
+                self._open_search_index(conn)
             finally:
                 conn.close()
 
+    def _open_search_index(self, conn: Any) -> None:
+        """Apply the requested search index mode; start the deferred indexer once."""
+        self._search_index = apply_search_index_mode(conn, self._search_index_request)
+        # A shared-cache memory database would only hand the thread table-lock
+        # errors; there the index catches up through ``index_search``.
+        in_memory = self._is_memory or "mode=memory" in self._connect_path
+        if self._search_index == "deferred" and self._search_indexer is None and not in_memory:
+            self._search_indexer = SearchIndexer(self._open_index_conn, interval=self._search_index_interval)
+
+    def _open_index_conn(self) -> Any:
+        import sqlite3
+
+        return sqlite3.connect(self._connect_path, uri=self._connect_uri)
+
     async def close(self) -> None:
         """Close database connections."""
+        if self._search_indexer is not None:
+            self._search_indexer.close()
+            self._search_indexer = None
         with self._sync_lock:
+            if self._sync_read_pool is not None:
+                self._sync_read_pool.close()
+                self._sync_read_pool = None
             if self._sync_conn is not None:
                 self._sync_conn.close()
                 self._sync_conn = None
+        if self._async_read_pool is not None:
+            await self._async_read_pool.close()
+            self._async_read_pool = None
         if self._db is not None:
             await self._db.close()
             self._db = None
@@ -720,6 +1064,69 @@ class SqliteCheckpointer(Checkpointer):
         """Lazy-initialize on first use."""
         await self.initialize()
 
+    # === Read connections ===
+    #
+    # Writes own the two writer connections; pure reads borrow from a pool of
+    # read-only WAL connections instead (see ``_read_pool``). A read path
+    # opts in by taking its connection from ``_read_db`` / ``_read_db_sync``
+    # rather than ``self._db`` / ``self._sync_db()``. Anything that reads
+    # inside a write transaction must keep using the writer: a pooled
+    # snapshot cannot see the transaction's own uncommitted rows.
+
+    async def _open_read_conn(self) -> Any:
+        db = await self._aiosqlite.connect(self._connect_path, uri=self._connect_uri)
+        try:
+            await db.execute("PRAGMA query_only = ON")
+        except BaseException:
+            with contextlib.suppress(Exception):
+                await db.close()
+            raise
+        return db
+
+    def _open_read_conn_sync(self) -> Any:
+        import sqlite3
+
+        conn = sqlite3.connect(self._connect_path, uri=self._connect_uri, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA query_only = ON")
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    @contextlib.asynccontextmanager
+    async def _read_db(self) -> AsyncIterator[Any]:
+        """Borrow a connection for one pure read; the writer when pooling is off."""
+        await self._ensure_db()
+        if not self._read_connections:
+            async with self._txn_lock():
+                yield self._db
+            return
+        if self._async_read_pool is None:
+            self._async_read_pool = AsyncReadPool(self._open_read_conn, self._read_connections)
+        async with self._async_read_pool.connection() as db:
+            yield db
+
+    @contextlib.contextmanager
+    def _read_db_sync(self) -> Iterator[Any]:
+        """Sync mirror of ``_read_db``.
+
+        A thread already holding the writer lock keeps reading through the
+        writer, so a read composed into a locked sequence (``fork_workflow``)
+        sees exactly what the lock holder sees.
+        """
+        if not self._read_connections or self._sync_lock.held_by_current_thread():
+            with self._sync_lock:
+                yield self._sync_db()
+            return
+        pool = self._sync_read_pool
+        if pool is None:
+            # Opening the writer migrates the schema and starts the pool.
+            self._sync_db()
+            pool = self._sync_read_pool
+        with pool.connection() as db:
+            yield db
+
     def _txn_lock(self) -> asyncio.Lock:
         """Serialize multi-statement work on the shared async connection.
 
@@ -748,10 +1155,48 @@ class SqliteCheckpointer(Checkpointer):
 
     # === Write ===
 
-    def _step_upsert_params(self, record: StepRecord) -> tuple[Any, ...]:
-        """Build the parameter tuple for ``_STEP_UPSERT_SQL``."""
-        values_blob = self._serializer.serialize(record.values) if record.values is not None else None
-        return (
+    def _encode_step_values(
+        self, values: dict[str, Any] | None, deltas: dict[str, Any] | None = None
+    ) -> tuple[Any, str | None, list[tuple[str, bytes]]]:
+        """``(values_data, value_refs, blobs)`` for one step's values.
+
+        A ``_BlobRef`` (a retention baseline carrying folded values forward)
+        keeps its digest without a decode/encode round trip, whatever
+        ``dedupe_values`` says; ``blobs`` are the ``(digest, data)`` rows the
+        step needs to exist before it is written. A key in ``deltas`` already
+        holds just its appended tail and stays inline beside its entry.
+        """
+        if values is None:
+            return None, None, []
+        if not self._dedupe_values and not deltas and not any(isinstance(value, _BlobRef) for value in values.values()):
+            return self._serializer.serialize(values), None, []
+        inline: dict[str, Any] = {}
+        refs: dict[str, Any] = {}
+        blobs: list[tuple[str, bytes]] = []
+        for key, value in values.items():
+            if deltas and key in deltas:
+                inline[key], refs[key] = value, deltas[key]
+                continue
+            if isinstance(value, _BlobRef):
+                inline[key], refs[key] = None, value.digest
+                continue
+            if self._dedupe_values:
+                data = self._serializer.serialize(value)
+                if len(data) >= _DEDUPE_MIN_BYTES:
+                    digest = hashlib.sha256(data).hexdigest()
+                    inline[key], refs[key] = None, digest
+                    blobs.append((digest, data))
+                    continue
+            inline[key] = value
+        return self._serializer.serialize(inline), json.dumps(refs) if refs else None, blobs
+
+    def _step_upsert_params(self, record: StepRecord) -> tuple[list[tuple[str, bytes]], tuple[Any, ...]]:
+        """Build the value blobs and the parameter tuple for ``_STEP_UPSERT_SQL``."""
+        values, deltas = record.values, None
+        if self._delta_encoder is not None:
+            values, deltas = self._delta_encoder.encode(record.run_id, record.superstep, record.node_name, values)
+        values_blob, value_refs, blobs = self._encode_step_values(values, deltas)
+        return blobs, (
             record.run_id,
             record.superstep,
             record.node_name,
@@ -769,14 +1214,30 @@ class SqliteCheckpointer(Checkpointer):
             record.child_run_id,
             int(record.partial),
             record.attempt_series_id,
+            value_refs,
+            _value_keys_json(record.values),
         )
 
+    async def _write_step(self, record: StepRecord) -> None:
+        """Upsert one step (and any new value blobs) inside the caller's transaction."""
+        blobs, params = self._step_upsert_params(record)
+        if blobs:
+            await self._db.executemany(_VALUE_BLOB_INSERT_SQL, blobs)
+        await self._db.execute(_STEP_UPSERT_SQL, params)
+
+    def _write_step_sync(self, db: Any, record: StepRecord) -> None:
+        """Sync mirror of ``_write_step``."""
+        blobs, params = self._step_upsert_params(record)
+        if blobs:
+            db.executemany(_VALUE_BLOB_INSERT_SQL, blobs)
+        db.execute(_STEP_UPSERT_SQL, params)
+
     async def save_step(self, record: StepRecord) -> None:
         """Save a step with upsert semantics."""
         await self._ensure_db()
         async with self._txn_lock():
             try:
-                await self._db.execute(_STEP_UPSERT_SQL, self._step_upsert_params(record))
+                await self._write_step(record)
                 await self._apply_retention_policy_async(record.run_id)
                 await self._after_run_mutation(
                     record.run_id,
@@ -886,7 +1347,7 @@ class SqliteCheckpointer(Checkpointer):
             try:
                 await self._db.execute("BEGIN IMMEDIATE")
                 for record in step_records:
-                    await self._db.execute(_STEP_UPSERT_SQL, self._step_upsert_params(record))
+                    await self._write_step(record)
                 if step_records:
                     await self._apply_retention_policy_async(slot.run_id)
                 await self._db.execute(_PAUSE_SLOT_INSERT_SQL, _pause_slot_insert_params(slot))
@@ -910,12 +1371,11 @@ class SqliteCheckpointer(Checkpointer):
 
     async def get_pause_slot(self, run_id: str, *, pause_id: str | None = None) -> PauseSlot | None:
         """The run's current pause occurrence, or a named earlier one."""
-        await self._ensure_db()
-        async with self._txn_lock():
+        async with self._read_db() as db:
             if pause_id is None:
-                cursor = await self._db.execute(_PAUSE_SLOT_CURRENT_SQL, (run_id,))
+                cursor = await db.execute(_PAUSE_SLOT_CURRENT_SQL, (run_id,))
             else:
-                cursor = await self._db.execute(_PAUSE_SLOT_BY_ID_SQL, (run_id, pause_id))
+                cursor = await db.execute(_PAUSE_SLOT_BY_ID_SQL, (run_id, pause_id))
             row = await cursor.fetchone()
         return _row_to_pause_slot(row) if row is not None else None
 
@@ -1018,7 +1478,7 @@ class SqliteCheckpointer(Checkpointer):
             try:
                 db.execute("BEGIN IMMEDIATE")
                 for record in step_records:
-                    db.execute(_STEP_UPSERT_SQL, self._step_upsert_params(record))
+                    self._write_step_sync(db, record)
                 if step_records:
                     self._apply_retention_policy_sync(slot.run_id)
                 db.execute(_PAUSE_SLOT_INSERT_SQL, _pause_slot_insert_params(slot))
@@ -1044,8 +1504,7 @@ class SqliteCheckpointer(Checkpointer):
 
     def get_pause_slot_sync(self, run_id: str, *, pause_id: str | None = None) -> PauseSlot | None:
         """Sync mirror of :meth:`get_pause_slot`."""
-        with self._sync_lock:
-            db = self._sync_db()
+        with self._read_db_sync() as db:
             if pause_id is None:
                 row = db.execute(_PAUSE_SLOT_CURRENT_SQL, (run_id,)).fetchone()
             else:
@@ -1178,6 +1637,8 @@ class SqliteCheckpointer(Checkpointer):
             await self._db.execute(sql, [*params, run_id])
             await self._after_run_mutation(run_id, "status", {"status": status.value})
             await self._db.commit()
+        if status.value in _TERMINAL_RUN_STATUS_VALUES:
+            self._forget_deltas(run_id)
 
     # === Read ===
 
@@ -1187,39 +1648,190 @@ class SqliteCheckpointer(Checkpointer):
         Empty for a run created before this column existed, which is exactly
         the legacy case ``build_resume_validation_values`` still tolerates.
         """
-        await self._ensure_db()
-        async with self._txn_lock():
-            cursor = await self._db.execute("SELECT inputs_data FROM runs WHERE id = ?", (run_id,))
+        async with self._read_db() as db:
+            cursor = await db.execute("SELECT inputs_data FROM runs WHERE id = ?", (run_id,))
             row = await cursor.fetchone()
         return _deserialize_run_inputs(self._serializer, row)
 
     def get_run_inputs_sync(self, run_id: str) -> dict[str, Any]:
         """Sync mirror of ``get_run_inputs``."""
-        with self._sync_lock:
-            row = self._sync_db().execute("SELECT inputs_data FROM runs WHERE id = ?", (run_id,)).fetchone()
+        with self._read_db_sync() as db:
+            row = db.execute("SELECT inputs_data FROM runs WHERE id = ?", (run_id,)).fetchone()
         return _deserialize_run_inputs(self._serializer, row)
 
-    async def get_state(self, run_id: str, *, superstep: int | None = None) -> dict[str, Any]:
-        """Compute state by folding step values in timestamp execution order."""
-        await self._ensure_db()
-        async with self._txn_lock():
-            if superstep is not None:
-                cursor = await self._db.execute(
-                    f"SELECT values_data FROM steps WHERE run_id = ? AND superstep <= ? ORDER BY {_STEP_TIME_ORDER}",
-                    (run_id, superstep),
-                )
+    # -- Step values ------------------------------------------------------------
+    #
+    # Every read decodes ``values_data`` through ``_decode_step_values`` and
+    # then resolves the ``_BlobRef`` placeholders it left, on the SAME
+    # connection, so a pooled snapshot never pairs a step with a blob from a
+    # later commit. Stores written without ``dedupe_values`` have no refs and
+    # skip the blob query entirely. A ``DeltaRef`` is rebuilt first, by
+    # walking its bases (one indexed lookup each) back to a full value.
+
+    def _decode_step_values(self, values_blob: Any, value_refs: str | None) -> dict[str, Any] | None:
+        """Decode one step's inline values, leaving shared ones as ``_BlobRef`` and appended ones as ``DeltaRef``."""
+        if values_blob is None:
+            return None
+        values = self._serializer.deserialize(values_blob)
+        if value_refs:
+            for key, ref in json.loads(value_refs).items():
+                values[key] = _BlobRef(ref) if isinstance(ref, str) else DeltaRef.from_entry(ref, values[key])
+        return values
+
+    def _fold_step_values(self, state: dict[str, Any], values_blob: Any, value_refs: str | None) -> None:
+        values = self._decode_step_values(values_blob, value_refs)
+        if values:
+            state.update(values)
+
+    def _replace_blob_refs(self, values_dicts: Sequence[dict[str, Any] | None], blobs: dict[str, bytes]) -> None:
+        """Swap each ``_BlobRef`` for its own decoded copy, in place.
+
+        Decoded per occurrence, exactly like inline values: two steps that
+        share a blob never share a mutable object.
+        """
+        for values in values_dicts:
+            if not values:
+                continue
+            for key, value in values.items():
+                if isinstance(value, _BlobRef):
+                    values[key] = self._serializer.deserialize(blobs[value.digest])
+
+    def _delta_base(self, row: Any, ref: DeltaRef, key: str) -> Any:
+        """The value under ``key`` in ``ref``'s base step row, still undecoded if shared or appended."""
+        values = self._decode_step_values(*row) if row is not None else None
+        if not values or key not in values:
+            raise RuntimeError(
+                f"Cannot rebuild {key!r} in run {ref.run_id!r}: its base step (superstep {ref.superstep}, node {ref.node_name!r}) is gone."
+            )
+        return values[key]
+
+    async def _resolve_deltas(self, db: Any, values_dicts: Sequence[dict[str, Any] | None]) -> None:
+        """Rebuild every ``DeltaRef`` in ``values_dicts`` through ``db``, in place."""
+        chains = DeltaChains(self._serializer)
+        for values in values_dicts:
+            for key, value in (values or {}).items():
+                if not isinstance(value, DeltaRef):
+                    continue
+                links = [value]
+                while not chains.knows(links[-1]):
+                    cursor = await db.execute(DELTA_BASE_SQL, links[-1].base_params)
+                    base = self._delta_base(await cursor.fetchone(), links[-1], key)
+                    if isinstance(base, _BlobRef):
+                        holder = {key: base}
+                        await self._resolve_blob_refs(db, [holder])
+                        base = holder[key]
+                    if isinstance(base, DeltaRef):
+                        links.append(base)
+                    else:
+                        chains.add_keyframe(links[-1], base)
+                values[key] = chains.rebuild(links)
+
+    def _resolve_deltas_sync(self, db: Any, values_dicts: Sequence[dict[str, Any] | None]) -> None:
+        """Sync mirror of ``_resolve_deltas``."""
+        chains = DeltaChains(self._serializer)
+        for values in values_dicts:
+            for key, value in (values or {}).items():
+                if not isinstance(value, DeltaRef):
+                    continue
+                links = [value]
+                while not chains.knows(links[-1]):
+                    base = self._delta_base(db.execute(DELTA_BASE_SQL, links[-1].base_params).fetchone(), links[-1], key)
+                    if isinstance(base, _BlobRef):
+                        holder = {key: base}
+                        self._resolve_blob_refs_sync(db, [holder])
+                        base = holder[key]
+                    if isinstance(base, DeltaRef):
+                        links.append(base)
+                    else:
+                        chains.add_keyframe(links[-1], base)
+                values[key] = chains.rebuild(links)
+
+    def _forget_deltas(self, run_id: str | None = None) -> None:
+        """Stop extending what this process last wrote — for ``run_id``, or for every run."""
+        if self._delta_encoder is not None:
+            if run_id is None:
+                self._delta_encoder.clear()
             else:
-                cursor = await self._db.execute(
-                    f"SELECT values_data FROM steps WHERE run_id = ? ORDER BY {_STEP_TIME_ORDER}",
-                    (run_id,),
-                )
+                self._delta_encoder.forget(run_id)
+
+    async def _resolve_blob_refs(self, db: Any, values_dicts: Iterable[dict[str, Any] | None]) -> None:
+        """Resolve every ``_BlobRef`` and ``DeltaRef`` in ``values_dicts`` through ``db``."""
+        values_dicts = list(values_dicts)
+        if _has_delta_refs(values_dicts):
+            await self._resolve_deltas(db, values_dicts)
+        blobs: dict[str, bytes] = {}
+        for sql, params in _value_blob_batches(_blob_digests(values_dicts)):
+            cursor = await db.execute(sql, params)
+            blobs.update(await cursor.fetchall())
+        self._replace_blob_refs(values_dicts, blobs)
+
+    def _resolve_blob_refs_sync(self, db: Any, values_dicts: Iterable[dict[str, Any] | None]) -> None:
+        """Sync mirror of ``_resolve_blob_refs``."""
+        values_dicts = list(values_dicts)
+        if _has_delta_refs(values_dicts):
+            self._resolve_deltas_sync(db, values_dicts)
+        blobs: dict[str, bytes] = {}
+        for sql, params in _value_blob_batches(_blob_digests(values_dicts)):
+            blobs.update(db.execute(sql, params).fetchall())
+        self._replace_blob_refs(values_dicts, blobs)
+
+    def _take_keyed_values(self, states: dict[str, dict[str, Any]], row: Any, keys: Sequence[str]) -> bool:
+        """Fold one newest-first keyed row into ``states``; True once its run has every key.
+
+        A later step already supplied any key present in ``states``, so only
+        the still-missing keys are taken, and a step whose ``value_keys``
+        names none of them is skipped without deserializing its values.
+        """
+        run_id, values_blob, value_refs, value_keys = row
+        state = states.setdefault(run_id, {})
+        missing = [key for key in keys if key not in state]
+        if not missing:
+            return True
+        if values_blob is None or (value_keys is not None and not set(missing).intersection(json.loads(value_keys))):
+            return False
+        values = self._decode_step_values(values_blob, value_refs) or {}
+        for key in missing:
+            if key in values:
+                state[key] = values[key]
+        return len(state) == len(keys)
+
+    @staticmethod
+    def _order_keyed(state: dict[str, Any], keys: Sequence[str]) -> dict[str, Any]:
+        """``state`` restricted to ``keys``, in the order they were requested."""
+        return {key: state[key] for key in keys if key in state}
 
+    async def get_state(
+        self,
+        run_id: str,
+        *,
+        superstep: int | None = None,
+        keys: Sequence[str] | None = None,
+    ) -> dict[str, Any]:
+        """Compute state by folding step values in timestamp execution order.
+
+        With ``keys``, steps are read newest first, a step that wrote none of
+        the still-missing keys never has its values read, and the scan stops
+        once every key has been found. A step that did write one is decoded
+        whole, its other outputs included: a step's inline values are one
+        serialized blob. Under ``dedupe_values=True`` every output of 64
+        serialized bytes or more is a blob of its own, so only the requested
+        ones among those are decoded.
+        """
+        sql, params = _state_query(run_id, superstep, keys)
+        async with self._read_db() as db:
+            cursor = await db.execute(sql, params)
             state: dict[str, Any] = {}
-            async for (values_blob,) in cursor:
-                if values_blob is not None:
-                    values = self._serializer.deserialize(values_blob)
-                    if values:
-                        state.update(values)
+            if keys is None:
+                async for values_blob, value_refs in cursor:
+                    self._fold_step_values(state, values_blob, value_refs)
+            else:
+                keys = list(dict.fromkeys(keys))
+                states: dict[str, dict[str, Any]] = {}
+                async for row in cursor:
+                    if self._take_keyed_values(states, row, keys):
+                        break
+                state = self._order_keyed(states.get(run_id, {}), keys)
+            await self._resolve_blob_refs(db, [state])
             return state
 
     # -- Batched projection reads ---------------------------------------------
@@ -1235,47 +1847,47 @@ class SqliteCheckpointer(Checkpointer):
         unique = list(dict.fromkeys(run_ids))
         return [unique[i : i + _MAX_SQL_VARIABLES] for i in range(0, len(unique), _MAX_SQL_VARIABLES)]
 
-    def _fold_states(self, rows: Iterable[Any]) -> dict[str, dict[str, Any]]:
-        """Fold ``(run_id, values_blob)`` rows exactly as ``get_state`` does."""
+    def _fold_states(self, rows: Iterable[Any], keys: Sequence[str] | None = None) -> dict[str, dict[str, Any]]:
+        """Fold ``_states_query`` rows exactly as ``get_state`` does.
+
+        Shared values are left as ``_BlobRef``; the caller resolves them.
+        """
         states: dict[str, dict[str, Any]] = {}
-        for run_id, values_blob in rows:
-            state = states.setdefault(run_id, {})
-            if values_blob is not None:
-                values = self._serializer.deserialize(values_blob)
-                if values:
-                    state.update(values)
-        return states
+        if keys is None:
+            for run_id, values_blob, value_refs in rows:
+                self._fold_step_values(states.setdefault(run_id, {}), values_blob, value_refs)
+            return states
+        for row in rows:
+            self._take_keyed_values(states, row, keys)
+        return {run_id: self._order_keyed(state, keys) for run_id, state in states.items()}
 
-    async def get_states(self, run_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
-        """Folded state for several runs at once. Runs with no steps are absent."""
-        await self._ensure_db()
+    async def get_states(self, run_ids: Sequence[str], *, keys: Sequence[str] | None = None) -> dict[str, dict[str, Any]]:
+        """Folded state for several runs at once. Runs with no steps are absent.
+
+        ``keys`` narrows every state to those outputs, and decodes the same
+        steps, as in ``get_state``.
+        """
+        keys = list(dict.fromkeys(keys)) if keys is not None else None
         states: dict[str, dict[str, Any]] = {}
         for chunk in self._chunk_run_ids(run_ids):
-            placeholders = ",".join("?" * len(chunk))
-            async with self._txn_lock():
-                cursor = await self._db.execute(
-                    f"SELECT run_id, values_data FROM steps WHERE run_id IN ({placeholders}) ORDER BY run_id, {_STEP_TIME_ORDER}",
-                    chunk,
-                )
-                rows = await cursor.fetchall()
-            states.update(self._fold_states(rows))
+            sql, params = _states_query(chunk, keys)
+            async with self._read_db() as db:
+                cursor = await db.execute(sql, params)
+                folded = self._fold_states(await cursor.fetchall(), keys)
+                await self._resolve_blob_refs(db, folded.values())
+            states.update(folded)
         return states
 
-    def get_states_sync(self, run_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
+    def get_states_sync(self, run_ids: Sequence[str], *, keys: Sequence[str] | None = None) -> dict[str, dict[str, Any]]:
         """Sync mirror of ``get_states``."""
+        keys = list(dict.fromkeys(keys)) if keys is not None else None
         states: dict[str, dict[str, Any]] = {}
         for chunk in self._chunk_run_ids(run_ids):
-            placeholders = ",".join("?" * len(chunk))
-            with self._sync_lock:
-                rows = (
-                    self._sync_db()
-                    .execute(
-                        f"SELECT run_id, values_data FROM steps WHERE run_id IN ({placeholders}) ORDER BY run_id, {_STEP_TIME_ORDER}",
-                        chunk,
-                    )
-                    .fetchall()
-                )
-            states.update(self._fold_states(rows))
+            sql, params = _states_query(chunk, keys)
+            with self._read_db_sync() as db:
+                folded = self._fold_states(db.execute(sql, params).fetchall(), keys)
+                self._resolve_blob_refs_sync(db, folded.values())
+            states.update(folded)
         return states
 
     async def get_step_failures(self, run_ids: Sequence[str]) -> dict[str, tuple[str, str | None, int | None]]:
@@ -1284,12 +1896,11 @@ class SqliteCheckpointer(Checkpointer):
         The error text is whatever the step persisted — the privacy-safe
         projection from ``safe_error_text``, never raw message text.
         """
-        await self._ensure_db()
         failures: dict[str, tuple[str, str | None, int | None]] = {}
         for chunk in self._chunk_run_ids(run_ids):
             placeholders = ",".join("?" * len(chunk))
-            async with self._txn_lock():
-                cursor = await self._db.execute(
+            async with self._read_db() as db:
+                cursor = await db.execute(
                     f"SELECT run_id, error, node_name, superstep FROM steps "
                     f"WHERE run_id IN ({placeholders}) AND error IS NOT NULL ORDER BY run_id, {_STEP_TIME_ORDER}",
                     chunk,
@@ -1303,16 +1914,12 @@ class SqliteCheckpointer(Checkpointer):
         failures: dict[str, tuple[str, str | None, int | None]] = {}
         for chunk in self._chunk_run_ids(run_ids):
             placeholders = ",".join("?" * len(chunk))
-            with self._sync_lock:
-                rows = (
-                    self._sync_db()
-                    .execute(
-                        f"SELECT run_id, error, node_name, superstep FROM steps "
-                        f"WHERE run_id IN ({placeholders}) AND error IS NOT NULL ORDER BY run_id, {_STEP_TIME_ORDER}",
-                        chunk,
-                    )
-                    .fetchall()
-                )
+            with self._read_db_sync() as db:
+                rows = db.execute(
+                    f"SELECT run_id, error, node_name, superstep FROM steps "
+                    f"WHERE run_id IN ({placeholders}) AND error IS NOT NULL ORDER BY run_id, {_STEP_TIME_ORDER}",
+                    chunk,
+                ).fetchall()
             _collect_first_failures(rows, failures)
         return failures
 
@@ -1324,7 +1931,6 @@ class SqliteCheckpointer(Checkpointer):
         show_internal: bool = False,
     ) -> list[StepRecord]:
         """Get step records in execution order."""
-        await self._ensure_db()
 
         conditions = ["run_id = ?"]
         params: list[Any] = [run_id]
@@ -1334,13 +1940,14 @@ class SqliteCheckpointer(Checkpointer):
         if not show_internal:
             conditions.append(_PUBLIC_STEP_FILTER)
 
-        async with self._txn_lock():
-            cursor = await self._db.execute(
+        async with self._read_db() as db:
+            cursor = await db.execute(
                 f"SELECT {_STEPS_COLS} FROM steps WHERE {' AND '.join(conditions)} ORDER BY {_STEP_TIME_ORDER}",
                 params,
             )
-            rows = await cursor.fetchall()
-            return StepTable(self._row_to_step(row) for row in rows)
+            steps = [self._row_to_step(row) for row in await cursor.fetchall()]
+            await self._resolve_blob_refs(db, [step.values for step in steps])
+            return StepTable(steps)
 
     async def retry_workflow_async(
         self,
@@ -1354,8 +1961,8 @@ class SqliteCheckpointer(Checkpointer):
         source = await self.get_run_async(source_run_id)
         if source is None:
             raise ValueError(f"Unknown source workflow_id: {source_run_id!r}")
-        async with self._txn_lock():
-            cursor = await self._db.execute("SELECT COUNT(*) FROM runs WHERE retry_of = ?", (source_run_id,))
+        async with self._read_db() as db:
+            cursor = await db.execute("SELECT COUNT(*) FROM runs WHERE retry_of = ?", (source_run_id,))
             (retry_count,) = await cursor.fetchone()
         retry_index = int(retry_count or 0) + 1
         checkpoint = await self.get_checkpoint(source_run_id, superstep=superstep)
@@ -1366,9 +1973,8 @@ class SqliteCheckpointer(Checkpointer):
 
     async def get_run_async(self, run_id: str) -> Run | None:
         """Get run metadata, including the run's current pause occurrence."""
-        await self._ensure_db()
-        async with self._txn_lock():
-            cursor = await self._db.execute(
+        async with self._read_db() as db:
+            cursor = await db.execute(
                 f"SELECT {_RUNS_COLS} FROM runs WHERE id = ?",
                 (run_id,),
             )
@@ -1376,12 +1982,18 @@ class SqliteCheckpointer(Checkpointer):
             if row is None:
                 return None
             run = self._row_to_run(row)
-            slot_cursor = await self._db.execute(_PAUSE_SLOT_CURRENT_SQL, (run_id,))
+            slot_cursor = await db.execute(_PAUSE_SLOT_CURRENT_SQL, (run_id,))
             slot_row = await slot_cursor.fetchone()
         if slot_row is not None:
             run.pause_slot = _row_to_pause_slot(slot_row)
         return run
 
+    async def _lineage_children(self, run_id: str, limit: int) -> list[Run]:
+        """Runs forked or retried from ``run_id``, oldest first (one lineage hop)."""
+        async with self._read_db() as db:
+            cursor = await db.execute(_LINEAGE_CHILDREN_SQL, (run_id, run_id, limit))
+            return [self._row_to_run(row) for row in await cursor.fetchall()]
+
     async def list_runs(
         self,
         *,
@@ -1392,7 +2004,6 @@ class SqliteCheckpointer(Checkpointer):
         limit: int | None = 100,
     ) -> list[Run]:
         """List runs, optionally filtered by status and/or parent."""
-        await self._ensure_db()
 
         conditions: list[str] = []
         params: list[Any] = []
@@ -1419,8 +2030,8 @@ class SqliteCheckpointer(Checkpointer):
             query += " LIMIT ?"
             params.append(limit)
 
-        async with self._txn_lock():
-            cursor = await self._db.execute(query, params)
+        async with self._read_db() as db:
+            cursor = await db.execute(query, params)
             rows = await cursor.fetchall()
             return RunTable(self._row_to_run(row) for row in rows)
 
@@ -1432,7 +2043,6 @@ class SqliteCheckpointer(Checkpointer):
         retry_of: str | None = None,
     ) -> int:
         """Count runs without materializing full run records."""
-        await self._ensure_db()
 
         conditions: list[str] = []
         params: list[Any] = []
@@ -1450,24 +2060,28 @@ class SqliteCheckpointer(Checkpointer):
             params.append(retry_of)
 
         where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
-        async with self._txn_lock():
-            cursor = await self._db.execute(f"SELECT COUNT(*) FROM runs{where}", params)
+        async with self._read_db() as db:
+            cursor = await db.execute(f"SELECT COUNT(*) FROM runs{where}", params)
             (count,) = await cursor.fetchone()
             return int(count or 0)
 
     _FTS_FIELDS = frozenset({"node_name", "error"})
 
-    async def search_async(self, query: str, *, field: str | None = None, limit: int = 20) -> list[StepRecord]:
-        """Search steps using FTS5 (async)."""
-        await self._ensure_db()
+    async def search_async(self, query: str, *, field: str | None = None, limit: int = 20) -> SearchResults:
+        """Search steps using FTS5 (async).
+
+        Matches only steps the index has reached: under a ``"deferred"`` or
+        ``"off"`` search index, ``results.lag`` counts the steps written
+        since, read on the same snapshot as the matches.
+        """
 
         if field is not None and field not in self._FTS_FIELDS:
             raise ValueError(f"Invalid search field: {field!r}. Must be one of {sorted(self._FTS_FIELDS)}")
         fts_query = f"{field}:{query}" if field else query
 
         cols = ", ".join(f"s.{c.strip()}" for c in _STEPS_COLS.split(","))
-        async with self._txn_lock():
-            cursor = await self._db.execute(
+        async with self._read_db() as db:
+            cursor = await db.execute(
                 f"""
                 SELECT {cols} FROM steps s
                 JOIN steps_fts fts ON s.id = fts.rowid
@@ -1477,8 +2091,33 @@ class SqliteCheckpointer(Checkpointer):
                 """,
                 (fts_query, limit),
             )
-            rows = await cursor.fetchall()
-            return StepTable(self._row_to_step(row) for row in rows)
+            steps = [self._row_to_step(row) for row in await cursor.fetchall()]
+            await self._resolve_blob_refs(db, [step.values for step in steps])
+            cursor = await db.execute(_SEARCH_LAG_SQL)
+            (lag,) = await cursor.fetchone()
+            return SearchResults(steps, lag=lag)
+
+    @property
+    def search_index(self) -> str | None:
+        """The store's search index mode, once a connection has opened it."""
+        return self._search_index
+
+    async def index_search(self, *, batch_size: int = SEARCH_INDEX_BATCH_SIZE) -> int:
+        """Catch the search index up to every step written so far.
+
+        Indexes in transactions of at most ``batch_size`` steps, yielding
+        between them, and returns how many steps it indexed. A no-op under
+        ``search_index="eager"``, where nothing is ever behind.
+        """
+        await self._ensure_db()
+        total = 0
+        while True:
+            async with self._txn_lock():
+                indexed = await index_batch(self._db, batch_size)
+            total += indexed
+            if indexed < batch_size:
+                return total
+            await asyncio.sleep(0)
 
     # === Attempt Ledger (async) ===
     #
@@ -1497,6 +2136,7 @@ class SqliteCheckpointer(Checkpointer):
     # - on any failure the open transaction is rolled back.
 
     async def _rollback_async(self) -> None:
+        self._forget_deltas()
         with contextlib.suppress(Exception):
             await self._db.rollback()
 
@@ -1728,7 +2368,7 @@ class SqliteCheckpointer(Checkpointer):
                         ),
                     )
                     self._check_settled_exactly_one(cursor.rowcount, f"Attempt #{attempt_number} in series {series_id!r}")
-                await self._db.execute(_STEP_UPSERT_SQL, self._step_upsert_params(step_record))
+                await self._write_step(step_record)
                 cursor = await self._db.execute(_ATTEMPT_SERIES_CLOSE_SQL, (now.isoformat(), step_record.superstep, series_id))
                 self._check_settled_exactly_one(cursor.rowcount, f"Attempt series {series_id!r}")
                 await self._apply_retention_policy_async(step_record.run_id)
@@ -1769,10 +2409,11 @@ class SqliteCheckpointer(Checkpointer):
         Columns: id, run_id, step_index, superstep, node_name, node_type,
                  status, duration_ms, cached, error, decision, input_versions,
                  values_data, child_run_id, created_at, completed_at, partial,
-                 attempt_series_id (trailing columns len-guarded for old rows).
+                 attempt_series_id, value_refs (trailing columns len-guarded
+                 for old rows). Shared values come back as ``_BlobRef``; the
+                 caller resolves them on the connection it read the row from.
         """
-        values_blob = row[12]
-        values = self._serializer.deserialize(values_blob) if values_blob is not None else None
+        values = self._decode_step_values(row[12], row[18] if len(row) > 18 else None)
         input_versions = json.loads(row[11]) if row[11] else {}
         decision_raw = row[10]
         decision = json.loads(decision_raw) if decision_raw else None
@@ -1840,37 +2481,44 @@ class SqliteCheckpointer(Checkpointer):
                 )
                 conn.execute("PRAGMA journal_mode=WAL")
                 ensure_schema(conn)
+                self._open_search_index(conn)
                 # Defense-in-depth for same-store references, mirroring the async
                 # connection. Set after ensure_schema so a v4->v5 table rebuild
                 # runs with foreign keys off.
                 conn.execute("PRAGMA foreign_keys=ON")
                 self._sync_conn = conn
+                if self._read_connections:
+                    # Started with the writer, so a later read never needs the
+                    # writer lock just to find its pool.
+                    self._sync_read_pool = SyncReadPool(self._open_read_conn_sync, self._read_connections)
             return self._sync_conn
 
-    def state(self, run_id: str, *, superstep: int | None = None) -> dict[str, Any]:
+    def state(
+        self,
+        run_id: str,
+        *,
+        superstep: int | None = None,
+        keys: Sequence[str] | None = None,
+    ) -> dict[str, Any]:
         """Get accumulated state synchronously.
 
         Same as ``get_state`` but uses stdlib ``sqlite3`` — no await needed.
         """
-        with self._sync_lock:
-            db = self._sync_db()
-            if superstep is not None:
-                cursor = db.execute(
-                    f"SELECT values_data FROM steps WHERE run_id = ? AND superstep <= ? ORDER BY {_STEP_TIME_ORDER}",
-                    (run_id, superstep),
-                )
-            else:
-                cursor = db.execute(
-                    f"SELECT values_data FROM steps WHERE run_id = ? ORDER BY {_STEP_TIME_ORDER}",
-                    (run_id,),
-                )
-
+        sql, params = _state_query(run_id, superstep, keys)
+        with self._read_db_sync() as db:
+            cursor = db.execute(sql, params)
             state: dict[str, Any] = {}
-            for (values_blob,) in cursor:
-                if values_blob is not None:
-                    values = self._serializer.deserialize(values_blob)
-                    if values:
-                        state.update(values)
+            if keys is None:
+                for values_blob, value_refs in cursor:
+                    self._fold_step_values(state, values_blob, value_refs)
+            else:
+                keys = list(dict.fromkeys(keys))
+                states: dict[str, dict[str, Any]] = {}
+                for row in cursor:
+                    if self._take_keyed_values(states, row, keys):
+                        break
+                state = self._order_keyed(states.get(run_id, {}), keys)
+            self._resolve_blob_refs_sync(db, [state])
             return state
 
     def steps(
@@ -1881,8 +2529,7 @@ class SqliteCheckpointer(Checkpointer):
         show_internal: bool = False,
     ) -> list[StepRecord]:
         """Get step records synchronously."""
-        with self._sync_lock:
-            db = self._sync_db()
+        with self._read_db_sync() as db:
             conditions = ["run_id = ?"]
             params: list[Any] = [run_id]
             if superstep is not None:
@@ -1894,12 +2541,13 @@ class SqliteCheckpointer(Checkpointer):
                 f"SELECT {_STEPS_COLS} FROM steps WHERE {' AND '.join(conditions)} ORDER BY {_STEP_TIME_ORDER}",
                 params,
             )
-            return StepTable(self._row_to_step(row) for row in cursor.fetchall())
+            steps = [self._row_to_step(row) for row in cursor.fetchall()]
+            self._resolve_blob_refs_sync(db, [step.values for step in steps])
+            return StepTable(steps)
 
     def get_run(self, run_id: str) -> Run | None:
         """Get run metadata synchronously, including its current pause occurrence."""
-        with self._sync_lock:
-            db = self._sync_db()
+        with self._read_db_sync() as db:
             cursor = db.execute(f"SELECT {_RUNS_COLS} FROM runs WHERE id = ?", (run_id,))
             row = cursor.fetchone()
             if row is None:
@@ -1927,8 +2575,7 @@ class SqliteCheckpointer(Checkpointer):
                 None → top-level only (no parent).
                 "X" → children of run X.
         """
-        with self._sync_lock:
-            db = self._sync_db()
+        with self._read_db_sync() as db:
             conditions = []
             params: list[Any] = []
 
@@ -1969,34 +2616,30 @@ class SqliteCheckpointer(Checkpointer):
         Shows root ancestor + all fork descendants in tree order. When
         ``include_steps=True`` each run can be expanded to inspect its steps.
         """
-        with self._sync_lock:
-            selected = self.get_run(workflow_id)
-            if selected is None:
-                raise ValueError(f"Unknown workflow_id: {workflow_id!r}")
-
-            root = selected
-            seen_ancestors = {root.id}
-            while _lineage_parent_id(root):
-                parent_id = _lineage_parent_id(root)
-                if parent_id is None:
-                    break
-                parent = self.get_run(parent_id)
-                if parent is None or parent.id in seen_ancestors:
-                    break
-                root = parent
-                seen_ancestors.add(root.id)
-
-            db = self._sync_db()
-            run_by_id: dict[str, Run] = {root.id: root}
-            children_by_parent: dict[str, list[Run]] = {}
-
-            queue: list[str] = [root.id]
+        selected = self.get_run(workflow_id)
+        if selected is None:
+            raise ValueError(f"Unknown workflow_id: {workflow_id!r}")
+
+        root = selected
+        seen_ancestors = {root.id}
+        while _lineage_parent_id(root):
+            parent_id = _lineage_parent_id(root)
+            if parent_id is None:
+                break
+            parent = self.get_run(parent_id)
+            if parent is None or parent.id in seen_ancestors:
+                break
+            root = parent
+            seen_ancestors.add(root.id)
+
+        run_by_id: dict[str, Run] = {root.id: root}
+        children_by_parent: dict[str, list[Run]] = {}
+
+        queue: list[str] = [root.id]
+        with self._read_db_sync() as db:
             while queue and len(run_by_id) < max_runs:
                 parent_id = queue.pop(0)
-                cursor = db.execute(
-                    f"SELECT {_RUNS_COLS} FROM runs WHERE forked_from = ? OR retry_of = ? ORDER BY created_at ASC LIMIT ?",
-                    (parent_id, parent_id, max_runs),
-                )
+                cursor = db.execute(_LINEAGE_CHILDREN_SQL, (parent_id, parent_id, max_runs))
                 children = [self._row_to_run(row) for row in cursor.fetchall()]
                 children_by_parent[parent_id] = children
                 for child in children:
@@ -2007,42 +2650,22 @@ class SqliteCheckpointer(Checkpointer):
                         break
                     queue.append(child.id)
 
-            rows: list[LineageRow] = [LineageRow(lane="● ", run=root, depth=0, is_selected=(root.id == workflow_id))]
-
-            def _walk(parent_id: str, *, flags: list[bool], depth: int) -> None:
-                children = children_by_parent.get(parent_id, [])
-                for idx, child in enumerate(children):
-                    has_next = idx < len(children) - 1
-                    prefix = "".join("│  " if flag else "   " for flag in flags)
-                    lane = f"{prefix}{'├─ ' if has_next else '└─ '}"
-                    rows.append(
-                        LineageRow(
-                            lane=lane,
-                            run=child,
-                            depth=depth,
-                            is_selected=(child.id == workflow_id),
-                        )
-                    )
-                    _walk(child.id, flags=[*flags, has_next], depth=depth + 1)
-
-            _walk(root.id, flags=[], depth=1)
-
-            steps_by_run: dict[str, StepTable] | None = None
-            if include_steps:
-                steps_by_run = {row.run.id: self.steps(row.run.id) for row in rows}  # type: ignore[misc]
+        rows = _lineage_rows(root, children_by_parent, workflow_id)
 
-            return LineageView(
-                rows,
-                selected_run_id=workflow_id,
-                root_run_id=root.id,
-                steps_by_run=steps_by_run,
-            )
+        steps_by_run: dict[str, StepTable] | None = None
+        if include_steps:
+            steps_by_run = {row.run.id: self.steps(row.run.id) for row in rows}  # type: ignore[misc]
 
-    def search(self, query: str, *, field: str | None = None, limit: int = 20) -> list[StepRecord]:
-        """Search steps using FTS5 (sync)."""
-        with self._sync_lock:
-            db = self._sync_db()
+        return LineageView(
+            rows,
+            selected_run_id=workflow_id,
+            root_run_id=root.id,
+            steps_by_run=steps_by_run,
+        )
 
+    def search(self, query: str, *, field: str | None = None, limit: int = 20) -> SearchResults:
+        """Search steps using FTS5 (sync); see ``search_async`` for ``lag``."""
+        with self._read_db_sync() as db:
             if field is not None and field not in self._FTS_FIELDS:
                 raise ValueError(f"Invalid search field: {field!r}. Must be one of {sorted(self._FTS_FIELDS)}")
             fts_query = f"{field}:{query}" if field else query
@@ -2059,20 +2682,28 @@ class SqliteCheckpointer(Checkpointer):
                 """,
                 (fts_query, limit),
             )
-            return StepTable(self._row_to_step(row) for row in cursor.fetchall())
+            steps = [self._row_to_step(row) for row in cursor.fetchall()]
+            self._resolve_blob_refs_sync(db, [step.values for step in steps])
+            (lag,) = db.execute(_SEARCH_LAG_SQL).fetchone()
+            return SearchResults(steps, lag=lag)
+
+    def index_search_sync(self, *, batch_size: int = SEARCH_INDEX_BATCH_SIZE) -> int:
+        """Catch the search index up synchronously (see ``index_search``)."""
+        total = 0
+        while True:
+            with self._sync_lock:
+                indexed = index_batch_sync(self._sync_db(), batch_size)
+            total += indexed
+            if indexed < batch_size:
+                return total
 
     def values(self, run_id: str, *, key: str | None = None) -> dict[str, Any]:
         """Get run output values synchronously. Optionally filter to a single key."""
-        with self._sync_lock:
-            full_state = self.state(run_id)
-            if key is not None:
-                return {key: full_state[key]} if key in full_state else {}
-            return full_state
+        return self.state(run_id, keys=[key] if key is not None else None)
 
     def stats(self, run_id: str) -> dict[str, Any]:
         """Get per-node duration/frequency stats for a run."""
-        with self._sync_lock:
-            db = self._sync_db()
+        with self._read_db_sync() as db:
             cursor = db.execute(
                 f"""
                 SELECT node_name, node_type,
@@ -2103,13 +2734,12 @@ class SqliteCheckpointer(Checkpointer):
 
     def checkpoint(self, run_id: str, *, superstep: int | None = None) -> Checkpoint:
         """Get a checkpoint synchronously — see ``get_checkpoint`` for the model."""
-        with self._sync_lock:
-            return Checkpoint(
-                values={**self.get_run_inputs_sync(run_id), **self.state(run_id, superstep=superstep)},
-                steps=self.steps(run_id, superstep=superstep),
-                source_run_id=run_id,
-                source_superstep=superstep,
-            )
+        return Checkpoint(
+            values={**self.get_run_inputs_sync(run_id), **self.state(run_id, superstep=superstep)},
+            steps=self.steps(run_id, superstep=superstep),
+            source_run_id=run_id,
+            source_superstep=superstep,
+        )
 
     def fork_workflow(
         self,
@@ -2220,7 +2850,7 @@ class SqliteCheckpointer(Checkpointer):
         with self._sync_lock:
             db = self._sync_db()
             try:
-                db.execute(_STEP_UPSERT_SQL, self._step_upsert_params(record))
+                self._write_step_sync(db, record)
                 self._apply_retention_policy_sync(record.run_id)
                 self._after_run_mutation_sync(
                     db,
@@ -2242,14 +2872,10 @@ class SqliteCheckpointer(Checkpointer):
         """Sync subclass hook that may delay after a committed step."""
 
     def _merge_retained_state(self, rows: Sequence[_RetentionRow]) -> dict[str, Any]:
+        """Fold the dropped rows; shared values stay ``_BlobRef`` into the baseline."""
         state: dict[str, Any] = {}
         for row in rows:
-            values_blob = row.values_data
-            if values_blob is None:
-                continue
-            values = self._serializer.deserialize(values_blob)
-            if values:
-                state.update(values)
+            self._fold_step_values(state, row.values_data, row.value_refs)
         return state
 
     def _baseline_timestamp(
@@ -2275,20 +2901,21 @@ class SqliteCheckpointer(Checkpointer):
         dropped_rows: Sequence[_RetentionRow],
         kept_rows: Sequence[_RetentionRow],
         baseline_superstep: int,
-    ) -> tuple[Any, ...] | None:
+    ) -> tuple[list[tuple[str, bytes]], tuple[Any, ...]] | None:
         values = self._merge_retained_state(dropped_rows)
         if not values:
             return None
 
+        values_blob, value_refs, blobs = self._encode_step_values(values)
         baseline_at = self._baseline_timestamp(kept_rows, dropped_rows).isoformat()
-        return (
+        return blobs, (
             run_id,
             baseline_superstep,
             _RETENTION_BASELINE_NODE_NAME,
             min(row.step_index for row in dropped_rows),
             StepStatus.COMPLETED.value,
             "{}",
-            self._serializer.serialize(values),
+            values_blob,
             0.0,
             0,
             None,
@@ -2299,6 +2926,8 @@ class SqliteCheckpointer(Checkpointer):
             None,
             0,
             None,
+            value_refs,
+            _value_keys_json(values),
         )
 
     @staticmethod
@@ -2393,7 +3022,12 @@ class SqliteCheckpointer(Checkpointer):
             await self._db.execute(records_sql, series_batch)
             await self._db.execute(series_sql, series_batch)
         if baseline_params is not None:
-            await self._db.execute(_STEP_UPSERT_SQL, baseline_params)
+            blobs, params = baseline_params
+            if blobs:
+                await self._db.executemany(_VALUE_BLOB_INSERT_SQL, blobs)
+            await self._db.execute(_STEP_UPSERT_SQL, params)
+        # After the baseline: it re-references the blobs the delete released.
+        await self._db.execute(_VALUE_BLOB_GC_SQL)
 
     def _compact_retention_sync(
         self,
@@ -2424,7 +3058,12 @@ class SqliteCheckpointer(Checkpointer):
                 db.execute(records_sql, series_batch)
                 db.execute(series_sql, series_batch)
             if baseline_params is not None:
-                db.execute(_STEP_UPSERT_SQL, baseline_params)
+                blobs, params = baseline_params
+                if blobs:
+                    db.executemany(_VALUE_BLOB_INSERT_SQL, blobs)
+                db.execute(_STEP_UPSERT_SQL, params)
+            # After the baseline: it re-references the blobs the delete released.
+            db.execute(_VALUE_BLOB_GC_SQL)
 
     async def _apply_retention_policy_async(self, run_id: str) -> None:
         """Apply configured retention policy after persisting a step (async)."""
@@ -2459,6 +3098,282 @@ class SqliteCheckpointer(Checkpointer):
                     baseline_superstep=plan.baseline_superstep,
                 )
 
+    # === Compaction (CheckpointPolicy.ttl) ===
+    #
+    # ``compact()`` is the one enforcement point for ``ttl``: nothing expires
+    # as a side effect of a write. It works in short BEGIN IMMEDIATE batches
+    # and gives the lock back between them, so calling it next to live runs
+    # costs them a brief wait per batch rather than a stall for the sweep.
+    # RunHome widens both hooks below so host rows expire with their runs.
+
+    #: Extra predicate on the expirable-roots query (``r`` is the runs row).
+    _EXPIRABLE_RUN_CLAUSE = ""
+    #: Extra ``(counter, sql)`` deletes run per chunk of expiring run ids.
+    _EXPIRE_RUN_EXTRA_DELETES: tuple[tuple[str, str], ...] = ()
+
+    @staticmethod
+    def _check_compact_args(batch_size: int, max_batches: int | None) -> None:
+        if isinstance(batch_size, bool) or not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(f"batch_size must be an int >= 1 root runs per transaction, got {batch_size!r}")
+        if max_batches is not None and (isinstance(max_batches, bool) or not isinstance(max_batches, int) or max_batches < 1):
+            raise ValueError(f"max_batches must be an int >= 1 or None for no bound, got {max_batches!r}")
+
+    def _expirable_trees_sync(self, db: Any, root_ids: Sequence[str]) -> tuple[dict[str, list[str]], set[str]]:
+        tree = [(row[0], row[1]) for chunk in self._chunk_run_ids(root_ids) for row in db.execute(*_descendant_runs_query(chunk)).fetchall()]
+        referrers: list[tuple[str, str | None, str | None]] = []
+        for chunk in self._chunk_run_ids([run_id for run_id, _ in tree]):
+            for column in ("forked_from", "retry_of"):
+                sql = _REFERRING_RUNS_SQL.format(column=column, ids=", ".join("?" for _ in chunk))
+                referrers.extend(db.execute(sql, chunk).fetchall())
+        return _surviving_trees(tree, referrers)
+
+    async def _expirable_trees(self, root_ids: Sequence[str]) -> tuple[dict[str, list[str]], set[str]]:
+        tree: list[tuple[str, str]] = []
+        for chunk in self._chunk_run_ids(root_ids):
+            cursor = await self._db.execute(*_descendant_runs_query(chunk))
+            tree.extend((row[0], row[1]) for row in await cursor.fetchall())
+        referrers: list[tuple[str, str | None, str | None]] = []
+        for chunk in self._chunk_run_ids([run_id for run_id, _ in tree]):
+            for column in ("forked_from", "retry_of"):
+                sql = _REFERRING_RUNS_SQL.format(column=column, ids=", ".join("?" for _ in chunk))
+                cursor = await self._db.execute(sql, chunk)
+                referrers.extend(await cursor.fetchall())
+        return _surviving_trees(tree, referrers)
+
+    def _delete_runs_sync(self, db: Any, run_ids: Sequence[str], counts: dict[str, int], archive: RunArchive | None = None) -> None:
+        for chunk in self._chunk_run_ids(run_ids):
+            placeholders = ", ".join("?" for _ in chunk)
+            if archive is not None:
+                tables: list[ArchiveRows] = []
+                for table, sql in ARCHIVE_SELECTS:
+                    cursor = db.execute(sql.format(ids=placeholders), chunk)
+                    tables.append((table, [column[0] for column in cursor.description], cursor.fetchall()))
+                counts["archived"] = counts.get("archived", 0) + archive.write(tables)
+            for counter, sql in (*_EXPIRE_RUN_DELETES, *self._EXPIRE_RUN_EXTRA_DELETES):
+                counts[counter] = counts.get(counter, 0) + db.execute(sql.format(ids=placeholders), chunk).rowcount
+            counts["runs"] = counts.get("runs", 0) + db.execute(_DELETE_RUNS_SQL.format(ids=placeholders), chunk).rowcount
+
+    async def _delete_runs(self, run_ids: Sequence[str], counts: dict[str, int], archive: RunArchive | None = None) -> None:
+        for chunk in self._chunk_run_ids(run_ids):
+            placeholders = ", ".join("?" for _ in chunk)
+            if archive is not None:
+                tables: list[ArchiveRows] = []
+                for table, sql in ARCHIVE_SELECTS:
+                    cursor = await self._db.execute(sql.format(ids=placeholders), chunk)
+                    tables.append((table, [column[0] for column in cursor.description], await cursor.fetchall()))
+                archived = await asyncio.to_thread(archive.write, tables)
+                counts["archived"] = counts.get("archived", 0) + archived
+            for counter, sql in (*_EXPIRE_RUN_DELETES, *self._EXPIRE_RUN_EXTRA_DELETES):
+                cursor = await self._db.execute(sql.format(ids=placeholders), chunk)
+                counts[counter] = counts.get(counter, 0) + cursor.rowcount
+            cursor = await self._db.execute(_DELETE_RUNS_SQL.format(ids=placeholders), chunk)
+            counts["runs"] = counts.get("runs", 0) + cursor.rowcount
+
+    def _compact_batch_sync(self, db: Any, cutoff: str, batch_size: int, archive: RunArchive | None = None) -> dict[str, int]:
+        """Expire up to ``batch_size`` root runs inside the caller's transaction."""
+        counts: dict[str, int] = {}
+        roots = [row[0] for row in db.execute(*_expired_roots_query(cutoff, batch_size, self._EXPIRABLE_RUN_CLAUSE)).fetchall()]
+        trees, _ = self._expirable_trees_sync(db, roots)
+        self._delete_runs_sync(db, [run_id for tree in trees.values() for run_id in tree], counts, archive)
+        counts["blobs"] = db.execute(_VALUE_BLOB_GC_SQL).rowcount
+        return counts
+
+    async def _compact_batch(self, cutoff: str, batch_size: int, archive: RunArchive | None = None) -> dict[str, int]:
+        """Expire up to ``batch_size`` root runs inside the caller's transaction."""
+        counts: dict[str, int] = {}
+        cursor = await self._db.execute(*_expired_roots_query(cutoff, batch_size, self._EXPIRABLE_RUN_CLAUSE))
+        roots = [row[0] for row in await cursor.fetchall()]
+        trees, _ = await self._expirable_trees(roots)
+        await self._delete_runs([run_id for tree in trees.values() for run_id in tree], counts, archive)
+        cursor = await self._db.execute(_VALUE_BLOB_GC_SQL)
+        counts["blobs"] = cursor.rowcount
+        return counts
+
+    @staticmethod
+    def _merge_counts(total: dict[str, int], counts: dict[str, int]) -> bool:
+        """Fold one batch into the running total; True when it removed anything."""
+        for counter, n in counts.items():
+            total[counter] = total.get(counter, 0) + n
+        return any(counts.values())
+
+    def _vacuum_sync(self, db: Any) -> tuple[int, int]:
+        """Return freed pages to the OS in bounded slices; ``(reclaimed, free)`` bytes."""
+        (page_size,) = db.execute("PRAGMA page_size").fetchone()
+        (before,) = db.execute("PRAGMA page_count").fetchone()
+        (mode,) = db.execute("PRAGMA auto_vacuum").fetchone()
+        (free_pages,) = db.execute("PRAGMA freelist_count").fetchone()
+        slices = 0
+        while mode == 2 and free_pages > 0 and slices < _VACUUM_MAX_SLICES:
+            db.execute(f"PRAGMA incremental_vacuum({_VACUUM_PAGE_BUDGET})").fetchall()
+            db.commit()
+            slices += 1
+            (free_pages,) = db.execute("PRAGMA freelist_count").fetchone()
+        (after,) = db.execute("PRAGMA page_count").fetchone()
+        return max(before - after, 0) * page_size, free_pages * page_size
+
+    async def _vacuum(self) -> tuple[int, int]:
+        """Return freed pages to the OS in bounded slices; ``(reclaimed, free)`` bytes."""
+
+        async def pragma(name: str) -> int:
+            cursor = await self._db.execute(f"PRAGMA {name}")
+            (value,) = await cursor.fetchone()
+            return int(value)
+
+        async with self._txn_lock():
+            page_size, before, mode = [await pragma(name) for name in ("page_size", "page_count", "auto_vacuum")]
+            free_pages = await pragma("freelist_count")
+        slices = 0
+        while mode == 2 and free_pages > 0 and slices < _VACUUM_MAX_SLICES:
+            async with self._txn_lock():
+                cursor = await self._db.execute(f"PRAGMA incremental_vacuum({_VACUUM_PAGE_BUDGET})")
+                await cursor.fetchall()
+                await self._db.commit()
+                free_pages = await pragma("freelist_count")
+            slices += 1
+            await asyncio.sleep(0)
+        async with self._txn_lock():
+            after = await pragma("page_count")
+        return max(before - after, 0) * page_size, free_pages * page_size
+
+    async def convert_to_incremental(self) -> bool:
+        """Switch a store created before incremental auto-vacuum over to it.
+
+        Changing the mode takes one full ``VACUUM``: the whole file is
+        rewritten under the write lock and needs about its own size again in
+        free disk space while it runs. Call it once, at a quiet moment; after
+        it ``compact()`` returns freed pages to the OS in bounded slices.
+
+        Returns:
+            True if the file was rewritten, False if it was already incremental.
+        """
+        await self._ensure_db()
+        async with self._txn_lock():
+            cursor = await self._db.execute("PRAGMA auto_vacuum")
+            (mode,) = await cursor.fetchone()
+            if mode == 2:
+                return False
+            await self._db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            await self._db.execute("VACUUM")
+        return True
+
+    def convert_to_incremental_sync(self) -> bool:
+        """Switch an older store to incremental auto-vacuum synchronously (see ``convert_to_incremental``)."""
+        with self._sync_lock:
+            db = self._sync_db()
+            (mode,) = db.execute("PRAGMA auto_vacuum").fetchone()
+            if mode == 2:
+                return False
+            db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            db.execute("VACUUM")
+        return True
+
+    async def compact(
+        self,
+        *,
+        now: datetime | None = None,
+        batch_size: int = _COMPACT_BATCH_SIZE,
+        max_batches: int | None = None,
+        archive: str | Path | None = None,
+    ) -> CompactionReport:
+        """Expire runs older than ``policy.ttl`` and return the freed space.
+
+        A run expires as a whole — its nested runs, steps, attempt ledger,
+        node boundaries, and pause slots go with it — once it is terminal and
+        finished at least ``ttl`` before ``now``. Active and paused runs never
+        expire, and neither does a run another surviving run forks or retries
+        from. Without a ``ttl`` nothing expires; freed pages are still
+        returned to the OS.
+
+        Work runs in transactions of at most ``batch_size`` root runs, oldest
+        first, yielding between them; ``max_batches`` bounds one call so a
+        periodic caller can spread a large backlog over several ticks
+        (``report.complete`` says whether anything expired was left behind).
+
+        With ``archive``, each expiring run tree is first copied into that
+        SQLite file (created on first use, same schema), which
+        ``SqliteCheckpointer(archive)`` reads like any store.
+
+        Freed pages go back to the OS in bounded slices. A store created
+        before incremental auto-vacuum keeps them on its freelist for reuse
+        (reported in ``free_bytes``) until ``convert_to_incremental()`` is
+        called; compaction never rewrites the file on its own.
+
+        Args:
+            now: The instant expiry is measured from (default: current UTC).
+            batch_size: Root runs expired per transaction.
+            max_batches: Stop after this many transactions (None: no bound).
+            archive: Path of a cold SQLite archive for expired runs (None:
+                expired runs are only deleted).
+        """
+        self._check_compact_args(batch_size, max_batches)
+        await self._ensure_db()
+        cutoff = _ttl_cutoff(self.policy.ttl, now)
+        total: dict[str, int] = {}
+        transactions = 0
+        complete = True
+        cold = await asyncio.to_thread(RunArchive, archive) if archive is not None and cutoff is not None else None
+        try:
+            while cutoff is not None:
+                if max_batches is not None and transactions >= max_batches:
+                    complete = False
+                    break
+                async with self._txn_lock():
+                    try:
+                        await self._db.execute("BEGIN IMMEDIATE")
+                        counts = await self._compact_batch(cutoff, batch_size, cold)
+                        await self._db.commit()
+                    except BaseException:
+                        await self._rollback_async()
+                        raise
+                transactions += 1
+                if not self._merge_counts(total, counts):
+                    break
+                await asyncio.sleep(0)
+        finally:
+            if cold is not None:
+                cold.close()
+        reclaimed, free = await self._vacuum()
+        return _compaction_report(total, transactions=transactions, bytes_reclaimed=reclaimed, free_bytes=free, complete=complete)
+
+    def compact_sync(
+        self,
+        *,
+        now: datetime | None = None,
+        batch_size: int = _COMPACT_BATCH_SIZE,
+        max_batches: int | None = None,
+        archive: str | Path | None = None,
+    ) -> CompactionReport:
+        """Expire runs older than ``policy.ttl`` synchronously (see ``compact``)."""
+        self._check_compact_args(batch_size, max_batches)
+        cutoff = _ttl_cutoff(self.policy.ttl, now)
+        total: dict[str, int] = {}
+        transactions = 0
+        complete = True
+        cold = RunArchive(archive) if archive is not None and cutoff is not None else None
+        try:
+            while cutoff is not None:
+                if max_batches is not None and transactions >= max_batches:
+                    complete = False
+                    break
+                with self._sync_lock:
+                    db = self._sync_db()
+                    try:
+                        db.execute("BEGIN IMMEDIATE")
+                        counts = self._compact_batch_sync(db, cutoff, batch_size, cold)
+                        db.commit()
+                    except BaseException:
+                        self._rollback_sync(db)
+                        raise
+                transactions += 1
+                if not self._merge_counts(total, counts):
+                    break
+        finally:
+            if cold is not None:
+                cold.close()
+        with self._sync_lock:
+            reclaimed, free = self._vacuum_sync(self._sync_db())
+        return _compaction_report(total, transactions=transactions, bytes_reclaimed=reclaimed, free_bytes=free, complete=complete)
+
     def update_run_status_sync(
         self,
         run_id: str,
@@ -2475,16 +3390,18 @@ class SqliteCheckpointer(Checkpointer):
             db.execute(sql, [*params, run_id])
             self._after_run_mutation_sync(db, run_id, "status", {"status": status.value})
             db.commit()
+        if status.value in _TERMINAL_RUN_STATUS_VALUES:
+            self._forget_deltas(run_id)
 
     # === Attempt Ledger (sync mirrors) ===
     #
     # Same write-through, BEGIN IMMEDIATE, and CAS/rowcount contract as the
     # async methods, over the cached sync connection used by SyncRunner. The
-    # threading RLock serializes in-process sync users; BEGIN IMMEDIATE
+    # reentrant writer lock serializes in-process sync users; BEGIN IMMEDIATE
     # serializes against the async connection at the database level.
 
-    @staticmethod
-    def _rollback_sync(db: Any) -> None:
+    def _rollback_sync(self, db: Any) -> None:
+        self._forget_deltas()
         with contextlib.suppress(Exception):
             db.rollback()
 
@@ -2659,7 +3576,7 @@ class SqliteCheckpointer(Checkpointer):
                         ),
                     )
                     self._check_settled_exactly_one(cursor.rowcount, f"Attempt #{attempt_number} in series {series_id!r}")
-                db.execute(_STEP_UPSERT_SQL, self._step_upsert_params(step_record))
+                self._write_step_sync(db, step_record)
                 cursor = db.execute(_ATTEMPT_SERIES_CLOSE_SQL, (now.isoformat(), step_record.superstep, series_id))
                 self._check_settled_exactly_one(cursor.rowcount, f"Attempt series {series_id!r}")
                 self._apply_retention_policy_sync(step_record.run_id)
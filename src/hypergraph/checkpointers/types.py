@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -170,6 +171,53 @@ class RunTotals:
 NO_RUN_TOTALS = RunTotals()
 
 
+@dataclass(frozen=True)
+class CompactionReport:
+    """What one ``compact()`` call removed from a SQLite store.
+
+    ``runs_deleted`` counts every runs row removed, nested runs included;
+    ``log_rows_deleted`` counts host update-log and command rows
+    (``run_updates``, ``batch_updates``, ``host_commands``) removed with
+    their runs; ``blobs_deleted`` counts shared value blobs
+    (``dedupe_values=True``) the expired steps were the last to reference.
+    ``runs_archived`` counts runs rows copied to ``compact(archive=...)``.
+    ``bytes_reclaimed`` is how much the database file actually shrank;
+    ``free_bytes`` is what is still sitting on the freelist — returned to
+    the OS a bounded number of slices per call, so a large sweep can leave
+    some for the next one. ``complete`` is False when the call
+    stopped at ``max_batches`` before a batch came back empty, so expired
+    runs may remain for the next call.
+    """
+
+    runs_deleted: int = 0
+    steps_deleted: int = 0
+    log_rows_deleted: int = 0
+    batches_deleted: int = 0
+    blobs_deleted: int = 0
+    runs_archived: int = 0
+    transactions: int = 0
+    bytes_reclaimed: int = 0
+    free_bytes: int = 0
+    complete: bool = True
+
+
+@dataclass(frozen=True)
+class MemoryFootprint:
+    """What a ``MemoryCheckpointer`` is holding right now.
+
+    ``bytes`` is an estimate from ``sys.getsizeof`` over step values, run
+    inputs, and the records themselves — the part that grows with use, not
+    the interpreter's own overhead. ``evicted_runs`` counts every run (nested
+    runs included) dropped by ``max_runs``, ``max_bytes``, or ``ttl`` since
+    the checkpointer was created.
+    """
+
+    runs: int = 0
+    steps: int = 0
+    bytes: int = 0
+    evicted_runs: int = 0
+
+
 @dataclass(frozen=True)
 class PauseSlot:
     """Durable record of ONE interrupt occurrence (PRD 0010).
@@ -673,6 +721,24 @@ class StepTable(list):
         return render_step_table_html(self)
 
 
+class SearchResults(StepTable):
+    """StepTable of ``search`` matches, plus how far the index is behind.
+
+    ``lag`` counts the steps written since the search index last caught up
+    (``SqliteCheckpointer(search_index="deferred")`` or ``"off"``); those
+    steps cannot match yet. Always 0 for an eagerly indexed store.
+    """
+
+    def __init__(self, steps: Iterable[StepRecord] = (), *, lag: int = 0) -> None:
+        super().__init__(steps)
+        self.lag = lag
+
+    def __repr__(self) -> str:
+        if not self.lag:
+            return super().__repr__()
+        return f"{super().__repr__()}\n  ({plural(self.lag, 'step')} not yet indexed)"
+
+
 @dataclass(frozen=True)
 class LineageRow:
     """One row in a fork lineage tree."""
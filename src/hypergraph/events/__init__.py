@@ -1,6 +1,6 @@
 """Event system for observing graph execution."""
 
-from hypergraph.events.dispatcher import EventDispatcher
+from hypergraph.events.dispatcher import DispatchStats, EventDispatcher
 from hypergraph.events.processor import (
     AsyncEventProcessor,
     EventProcessor,
@@ -50,5 +50,6 @@ __all__ = [
     "EventProcessor",
     "TypedEventProcessor",
     # Dispatcher
+    "DispatchStats",
     "EventDispatcher",
 ]
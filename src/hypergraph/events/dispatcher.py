@@ -2,23 +2,93 @@
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import contextlib
 import logging
+import queue
 import sys
-from typing import TYPE_CHECKING
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
 
 from hypergraph.events.processor import AsyncEventProcessor, EventProcessor
+from hypergraph.events.types import StreamingChunkEvent
 
 if TYPE_CHECKING:
     from hypergraph.events.types import Event
 
 logger = logging.getLogger(__name__)
 
+DispatchMode = Literal["inline", "background"]
+OverflowPolicy = Literal["block", "drop_chunks", "drop_oldest"]
 
-class EventDispatcher:
+# Wakes a worker blocked on an empty queue so it can see its stop Event. It
+# carries no event: evicting it from a full queue is harmless, since a full
+# queue wakes the worker anyway.
+_WAKE = object()
+#: How often a worker waiting on an emitting loop checks that the loop can
+#: still run the coroutine (it stops, or blocks on this dispatcher).
+_OWNER_LOOP_POLL_SECONDS = 0.05
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+@dataclass(frozen=True)
+class DispatchStats:
+    """Counters of a background ``EventDispatcher``.
+
+    Attributes:
+        delivered: Events handed to every processor by the worker.
+        dropped: Events discarded because the queue was full.
+        queued: Events waiting in the queue right now.
+        mean_latency_ms: Mean time from ``emit`` to the last processor returning.
+        max_latency_ms: Longest such time.
+    """
+
+    delivered: int = 0
+    dropped: int = 0
+    queued: int = 0
+    mean_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+
+
+class EventDispatcher(AsyncEventProcessor):
     """Manages a list of event processors and dispatches events to them.
 
     By default, dispatch is best-effort: a failing processor never breaks
     execution. With ``strict=True``, exceptions propagate immediately.
+
+    With ``mode="background"`` processors run on a dedicated worker thread:
+    ``emit`` only enqueues, so a slow exporter or renderer never adds to node
+    latency or blocks the event loop. One worker delivers events in emit
+    order. When the ``queue_size`` queue is full, ``overflow`` decides:
+    ``"block"`` waits for room, ``"drop_chunks"`` discards the incoming
+    ``StreamingChunkEvent`` (and waits for any other event), and
+    ``"drop_oldest"`` discards the oldest queued event. ``shutdown`` delivers
+    everything still queued before shutting the processors down; a strict
+    dispatcher logs each processor error as it happens and re-raises the
+    first one there.
+
+    In background mode an async processor's coroutine runs on the event loop
+    that emitted the event, so a processor holding that loop's queues or
+    futures keeps working. It falls back to a loop of the worker's own when
+    the event came from no running loop, when that loop has stopped, or
+    while the loop's thread is blocked in this dispatcher's ``flush``,
+    ``shutdown`` or a blocking ``emit`` — a loop-bound processor cannot be
+    served then, and its failure is logged like any other.
+
+    A dispatcher is itself a processor, so a background dispatcher is how a
+    run opts in::
+
+        runner.run(graph, values, event_processors=[EventDispatcher([otel], mode="background")])
     """
 
     def __init__(
@@ -26,17 +96,72 @@ class EventDispatcher:
         processors: list[EventProcessor] | None = None,
         *,
         strict: bool = False,
+        mode: DispatchMode = "inline",
+        queue_size: int = 10_000,
+        overflow: OverflowPolicy = "block",
     ) -> None:
+        if mode not in ("inline", "background"):
+            raise ValueError(f"EventDispatcher mode must be 'inline' or 'background', got {mode!r}")
+        if overflow not in ("block", "drop_chunks", "drop_oldest"):
+            raise ValueError(f"EventDispatcher overflow must be 'block', 'drop_chunks' or 'drop_oldest', got {overflow!r}")
+        if queue_size < 1:
+            raise ValueError(f"EventDispatcher queue_size must be at least 1, got {queue_size}")
         self._processors: list[EventProcessor] = list(processors) if processors else []
         self._strict = strict
+        self._mode = mode
+        self._overflow = overflow
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._worker_stop: threading.Event | None = None
+        # Set while ``_stop_worker`` drains the current worker; no other
+        # worker may start until it has exited.
+        self._stopping = False
+        # Loops whose thread is blocked inside this dispatcher, waiting on
+        # the worker: the worker must not hand them a coroutine.
+        self._blocked_loops: set[asyncio.AbstractEventLoop] = set()
+        self._worker_error: BaseException | None = None
+        self._delivered = 0
+        self._dropped = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
 
     @property
     def active(self) -> bool:
         """True if there is at least one registered processor."""
         return len(self._processors) > 0
 
+    @property
+    def mode(self) -> DispatchMode:
+        return self._mode
+
+    @property
+    def processors(self) -> tuple[EventProcessor, ...]:
+        return tuple(self._processors)
+
+    def stats(self) -> DispatchStats:
+        """Delivery, drop and latency counters; all zero for an inline dispatcher."""
+        with self._lock:
+            delivered = self._delivered
+            return DispatchStats(
+                delivered=delivered,
+                dropped=self._dropped,
+                queued=self._queue.qsize(),
+                mean_latency_ms=self._latency_total / delivered * 1000 if delivered else 0.0,
+                max_latency_ms=self._latency_max * 1000,
+            )
+
+    def on_event(self, event: Event) -> None:
+        self.emit(event)
+
+    async def on_event_async(self, event: Event) -> None:
+        await self.emit_async(event)
+
     def emit(self, event: Event) -> None:
-        """Send *event* to every processor synchronously."""
+        """Send *event* to every processor synchronously, or enqueue it in background mode."""
+        if self._mode == "background":
+            self._enqueue(event, block=True, owner=_running_loop())
+            return
         for processor in self._processors:
             try:
                 processor.on_event(event)
@@ -51,7 +176,16 @@ class EventDispatcher:
                 )
 
     async def emit_async(self, event: Event) -> None:
-        """Send *event* to every processor, using async when available."""
+        """Send *event* to every processor, using async when available.
+
+        In background mode the event is enqueued; waiting for room in a full
+        ``"block"`` queue happens off the event loop.
+        """
+        if self._mode == "background":
+            owner = asyncio.get_running_loop()
+            if not self._enqueue(event, block=False, owner=owner):
+                await asyncio.to_thread(self._enqueue, event, block=True, owner=owner)
+            return
         for processor in self._processors:
             try:
                 if isinstance(processor, AsyncEventProcessor):
@@ -68,8 +202,177 @@ class EventDispatcher:
                     exc_info=True,
                 )
 
+    # ------------------------------------------------------------------
+    # Background delivery
+    # ------------------------------------------------------------------
+
+    def _enqueue(self, event: Event, *, block: bool, owner: asyncio.AbstractEventLoop | None) -> bool:
+        """Queue *event* for the worker; False only when ``block`` is off and it has to wait.
+
+        ``owner`` is the loop that emitted *event*, where async processors run it.
+        """
+        self._ensure_worker()
+        item = (event, time.perf_counter(), owner)
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
+        if self._overflow == "drop_chunks" and isinstance(event, StreamingChunkEvent):
+            with self._lock:
+                self._dropped += 1
+            return True
+        if self._overflow == "drop_oldest":
+            while True:
+                try:
+                    oldest = self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+                else:
+                    self._queue.task_done()
+                    if oldest is not _WAKE:
+                        with self._lock:
+                            self._dropped += 1
+                try:
+                    self._queue.put_nowait(item)
+                    return True
+                except queue.Full:
+                    continue
+        if not block:
+            return False
+        with self._blocking_caller():
+            self._queue.put(item)
+        return True
+
+    @contextlib.contextmanager
+    def _blocking_caller(self) -> Iterator[None]:
+        """Mark the caller's event loop, if any, as blocked on the worker for the duration."""
+        loop = _running_loop()
+        if loop is None:
+            yield
+            return
+        with self._lock:
+            self._blocked_loops.add(loop)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._blocked_loops.discard(loop)
+
+    def _owner_can_run(self, owner: asyncio.AbstractEventLoop) -> bool:
+        with self._lock:
+            return owner.is_running() and owner not in self._blocked_loops
+
+    def _run_on_owner(self, processor: AsyncEventProcessor, event: Event, owner: asyncio.AbstractEventLoop | None) -> bool:
+        """Run *processor* on the loop that emitted *event*; False when that loop cannot take it."""
+        if owner is None or not self._owner_can_run(owner):
+            return False
+        try:
+            future = asyncio.run_coroutine_threadsafe(processor.on_event_async(event), owner)
+        except RuntimeError:  # closed since the check
+            return False
+        while True:
+            try:
+                future.result(timeout=_OWNER_LOOP_POLL_SECONDS)
+                return True
+            except concurrent.futures.TimeoutError:
+                if not self._owner_can_run(owner):
+                    future.cancel()
+                    return False
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._stopping or (self._worker is not None and self._worker.is_alive()):
+                return
+            self._worker_stop = threading.Event()
+            self._worker = threading.Thread(target=self._work, args=(self._worker_stop,), name="hypergraph-event-dispatch", daemon=True)
+            self._worker.start()
+
+    def _work(self, stop: threading.Event) -> None:
+        loop: asyncio.AbstractEventLoop | None = None
+        try:
+            # Once stopped, drain what is queued; later events wait for the next worker.
+            while not (stop.is_set() and self._queue.empty()):
+                item = self._queue.get()
+                try:
+                    if item is _WAKE:
+                        continue
+                    event, queued_at, owner = item
+                    for processor in self._processors:
+                        try:
+                            if isinstance(processor, AsyncEventProcessor):
+                                if not self._run_on_owner(processor, event, owner):
+                                    loop = loop or asyncio.new_event_loop()
+                                    loop.run_until_complete(processor.on_event_async(event))
+                            else:
+                                processor.on_event(event)
+                        except Exception as error:
+                            if self._strict:
+                                # Raised at shutdown; logged now so it is seen while the run goes on.
+                                logger.error(
+                                    "EventProcessor %s failed on %s",
+                                    processor,
+                                    type(event).__name__,
+                                    exc_info=True,
+                                )
+                                with self._lock:
+                                    self._worker_error = self._worker_error or error
+                                continue
+                            logger.warning(
+                                "EventProcessor %s failed on %s",
+                                processor,
+                                type(event).__name__,
+                                exc_info=True,
+                            )
+                    latency = time.perf_counter() - queued_at
+                    with self._lock:
+                        self._delivered += 1
+                        self._latency_total += latency
+                        self._latency_max = max(self._latency_max, latency)
+                finally:
+                    self._queue.task_done()
+        finally:
+            if loop is not None:
+                loop.close()
+
+    def flush(self) -> None:
+        """Block until every queued event has been delivered. A no-op inline."""
+        if self._mode == "background" and self._worker is not None:
+            with self._blocking_caller():
+                self._queue.join()
+
+    def _stop_worker(self) -> None:
+        """Deliver what is queued, then stop the worker; the next emit starts a new one."""
+        with self._lock:
+            worker, stop = self._worker, self._worker_stop
+            if worker is None or stop is None or not worker.is_alive():
+                return
+            self._stopping = True
+        try:
+            stop.set()
+            with contextlib.suppress(queue.Full):
+                self._queue.put_nowait(_WAKE)
+            with self._blocking_caller():
+                worker.join()
+        finally:
+            with self._lock:
+                if self._worker is worker:
+                    self._worker = self._worker_stop = None
+                self._stopping = False
+
+    def _raise_worker_error(self) -> None:
+        with self._lock:
+            error, self._worker_error = self._worker_error, None
+        if error is not None:
+            raise error
+
     def shutdown(self) -> None:
-        """Shut down all processors. Best-effort unless strict."""
+        """Shut down all processors. Best-effort unless strict.
+
+        In background mode, queued events are delivered first.
+        """
+        self._stop_worker()
+        self._raise_worker_error()
         first_error = None
         for processor in self._processors:
             try:
@@ -89,6 +392,8 @@ class EventDispatcher:
 
     async def shutdown_async(self) -> None:
         """Shut down all processors, using async when available. Best-effort unless strict."""
+        await asyncio.to_thread(self._stop_worker)
+        self._raise_worker_error()
         for processor in self._processors:
             try:
                 if isinstance(processor, AsyncEventProcessor):
@@ -1615,6 +1615,7 @@ class Graph:
         store: TableStore,
         runner: BaseRunner | None = None,
         page_max_concurrency: int = 16,
+        max_workers: int = 1,
         on_error: Literal["raise", "store"] = "raise",
         name: str | None = None,
     ) -> HyperTable:
@@ -1631,6 +1632,7 @@ class Graph:
             store=store,
             runner=runner,
             page_max_concurrency=page_max_concurrency,
+            max_workers=max_workers,
             on_error=on_error,
             name=name,
         )
@@ -25,6 +25,8 @@ from hypergraph.host.read_models import (
     BatchItemReadModel,
     BatchReadModel,
     BatchSummaryReadModel,
+    NodeLatenciesReadModel,
+    NodeLatencyReadModel,
     NodeTimingReadModel,
     NodeTimingsReadModel,
     PauseReadModel,
@@ -56,6 +58,8 @@ __all__ = [
     "HostError",
     "HostRuntime",
     "ItemKeyError",
+    "NodeLatenciesReadModel",
+    "NodeLatencyReadModel",
     "NodeTimingReadModel",
     "NodeTimingsReadModel",
     "PauseReadModel",
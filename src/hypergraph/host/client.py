@@ -212,20 +212,7 @@ def _build_batch_view(
             abandoned.append(key)
         counts[bucket] += 1
         outcomes[key] = outcome
-        workflow_id = submission["workflow_id"]
-        # The item's waiting condition comes from the SAME computation
-        # RunView uses, so an item view and client.get(item.run_ref) can
-        # never disagree about why the item waits.
-        view = _build_view(home_uri, workflow_id, submission, run, admission_full=admission_full)
-        items[key] = BatchItemView(
-            item_key=key,
-            run_ref=RunRef(home=home_uri, run_id=workflow_id),
-            workflow_id=workflow_id,
-            status=run.status if run is not None else None,
-            waiting=view.waiting if view is not None else None,
-            outcome=outcome,
-            started=run is not None,
-        )
+        items[key] = _batch_item_view(home_uri, key, submission, run, outcome, admission_full=admission_full)
     # Settlement uses THE settled-child rule, the same one the rerun gate
     # applies — a child is never settled for rerun and in flight for the view.
     settled = all(_child_settled(submission, run) for submission, run in child_rows.values())
@@ -244,6 +231,32 @@ def _build_batch_view(
     )
 
 
+def _batch_item_view(
+    home_uri: str,
+    key: str,
+    submission: dict[str, Any],
+    run: Run | None,
+    outcome: str | None,
+    *,
+    admission_full: bool,
+) -> BatchItemView:
+    """One manifest item's view, shared by the full Batch view and item pages."""
+    workflow_id = submission["workflow_id"]
+    # The item's waiting condition comes from the SAME computation
+    # RunView uses, so an item view and client.get(item.run_ref) can
+    # never disagree about why the item waits.
+    view = _build_view(home_uri, workflow_id, submission, run, admission_full=admission_full)
+    return BatchItemView(
+        item_key=key,
+        run_ref=RunRef(home=home_uri, run_id=workflow_id),
+        workflow_id=workflow_id,
+        status=run.status if run is not None else None,
+        waiting=view.waiting if view is not None else None,
+        outcome=outcome,
+        started=run is not None,
+    )
+
+
 def _started_child_ids(child_rows: dict[str, tuple[dict[str, Any], Run | None]]) -> list[str]:
     """Workflow ids of children that actually executed.
 
@@ -527,6 +540,40 @@ class _TimingSnapshot:
     steps: tuple[_StepFact, ...]
 
 
+@dataclass(frozen=True)
+class _NodeRollupSnapshot:
+    """The durable per-node rollup rows for one Definition (or all of them).
+
+    ``totals`` rows are ``(node_name, executions, cached, errors, total_ms,
+    ran, ran_ms, min_ms, max_ms)``; ``buckets`` rows are ``(node_name,
+    bucket, n)`` in bucket order. Package-private like ``_TimingSnapshot``.
+    """
+
+    definition: str | None
+    totals: tuple[tuple[Any, ...], ...]
+    buckets: tuple[tuple[Any, ...], ...]
+
+
+@dataclass(frozen=True)
+class _BatchCensus:
+    """One Batch's projected counts without its per-item detail.
+
+    Package-private for the same reason as ``_RunReadSnapshot``: products
+    consume ``BatchSummaryReadModel``. The counts come from the
+    ``host_batch_census`` projection, so building one costs a manifest read
+    and a handful of counter rows however many children the Batch holds.
+    """
+
+    batch_ref: BatchRef
+    workflow_id: str
+    definition_id: DefinitionId
+    created_at: datetime
+    counts: dict[str, int]
+    settled: bool
+    tolerance_tripped: bool
+    retry_of: str | None
+
+
 def _validate_timing_request(definition: str | None, limit: int) -> None:
     """Refuse a timing request the store cannot honor, before it reads."""
     if definition is not None and not isinstance(definition, str):
@@ -535,6 +582,11 @@ def _validate_timing_request(definition: str | None, limit: int) -> None:
         raise ValueError(f"node_timings() limit must be a positive int, got {limit!r}.")
 
 
+def _validate_rollup_definition(definition: str | None) -> None:
+    if definition is not None and not isinstance(definition, str):
+        raise TypeError(f"node_latencies() definition must be a Definition name string or None, got {type(definition).__name__}.")
+
+
 def _timing_batch_id(batch: BatchRef | str | None) -> str | None:
     if batch is None or isinstance(batch, str):
         return batch
@@ -765,28 +817,42 @@ def _validate_batch_listing(definition: str | None, limit: int) -> None:
         raise ValueError(f"list_batches() limit must be a positive int, got {limit!r}.")
 
 
-def _batch_listing(
-    home_uri: str,
-    batches: Sequence[dict[str, Any]],
-    children: dict[str, dict[str, tuple[dict[str, Any], Run | None]]],
-    tripped: frozenset[str],
-    *,
-    admission_full: bool,
-) -> list[tuple[BatchView, datetime]]:
-    """Project manifest rows plus their joined children into listed views."""
-    return [
-        (
-            _build_batch_view(
-                home_uri,
-                batch,
-                children.get(str(batch["batch_id"]), {}),
-                str(batch["batch_id"]) in tripped,
-                admission_full=admission_full,
-            ),
-            _parse_iso(str(batch["created_at"])),
-        )
-        for batch in batches
-    ]
+def _validate_item_page(after: str | None, limit: int) -> None:
+    """Refuse an item page request the store cannot honor, before it reads."""
+    if after is not None and not isinstance(after, str):
+        raise TypeError(f"list_batch_items() after must be an item_key string or None, got {type(after).__name__}.")
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        raise ValueError(f"list_batch_items() limit must be a positive int, got {limit!r}.")
+
+
+def _batch_census(home_uri: str, batch: dict[str, Any], projected: dict[str, int], tripped: bool) -> _BatchCensus:
+    """Project one manifest row plus its projected counters into a census.
+
+    ``settled`` is read off the counts rather than off the children: a
+    child is unsettled exactly when it sits in ``active``, ``paused`` or
+    ``queued``, which is the same answer ``BatchView.settled`` derives one
+    child at a time.
+    """
+    counts = {key: projected.get(key, 0) for key in BATCH_COUNT_KEYS}
+    return _BatchCensus(
+        batch_ref=BatchRef(home=home_uri, batch_id=batch["batch_id"]),
+        workflow_id=batch["workflow_id"],
+        definition_id=DefinitionId(batch["definition_name"], batch["def_version"], batch["def_struct_hash"]),
+        created_at=_parse_iso(str(batch["created_at"])),
+        counts=counts,
+        settled=counts["active"] == 0 and counts["paused"] == 0 and counts["queued"] == 0,
+        tolerance_tripped=tripped,
+        retry_of=batch["retry_of"],
+    )
+
+
+def _item_page(home_uri: str, rows: Sequence[tuple[dict[str, Any], Run | None]], *, admission_full: bool) -> list[BatchItemView]:
+    """Project one page of joined children through THE bucket ladder."""
+    items = []
+    for submission, run in rows:
+        _, outcome = _child_bucket(submission, run)
+        items.append(_batch_item_view(home_uri, submission["item_key"], submission, run, outcome, admission_full=admission_full))
+    return items
 
 
 def _make_read_snapshot(
@@ -1300,36 +1366,73 @@ class RunHomeClient:
         rows = self._home._list_run_rows_sync()
         return _filter_list_rows(self._home.uri, rows, query, admission_full=self._home._admission_is_full_sync())
 
-    async def _list_batch_views(self, definition: str | None, limit: int) -> builtins.list[tuple[BatchView, datetime]]:
-        """Recent Batch views with their acceptance time, newest first.
+    async def _list_batch_censuses(self, definition: str | None, limit: int) -> builtins.list[_BatchCensus]:
+        """Recent Batch censuses, newest first.
 
-        Every view is built by ``_build_batch_view`` — THE bucket ladder —
-        so a listed census can never disagree with ``get(batch_ref)``. The
-        whole page costs a bounded number of statements: one manifest read,
-        one joined-children read per id chunk, one trip read, one admission
-        probe.
+        The whole page costs a bounded number of statements — one manifest
+        read, one projected-counter read per id chunk, one trip read — and
+        none of them touches a child row, so a page of 100k-item Batches
+        reads as fast as a page of small ones.
         """
         _validate_batch_listing(definition, limit)
         batches = await self._home._list_batch_rows(definition=definition, limit=limit)
         if not batches:
             return []
         batch_ids = [str(batch["batch_id"]) for batch in batches]
-        children = await self._home._batch_children(batch_ids)
+        census = await self._home._batch_census(batch_ids)
         tripped = await self._home._tripped_batch_ids_scan(batch_ids)
-        admission_full = await self._home._admission_is_full()
-        return _batch_listing(self._home.uri, batches, children, tripped, admission_full=admission_full)
+        return [
+            _batch_census(self._home.uri, batch, census[batch_id], batch_id in tripped) for batch, batch_id in zip(batches, batch_ids, strict=True)
+        ]
 
-    def _list_batch_views_sync(self, definition: str | None, limit: int) -> builtins.list[tuple[BatchView, datetime]]:
-        """Sync mirror of ``_list_batch_views``."""
+    def _list_batch_censuses_sync(self, definition: str | None, limit: int) -> builtins.list[_BatchCensus]:
+        """Sync mirror of ``_list_batch_censuses``."""
         _validate_batch_listing(definition, limit)
         batches = self._home._list_batch_rows_sync(definition=definition, limit=limit)
         if not batches:
             return []
         batch_ids = [str(batch["batch_id"]) for batch in batches]
-        children = self._home._batch_children_sync(batch_ids)
+        census = self._home._batch_census_sync(batch_ids)
         tripped = self._home._tripped_batch_ids_sync(batch_ids)
-        admission_full = self._home._admission_is_full_sync()
-        return _batch_listing(self._home.uri, batches, children, tripped, admission_full=admission_full)
+        return [
+            _batch_census(self._home.uri, batch, census[batch_id], batch_id in tripped) for batch, batch_id in zip(batches, batch_ids, strict=True)
+        ]
+
+    async def _get_batch_census(self, ref: BatchRef) -> _BatchCensus | None:
+        """One Batch's projected census, or None for an unknown Batch."""
+        if not isinstance(ref, BatchRef):
+            raise TypeError(f"get_batch_summary() expects a BatchRef, got {type(ref).__name__}.")
+        batch = await self._home._get_batch(ref.batch_id)
+        if batch is None:
+            return None
+        census = await self._home._batch_census([ref.batch_id])
+        return _batch_census(self._home.uri, batch, census[ref.batch_id], await self._home._batch_tripped(ref.batch_id))
+
+    def _get_batch_census_sync(self, ref: BatchRef) -> _BatchCensus | None:
+        """Sync mirror of ``_get_batch_census``."""
+        if not isinstance(ref, BatchRef):
+            raise TypeError(f"get_batch_summary() expects a BatchRef, got {type(ref).__name__}.")
+        batch = self._home._get_batch_sync(ref.batch_id)
+        if batch is None:
+            return None
+        census = self._home._batch_census_sync([ref.batch_id])
+        return _batch_census(self._home.uri, batch, census[ref.batch_id], self._home._batch_tripped_sync(ref.batch_id))
+
+    async def _batch_item_page(self, ref: BatchRef, *, after: str | None, limit: int) -> builtins.list[BatchItemView]:
+        """One page of a Batch's item views, in manifest order."""
+        if not isinstance(ref, BatchRef):
+            raise TypeError(f"list_batch_items() expects a BatchRef, got {type(ref).__name__}.")
+        _validate_item_page(after, limit)
+        rows = await self._home._batch_item_page(ref.batch_id, after=after, limit=limit)
+        return _item_page(self._home.uri, rows, admission_full=await self._home._admission_is_full())
+
+    def _batch_item_page_sync(self, ref: BatchRef, *, after: str | None, limit: int) -> builtins.list[BatchItemView]:
+        """Sync mirror of ``_batch_item_page``."""
+        if not isinstance(ref, BatchRef):
+            raise TypeError(f"list_batch_items() expects a BatchRef, got {type(ref).__name__}.")
+        _validate_item_page(after, limit)
+        rows = self._home._batch_item_page_sync(ref.batch_id, after=after, limit=limit)
+        return _item_page(self._home.uri, rows, admission_full=self._home._admission_is_full_sync())
 
     async def _timing_snapshot(self, definition: str | None, batch: BatchRef | str | None, limit: int) -> _TimingSnapshot:
         """Durable timing facts for a selection of Host Runs and their descendants.
@@ -1356,6 +1459,18 @@ class RunHomeClient:
         steps = _step_facts(self._home._step_timing_rows_sync(builtins.list(owners)), owners)
         return _TimingSnapshot(home=self._home.uri, definition=definition, runs=tuple(runs), steps=tuple(steps))
 
+    async def _node_rollup(self, definition: str | None) -> _NodeRollupSnapshot:
+        """The Home's maintained per-node rollups: O(nodes), whatever the history."""
+        _validate_rollup_definition(definition)
+        totals, buckets = await self._home._node_rollup_rows(definition)
+        return _NodeRollupSnapshot(definition=definition, totals=tuple(totals), buckets=tuple(buckets))
+
+    def _node_rollup_sync(self, definition: str | None) -> _NodeRollupSnapshot:
+        """Sync mirror of ``_node_rollup``."""
+        _validate_rollup_definition(definition)
+        totals, buckets = self._home._node_rollup_rows_sync(definition)
+        return _NodeRollupSnapshot(definition=definition, totals=tuple(totals), buckets=tuple(buckets))
+
     async def _read_model_snapshot(self, ref: RunRef) -> _RunReadSnapshot | None:
         """Joined facts used by ``RunHomeReadModel`` for one Run."""
         if not isinstance(ref, RunRef):
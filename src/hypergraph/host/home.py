@@ -23,11 +23,14 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from hypergraph.checkpointers._archive import RunArchive
+from hypergraph.checkpointers._delta import DeltaValues
+from hypergraph.checkpointers._search_index import SearchIndexMode
 from hypergraph.checkpointers.base import CheckpointPolicy, _check_settlement
 
 # host/ is the same persistence subsystem as checkpointers/ (a RunHome IS a
 # SqliteCheckpointer), so reaching its private column list here is deliberate.
-from hypergraph.checkpointers.sqlite import _PUBLIC_STEP_FILTER, _RUNS_COLS, SqliteCheckpointer, _run_status_update
+from hypergraph.checkpointers.sqlite import _PUBLIC_STEP_FILTER, _RUNS_COLS, SqliteCheckpointer, _descendant_runs_query, _run_status_update
 from hypergraph.checkpointers.types import (
     NO_RUN_TOTALS,
     AnswerRejectedError,
@@ -319,10 +322,6 @@ def _weighted_admission_fits(budget: int, claimed_count: int, claimed_units: int
 
 #: One durable step row, as the timing read needs it.
 _STEP_TIMING_COLS = "run_id, superstep, node_name, node_type, status, duration_ms, cached, error, completed_at"
-#: How far the nested-run walk descends before it stops. A parent chain is
-#: a tree by construction; the bound is what makes a corrupted store return
-#: a bounded answer instead of spinning.
-_MAX_RUN_NESTING_DEPTH = 32
 
 
 def _timing_run_rows_query(*, definition: str | None, batch_id: str | None, limit: int) -> tuple[str, list[Any]]:
@@ -349,33 +348,6 @@ def _timing_run_rows_query(*, definition: str | None, batch_id: str | None, limi
     )
 
 
-def _descendant_runs_query(root_ids: Sequence[str]) -> tuple[str, list[Any]]:
-    """Every run reachable from ``root_ids`` through ``runs.parent_run_id``.
-
-    A Host Run is only the OUTERMOST run of the work it drove: a nested
-    graph node, and every item of a ``map``, commits its own runs row with
-    the parent recorded. Their step records are as durable as the parent's,
-    and a join that only matched ``runs.id = host_submissions.workflow_id``
-    threw them away — which is exactly the per-node evidence a fan-out is
-    worth reading. ``UNION`` (not ``UNION ALL``) plus the depth bound keeps
-    a malformed parent cycle finite.
-    """
-    placeholders = ", ".join("?" for _ in root_ids)
-    return (
-        f"""
-        WITH RECURSIVE descendants(id, root_id, depth) AS (
-            SELECT id, id, 0 FROM runs WHERE id IN ({placeholders})
-            UNION
-            SELECT child.id, parent.root_id, parent.depth + 1
-            FROM runs child JOIN descendants parent ON child.parent_run_id = parent.id
-            WHERE parent.depth < ?
-        )
-        SELECT id, root_id FROM descendants
-        """,
-        [*root_ids, _MAX_RUN_NESTING_DEPTH],
-    )
-
-
 def _step_timing_query(run_ids: Sequence[str]) -> tuple[str, Sequence[str]]:
     """Durable step facts for one chunk of run ids, in execution order."""
     placeholders = ", ".join("?" for _ in run_ids)
@@ -386,6 +358,27 @@ def _step_timing_query(run_ids: Sequence[str]) -> tuple[str, Sequence[str]]:
     )
 
 
+def _node_rollup_queries(definition: str | None) -> tuple[tuple[str, list[Any]], tuple[str, list[Any]]]:
+    """The per-node rollup totals and merged sketch buckets for one Definition (or all).
+
+    Summing across Definitions is exact for the counters and for the sketch
+    alike — a log-bucket histogram merges by adding counts — so the
+    all-Definitions answer is one GROUP BY, not a second store.
+    """
+    where, params = ("", []) if definition is None else (" AND definition_name = ?", [definition])
+    return (
+        (
+            "SELECT node_name, SUM(executions), SUM(cached), SUM(errors), SUM(total_ms), SUM(ran), SUM(ran_ms), MIN(min_ms), MAX(max_ms) "
+            f"FROM host_node_timing WHERE executions > 0{where} GROUP BY node_name",
+            params,
+        ),
+        (
+            f"SELECT node_name, bucket, SUM(n) FROM host_node_timing_sketch WHERE n > 0{where} GROUP BY node_name, bucket ORDER BY node_name, bucket",
+            list(params),
+        ),
+    )
+
+
 def _batch_children_query(batch_ids: Sequence[str]) -> tuple[str, Sequence[str]]:
     """The joined-children read for one chunk of Batch ids, and its binds.
 
@@ -401,6 +394,90 @@ def _batch_children_query(batch_ids: Sequence[str]) -> tuple[str, Sequence[str]]
     )
 
 
+def _batch_census_query(batch_ids: Sequence[str]) -> tuple[str, Sequence[str]]:
+    """The projected per-bucket counters for one chunk of Batch ids."""
+    placeholders = ", ".join("?" for _ in batch_ids)
+    return f"SELECT batch_id, bucket, n FROM host_batch_census WHERE batch_id IN ({placeholders}) AND n > 0", batch_ids
+
+
+#: One page of a Batch's children in manifest order, joined exactly as
+#: ``_batch_children_query`` joins them. The projection supplies the order;
+#: the rows themselves still come from the submission and the runs row.
+_BATCH_ITEM_PAGE_SQL = (
+    f"SELECT {_QUALIFIED_SUBMISSION_COLS}, {_QUALIFIED_RUN_COLS} FROM host_batch_children c "
+    "JOIN host_submissions s ON s.workflow_id = c.workflow_id LEFT JOIN runs r ON r.id = s.workflow_id "
+    "WHERE c.batch_id = ? AND c.ordinal > ? ORDER BY c.ordinal LIMIT ?"
+)
+_SELECT_ITEM_ORDINAL = "SELECT ordinal FROM host_batch_children WHERE batch_id = ? AND item_key = ?"
+
+# === Compaction (CheckpointPolicy.ttl) ===
+#
+# A Home's host rows expire with the runs they describe, never on their own
+# clock: a submission, its run_updates log, and its commands go in the same
+# transaction as the runs row, so no reader ever sees a finished submission
+# whose run vanished (it would re-read as 'unstarted'). A Batch child never
+# expires alone — its Batch starts expiring only once every child has
+# settled past the cutoff, because a manifest with holes in it is not a
+# Batch. Its children then go a transaction-sized share at a time, and the
+# Batch's own rows go with the last share.
+
+#: Every workflow id an accepted rerun or fork names as its source. Not
+#: correlated, so SQLite builds it once per statement rather than scanning
+#: host_submissions for every candidate.
+_NAMED_SOURCES_SQL = (
+    "SELECT retry_of FROM host_submissions WHERE retry_of IS NOT NULL UNION SELECT forked_from FROM host_submissions WHERE forked_from IS NOT NULL"
+)
+#: A standalone Run expires only once its submission has finished and no
+#: accepted rerun or fork still names it as a source.
+_EXPIRABLE_HOST_RUN_CLAUSE = (
+    " AND NOT EXISTS (SELECT 1 FROM host_submissions s WHERE s.workflow_id = r.id AND (s.batch_id IS NOT NULL OR s.state != 'finished'))"
+    f" AND r.id NOT IN ({_NAMED_SOURCES_SQL})"
+)
+_EXPIRE_HOST_ROW_DELETES = (
+    ("logs", "DELETE FROM run_updates WHERE run_id IN ({ids})"),
+    ("logs", "DELETE FROM host_commands WHERE run_id IN ({ids})"),
+    ("submissions", "DELETE FROM host_submissions WHERE workflow_id IN ({ids})"),
+)
+#: Submissions that finished without ever writing a runs row (stopped
+#: before start) — the runs-driven sweep cannot see them.
+_EXPIRED_RUNLESS_SUBMISSIONS_SQL = (
+    "SELECT s.workflow_id FROM host_submissions s "
+    "WHERE s.state = 'finished' AND s.batch_id IS NULL AND s.finished_at <= ? "
+    "AND NOT EXISTS (SELECT 1 FROM runs r WHERE r.id = s.workflow_id) "
+    f"AND s.workflow_id NOT IN ({_NAMED_SOURCES_SQL}) "
+    "ORDER BY s.finished_at LIMIT ?"
+)
+#: Batches whose every child finished at or before the cutoff, and that no
+#: Batch rerun, or rerun/fork of one of its children, still names.
+_EXPIRED_BATCHES_SQL = (
+    "SELECT b.batch_id FROM host_batches b WHERE b.created_at <= ? "
+    "AND NOT EXISTS (SELECT 1 FROM host_submissions s LEFT JOIN runs r ON r.id = s.workflow_id "
+    "WHERE s.batch_id = b.batch_id AND (s.state != 'finished' OR COALESCE(r.completed_at, s.finished_at) IS NULL "
+    "OR COALESCE(r.completed_at, s.finished_at) > ? "
+    f"OR s.workflow_id IN ({_NAMED_SOURCES_SQL}))) "
+    "AND NOT EXISTS (SELECT 1 FROM host_batches n WHERE n.retry_of = b.workflow_id OR n.retry_of = b.batch_id) "
+    "ORDER BY b.created_at LIMIT ?"
+)
+#: One transaction's share of a Batch's children. A large Batch drains over
+#: several transactions; its Batch-scoped rows go once no child is left.
+_SELECT_BATCH_CHILD_IDS = "SELECT workflow_id FROM host_submissions WHERE batch_id = ? ORDER BY workflow_id LIMIT ?"
+#: Batch-scoped rows, removed after the Batch's children are gone.
+_EXPIRE_BATCH_DELETES = (
+    ("logs", "DELETE FROM batch_updates WHERE batch_id = ?"),
+    ("census", "DELETE FROM host_batch_census WHERE batch_id = ?"),
+    ("batches", "DELETE FROM host_batches WHERE batch_id = ?"),
+)
+
+
+def _item_ordinal(row: tuple[Any, ...] | None, batch_id: str, after: str | None) -> int:
+    """The manifest position a page resumes after; refuses an unknown item key."""
+    if after is None:
+        return -1
+    if row is None:
+        raise ValueError(f"Batch {batch_id!r} has no item {after!r} to list after. Pass an item_key from the previous page.")
+    return int(row[0])
+
+
 def _row_to_submission(row: tuple[Any, ...]) -> dict[str, Any]:
     return dict(zip(_SUBMISSION_COLS.split(", "), row, strict=True))
 
@@ -493,6 +570,10 @@ class RunHome(SqliteCheckpointer):
         serializer: Any = None,
         max_active_runs: int | None | _Unset = _UNSET,
         max_admission_units: int | None | _Unset = _UNSET,
+        read_connections: int = 4,
+        dedupe_values: bool = False,
+        search_index: SearchIndexMode | None = None,
+        delta_values: DeltaValues = False,
     ):
         if policy is not None and policy.durability == "exit":
             raise ValueError(
@@ -504,7 +585,15 @@ class RunHome(SqliteCheckpointer):
             window=policy.window if policy is not None else None,
             ttl=policy.ttl if policy is not None else None,
         )
-        super().__init__(path, policy=effective_policy, serializer=serializer)
+        super().__init__(
+            path,
+            policy=effective_policy,
+            serializer=serializer,
+            read_connections=read_connections,
+            dedupe_values=dedupe_values,
+            search_index=search_index,
+            delta_values=delta_values,
+        )
         self._memory_lock_token: int | None = next(_memory_lock_tokens) if self._is_memory else None
         if not isinstance(max_active_runs, _Unset):
             # Explicit argument writes through; omitting it adopts whatever the
@@ -522,6 +611,10 @@ class RunHome(SqliteCheckpointer):
         serializer: Any = None,
         max_active_runs: int | None | _Unset = _UNSET,
         max_admission_units: int | None | _Unset = _UNSET,
+        read_connections: int = 4,
+        dedupe_values: bool = False,
+        search_index: SearchIndexMode | None = None,
+        delta_values: DeltaValues = False,
     ) -> RunHome:
         """Open (or create) a Run Home at ``uri``.
 
@@ -537,6 +630,20 @@ class RunHome(SqliteCheckpointer):
                 unlimited) and **omitting it adopts the stored value**. A
                 store that was never configured is unlimited. Tunable later
                 via the ``max_active_runs`` attribute.
+            read_connections: Read-only connections that client reads
+                (``list``, ``watch``, Batch results, timings) borrow so a
+                dashboard polling the Home never queues behind a worker's
+                step commits. ``0`` keeps every read on the writer.
+            dedupe_values: Store repeated step outputs once, shared across
+                every step and Run that emits them (see
+                ``SqliteCheckpointer``).
+            search_index: ``"eager"``, ``"deferred"``, or ``"off"`` — whether
+                step commits also maintain the ``search`` index (see
+                ``SqliteCheckpointer``). Omitting it keeps the stored mode.
+            delta_values: Store a list output that only grew since the
+                Run's previous step as its appended items (``True``, output
+                names, or a predicate; see ``SqliteCheckpointer``). Needs
+                ``retention="full"``.
         """
         return cls(
             uri,
@@ -544,6 +651,10 @@ class RunHome(SqliteCheckpointer):
             serializer=serializer,
             max_active_runs=max_active_runs,
             max_admission_units=max_admission_units,
+            read_connections=read_connections,
+            dedupe_values=dedupe_values,
+            search_index=search_index,
+            delta_values=delta_values,
         )
 
     @property
@@ -641,17 +752,20 @@ class RunHome(SqliteCheckpointer):
         slot. Pending (queued, scheduled, version-incompatible), exhausted,
         and finished submissions are not claimed and hold none.
         """
-        now_iso = await self._store_now()
-        await self._ensure_db()
-        async with self._txn_lock():
-            free = await self._free_admission_slots()
+        async with self._read_db() as db:
+            cap_cursor = await db.execute(_SELECT_SETTING_SQL, (_MAX_ACTIVE_RUNS_KEY,))
+            cap_row = await cap_cursor.fetchone()
+            count_cursor = await db.execute(_ACTIVE_RUN_COUNT_SQL)
+            free = _slots_left(cap_row, await count_cursor.fetchone())
             if free is not None and free <= 0:
                 return True
-            budget_cursor = await self._db.execute(_SELECT_SETTING_SQL, (_MAX_ADMISSION_UNITS_KEY,))
+            budget_cursor = await db.execute(_SELECT_SETTING_SQL, (_MAX_ADMISSION_UNITS_KEY,))
             budget = _cap_from_row(await budget_cursor.fetchone())
             if budget is None:
                 return False
-            pending_cursor = await self._db.execute(
+            now_cursor = await db.execute(_STORE_NOW_SQL)
+            now_iso = str((await now_cursor.fetchone())[0])
+            pending_cursor = await db.execute(
                 "SELECT s.admission_cost FROM host_submissions s "
                 f"WHERE s.state = 'pending' AND s.compat_state = 'compatible' AND {_due_clause('s.start_at', null_is_due=True)} "
                 "AND (s.batch_id IS NULL OR NOT EXISTS ("
@@ -662,14 +776,13 @@ class RunHome(SqliteCheckpointer):
             pending = await pending_cursor.fetchone()
             if pending is None:
                 return False
-            usage_cursor = await self._db.execute("SELECT COUNT(*), COALESCE(SUM(admission_cost), 0) FROM host_submissions WHERE state = 'claimed'")
+            usage_cursor = await db.execute("SELECT COUNT(*), COALESCE(SUM(admission_cost), 0) FROM host_submissions WHERE state = 'claimed'")
             count, units = await usage_cursor.fetchone()
         return not _weighted_admission_fits(budget, int(count), int(units), int(pending[0]))
 
     def _admission_is_full_sync(self) -> bool:
         """Sync mirror of ``_admission_is_full``."""
-        with self._sync_lock:
-            db = self._sync_db()
+        with self._read_db_sync() as db:
             cap_row = db.execute(_SELECT_SETTING_SQL, (_MAX_ACTIVE_RUNS_KEY,)).fetchone()
             free = _slots_left(cap_row, db.execute(_ACTIVE_RUN_COUNT_SQL).fetchone())
             if free is not None and free <= 0:
@@ -1048,15 +1161,13 @@ class RunHome(SqliteCheckpointer):
 
     def _batch_tripped_sync(self, batch_id: str) -> bool:
         """True when a durable ``tolerance_tripped`` fact exists for this Batch."""
-        with self._sync_lock:
-            db = self._sync_db()
+        with self._read_db_sync() as db:
             return db.execute(SELECT_TRIPPED, (batch_id,)).fetchone() is not None
 
     async def _batch_tripped(self, batch_id: str) -> bool:
         """Async mirror of ``_batch_tripped_sync``."""
-        await self._ensure_db()
-        async with self._txn_lock():
-            cursor = await self._db.execute(SELECT_TRIPPED, (batch_id,))
+        async with self._read_db() as db:
+            cursor = await db.execute(SELECT_TRIPPED, (batch_id,))
             return await cursor.fetchone() is not None
 
     # === Submissions ===
@@ -1293,8 +1404,7 @@ class RunHome(SqliteCheckpointer):
         return True, row
 
     def _get_submission_sync(self, workflow_id: str) -> dict[str, Any] | None:
-        with self._sync_lock:
-            db = self._sync_db()
+        with self._read_db_sync() as db:
             row = db.execute(
                 _SELECT_SUBMISSION,
                 (workflow_id,),
@@ -1302,9 +1412,8 @@ class RunHome(SqliteCheckpointer):
             return _row_to_submission(row) if row is not None else None
 
     async def _get_submission(self, workflow_id: str) -> dict[str, Any] | None:
-        await self._ensure_db()
-        async with self._txn_lock():
-            cursor = await self._db.execute(
+        async with self._read_db() as db:
+            cursor = await db.execute(
                 _SELECT_SUBMISSION,
                 (workflow_id,),
             )
@@ -1548,8 +1657,7 @@ class RunHome(SqliteCheckpointer):
             await self._append_run_update(spec.workflow_id, "submitted", request.child_submitted_fact(spec))
 
     def _get_batch_sync(self, batch_id: str) -> dict[str, Any] | None:
-        with self._sync_lock:
-            db = self._sync_db()
+        with self._read_db_sync() as db:
             row = db.execute(
                 SELECT_BATCH_BY_ID,
                 (batch_id,),
@@ -1558,9 +1666,8 @@ class RunHome(SqliteCheckpointer):
 
     async def _get_batch(self, batch_id: str) -> dict[str, Any] | None:
         """Async mirror of ``_get_batch_sync``."""
-        await self._ensure_db()
-        async with self._txn_lock():
-            cursor = await self._db.execute(
+        async with self._read_db() as db:
+            cursor = await db.execute(
                 SELECT_BATCH_BY_ID,
                 (batch_id,),
             )
@@ -1569,8 +1676,7 @@ class RunHome(SqliteCheckpointer):
 
     def _batch_child_rows_sync(self, batch_id: str) -> dict[str, tuple[dict[str, Any], Run | None]]:
         """Batch children joined with their runs rows, keyed by item key."""
-        with self._sync_lock:
-            db = self._sync_db()
+        with self._read_db_sync() as db:
             rows: dict[str, tuple[dict[str, Any], Run | None]] = {}
             cursor = db.execute(
                 f"SELECT {_QUALIFIED_SUBMISSION_COLS}, {_QUALIFIED_RUN_COLS} FROM host_submissions s "
@@ -1586,10 +1692,9 @@ class RunHome(SqliteCheckpointer):
 
     async def _batch_child_rows(self, batch_id: str) -> dict[str, tuple[dict[str, Any], Run | None]]:
         """Async mirror of ``_batch_child_rows_sync``."""
-        await self._ensure_db()
-        async with self._txn_lock():
+        async with self._read_db() as db:
             rows: dict[str, tuple[dict[str, Any], Run | None]] = {}
-            cursor = await self._db.execute(
+            cursor = await db.execute(
                 f"SELECT {_QUALIFIED_SUBMISSION_COLS}, {_QUALIFIED_RUN_COLS} FROM host_submissions s "
                 "LEFT JOIN runs r ON r.id = s.workflow_id WHERE s.batch_id = ?",
                 (batch_id,),
@@ -1610,17 +1715,16 @@ class RunHome(SqliteCheckpointer):
         """
         statement = SELECT_RECENT_BATCHES if definition is None else SELECT_RECENT_BATCHES_BY_DEFINITION
         params: tuple[Any, ...] = (limit,) if definition is None else (definition, limit)
-        with self._sync_lock:
-            rows = self._sync_db().execute(statement, params).fetchall()
+        with self._read_db_sync() as db:
+            rows = db.execute(statement, params).fetchall()
         return [row_to_batch(row) for row in rows]
 
     async def _list_batch_rows(self, *, definition: str | None, limit: int) -> list[dict[str, Any]]:
         """Async mirror of ``_list_batch_rows_sync``."""
         statement = SELECT_RECENT_BATCHES if definition is None else SELECT_RECENT_BATCHES_BY_DEFINITION
         params: tuple[Any, ...] = (limit,) if definition is None else (definition, limit)
-        await self._ensure_db()
-        async with self._txn_lock():
-            cursor = await self._db.execute(statement, params)
+        async with self._read_db() as db:
+            cursor = await db.execute(statement, params)
             rows = await cursor.fetchall()
         return [row_to_batch(row) for row in rows]
 
@@ -1634,8 +1738,8 @@ class RunHome(SqliteCheckpointer):
         """
         grouped: dict[str, dict[str, tuple[dict[str, Any], Run | None]]] = {batch_id: {} for batch_id in batch_ids}
         for chunk in self._chunk_run_ids(batch_ids):
-            with self._sync_lock:
-                rows = self._sync_db().execute(*_batch_children_query(chunk)).fetchall()
+            with self._read_db_sync() as db:
+                rows = db.execute(*_batch_children_query(chunk)).fetchall()
             self._collect_batch_children(rows, grouped)
         return grouped
 
@@ -1644,10 +1748,9 @@ class RunHome(SqliteCheckpointer):
         grouped: dict[str, dict[str, tuple[dict[str, Any], Run | None]]] = {batch_id: {} for batch_id in batch_ids}
         if not batch_ids:
             return grouped
-        await self._ensure_db()
         for chunk in self._chunk_run_ids(batch_ids):
-            async with self._txn_lock():
-                cursor = await self._db.execute(*_batch_children_query(chunk))
+            async with self._read_db() as db:
+                cursor = await db.execute(*_batch_children_query(chunk))
                 rows = await cursor.fetchall()
             self._collect_batch_children(rows, grouped)
         return grouped
@@ -1664,21 +1767,70 @@ class RunHome(SqliteCheckpointer):
             run = self._row_to_run(row[sub_count:]) if row[sub_count] is not None else None
             grouped.setdefault(str(submission["batch_id"]), {})[submission["item_key"]] = (submission, run)
 
+    def _batch_census_sync(self, batch_ids: Sequence[str]) -> dict[str, dict[str, int]]:
+        """Projected bucket counters for MANY Batches, keyed by batch id.
+
+        Reads ``host_batch_census`` — triggers keep it in step with every
+        submission and runs-row change — so the cost follows the number of
+        Batches asked about, never the number of children they hold.
+        """
+        census: dict[str, dict[str, int]] = {batch_id: {} for batch_id in batch_ids}
+        for chunk in self._chunk_run_ids(batch_ids):
+            with self._read_db_sync() as db:
+                rows = db.execute(*_batch_census_query(chunk)).fetchall()
+            for batch_id, bucket, count in rows:
+                census.setdefault(str(batch_id), {})[str(bucket)] = int(count)
+        return census
+
+    async def _batch_census(self, batch_ids: Sequence[str]) -> dict[str, dict[str, int]]:
+        """Async mirror of ``_batch_census_sync``."""
+        census: dict[str, dict[str, int]] = {batch_id: {} for batch_id in batch_ids}
+        if not batch_ids:
+            return census
+        for chunk in self._chunk_run_ids(batch_ids):
+            async with self._read_db() as db:
+                cursor = await db.execute(*_batch_census_query(chunk))
+                rows = await cursor.fetchall()
+            for batch_id, bucket, count in rows:
+                census.setdefault(str(batch_id), {})[str(bucket)] = int(count)
+        return census
+
+    def _batch_item_page_sync(self, batch_id: str, *, after: str | None, limit: int) -> list[tuple[dict[str, Any], Run | None]]:
+        """One page of a Batch's joined children, in manifest order.
+
+        ``after`` is the last item key of the previous page (None for the
+        first page), so each page is an index range over the projection
+        rather than a scan of every child before it.
+        """
+        with self._read_db_sync() as db:
+            ordinal = _item_ordinal(db.execute(_SELECT_ITEM_ORDINAL, (batch_id, after)).fetchone(), batch_id, after)
+            rows = db.execute(_BATCH_ITEM_PAGE_SQL, (batch_id, ordinal, limit)).fetchall()
+        return self._page_rows(rows)
+
+    async def _batch_item_page(self, batch_id: str, *, after: str | None, limit: int) -> list[tuple[dict[str, Any], Run | None]]:
+        """Async mirror of ``_batch_item_page_sync``."""
+        async with self._read_db() as db:
+            cursor = await db.execute(_SELECT_ITEM_ORDINAL, (batch_id, after))
+            ordinal = _item_ordinal(await cursor.fetchone(), batch_id, after)
+            cursor = await db.execute(_BATCH_ITEM_PAGE_SQL, (batch_id, ordinal, limit))
+            rows = await cursor.fetchall()
+        return self._page_rows(rows)
+
+    def _page_rows(self, rows: Sequence[Any]) -> list[tuple[dict[str, Any], Run | None]]:
+        sub_count = len(_SUBMISSION_COLS.split(", "))
+        return [(_row_to_submission(row[:sub_count]), self._row_to_run(row[sub_count:]) if row[sub_count] is not None else None) for row in rows]
+
     def _tripped_batch_ids_sync(self, batch_ids: Collection[str]) -> frozenset[str]:
-        """Sync mirror of ``_tripped_batch_ids``, taking its own lock."""
+        """Sync mirror of ``_tripped_batch_ids``, on its own read connection."""
         ids = list(batch_ids)
         if not ids:
             return frozenset()
         placeholders = ", ".join("?" for _ in ids)
-        with self._sync_lock:
-            rows = (
-                self._sync_db()
-                .execute(
-                    f"SELECT DISTINCT batch_id FROM batch_updates WHERE kind = '{TRIP_UPDATE_KIND}' AND batch_id IN ({placeholders})",
-                    ids,
-                )
-                .fetchall()
-            )
+        with self._read_db_sync() as db:
+            rows = db.execute(
+                f"SELECT DISTINCT batch_id FROM batch_updates WHERE kind = '{TRIP_UPDATE_KIND}' AND batch_id IN ({placeholders})",
+                ids,
+            ).fetchall()
         return frozenset(str(row[0]) for row in rows)
 
     async def _tripped_batch_ids_scan(self, batch_ids: Collection[str]) -> frozenset[str]:
@@ -1691,8 +1843,7 @@ class RunHome(SqliteCheckpointer):
 
     def _read_batch_updates_sync(self, batch_id: str, after_bseq: int = 0) -> list[tuple[int, str, str, str]]:
         """Read batch_updates rows with bseq > after_bseq, in bseq order."""
-        with self._sync_lock:
-            db = self._sync_db()
+        with self._read_db_sync() as db:
             cursor = db.execute(
                 SELECT_BATCH_UPDATES,
                 (batch_id, after_bseq),
@@ -1701,9 +1852,8 @@ class RunHome(SqliteCheckpointer):
 
     async def _read_batch_updates(self, batch_id: str, after_bseq: int = 0) -> list[tuple[int, str, str, str]]:
         """Async mirror of ``_read_batch_updates_sync``."""
-        await self._ensure_db()
-        async with self._txn_lock():
-            cursor = await self._db.execute(
+        async with self._read_db() as db:
+            cursor = await db.execute(
                 SELECT_BATCH_UPDATES,
                 (batch_id, after_bseq),
             )
@@ -2744,12 +2894,82 @@ class RunHome(SqliteCheckpointer):
                 await self._rollback_async()
                 raise
 
+    # === compaction (CheckpointPolicy.ttl) ===
+
+    _EXPIRABLE_RUN_CLAUSE = _EXPIRABLE_HOST_RUN_CLAUSE
+    _EXPIRE_RUN_EXTRA_DELETES = _EXPIRE_HOST_ROW_DELETES
+
+    def _delete_host_rows_sync(self, db: Any, workflow_ids: Sequence[str], counts: dict[str, int]) -> None:
+        for chunk in self._chunk_run_ids(workflow_ids):
+            placeholders = ", ".join("?" for _ in chunk)
+            for counter, sql in _EXPIRE_HOST_ROW_DELETES:
+                counts[counter] = counts.get(counter, 0) + db.execute(sql.format(ids=placeholders), chunk).rowcount
+
+    async def _delete_host_rows(self, workflow_ids: Sequence[str], counts: dict[str, int]) -> None:
+        for chunk in self._chunk_run_ids(workflow_ids):
+            placeholders = ", ".join("?" for _ in chunk)
+            for counter, sql in _EXPIRE_HOST_ROW_DELETES:
+                cursor = await self._db.execute(sql.format(ids=placeholders), chunk)
+                counts[counter] = counts.get(counter, 0) + cursor.rowcount
+
+    @staticmethod
+    def _child_budget(batch_size: int, counts: dict[str, int]) -> int:
+        """Batch children this transaction may still expire.
+
+        A Batch child costs one root run of ``batch_size``, as do the runs the
+        standalone sweep already removed, so a Batch with a huge manifest is
+        spread over as many transactions as the same number of lone runs.
+        """
+        return batch_size - counts.get("runs", 0)
+
+    def _compact_batch_sync(self, db: Any, cutoff: str, batch_size: int, archive: RunArchive | None = None) -> dict[str, int]:
+        counts = super()._compact_batch_sync(db, cutoff, batch_size, archive)
+        runless = [row[0] for row in db.execute(_EXPIRED_RUNLESS_SUBMISSIONS_SQL, (cutoff, batch_size)).fetchall()]
+        self._delete_host_rows_sync(db, runless, counts)
+        budget = self._child_budget(batch_size, counts)
+        for (batch_id,) in db.execute(_EXPIRED_BATCHES_SQL, (cutoff, cutoff, batch_size)).fetchall():
+            if budget <= 0:
+                break
+            child_ids = [row[0] for row in db.execute(_SELECT_BATCH_CHILD_IDS, (batch_id, budget)).fetchall()]
+            trees, pinned = self._expirable_trees_sync(db, child_ids)
+            if pinned:
+                continue
+            self._delete_runs_sync(db, [run_id for tree in trees.values() for run_id in tree], counts, archive)
+            self._delete_host_rows_sync(db, child_ids, counts)
+            if len(child_ids) < budget:
+                for counter, sql in _EXPIRE_BATCH_DELETES:
+                    counts[counter] = counts.get(counter, 0) + db.execute(sql, (batch_id,)).rowcount
+            budget -= len(child_ids)
+        return counts
+
+    async def _compact_batch(self, cutoff: str, batch_size: int, archive: RunArchive | None = None) -> dict[str, int]:
+        counts = await super()._compact_batch(cutoff, batch_size, archive)
+        cursor = await self._db.execute(_EXPIRED_RUNLESS_SUBMISSIONS_SQL, (cutoff, batch_size))
+        await self._delete_host_rows([row[0] for row in await cursor.fetchall()], counts)
+        budget = self._child_budget(batch_size, counts)
+        cursor = await self._db.execute(_EXPIRED_BATCHES_SQL, (cutoff, cutoff, batch_size))
+        for (batch_id,) in await cursor.fetchall():
+            if budget <= 0:
+                break
+            child_cursor = await self._db.execute(_SELECT_BATCH_CHILD_IDS, (batch_id, budget))
+            child_ids = [row[0] for row in await child_cursor.fetchall()]
+            trees, pinned = await self._expirable_trees(child_ids)
+            if pinned:
+                continue
+            await self._delete_runs([run_id for tree in trees.values() for run_id in tree], counts, archive)
+            await self._delete_host_rows(child_ids, counts)
+            if len(child_ids) < budget:
+                for counter, sql in _EXPIRE_BATCH_DELETES:
+                    delete_cursor = await self._db.execute(sql, (batch_id,))
+                    counts[counter] = counts.get(counter, 0) + delete_cursor.rowcount
+            budget -= len(child_ids)
+        return counts
+
     # === listing (client.list) ===
 
     def _list_run_rows_sync(self) -> list[tuple[dict[str, Any] | None, Run | None]]:
         """All submissions with their runs row, plus bare Tier-0 runs."""
-        with self._sync_lock:
-            db = self._sync_db()
+        with self._read_db_sync() as db:
             rows: list[tuple[dict[str, Any] | None, Run | None]] = []
             cursor = db.execute(
                 f"SELECT {_QUALIFIED_SUBMISSION_COLS}, {_QUALIFIED_RUN_COLS} FROM host_submissions s LEFT JOIN runs r ON r.id = s.workflow_id"
@@ -2766,10 +2986,9 @@ class RunHome(SqliteCheckpointer):
 
     async def _list_run_rows(self) -> list[tuple[dict[str, Any] | None, Run | None]]:
         """Async mirror of ``_list_run_rows_sync``."""
-        await self._ensure_db()
-        async with self._txn_lock():
+        async with self._read_db() as db:
             rows: list[tuple[dict[str, Any] | None, Run | None]] = []
-            cursor = await self._db.execute(
+            cursor = await db.execute(
                 f"SELECT {_QUALIFIED_SUBMISSION_COLS}, {_QUALIFIED_RUN_COLS} FROM host_submissions s LEFT JOIN runs r ON r.id = s.workflow_id"
             )
             sub_count = len(_SUBMISSION_COLS.split(", "))
@@ -2777,26 +2996,40 @@ class RunHome(SqliteCheckpointer):
                 submission = _row_to_submission(row[:sub_count])
                 run = self._row_to_run(row[sub_count:]) if row[sub_count] is not None else None
                 rows.append((submission, run))
-            cursor = await self._db.execute(f"SELECT {_RUNS_COLS} FROM runs WHERE id NOT IN (SELECT workflow_id FROM host_submissions)")
+            cursor = await db.execute(f"SELECT {_RUNS_COLS} FROM runs WHERE id NOT IN (SELECT workflow_id FROM host_submissions)")
             for row in await cursor.fetchall():
                 rows.append((None, self._row_to_run(row)))
             return rows
 
     # === durable timing reads (issue #386) ===
 
+    def _node_rollup_rows_sync(self, definition: str | None) -> tuple[list[tuple[Any, ...]], list[tuple[Any, ...]]]:
+        """Rollup totals and sketch buckets per node, read in one snapshot."""
+        totals_query, sketch_query = _node_rollup_queries(definition)
+        with self._read_db_sync() as db:
+            return db.execute(*totals_query).fetchall(), db.execute(*sketch_query).fetchall()
+
+    async def _node_rollup_rows(self, definition: str | None) -> tuple[list[tuple[Any, ...]], list[tuple[Any, ...]]]:
+        """Async mirror of ``_node_rollup_rows_sync``."""
+        totals_query, sketch_query = _node_rollup_queries(definition)
+        async with self._read_db() as db:
+            totals_cursor = await db.execute(*totals_query)
+            totals = await totals_cursor.fetchall()
+            sketch_cursor = await db.execute(*sketch_query)
+            return list(totals), list(await sketch_cursor.fetchall())
+
     def _timing_run_rows_sync(self, *, definition: str | None, batch_id: str | None, limit: int) -> list[tuple[dict[str, Any], Run | None]]:
         """Host Runs a timing read covers, joined with their runs row."""
         statement, params = _timing_run_rows_query(definition=definition, batch_id=batch_id, limit=limit)
-        with self._sync_lock:
-            rows = self._sync_db().execute(statement, params).fetchall()
+        with self._read_db_sync() as db:
+            rows = db.execute(statement, params).fetchall()
         return self._join_timing_rows(rows)
 
     async def _timing_run_rows(self, *, definition: str | None, batch_id: str | None, limit: int) -> list[tuple[dict[str, Any], Run | None]]:
         """Async mirror of ``_timing_run_rows_sync``."""
         statement, params = _timing_run_rows_query(definition=definition, batch_id=batch_id, limit=limit)
-        await self._ensure_db()
-        async with self._txn_lock():
-            cursor = await self._db.execute(statement, params)
+        async with self._read_db() as db:
+            cursor = await db.execute(statement, params)
             rows = await cursor.fetchall()
         return self._join_timing_rows(rows)
 
@@ -2808,8 +3041,8 @@ class RunHome(SqliteCheckpointer):
         """Every run under ``root_ids``, mapped to the root that owns it."""
         owners: dict[str, str] = {}
         for chunk in self._chunk_run_ids(root_ids):
-            with self._sync_lock:
-                rows = self._sync_db().execute(*_descendant_runs_query(chunk)).fetchall()
+            with self._read_db_sync() as db:
+                rows = db.execute(*_descendant_runs_query(chunk)).fetchall()
             owners.update({str(run_id): str(root_id) for run_id, root_id in rows})
         return owners
 
@@ -2818,10 +3051,9 @@ class RunHome(SqliteCheckpointer):
         owners: dict[str, str] = {}
         if not root_ids:
             return owners
-        await self._ensure_db()
         for chunk in self._chunk_run_ids(root_ids):
-            async with self._txn_lock():
-                cursor = await self._db.execute(*_descendant_runs_query(chunk))
+            async with self._read_db() as db:
+                cursor = await db.execute(*_descendant_runs_query(chunk))
                 rows = await cursor.fetchall()
             owners.update({str(run_id): str(root_id) for run_id, root_id in rows})
         return owners
@@ -2830,8 +3062,8 @@ class RunHome(SqliteCheckpointer):
         """Durable step facts for these runs, in execution order."""
         facts: list[tuple[Any, ...]] = []
         for chunk in self._chunk_run_ids(run_ids):
-            with self._sync_lock:
-                facts.extend(self._sync_db().execute(*_step_timing_query(chunk)).fetchall())
+            with self._read_db_sync() as db:
+                facts.extend(db.execute(*_step_timing_query(chunk)).fetchall())
         return facts
 
     async def _step_timing_rows(self, run_ids: Sequence[str]) -> list[tuple[Any, ...]]:
@@ -2839,10 +3071,9 @@ class RunHome(SqliteCheckpointer):
         facts: list[tuple[Any, ...]] = []
         if not run_ids:
             return facts
-        await self._ensure_db()
         for chunk in self._chunk_run_ids(run_ids):
-            async with self._txn_lock():
-                cursor = await self._db.execute(*_step_timing_query(chunk))
+            async with self._read_db() as db:
+                cursor = await db.execute(*_step_timing_query(chunk))
                 facts.extend(await cursor.fetchall())
         return facts
 
@@ -2850,8 +3081,7 @@ class RunHome(SqliteCheckpointer):
 
     def _read_run_updates_sync(self, run_id: str, after_seq: int = 0) -> list[tuple[int, str, str, str]]:
         """Read run_updates rows with seq > after_seq, in seq order."""
-        with self._sync_lock:
-            db = self._sync_db()
+        with self._read_db_sync() as db:
             cursor = db.execute(
                 "SELECT seq, kind, payload, created_at FROM run_updates WHERE run_id = ? AND seq > ? ORDER BY seq",
                 (run_id, after_seq),
@@ -2860,9 +3090,8 @@ class RunHome(SqliteCheckpointer):
 
     async def _read_run_updates(self, run_id: str, after_seq: int = 0) -> list[tuple[int, str, str, str]]:
         """Async mirror of ``_read_run_updates_sync``."""
-        await self._ensure_db()
-        async with self._txn_lock():
-            cursor = await self._db.execute(
+        async with self._read_db() as db:
+            cursor = await db.execute(
                 "SELECT seq, kind, payload, created_at FROM run_updates WHERE run_id = ? AND seq > ? ORDER BY seq",
                 (run_id, after_seq),
             )
@@ -2874,11 +3103,9 @@ class RunHome(SqliteCheckpointer):
         if not run_ids:
             return {}
         placeholders = ", ".join("?" for _ in run_ids)
-        with self._sync_lock:
-            rows = (
-                self._sync_db()
-                .execute(
-                    f"""
+        with self._read_db_sync() as db:
+            rows = db.execute(
+                f"""
                 SELECT update_row.run_id, update_row.created_at
                 FROM run_updates AS update_row
                 JOIN (
@@ -2889,20 +3116,17 @@ class RunHome(SqliteCheckpointer):
                 ) AS latest
                   ON latest.run_id = update_row.run_id AND latest.seq = update_row.seq
                 """,
-                    run_ids,
-                )
-                .fetchall()
-            )
+                run_ids,
+            ).fetchall()
         return {str(run_id): str(created_at) for run_id, created_at in rows}
 
     async def _latest_run_update_times(self, run_ids: list[str]) -> dict[str, str]:
         """Async mirror of ``_latest_run_update_times_sync``."""
         if not run_ids:
             return {}
-        await self._ensure_db()
         placeholders = ", ".join("?" for _ in run_ids)
-        async with self._txn_lock():
-            cursor = await self._db.execute(
+        async with self._read_db() as db:
+            cursor = await db.execute(
                 f"""
                 SELECT update_row.run_id, update_row.created_at
                 FROM run_updates AS update_row
@@ -19,6 +19,8 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
+import time
 import uuid
 from collections.abc import Collection, Mapping, Sequence
 from dataclasses import dataclass
@@ -58,6 +60,15 @@ class _Definition:
         return DefinitionId(self.name, self.version, self.struct_hash)
 
 
+logger = logging.getLogger("hypergraph.host")
+
+#: Minimum gap between the worker's compaction passes on a Home with a
+#: ``ttl``. Expiry is coarse by nature — ttls are hours or days — so one
+#: single-transaction pass a minute keeps the backlog draining without ever
+#: competing with the claim loop for the write lock.
+_COMPACTION_INTERVAL_SECONDS = 60.0
+
+
 def _normalize_start_at(start_at: datetime | str | None) -> str | None:
     """Normalize start_at through the Home's one store-time normalizer.
 
@@ -104,6 +115,7 @@ class Host:
         self._stop_event: asyncio.Event | None = None
         self._worker_loop: asyncio.AbstractEventLoop | None = None
         self._shutdown_requested = False
+        self._next_compaction_at = 0.0
         self.worker_errors: list[BaseException] = []
 
     @property
@@ -626,6 +638,9 @@ class Host:
         then scheduled pause answers whose ``due_at`` has arrived. There is
         one due-row scanner, not a timer per feature — and one clock, so a
         worker whose process clock drifts never claims early or fires late.
+        When the Home's policy carries a ``ttl``, the same ``now`` also
+        drives ``RunHome.compact`` — at most one short batch a minute, run
+        as a background task whose errors are logged, never raised here.
         """
         if not isinstance(worker_id, str) or not worker_id:
             raise ValueError("work_forever() requires a non-empty worker_id string.")
@@ -640,6 +655,7 @@ class Host:
             stop_event.set()
             self._shutdown_requested = False
         tasks: dict[str, asyncio.Task] = {}
+        compaction: asyncio.Task | None = None
         try:
             await self._home._restart_scan()
             try:
@@ -659,14 +675,40 @@ class Host:
                     tasks = {workflow_id: task for workflow_id, task in tasks.items() if not task.done()}
                     await self._home._settle_due_answers(now_iso)
                     await self._process_stop_commands(set(tasks))
+                    if compaction is None or compaction.done():
+                        compaction = self._maybe_compact(now_iso)
                     await asyncio.sleep(0 if claimed else poll_interval)
             finally:
+                if compaction is not None:
+                    compaction.cancel()
+                    await asyncio.gather(compaction, return_exceptions=True)
                 await _drain(set(tasks.values()), drain_timeout)
         finally:
             self._stop_event = None
             self._worker_loop = None
             lock.release()
 
+    def _maybe_compact(self, now_iso: str) -> asyncio.Task | None:
+        """Start one bounded compaction pass when the Home has a ``ttl`` and one is due.
+
+        The pass runs as its own task, beside the claim loop rather than in
+        it, so a slow batch never holds up claiming. Expiry is measured
+        against the same store-clock ``now`` as every other due-row scan in
+        the pass. ``max_batches=1`` keeps the pass to a single short
+        transaction; a large backlog drains over later passes.
+        """
+        if self._home.policy.ttl is None or time.monotonic() < self._next_compaction_at:
+            return None
+        self._next_compaction_at = time.monotonic() + _COMPACTION_INTERVAL_SECONDS
+        return asyncio.create_task(self._compact(datetime.fromisoformat(now_iso)))
+
+    async def _compact(self, now: datetime) -> None:
+        """One compaction pass; a failure is logged and retried next interval."""
+        try:
+            await self._home.compact(now=now, max_batches=1)
+        except Exception:
+            logger.exception("Compaction of Run Home %s failed; retrying in %.0fs", self._home.uri, _COMPACTION_INTERVAL_SECONDS)
+
     def _record_task_exception(self, task: asyncio.Task) -> None:
         """Retrieve a finished execution task's exception for observability.
 
@@ -15,13 +15,15 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+from hypergraph.checkpointers._migrate import TIMING_SKETCH_GAMMA, TIMING_SKETCH_MIN_MS
 from hypergraph.checkpointers.types import PauseSlot, WorkflowStatus
-from hypergraph.host.client import RunHomeClient, _parse_iso, _RunReadSnapshot, _StepFact, _TimingSnapshot
+from hypergraph.host.client import RunHomeClient, _BatchCensus, _NodeRollupSnapshot, _parse_iso, _RunReadSnapshot, _StepFact, _TimingSnapshot
 from hypergraph.host.definition import DefinitionId
 from hypergraph.host.refs import BatchRef, RunRef
 from hypergraph.host.views import (
     BATCH_OUTCOME_ABANDONED,
     TERMINAL_STATUS_VALUES,
+    BatchItemView,
     BatchView,
     RunQuery,
     RunView,
@@ -307,6 +309,56 @@ class NodeTimingsReadModel:
         }
 
 
+@dataclass(frozen=True)
+class NodeLatencyReadModel:
+    """One node's lifetime cost and latency percentiles, from the Home's rollup.
+
+    Counts and totals are exact. ``min_ms``/``max_ms`` and the percentiles
+    describe executions that ACTUALLY RAN, for the same reason
+    ``NodeTimingReadModel.average_ms`` does; the percentiles come from a
+    log-bucket sketch and sit within about 1% of the true order statistic.
+    All five are None when every execution was a cache hit.
+    """
+
+    node_name: str
+    executions: int
+    cached: int
+    errors: int
+    total_seconds: float
+    average_ms: float | None
+    min_ms: float | None
+    max_ms: float | None
+    p50_ms: float | None
+    p95_ms: float | None
+    p99_ms: float | None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "node_name": self.node_name,
+            "executions": self.executions,
+            "cached": self.cached,
+            "errors": self.errors,
+            "total_seconds": self.total_seconds,
+            "average_ms": self.average_ms,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+            "p50_ms": self.p50_ms,
+            "p95_ms": self.p95_ms,
+            "p99_ms": self.p99_ms,
+        }
+
+
+@dataclass(frozen=True)
+class NodeLatenciesReadModel:
+    """Lifetime per-node latency for one Definition, or for the whole Home."""
+
+    definition: str | None
+    nodes: tuple[NodeLatencyReadModel, ...]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"definition": self.definition, "nodes": [node.to_dict() for node in self.nodes]}
+
+
 class RunHomeReadModel:
     """Derive generic operator views from a backend-neutral Run Home client.
 
@@ -356,13 +408,51 @@ class RunHomeReadModel:
         view = self._client.get_sync(ref)
         return _batch(view) if isinstance(view, BatchView) else None
 
+    async def get_batch_summary(self, ref: BatchRef) -> BatchSummaryReadModel | None:
+        """One Batch's census without its per-item detail, or None if unknown.
+
+        The cheap sibling of ``get_batch``: the counts are read from the
+        Home's census projection rather than folded from every child, so an
+        operator screen over a very large Batch can poll it freely and page
+        the items it actually shows through ``list_batch_items``.
+        """
+        census = await self._client._get_batch_census(ref)
+        return None if census is None else _batch_summary(census)
+
+    def get_batch_summary_sync(self, ref: BatchRef) -> BatchSummaryReadModel | None:
+        """Sync mirror of ``get_batch_summary``."""
+        census = self._client._get_batch_census_sync(ref)
+        return None if census is None else _batch_summary(census)
+
+    async def list_batch_items(self, ref: BatchRef, *, after: str | None = None, limit: int = 100) -> list[BatchItemReadModel]:
+        """One page of a Batch's items, in manifest order.
+
+        Args:
+            ref: The Batch to page through.
+            after: The ``item_key`` of the last item on the previous page,
+                or None for the first page.
+            limit: Cap on returned items (default 100).
+
+        Returns:
+            Up to ``limit`` :class:`BatchItemReadModel` rows, each carrying
+            the same condition word ``get_batch`` reports for that item. An
+            empty list means the manifest is exhausted.
+        """
+        return [_batch_item(item) for item in await self._client._batch_item_page(ref, after=after, limit=limit)]
+
+    def list_batch_items_sync(self, ref: BatchRef, *, after: str | None = None, limit: int = 100) -> list[BatchItemReadModel]:
+        """Sync mirror of ``list_batch_items``."""
+        return [_batch_item(item) for item in self._client._batch_item_page_sync(ref, after=after, limit=limit)]
+
     async def list_batches(self, definition: str | None = None, limit: int = 50) -> list[BatchSummaryReadModel]:
         """List recent Batches, newest first.
 
         The listing an operator opens a bulk run on: which sweeps this Run
         Home accepted, when, and how each one's manifest is doing right now.
         Counts come from the SAME bucket ladder ``get_batch`` uses, so a row
-        in the list and the Batch it opens can never tell different stories.
+        in the list and the Batch it opens can never tell different stories
+        — read from the Home's census projection, so a page costs the same
+        whether its Batches hold ten items or a hundred thousand.
 
         Args:
             definition: Only Batches pinned to this Definition name, or None
@@ -373,11 +463,11 @@ class RunHomeReadModel:
             One :class:`BatchSummaryReadModel` per Batch, newest acceptance
             first, with ``batch_id`` as the total tie-breaker.
         """
-        return [_batch_summary(view, created_at) for view, created_at in await self._client._list_batch_views(definition, limit)]
+        return [_batch_summary(census) for census in await self._client._list_batch_censuses(definition, limit)]
 
     def list_batches_sync(self, definition: str | None = None, limit: int = 50) -> list[BatchSummaryReadModel]:
         """Sync mirror of ``list_batches``."""
-        return [_batch_summary(view, created_at) for view, created_at in self._client._list_batch_views_sync(definition, limit)]
+        return [_batch_summary(census) for census in self._client._list_batch_censuses_sync(definition, limit)]
 
     async def node_timings(
         self,
@@ -427,6 +517,33 @@ class RunHomeReadModel:
         """Sync mirror of ``node_timings``."""
         return _node_timings(self._client._timing_snapshot_sync(definition, batch, limit))
 
+    async def node_latencies(self, definition: str | None = None) -> NodeLatenciesReadModel:
+        """Per-node latency percentiles from the Home's maintained rollups.
+
+        ``node_timings`` folds the step rows of a selection, so its cost
+        grows with the history it covers. This reads the rollup the Home
+        keeps current as each step commits — one row per node plus its
+        sketch buckets — so a dashboard asking "what is p95 for ``embed``?"
+        costs the same after ten runs or ten million.
+
+        The rollup is a LIFETIME aggregate: retention and compaction drop
+        step rows, not the executions they already counted. For a windowed
+        or per-Batch view, use ``node_timings``.
+
+        Args:
+            definition: One Definition name, or None to merge every
+                Definition's rollup per node name.
+
+        Returns:
+            :class:`NodeLatenciesReadModel`, nodes ordered by total cost
+            (heaviest first, node name as the tie-breaker).
+        """
+        return _node_latencies(await self._client._node_rollup(definition))
+
+    def node_latencies_sync(self, definition: str | None = None) -> NodeLatenciesReadModel:
+        """Sync mirror of ``node_latencies``."""
+        return _node_latencies(self._client._node_rollup_sync(definition))
+
     async def _run(self, snapshot: _RunReadSnapshot) -> RunReadModel:
         pause = _pause(snapshot.view.run_ref, snapshot.pause_slot) if snapshot.view.waiting is WaitingCondition.PAUSED else None
         return _run(snapshot, pause)
@@ -496,33 +613,34 @@ def _batch(view: BatchView) -> BatchReadModel:
         workflow_id=view.workflow_id,
         definition_id=view.definition_id,
         counts=dict(view.counts),
-        items={
-            key: BatchItemReadModel(
-                item_key=item.item_key,
-                run_ref=item.run_ref,
-                workflow_id=item.workflow_id,
-                word=item_condition(item),
-                started=item.started,
-            )
-            for key, item in view.items.items()
-        },
+        items={key: _batch_item(item) for key, item in view.items.items()},
         settled=view.settled,
         tolerance_tripped=view.tolerance_tripped,
         retry_of=view.retry_of,
     )
 
 
-def _batch_summary(view: BatchView, created_at: datetime) -> BatchSummaryReadModel:
+def _batch_item(item: BatchItemView) -> BatchItemReadModel:
+    return BatchItemReadModel(
+        item_key=item.item_key,
+        run_ref=item.run_ref,
+        workflow_id=item.workflow_id,
+        word=item_condition(item),
+        started=item.started,
+    )
+
+
+def _batch_summary(census: _BatchCensus) -> BatchSummaryReadModel:
     return BatchSummaryReadModel(
-        batch_ref=view.batch_ref,
-        workflow_id=view.workflow_id,
-        definition_id=view.definition_id,
-        created_at=created_at,
-        item_count=len(view.items),
-        counts=dict(view.counts),
-        settled=view.settled,
-        tolerance_tripped=view.tolerance_tripped,
-        retry_of=view.retry_of,
+        batch_ref=census.batch_ref,
+        workflow_id=census.workflow_id,
+        definition_id=census.definition_id,
+        created_at=census.created_at,
+        item_count=sum(census.counts.values()),
+        counts=dict(census.counts),
+        settled=census.settled,
+        tolerance_tripped=census.tolerance_tripped,
+        retry_of=census.retry_of,
     )
 
 
@@ -616,6 +734,59 @@ class _NodeFold:
         )
 
 
+def _node_latencies(snapshot: _NodeRollupSnapshot) -> NodeLatenciesReadModel:
+    sketches: dict[str, list[tuple[int, int]]] = {}
+    for node_name, bucket, n in snapshot.buckets:
+        sketches.setdefault(node_name, []).append((int(bucket), int(n)))
+    nodes = []
+    for node_name, executions, cached, errors, total_ms, ran, ran_ms, min_ms, max_ms in snapshot.totals:
+        sketch = sketches.get(node_name, [])
+        p50, p95, p99 = (_sketch_quantile(sketch, q, min_ms, max_ms) for q in (0.50, 0.95, 0.99))
+        nodes.append(
+            NodeLatencyReadModel(
+                node_name=node_name,
+                executions=int(executions),
+                cached=int(cached),
+                errors=int(errors),
+                total_seconds=float(total_ms) / 1000.0,
+                average_ms=(float(ran_ms) / ran) if ran else None,
+                min_ms=min_ms if ran else None,
+                max_ms=max_ms if ran else None,
+                p50_ms=p50,
+                p95_ms=p95,
+                p99_ms=p99,
+            )
+        )
+    nodes.sort(key=lambda node: (-node.total_seconds, node.node_name))
+    return NodeLatenciesReadModel(definition=snapshot.definition, nodes=tuple(nodes))
+
+
+def _sketch_quantile(sketch: Sequence[tuple[int, int]], q: float, min_ms: float | None, max_ms: float | None) -> float | None:
+    """Nearest-rank estimate from a log-bucket sketch.
+
+    Bucket ``k`` holds durations in ``(MIN·γ^(k-1), MIN·γ^k]``; its midpoint
+    in relative terms is within ``(γ-1)/(γ+1)`` of anything inside it.
+    Clamping to the observed extremes keeps p0/p100 exact.
+    """
+    total = sum(n for _, n in sketch)
+    if total <= 0:
+        return None
+    rank = q * (total - 1)
+    seen = 0
+    bucket = sketch[-1][0]
+    for candidate, n in sketch:
+        seen += n
+        if seen > rank:
+            bucket = candidate
+            break
+    estimate = TIMING_SKETCH_MIN_MS * TIMING_SKETCH_GAMMA**bucket * 2.0 / (1.0 + TIMING_SKETCH_GAMMA)
+    if min_ms is not None:
+        estimate = max(estimate, min_ms)
+    if max_ms is not None:
+        estimate = min(estimate, max_ms)
+    return estimate
+
+
 def _json_copy(value: dict[str, Any]) -> dict[str, Any]:
     return json.loads(json.dumps(value))
 
@@ -628,6 +799,8 @@ __all__ = [
     "BatchItemReadModel",
     "BatchReadModel",
     "BatchSummaryReadModel",
+    "NodeLatenciesReadModel",
+    "NodeLatencyReadModel",
     "NodeTimingReadModel",
     "NodeTimingsReadModel",
     "PauseReadModel",
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from hypergraph.materialization._branches import MaterializationBranch, MaterializedArtifact
 from hypergraph.materialization._hypertable import ChildTable, HyperTable
+from hypergraph.materialization._row_view import RowView
 from hypergraph.materialization._table import Table
 from hypergraph.materialization._table_store import TableStore, validate_store
 from hypergraph.materialization._types import (
@@ -12,6 +13,7 @@ from hypergraph.materialization._types import (
     RecipeDrift,
     RowReceipt,
     RowStatus,
+    TableOptimization,
     TableReceipt,
     TableStatus,
     WaitingRow,
@@ -24,6 +26,7 @@ __all__ = [
     "MaterializationBranch",
     "MaterializedArtifact",
     "LanceDBStore",
+    "RowView",
     "Table",
     "TableStore",
     "validate_store",
@@ -32,6 +35,7 @@ __all__ = [
     "RecipeDrift",
     "RowReceipt",
     "RowStatus",
+    "TableOptimization",
     "TableReceipt",
     "TableStatus",
     "WaitingRow",
@@ -127,6 +127,17 @@ def _check_read_one_returns_newest_generation(store: TableStore) -> None:
     )
 
 
+def _check_read_many_returns_newest_generations(store: TableStore) -> None:
+    store.open(_spec("c_many"), [])
+    store.write_rows("c_many", [_row("a", 1, 1), _row("b", 2, 1), _row("c", 3, 1)])
+    store.write_rows("c_many", [_row("a", 10, 2)])
+    got = store.read_many("c_many", "cid", ["a", "b", "missing"])
+    assert set(got) == {"a", "b"}, f"read_many must return exactly the requested identities that exist; got keys {sorted(got)!r}"
+    assert got["a"]["n"] == 10, f"read_many must return the highest _write_gen per identity, like read_one; got {got['a']!r}"
+    assert got["b"]["n"] == 2, f"read_many returned the wrong data for 'b': {got['b']!r}"
+    assert store.read_many("c_many", "cid", []) == {}, "read_many with no identities must return {}"
+
+
 def _check_predicate_operators(store: TableStore) -> None:
     store.open(_spec("c_ops"), [])
     store.write_rows("c_ops", [_row("a", 1, 1), _row("b", 2, 1), _row("c", 3, 1)])
@@ -271,6 +282,23 @@ def _check_binary_null(store: TableStore) -> None:
     )
 
 
+def _check_scan_yields_projected_batches(store: TableStore) -> None:
+    store.open(_spec("c_scan"), [])
+    store.write_rows("c_scan", [_row(f"r{i}", i, 1) for i in range(5)])
+    store.write_rows("c_scan", [_row("r1", 10, 2)])
+    batches = list(store.scan("c_scan", [("n", "gte", 1)], columns=["cid", "_write_gen"], batch_rows=2))
+    assert all(0 < batch.num_rows <= 2 for batch in batches), (
+        f"scan must yield non-empty batches of at most batch_rows rows; got sizes {[batch.num_rows for batch in batches]}"
+    )
+    rows = [row for batch in batches for row in batch.to_pylist()]
+    assert all(set(row) == {"cid", "_write_gen"} for row in rows), f"scan(columns=[...]) must yield only those columns; got {rows[:1]!r}"
+    got = sorted((row["cid"], row["_write_gen"]) for row in rows)
+    assert got == [("r1", 1), ("r1", 2), ("r2", 1), ("r3", 1), ("r4", 1)], (
+        f"scan must yield every physical row matching the predicate, older generations included; got {got!r}"
+    )
+    assert list(store.scan("c_scan", [("n", "gt", 100)])) == [], "a scan matching nothing must yield no batches"
+
+
 def _check_read_rows_column_projection(store: TableStore) -> None:
     store.open(_binary_spec("c_proj"), [])
     store.write_rows("c_proj", [_binary_row("a", _BLOB, 1, label="alpha"), _binary_row("b", _BLOB, 1, label="beta")])
@@ -309,9 +337,55 @@ def _check_read_one_column_projection(store: TableStore) -> None:
     assert newest == {"label": "beta"}, f"read_one under projection must still return the newest generation; got {newest!r}"
 
 
+def _check_identity_index_lookups(store: TableStore) -> None:
+    store.open(_spec("c_idx"), [])
+    store.write_rows("c_idx", [_row(f"r{i}", i, 1) for i in range(50)])
+    assert store.identity_index("c_idx") == "cid", (
+        f"a store with an identity index must report it on the identity column once rows exist; got {store.identity_index('c_idx')!r}"
+    )
+
+    # Rows written after the index was built must still be found, newest generation first.
+    store.write_rows("c_idx", [_row("r7", 70, 2), _row("late", 99, 1), _row("O'Neil", 5, 1)])
+    assert store.identity_index("c_idx") == "cid", "the identity index must survive later writes"
+    got = store.read_one("c_idx", "cid", "r7")
+    assert got is not None and got["n"] == 70, f"an indexed read_one must return the newest generation; got {got!r}"
+    late = store.read_one("c_idx", "cid", "late")
+    assert late is not None and late["n"] == 99, f"an indexed read_one must find a row written after the index was built; got {late!r}"
+    quoted = store.read_one("c_idx", "cid", "O'Neil")
+    assert quoted is not None and quoted["n"] == 5, "an indexed read_one must handle identity values containing a single quote"
+    many = store.read_many("c_idx", "cid", ["r3", "r7", "late", "missing"])
+    assert {key: row["n"] for key, row in many.items()} == {"r3": 3, "r7": 70, "late": 99}, f"indexed read_many returned {many!r}"
+
+    store.delete_rows("c_idx", [("cid", "eq", "r3")])
+    assert store.read_one("c_idx", "cid", "r3") is None, "an indexed read_one must not return a deleted row"
+
+
+def _check_optimize_preserves_rows(store: TableStore) -> None:
+    store.open(_spec("c_opt"), [])
+    for i in range(4):
+        store.write_rows("c_opt", [_row(f"r{i}", i, 1)])
+    store.write_rows("c_opt", [_row("r1", 10, 2)])
+    store.delete_rows("c_opt", [("cid", "eq", "r1"), ("_write_gen", "lt", 2)])
+    store.delete_rows("c_opt", [("cid", "eq", "r3")])
+    before = sorted((r["cid"], r["n"], r["_write_gen"]) for r in store.read_rows("c_opt"))
+    fragments = store.fragment_count("c_opt")
+
+    store.optimize("c_opt")
+
+    after = sorted((r["cid"], r["n"], r["_write_gen"]) for r in store.read_rows("c_opt"))
+    assert after == before, f"optimize must not change what read_rows returns; before {before!r}, after {after!r}"
+    got = store.read_one("c_opt", "cid", "r1")
+    assert got is not None and got["n"] == 10, f"read_one after optimize must still return the newest generation; got {got!r}"
+    assert store.max_write_gen("c_opt") == 2, "max_write_gen must be unchanged by optimize"
+    if fragments is not None:
+        assert store.fragment_count("c_opt") <= fragments, "optimize must not increase the fragment count"
+
+
 _CHECKS: list[Callable[[TableStore], None]] = [
     _check_open_and_roundtrip,
     _check_read_one_returns_newest_generation,
+    _check_read_many_returns_newest_generations,
+    _check_scan_yields_projected_batches,
     _check_predicate_operators,
     _check_delete_returns_count,
     _check_string_quotes,
@@ -337,6 +411,20 @@ _PROJECTION_CHECKS: list[Callable[[TableStore], None]] = [
 ]
 
 
+# Storage maintenance is optional too: only a store that overrides
+# ``optimize`` (``supports_optimize()``) is held to leaving reads unchanged.
+_OPTIMIZE_CHECKS: list[Callable[[TableStore], None]] = [
+    _check_optimize_preserves_rows,
+]
+
+
+# The identity index is also a capability: only a store that reports one
+# (``supports_identity_index()``) must keep it correct across later writes.
+_IDENTITY_INDEX_CHECKS: list[Callable[[TableStore], None]] = [
+    _check_identity_index_lookups,
+]
+
+
 def check_store_conformance(store: TableStore) -> None:
     """Drive a fresh, empty ``store`` through the TableStore behavioral contract.
 
@@ -347,6 +435,8 @@ def check_store_conformance(store: TableStore) -> None:
     The column-projection checks are conditional: they run only when the store
     advertises ``supports_column_projection()`` (its read methods accept the
     ``columns=`` kwarg). A store that predates projection stays fully green.
+    The identity-index and optimize checks likewise run only for
+    ``supports_identity_index()`` and ``supports_optimize()``.
     """
     if not isinstance(store, TableStore):
         raise TypeError(f"store must subclass TableStore, got {type(store).__name__}")
@@ -354,6 +444,10 @@ def check_store_conformance(store: TableStore) -> None:
     checks = list(_CHECKS)
     if store.supports_column_projection():
         checks += _PROJECTION_CHECKS
+    if store.supports_identity_index():
+        checks += _IDENTITY_INDEX_CHECKS
+    if store.supports_optimize():
+        checks += _OPTIMIZE_CHECKS
 
     failures: list[str] = []
     for check in checks:
@@ -6,14 +6,26 @@ plain values (a scalar such as a segmentation mode) are recipe: they
 parameterize derivation exactly like a component config, so they participate
 in fingerprints and per-column provenance. When any of those change, the row
 re-derives on the next insert/sync; otherwise it is skipped.
+
+The recipe half of a row fingerprint is the same for every row of a table, so
+``recipe_parts`` computes it once and ``fingerprint_inputs`` only digests the
+input values, feeding each one to the hash by type rather than through
+``str()``.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
-from collections.abc import Iterable
-from typing import Any
+import struct
+import sys
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 from hypergraph._utils import hash_definition
 from hypergraph.materialization._schema import node_func
@@ -150,15 +162,165 @@ def _fingerprint(inputs: dict[str, Any], node_hashes: list[str], component_hashe
     return hashlib.sha256(payload.encode()).hexdigest()
 
 
+@dataclass(frozen=True)
+class RecipeParts:
+    """The per-table half of every row fingerprint, computed once per table.
+
+    ``prefix`` seeds each row's hash; ``recipe`` is the table's recipe-only
+    fingerprint (``compute_table_recipe_fingerprint``). The node and component
+    hashes are kept to recompute fingerprints stamped by ``legacy_fingerprint``.
+    """
+
+    node_hashes: tuple[str, ...]
+    component_hashes: dict[str, str]
+    prefix: bytes
+    recipe: str
+
+
+def recipe_parts(graph: Any, components: dict[str, Any], valid_inputs: set[str] | None = None) -> RecipeParts:
+    node_hashes = sorted(_node_definition_hashes(graph))
+    component_hashes = _component_config_hashes(components, valid_inputs)
+    prefix = json.dumps({"version": 2, "nodes": node_hashes, "components": component_hashes}, sort_keys=True)
+    return RecipeParts(
+        node_hashes=tuple(node_hashes),
+        component_hashes=component_hashes,
+        prefix=prefix.encode() + b"\0",
+        recipe=_fingerprint({}, node_hashes, component_hashes),
+    )
+
+
+def _sized(tag: bytes, size: int) -> bytes:
+    return tag + str(size).encode() + b":"
+
+
+def _float_vector(values: Sequence[float]) -> bytes:
+    packed = array("d", values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _digest_value(update: Callable[[bytes], Any], value: Any) -> None:
+    """Feed ``value`` to a hash by type, never through ``str()`` of the whole value.
+
+    Every part is tagged and length-prefixed so adjacent values cannot run
+    together. A list of floats and a 1-D float NumPy array hash alike (as
+    float64 bytes), since the store may hand back either for the same column.
+    """
+    if value is None:
+        update(b"N")
+    elif isinstance(value, bool):
+        update(b"?1" if value else b"?0")
+    elif isinstance(value, int):
+        encoded = str(value).encode()
+        update(_sized(b"i", len(encoded)) + encoded)
+    elif isinstance(value, float):
+        update(b"f" + struct.pack("<d", value))
+    elif isinstance(value, str):
+        encoded = value.encode("utf-8", "surrogatepass")
+        update(_sized(b"s", len(encoded)))
+        update(encoded)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        update(_sized(b"y", len(value)))
+        update(value)
+    elif isinstance(value, (list, tuple)):
+        if all(type(item) is float for item in value):
+            update(_sized(b"v", len(value)) + _float_vector(value))
+            return
+        update(_sized(b"l" if isinstance(value, list) else b"t", len(value)))
+        for item in value:
+            _digest_value(update, item)
+    elif isinstance(value, dict):
+        update(_sized(b"d", len(value)))
+        for key in sorted(value, key=str):
+            _digest_value(update, str(key))
+            _digest_value(update, value[key])
+    elif (np := sys.modules.get("numpy")) is not None and isinstance(value, (np.ndarray, np.generic)):
+        if isinstance(value, np.generic):
+            _digest_value(update, value.item())
+        elif value.ndim == 1 and value.dtype.kind == "f":
+            update(_sized(b"v", len(value)) + value.astype("<f8").tobytes())
+        else:
+            _digest_value(update, value.tolist())
+    else:
+        encoded = f"{type(value).__name__}:{value}".encode("utf-8", "surrogatepass")
+        update(_sized(b"o", len(encoded)))
+        update(encoded)
+
+
+def fingerprint_inputs(parts: RecipeParts, inputs: dict[str, Any]) -> str:
+    """Fingerprint one row's input values under a table's precomputed recipe."""
+    hasher = hashlib.sha256(parts.prefix)
+    for name in sorted(inputs):
+        _digest_value(hasher.update, name)
+        _digest_value(hasher.update, inputs[name])
+    return hasher.hexdigest()
+
+
+def legacy_fingerprint(parts: RecipeParts, inputs: dict[str, Any]) -> str:
+    """The fingerprint rows were stamped with before inputs were digested by type."""
+    return _fingerprint(inputs, list(parts.node_hashes), parts.component_hashes)
+
+
+def _float_vector_rows(column: pa.ChunkedArray | pa.Array) -> list[bytes] | None:
+    """Each row of a null-free float list column as the bytes ``_digest_value`` feeds, or None."""
+    import pyarrow as pa
+
+    values = column.combine_chunks() if isinstance(column, pa.ChunkedArray) else column
+    value_type = values.type
+    if not (pa.types.is_list(value_type) or pa.types.is_large_list(value_type) or pa.types.is_fixed_size_list(value_type)):
+        return None
+    if not pa.types.is_floating(value_type.value_type) or values.null_count:
+        return None
+    flat = values.flatten()
+    if flat.null_count:
+        return None
+    data = flat.to_numpy(zero_copy_only=False).astype("<f8")
+    if pa.types.is_fixed_size_list(value_type):
+        size = value_type.list_size
+        return [_sized(b"v", size) + data[row * size : (row + 1) * size].tobytes() for row in range(len(values))]
+    offsets = values.offsets.to_numpy()
+    offsets = offsets - offsets[0]
+    return [_sized(b"v", int(end - start)) + data[start:end].tobytes() for start, end in zip(offsets[:-1], offsets[1:], strict=True)]
+
+
+def fingerprint_batch(parts: RecipeParts, batch: pa.RecordBatch | pa.Table, names: Iterable[str]) -> list[str]:
+    """``fingerprint_inputs`` for every row of an Arrow batch, one column at a time.
+
+    Row ``i`` gets the fingerprint of ``{name: batch[name][i] for name in
+    names}``. Float vector columns are digested straight from the Arrow buffer;
+    other columns are converted to Python values a column at a time.
+    """
+    columns: list[tuple[str, list[bytes] | None, list[Any]]] = []
+    for name in sorted(names):
+        column = batch.column(name)
+        packed = _float_vector_rows(column)
+        columns.append((name, packed, column.to_pylist() if packed is None else []))
+    fingerprints: list[str] = []
+    for row in range(batch.num_rows):
+        hasher = hashlib.sha256(parts.prefix)
+        for name, packed, values in columns:
+            _digest_value(hasher.update, name)
+            if packed is not None:
+                hasher.update(packed[row])
+            else:
+                _digest_value(hasher.update, values[row])
+        fingerprints.append(hasher.hexdigest())
+    return fingerprints
+
+
 def compute_row_fingerprint(graph: Any, components: dict[str, Any], graph_inputs: dict[str, Any]) -> str:
     """Fingerprint a root row from its source inputs, node code, and component configs."""
-    return _fingerprint(graph_inputs, _node_definition_hashes(graph), _component_config_hashes(components))
+    return fingerprint_inputs(recipe_parts(graph, components), graph_inputs)
+
+
+def child_valid_inputs(child_graph: Any) -> set[str]:
+    return set(child_graph.inputs.all) if child_graph is not None and hasattr(child_graph.inputs, "all") else set()
 
 
 def compute_child_fingerprint(child_graph: Any, components: dict[str, Any], child_inputs: dict[str, Any]) -> str:
     """Fingerprint a child row, scoped to the child graph (only its components count)."""
-    valid_inputs = set(child_graph.inputs.all) if child_graph is not None and hasattr(child_graph.inputs, "all") else set()
-    return _fingerprint(child_inputs, _node_definition_hashes(child_graph), _component_config_hashes(components, valid_inputs))
+    return fingerprint_inputs(recipe_parts(child_graph, components, child_valid_inputs(child_graph)), child_inputs)
 
 
 def compute_recipe_fingerprint(node_fn: Any, component_hashes: dict[str, str]) -> str:
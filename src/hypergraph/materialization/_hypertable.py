@@ -4,7 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-from collections.abc import Awaitable, Callable, Mapping
+import contextvars
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from functools import partial
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -16,6 +20,7 @@ from hypergraph.materialization._hypertable_viz import render_hypertable
 from hypergraph.materialization._indexes import IndexPolicy
 from hypergraph.materialization._provenance import Provenance
 from hypergraph.materialization._provenance import normalize_value as _normalize_value
+from hypergraph.materialization._row_view import RowView, arrow_table, limit_batches, newest_batches, public_batch
 from hypergraph.materialization._schema import (
     PARENT_LINK_COLUMN,
     QUESTION_COLUMN,
@@ -26,11 +31,13 @@ from hypergraph.materialization._schema import (
     is_internal_column,
     python_type_to_arrow,
 )
+from hypergraph.materialization._table_store import SCAN_BATCH_ROWS
 from hypergraph.materialization._types import (
     ErroredRow,
     RecipeDrift,
     RowReceipt,
     RowStatus,
+    TableOptimization,
     TableReceipt,
     TableStatus,
     WaitingRow,
@@ -44,16 +51,21 @@ from hypergraph.materialization._writes import (
 from hypergraph.materialization._writes import (
     dedup_rows as _dedup_rows,
 )
+from hypergraph.materialization._writes import (
+    scan_rows as _scan_rows,
+)
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from hypergraph.materialization._branches import MaterializationBranch
     from hypergraph.materialization._table_store import TableStore
     from hypergraph.nodes import HyperNode
     from hypergraph.runners import BaseRunner
 
 
-def _public_row(row: dict[str, Any], spec: TableSpec | None = None) -> dict[str, Any]:
-    gate_outputs = {
+def _gate_outputs(spec: TableSpec | None) -> set[str]:
+    return {
         column.name
         for column in (spec.columns if spec is not None else ())
         if any(
@@ -61,6 +73,10 @@ def _public_row(row: dict[str, Any], spec: TableSpec | None = None) -> dict[str,
             for producer in (column.produced_by if isinstance(column.produced_by, tuple) else (column.produced_by,))
         )
     }
+
+
+def _public_row(row: dict[str, Any], spec: TableSpec | None = None) -> dict[str, Any]:
+    gate_outputs = _gate_outputs(spec)
     result = {}
     for k, v in row.items():
         if not is_internal_column(k) and k not in gate_outputs:
@@ -76,6 +92,23 @@ def _where_predicate(where: Any) -> list[tuple[str, str, Any]]:
     return list(where)
 
 
+def _public_batches(
+    store: TableStore,
+    table_name: str,
+    where: list[tuple[str, str, Any]] | None,
+    key_columns: list[str],
+    *,
+    hidden: set[str],
+    parent_identity: str | None = None,
+    batch_rows: int = SCAN_BATCH_ROWS,
+) -> Iterator[pa.RecordBatch]:
+    def scan(columns: list[str] | None) -> Iterator[pa.RecordBatch]:
+        return store.scan(table_name, where or None, columns=columns, batch_rows=batch_rows)
+
+    for batch in newest_batches(scan, key_columns):
+        yield public_batch(batch, hidden=hidden, parent_identity=parent_identity)
+
+
 def _run_write_step(step: Callable[[], Any]) -> tuple[bool, Any]:
     """Run one write-plan step, catching StopIteration on this side of any
     thread boundary: raised through a future into the awaiting coroutine it
@@ -88,6 +121,25 @@ def _run_write_step(step: Callable[[], Any]) -> tuple[bool, Any]:
         return True, complete.value
 
 
+@dataclass(eq=False)
+class _PooledOperation:
+    """One write plan in flight under ``HyperTable._drive_sync_pooled``.
+
+    ``slot`` is its position in the parent's ``RunOperations`` response; a
+    plan waiting on its own children keeps their results in ``results`` and
+    the not-yet-started ones in ``queued``.
+    """
+
+    operation: WriteOperation
+    parent: _PooledOperation | None = None
+    slot: int = 0
+    queued: deque[tuple[int, WriteOperation]] = field(default_factory=deque)
+    results: list[Any] = field(default_factory=list)
+    running: int = 0
+    remaining: int = 0
+    limit: int = 1
+
+
 class ChildTable:
     """Read and annotate one named child grain."""
 
@@ -100,13 +152,8 @@ class ChildTable:
         public[self._parent._identity] = _normalize_value(row[PARENT_LINK_COLUMN])
         return public
 
-    def _matching_rows(
-        self,
-        where: Any = None,
-        *,
-        parent: str | None = None,
-        limit: int | None = None,
-    ) -> list[dict[str, Any]]:
+    def _child_predicates(self, where: Any = None, *, parent: str | None = None) -> list[tuple[str, str, Any]] | None:
+        """Child-table predicates for ``where``; None when a parent-column filter matches no parent."""
         predicates = _where_predicate(where)
         child_columns = set(self._parent._store.column_names(self._spec.name))
         parent_columns = set(self._parent._store.column_names(self._parent._spec.name))
@@ -129,8 +176,20 @@ class ChildTable:
             )
             parent_ids = [row[self._parent._identity] for row in parents]
             if not parent_ids:
-                return []
+                return None
             child_predicates.append((PARENT_LINK_COLUMN, "in", parent_ids))
+        return child_predicates
+
+    def _matching_rows(
+        self,
+        where: Any = None,
+        *,
+        parent: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        child_predicates = self._child_predicates(where, parent=parent)
+        if child_predicates is None:
+            return []
         rows = self._parent._store.read_rows(self._spec.name, child_predicates or None)
         rows = _dedup_child_rows(rows, self._spec.identity)
         return rows[:limit] if limit is not None else rows
@@ -151,6 +210,35 @@ class ChildTable:
     ) -> list[dict[str, Any]]:
         return [self._public_row(row) for row in self._matching_rows(where, parent=parent, limit=limit)]
 
+    def iter_batches(
+        self,
+        where: Any = None,
+        *,
+        parent: str | None = None,
+        batch_rows: int = SCAN_BATCH_ROWS,
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream the rows ``rows`` would return as Arrow record batches."""
+        child_predicates = self._child_predicates(where, parent=parent)
+        if child_predicates is None:
+            return iter(())
+        return _public_batches(
+            self._parent._store,
+            self._spec.name,
+            child_predicates,
+            [PARENT_LINK_COLUMN, self._spec.identity],
+            hidden=_gate_outputs(self._spec),
+            parent_identity=self._parent._identity,
+            batch_rows=batch_rows,
+        )
+
+    def rows_arrow(self, where: Any = None, *, parent: str | None = None, limit: int | None = None) -> pa.Table:
+        """The rows ``rows`` would return, as one Arrow table."""
+        return arrow_table(limit_batches(self.iter_batches(where, parent=parent), limit))
+
+    def row_view(self, where: Any = None, *, parent: str | None = None, limit: int | None = None) -> RowView:
+        """The rows ``rows`` would return, as a lazy ``RowView``."""
+        return RowView(self.rows_arrow(where, parent=parent, limit=limit))
+
     def waiting(self) -> tuple[WaitingRow, ...]:
         result: list[WaitingRow] = []
         for row in self._matching_rows([(STATUS_COLUMNS[0], "eq", RowStatus.WAITING.value)]):
@@ -223,6 +311,7 @@ class HyperTable:
         store: TableStore,
         runner: BaseRunner | None = None,
         page_max_concurrency: int = 16,
+        max_workers: int = 1,
         on_error: Literal["raise", "store"] = "raise",
         name: str | None = None,
     ) -> None:
@@ -244,6 +333,11 @@ class HyperTable:
                 f"HyperTable page_max_concurrency must be an int >= 1; got {page_max_concurrency!r}.\n\n"
                 "How to fix: pass page_max_concurrency=16 (the default), or another positive child-page window."
             )
+        if isinstance(max_workers, bool) or not isinstance(max_workers, int) or max_workers < 1:
+            raise GraphConfigError(
+                f"HyperTable max_workers must be an int >= 1; got {max_workers!r}.\n\n"
+                "How to fix: pass max_workers=1 (the default) to derive rows serially, or a larger thread count."
+            )
         if not isinstance(graph, Graph):
             raise TypeError(
                 "HyperTable requires a Graph, not a node list.\n\n"
@@ -257,6 +351,7 @@ class HyperTable:
         self._name = name
         self._runner = runner
         self._page_max_concurrency = page_max_concurrency
+        self._max_workers = max_workers
         self._components = dict(graph._bound)
         graph_nodes = list(graph.nodes.values()) if isinstance(graph.nodes, dict) else []
         if not graph_nodes:
@@ -362,6 +457,13 @@ class HyperTable:
         parent_run_id: str | None = None,
     ) -> Any:
         """Execute one shared write plan with a synchronous runner."""
+        if self._max_workers > 1:
+            return self._drive_sync_pooled(
+                operation,
+                event_processors=event_processors,
+                parent_span_id=parent_span_id,
+                parent_run_id=parent_run_id,
+            )
         try:
             action = next(operation)
         except StopIteration as complete:
@@ -401,6 +503,92 @@ class HyperTable:
             except StopIteration as complete:
                 return complete.value
 
+    def _drive_sync_pooled(
+        self,
+        operation: WriteOperation,
+        *,
+        event_processors: list[Any] | None = None,
+        parent_span_id: str | None = None,
+        parent_run_id: str | None = None,
+    ) -> Any:
+        """Execute a write plan with its graph runs spread over ``max_workers`` threads.
+
+        Only ``RunGraph`` actions leave the calling thread. Every plan step —
+        and so every store call — still runs here, one at a time, so a store
+        that is not ``thread_safe`` keeps its thread affinity and writes stay
+        serialized. Up to ``max_concurrency`` operations of a ``RunOperations``
+        are in flight at once, and their responses keep the order they were
+        yielded in, so receipts come out exactly as with the serial driver.
+        """
+        nested_options: dict[str, Any] = {"event_processors": event_processors}
+        if parent_span_id is not None:
+            nested_options["_parent_span_id"] = parent_span_id
+            nested_options["_parent_run_id"] = parent_run_id
+        steps: deque[tuple[_PooledOperation, Callable[[], Any]]] = deque()
+        running: dict[Future[Any], _PooledOperation] = {}
+        outcome: list[Any] = []
+
+        def start_children(frame: _PooledOperation) -> None:
+            while frame.queued and frame.running < frame.limit:
+                slot, child = frame.queued.popleft()
+                frame.running += 1
+                steps.append((_PooledOperation(child, parent=frame, slot=slot), partial(next, child)))
+
+        def finish(frame: _PooledOperation, value: Any) -> None:
+            parent = frame.parent
+            if parent is None:
+                outcome.append(value)
+                return
+            parent.results[frame.slot] = value
+            parent.running -= 1
+            parent.remaining -= 1
+            if parent.remaining == 0:
+                steps.append((parent, partial(parent.operation.send, parent.results)))
+            else:
+                start_children(parent)
+
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="hypertable-derive") as pool:
+            try:
+                steps.append((_PooledOperation(operation), partial(next, operation)))
+                while not outcome:
+                    while steps:
+                        frame, step = steps.popleft()
+                        done, action = _run_write_step(step)
+                        if done:
+                            finish(frame, action)
+                        elif isinstance(action, RunGraph):
+                            context = contextvars.copy_context()
+                            future = pool.submit(context.run, partial(self._runner.run, action.graph, **nested_options, **action.input_values()))
+                            running[future] = frame
+                        elif isinstance(action, RunOperations):
+                            frame.queued = deque(enumerate(action.operations))
+                            frame.results = [None] * len(frame.queued)
+                            frame.remaining = len(frame.queued)
+                            frame.limit = action.max_concurrency
+                            if frame.remaining == 0:
+                                steps.append((frame, partial(frame.operation.send, [])))
+                            else:
+                                start_children(frame)
+                        else:
+                            raise TypeError(f"unsupported write effect: {type(action).__name__}")
+                    if outcome:
+                        break
+                    completed, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        frame = running.pop(future)
+                        error = future.exception()
+                        if error is None:
+                            steps.append((frame, partial(frame.operation.send, future.result())))
+                        elif isinstance(error, Exception):
+                            steps.append((frame, partial(frame.operation.throw, error)))
+                        else:
+                            raise error
+            finally:
+                # A failed plan leaves graphs queued behind it; drop those and
+                # let the ones already running finish before re-raising.
+                pool.shutdown(wait=True, cancel_futures=True)
+        return outcome[0]
+
     async def _run_write_step_async(self, step: Callable[[], Any]) -> tuple[bool, Any]:
         """One write-plan step under the store's execution policy.
 
@@ -615,22 +803,70 @@ class HyperTable:
         Child tables are checked with their scoped child fingerprints.
         """
         self._ensure_analyzed()
-        rows = _dedup_rows(self._store.read_rows(self._spec.name), self._identity)
-        stale_column_counts: dict[str, int] = {}
+        rows, fingerprints = self._status_rows(self._spec)
+        stale_gens: dict[Any, Any] = {}
         root = self._classify_rows(
             rows,
+            fingerprints,
             identity=self._identity,
-            fingerprint_of=lambda row: self._provenance_policy.root_fingerprint(self._provenance_policy.source_inputs(row)),
-            on_stale=lambda row: self._count_stale_columns(row, stale_column_counts),
+            on_stale=lambda row: stale_gens.setdefault(str(row.get(self._identity, "")), row.get("_write_gen")),
         )
+        stale_column_counts = self._stale_column_counts(self._spec.name, stale_gens, lambda row: str(row.get(self._identity, "")))
         children = tuple(self._child_status(child_spec) for child_spec in self._spec.children)
         return TableStatus(
             table=self._spec.name,
             children=children,
             stale_columns=tuple(sorted(stale_column_counts.items())),
+            fragments=self._store.fragment_count(self._spec.name),
             **root,
         )
 
+    def optimize(self) -> TableOptimization:
+        """Compact the storage of the root and every child table now.
+
+        Runs the store's ``optimize`` maintenance — for LanceDB: merge small
+        fragments, prune old versions, refresh indexes — and reports fragment
+        counts before and after. Reads return the same rows afterwards. Use it
+        as an explicit maintenance step between syncs, or configure the store
+        to run it inline (``LanceDBStore(optimize_every=...)``).
+        """
+        self._ensure_analyzed()
+
+        def optimize_table(table_name: str) -> TableOptimization:
+            before = self._store.fragment_count(table_name)
+            self._store.optimize(table_name)
+            return TableOptimization(table=table_name, fragments_before=before, fragments_after=self._store.fragment_count(table_name))
+
+        children = tuple(optimize_table(child_spec.name) for child_spec in self._spec.children)
+        root = optimize_table(self._spec.name)
+        return TableOptimization(root.table, root.fragments_before, root.fragments_after, children=children)
+
+    def _status_columns(self, spec: TableSpec) -> list[str]:
+        """The columns ``status`` needs to classify a row: keys, generation, outcome and sources."""
+        columns = [spec.identity, "_write_gen", "_status", "_row_fingerprint"]
+        if spec is not self._spec:
+            columns.append("_parent_id")
+        columns.extend(column.name for column in spec.columns if column.role == "source")
+        physical = self._store.column_names(spec.name)
+        return [column for column in dict.fromkeys(columns) if not physical or column in physical]
+
+    def _stale_column_counts(self, table_name: str, stale_gens: dict[Any, Any], key_of: Any, spec: TableSpec | None = None) -> dict[str, int]:
+        """Count stale columns over the full stored rows of the stale generations, streamed.
+
+        Attributing staleness needs every stored value of a row, so the stale
+        rows are re-read in full, one batch at a time, and matched back to the
+        generation ``status`` classified.
+        """
+        counts: dict[str, int] = {}
+        if not stale_gens:
+            return counts
+        for row in _scan_rows(self._store, table_name):
+            key = key_of(row)
+            if key in stale_gens and stale_gens[key] == row.get("_write_gen"):
+                del stale_gens[key]
+                self._count_stale_columns(row, counts, spec)
+        return counts
+
     def _count_stale_columns(self, row: dict[str, Any], counts: dict[str, int], spec: TableSpec | None = None) -> None:
         """Attribute a stale row to the specific columns whose provenance no longer matches."""
         values = self._provenance_policy.stored_values(row)
@@ -640,30 +876,72 @@ class HyperTable:
                 if prov is None or self._provenance_policy.column_is_null(row.get(c.name)) or row.get(f"_provenance_{c.name}") != prov:
                     counts[c.name] = counts.get(c.name, 0) + 1
 
+    def _status_rows(self, spec: TableSpec) -> tuple[list[dict[str, Any]], list[str]]:
+        """The newest stored rows of ``spec``'s table and each one's current fingerprint.
+
+        A store that streams Arrow batches is fingerprinted a batch at a time,
+        and its source columns never become Python row dicts; any other store
+        is read with ``read_rows`` and fingerprinted row by row.
+        """
+        provenance = self._provenance_policy
+        child_spec = None if spec is self._spec else spec
+        columns = self._status_columns(spec)
+        if not self._store.supports_scan():
+            if child_spec is None:
+                roots = _dedup_rows(_scan_rows(self._store, spec.name, columns=columns), spec.identity)
+                return roots, [provenance.root_fingerprint(provenance.source_inputs(row), stored=row.get("_row_fingerprint")) for row in roots]
+            children = _dedup_child_rows(_scan_rows(self._store, spec.name, columns=columns), spec.identity)
+            return children, [
+                provenance.child_fingerprint(provenance.child_source_inputs(row, spec), spec, stored=row.get("_row_fingerprint")) for row in children
+            ]
+
+        sources = {column.name for column in spec.columns if column.role == "source"} - {spec.identity}
+        rows: list[dict[str, Any]] = []
+        fingerprints: list[str] = []
+        for batch in self._store.scan(spec.name, columns=columns):
+            fingerprints.extend(provenance.fingerprint_batch(batch, child_spec))
+            rows.extend(batch.select([name for name in batch.schema.names if name not in sources]).to_pylist())
+        # The newest generation per key, exactly as dedup_rows/dedup_child_rows pick it.
+        newest: dict[Any, int] = {}
+        for position, row in enumerate(rows):
+            key = str(row.get(spec.identity, "")) if child_spec is None else (str(row.get("_parent_id", "")), str(row.get(spec.identity, "")))
+            current = newest.get(key)
+            if current is None or row.get("_write_gen", 0) > rows[current].get("_write_gen", 0):
+                newest[key] = position
+        return [rows[position] for position in newest.values()], [fingerprints[position] for position in newest.values()]
+
     def _child_status(self, child_spec: TableSpec) -> TableStatus:
-        rows = _dedup_child_rows(self._store.read_rows(child_spec.name), child_spec.identity)
-        stale_column_counts: dict[str, int] = {}
+        rows, fingerprints = self._status_rows(child_spec)
+        stale_gens: dict[Any, Any] = {}
+
+        def key_of(row: dict[str, Any]) -> tuple[str, str]:
+            return (str(row.get("_parent_id", "")), str(row.get(child_spec.identity, "")))
+
         counts = self._classify_rows(
             rows,
+            fingerprints,
             identity=child_spec.identity,
-            fingerprint_of=lambda row: self._provenance_policy.child_fingerprint(
-                self._provenance_policy.child_source_inputs(row, child_spec), child_spec
-            ),
-            on_stale=lambda row: self._count_stale_columns(row, stale_column_counts, spec=child_spec),
+            on_stale=lambda row: stale_gens.setdefault(key_of(row), row.get("_write_gen")),
+        )
+        stale_column_counts = self._stale_column_counts(child_spec.name, stale_gens, key_of, spec=child_spec)
+        return TableStatus(
+            table=child_spec.name,
+            stale_columns=tuple(sorted(stale_column_counts.items())),
+            fragments=self._store.fragment_count(child_spec.name),
+            **counts,
         )
-        return TableStatus(table=child_spec.name, stale_columns=tuple(sorted(stale_column_counts.items())), **counts)
 
-    def _classify_rows(self, rows: list[dict[str, Any]], *, identity: str, fingerprint_of: Any, on_stale: Any = None) -> dict[str, Any]:
+    def _classify_rows(self, rows: list[dict[str, Any]], fingerprints: list[str], *, identity: str, on_stale: Any = None) -> dict[str, Any]:
         """Split stored rows into fresh / stale / errored for a status report."""
         fresh = stale = errored = 0
         stale_ids: list[str] = []
         errored_ids: list[str] = []
-        for row in rows:
+        for row, fingerprint in zip(rows, fingerprints, strict=True):
             id_val = str(row.get(identity, ""))
             if row.get("_status") == "error":
                 errored += 1
                 errored_ids.append(id_val)
-            elif row.get("_row_fingerprint") == fingerprint_of(row):
+            elif row.get("_row_fingerprint") == fingerprint:
                 fresh += 1
             else:
                 stale += 1
@@ -757,6 +1035,36 @@ class HyperTable:
         rows = _dedup_rows(rows, self._identity)
         return [_public_row(row, self._spec) for row in rows]
 
+    def iter_batches(self, where: Any = None, *, batch_rows: int = SCAN_BATCH_ROWS) -> Iterator[pa.RecordBatch]:
+        """Stream the rows ``rows`` would return as Arrow record batches.
+
+        Batches come straight from ``TableStore.scan`` with internal columns
+        dropped, so no row is converted to a dict. Superseded generations are
+        filtered out the way ``rows`` filters them; the scan reads the identity
+        and ``_write_gen`` columns once up front to find them.
+        """
+        self._ensure_analyzed()
+        return _public_batches(
+            self._store,
+            self._spec.name,
+            _where_predicate(where),
+            [self._identity],
+            hidden=_gate_outputs(self._spec),
+            batch_rows=batch_rows,
+        )
+
+    def rows_arrow(self, where: Any = None, *, limit: int | None = None) -> pa.Table:
+        """The rows ``rows`` would return, as one Arrow table."""
+        return arrow_table(limit_batches(self.iter_batches(where), limit))
+
+    def row_view(self, where: Any = None, *, limit: int | None = None) -> RowView:
+        """The rows ``rows`` would return, as a lazy ``RowView``.
+
+        A ``RowView`` is a read-only sequence of row dicts that converts each
+        row on access; ``to_numpy`` turns a vector column into a 2-D matrix.
+        """
+        return RowView(self.rows_arrow(where, limit=limit))
+
     def waiting(self) -> tuple[WaitingRow, ...]:
         """Return the typed inbox of rows blocked on a human answer."""
         self._ensure_analyzed()
@@ -869,6 +1177,30 @@ class HyperTable:
             results.append(public)
         return results
 
+    def search_many(
+        self,
+        query_vectors: Any,
+        *,
+        index: str,
+        limit: int = 10,
+        where: Any = None,
+        columns: list[str] | None = None,
+    ) -> pa.Table:
+        """Vector search for many query vectors at once, as one Arrow table.
+
+        ``query_vectors`` is a matrix: a NumPy array or a list of vectors.
+        Each hit row holds ``_query`` (the position of its query vector), the
+        public columns (or only ``columns``), and ``_distance``. ``where``
+        stacks on the index's ``rows`` slice like ``search``, and both are
+        applied before the nearest neighbours are picked.
+        """
+        self._ensure_analyzed()
+        hits = self._indexes.search_many(query_vectors, index=index, limit=limit, where=where, columns=columns)
+        if PARENT_LINK_COLUMN in hits.column_names:
+            hits = hits.rename_columns([self._identity if name == PARENT_LINK_COLUMN else name for name in hits.column_names])
+        gate_outputs = _gate_outputs(self._spec)
+        return hits.select([name for name in hits.column_names if not is_internal_column(name) and name not in gate_outputs])
+
     def set(self, where: Any, **fields: Any) -> int | Awaitable[int]:
         """Bulk metadata update for all rows matching a predicate."""
         self._ensure_analyzed()
@@ -967,3 +1299,17 @@ class HyperTable:
         if self._is_async_runner():
             return self._drive_async(operation)
         return self._drive_sync(operation)
+
+    def rebuild_drifted(self) -> TableReceipt | Awaitable[TableReceipt]:
+        """Re-derive the columns whose recipe changed, on the rows built under the old one.
+
+        Only the drifted nodes and their downstream nodes run, over only the
+        rows ``recipe_drift()`` counts as drifted or unknown; every other
+        column is read from the store and left as it is. Waiting and errored
+        rows are left to ``sync()``.
+        """
+        self._ensure_analyzed()
+        operation = self._write_planner.rebuild_drifted()
+        if self._is_async_runner():
+            return self._drive_async(operation)
+        return self._drive_sync(operation)
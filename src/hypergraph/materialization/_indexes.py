@@ -7,7 +7,7 @@ from typing import Any
 
 from hypergraph.materialization._branch_registry import load_branch_records
 from hypergraph.materialization._provenance import Provenance
-from hypergraph.materialization._schema import TableSpec, is_internal_column
+from hypergraph.materialization._schema import PARENT_LINK_COLUMN, TableSpec, is_internal_column
 
 
 def _where_predicate(where: Any) -> list[tuple[str, str, Any]]:
@@ -181,3 +181,29 @@ class IndexPolicy:
             where=combined_where or None,
             limit=limit,
         )
+
+    def search_many(
+        self,
+        query_vectors: Any,
+        *,
+        index: str,
+        limit: int,
+        where: Any,
+        columns: list[str] | None,
+    ) -> Any:
+        indexes = self._load()
+        if index not in indexes:
+            raise KeyError(f"no index named {index!r}; known indexes: {sorted(indexes)}")
+        index_spec = indexes[index]
+        combined_where = [*_where_predicate(index_spec.get("rows")), *_where_predicate(where)]
+        if columns is not None and self._resolve_table(index_spec.get("on")) is not self._spec:
+            # A child row names its parent by the root identity publicly.
+            columns = [PARENT_LINK_COLUMN if name == self._spec.identity else name for name in columns]
+        return self._store.search_many(
+            index_spec["on"],
+            query_vectors,
+            vector_column=index_spec["vector"],
+            where=combined_where or None,
+            limit=limit,
+            columns=columns,
+        )
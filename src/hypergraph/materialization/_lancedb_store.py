@@ -4,24 +4,34 @@ from __future__ import annotations
 
 import hashlib
 import json
+import logging
 import os
 import threading
+from collections.abc import Iterator, Sequence
+from datetime import timedelta
 from pathlib import Path
 from typing import Any
 
 import lancedb
+import numpy as np
 import pyarrow as pa
 import pyarrow.compute as pc
+from lancedb.index import BTree
 
 from hypergraph.materialization._provenance import normalize_value
 from hypergraph.materialization._schema import TableSpec, is_internal_column
-from hypergraph.materialization._table_store import RowPredicate, TableStore
+from hypergraph.materialization._table_store import SCAN_BATCH_ROWS, RowPredicate, TableStore
 
 try:
     import fcntl
 except ImportError:  # pragma: no cover - LanceDB local storage is POSIX in CI
     fcntl = None  # type: ignore[assignment]
 
+logger = logging.getLogger(__name__)
+
+_INDEX_REFRESH_ROWS = 10_000
+"""Appended rows after which the identity index is brought up to date."""
+
 _CAS_LOCKS: dict[str, threading.Lock] = {}
 _CAS_LOCKS_GUARD = threading.Lock()
 
@@ -56,6 +66,38 @@ def _arrow_table_to_dicts(table: pa.Table) -> list[dict[str, Any]]:
     return [{c: pydict[c][i] for c in cols} for i in range(len(table))]
 
 
+def _column_array(values: list[Any], arrow_type: pa.DataType) -> pa.Array:
+    """One Arrow column from per-row Python values.
+
+    A vector column whose values are all present and the right length is
+    stacked into one NumPy buffer and wrapped as a fixed-size list without
+    visiting each element from Python.
+    """
+    if pa.types.is_fixed_size_list(arrow_type) and values and all(value is not None for value in values):
+        try:
+            flat = np.asarray(values, dtype=arrow_type.value_type.to_pandas_dtype())
+        except (TypeError, ValueError):
+            flat = None
+        if flat is not None and flat.shape == (len(values), arrow_type.list_size):
+            return pa.FixedSizeListArray.from_arrays(pa.array(flat.reshape(-1), type=arrow_type.value_type), arrow_type.list_size)
+    return pa.array(values, type=arrow_type)
+
+
+def _cast_column(column: pa.ChunkedArray, arrow_type: pa.DataType) -> pa.ChunkedArray | pa.Array:
+    """Cast an Arrow input column to the table's field type.
+
+    Older pyarrow cannot cast a variable-size list to a fixed-size one, which
+    is exactly what a caller-built vector column looks like before the table
+    specialized it; those go through the Python conversion instead.
+    """
+    if column.type == arrow_type:
+        return column
+    try:
+        return column.cast(arrow_type)
+    except pa.ArrowNotImplementedError:
+        return _column_array(column.to_pylist(), arrow_type)
+
+
 def _sql_literal(val: Any) -> str:
     """Render a predicate value as a LanceDB SQL literal, escaping quotes in strings."""
     if isinstance(val, str):
@@ -83,9 +125,17 @@ class LanceDBStore(TableStore):
     filesystem path by a process mutex plus POSIX ``flock``. The guarantee
     applies to contenders using ``compare_and_set`` and relies on the shared
     filesystem honoring advisory locks; ordinary writes do not join it.
+
+    Every append and every delete leaves a new fragment or deletion file
+    behind. ``optimize(table)`` compacts them, prunes versions older than
+    ``cleanup_older_than`` and folds new rows into the indexes. With
+    ``optimize_every=N`` the store does that itself after every N commits to
+    a table; by default it is left to an explicit ``HyperTable.optimize()``.
     """
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, *, optimize_every: int | None = None, cleanup_older_than: timedelta = timedelta(days=7)):
+        if optimize_every is not None and (isinstance(optimize_every, bool) or not isinstance(optimize_every, int) or optimize_every < 1):
+            raise ValueError(f"LanceDBStore optimize_every must be None or an int >= 1; got {optimize_every!r}")
         # Construction is zero-I/O: only the path is recorded. ``lancedb.connect``
         # creates the directory eagerly, so it is deferred to the first
         # store-method use — config functions construct stores without side
@@ -95,6 +145,21 @@ class LanceDBStore(TableStore):
         self._tables: dict[str, Any] = {}
         self._schemas: dict[str, pa.Schema] = {}
         self._vector_dims: dict[str, dict[str, int]] = {}
+        # Identity index bookkeeping: the column each opened table is keyed by,
+        # and for tables whose index is built, rows appended since it last
+        # caught up.
+        self._identity_columns: dict[str, str] = {}
+        self._unindexed_rows: dict[str, int] = {}
+        # Tables whose index build failed -> rows appended since it did.
+        self._index_failures: dict[str, int] = {}
+        # Write-generation high-water marks: table -> (dataset version, highest
+        # _write_gen at that version). Valid only while the table is still at
+        # that version; see ``max_write_gen``.
+        self._write_gens: dict[str, tuple[int, int]] = {}
+        # Maintenance policy, and commits per table since it last ran.
+        self._optimize_every = optimize_every
+        self._cleanup_older_than = cleanup_older_than
+        self._commits: dict[str, int] = {}
 
     @property
     def _db(self) -> Any:
@@ -104,13 +169,16 @@ class LanceDBStore(TableStore):
 
     def open(self, spec: TableSpec, children: list[TableSpec]) -> dict[str, list[str]]:
         result: dict[str, list[str]] = {}
-        self._ensure_table(spec)
-        result[spec.name] = [f.name for f in self._tables[spec.name].schema]
-        for child in children:
-            self._ensure_table(child)
-            result[child.name] = [f.name for f in self._tables[child.name].schema]
+        for table_spec in (spec, *children):
+            self._ensure_table(table_spec)
+            self._identity_columns[table_spec.name] = table_spec.identity
+            self._maintain_identity_index(table_spec.name, 0)
+            result[table_spec.name] = [f.name for f in self._tables[table_spec.name].schema]
         return result
 
+    def identity_index(self, table_name: str) -> str | None:
+        return self._identity_columns[table_name] if table_name in self._unindexed_rows else None
+
     def _readable(self, table_name: str) -> Any | None:
         """The cached Table handle advanced to the latest committed version.
 
@@ -163,8 +231,11 @@ class LanceDBStore(TableStore):
         # Identity + _write_gen are always fetched: identity to match, _write_gen
         # to pick the newest generation on crash-leftover duplicates. Both are
         # dropped from the returned row if the caller did not ask for them.
-        at = self._read_arrow(tbl, columns, extra=[identity_column, "_write_gen"])
-        at = _apply_arrow_predicate(at, [(identity_column, "eq", identity_value)])
+        if identity_value is None:
+            return None
+        # The identity filter runs inside the Lance scan: with the identity
+        # index built it is a point lookup, not a read of the whole column.
+        at = self._read_arrow(tbl, columns, extra=[identity_column, "_write_gen"], where=[(identity_column, "eq", identity_value)])
         if len(at) == 0:
             return None
         if len(at) > 1:
@@ -176,12 +247,61 @@ class LanceDBStore(TableStore):
         rows = _arrow_table_to_dicts(at)
         return rows[0]
 
+    def read_many(
+        self, table_name: str, identity_column: str, identity_values: Any, *, columns: list[str] | None = None
+    ) -> dict[Any, dict[str, Any]]:
+        wanted = [value for value in dict.fromkeys(identity_values) if value is not None]
+        tbl = self._readable(table_name) if wanted else None
+        if tbl is None:
+            return {}
+        # One filtered scan for the whole batch. Sorting newest-first lets the
+        # first row seen per identity win, the same tie-break as ``read_one``.
+        at = self._read_arrow(tbl, columns, extra=[identity_column, "_write_gen"], where=[(identity_column, "in", wanted)])
+        if len(at) == 0:
+            return {}
+        at = at.take(pc.sort_indices(at, sort_keys=[("_write_gen", "descending")]))
+        identities = at.column(identity_column).to_pylist()
+        if columns is not None:
+            at = at.select([c for c in columns if c in at.column_names])
+        newest: dict[Any, dict[str, Any]] = {}
+        for identity_value, row in zip(identities, _arrow_table_to_dicts(at), strict=True):
+            newest.setdefault(identity_value, row)
+        return newest
+
+    def scan(
+        self,
+        table_name: str,
+        where: RowPredicate | None = None,
+        *,
+        columns: list[str] | None = None,
+        batch_rows: int = SCAN_BATCH_ROWS,
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream record batches straight from the Lance scanner.
+
+        Projection and the predicate are pushed into the scan, so only the
+        requested columns of matching rows are ever read, one batch at a time.
+        """
+        tbl = self._readable(table_name)
+        if tbl is None:
+            return
+        available = {f.name for f in tbl.schema}
+        if any(column not in available for column in self._predicate_columns(where)):
+            return  # mirrors read_rows: a predicate on an absent column matches nothing
+        if columns is not None:
+            unknown = [c for c in columns if c not in available]
+            if unknown:
+                raise KeyError(f"read requested unknown column(s) {unknown} on table {tbl.name!r}; available columns: {sorted(available)}")
+        filter_expr = _build_lance_filter(where) if where else None
+        for batch in tbl.to_lance().to_batches(columns=columns, filter=filter_expr, batch_size=batch_rows):
+            if len(batch):
+                yield batch
+
     @staticmethod
     def _predicate_columns(where: RowPredicate | None) -> list[str]:
         """Columns a predicate reads — must survive the projection so the filter can run."""
         return [col for col, _op, _val in where] if where else []
 
-    def _read_arrow(self, tbl: Any, columns: list[str] | None, *, extra: list[str]) -> pa.Table:
+    def _read_arrow(self, tbl: Any, columns: list[str] | None, *, extra: list[str], where: RowPredicate | None = None) -> pa.Table:
         """Read an Arrow table, pushing a column projection into LanceDB when asked.
 
         A projected read never materializes unrequested columns (the point:
@@ -190,48 +310,62 @@ class LanceDBStore(TableStore):
         ``_write_gen``) that must be present even if the caller did not list
         them; they are trimmed from the returned rows afterward. An unknown
         requested column fails loudly, naming the column and the real schema.
+        ``where`` is pushed into the Lance scan, where a scalar index on its
+        column can answer it.
         """
-        if columns is None:
+        if columns is None and where is None:
             return tbl.to_arrow()
-        available = {f.name for f in tbl.schema}
-        requested = list(dict.fromkeys([*columns, *extra]))
-        unknown = [c for c in requested if c not in available]
-        if unknown:
-            raise KeyError(f"read requested unknown column(s) {unknown} on table {tbl.name!r}; available columns: {sorted(available)}")
-        projected = [c for c in requested if c in available]
-        return tbl.to_lance().to_table(columns=projected)
-
-    def write_rows(self, table_name: str, rows: list[dict[str, Any]]) -> None:
-        if not rows:
+        projected = None
+        if columns is not None:
+            available = {f.name for f in tbl.schema}
+            requested = list(dict.fromkeys([*columns, *extra]))
+            unknown = [c for c in requested if c not in available]
+            if unknown:
+                raise KeyError(f"read requested unknown column(s) {unknown} on table {tbl.name!r}; available columns: {sorted(available)}")
+            projected = [c for c in requested if c in available]
+        dataset = tbl.to_lance()
+        if where is None:
+            return dataset.to_table(columns=projected)
+        return dataset.to_table(columns=projected, filter=_build_lance_filter(where))
+
+    def write_rows(self, table_name: str, rows: list[dict[str, Any]] | pa.Table | pa.RecordBatch) -> None:
+        """Append rows, given as dicts or as an already-built Arrow table/batch.
+
+        Dict rows are converted a column at a time: one ``pa.array`` per field
+        over every row, never one per cell. A field a row (or an Arrow input)
+        lacks is written as null, and dict rows get the missing key set to
+        ``None`` in place, as before.
+        """
+        if isinstance(rows, pa.RecordBatch):
+            rows = pa.Table.from_batches([rows])
+        if len(rows) == 0:
             return
         tbl = self._tables[table_name]
-        schema = tbl.schema
 
         if table_name not in self._vector_dims:
-            self._detect_and_fix_vectors(table_name, rows[0])
+            first = rows.slice(0, 1).to_pylist()[0] if isinstance(rows, pa.Table) else rows[0]
+            self._detect_and_fix_vectors(table_name, first)
             tbl = self._tables[table_name]
-            schema = tbl.schema
-
-        record_batches: list[pa.RecordBatch] = []
-        for row in rows:
-            for field_obj in schema:
-                if field_obj.name not in row:
-                    row[field_obj.name] = None
-
-            arrays = []
-            for field_obj in schema:
-                val = row.get(field_obj.name)
-                if val is None:
-                    arrays.append(pa.array([None], type=field_obj.type))
-                elif pa.types.is_list(field_obj.type) and isinstance(val, list):
-                    inner_type = field_obj.type.value_type
-                    inner_arr = pa.array(val, type=inner_type)
-                    arrays.append(pa.array([inner_arr], type=field_obj.type))
-                else:
-                    arrays.append(pa.array([val], type=field_obj.type))
-            record_batches.append(pa.record_batch(arrays, schema=schema))
+        schema = tbl.schema
 
-        tbl.add(pa.Table.from_batches(record_batches, schema=schema))
+        if isinstance(rows, pa.Table):
+            present = set(rows.column_names)
+            arrays = [
+                _cast_column(rows.column(field_obj.name), field_obj.type) if field_obj.name in present else pa.nulls(len(rows), type=field_obj.type)
+                for field_obj in schema
+            ]
+        else:
+            for row in rows:
+                for field_obj in schema:
+                    row.setdefault(field_obj.name, None)
+            arrays = [_column_array([row[field_obj.name] for row in rows], field_obj.type) for field_obj in schema]
+        batch = pa.Table.from_arrays(arrays, schema=schema)
+        before = tbl.version
+        tbl.add(batch)
+        written = pc.max(batch.column("_write_gen")).as_py() if "_write_gen" in batch.column_names else None
+        self._advance_write_gen(table_name, before, written)
+        self._maintain_identity_index(table_name, len(rows))
+        self._note_commit(table_name)
 
     def delete_rows(self, table_name: str, where: RowPredicate) -> int:
         tbl = self._readable(table_name)
@@ -246,17 +380,39 @@ class LanceDBStore(TableStore):
         if matching == 0:
             return 0
         filter_expr = _build_lance_filter(where)
+        before = tbl.version
         tbl.delete(filter_expr)
+        # Superseded-generation cleanup (``_write_gen < g`` with g at or below
+        # the high-water mark) cannot remove the newest row; any other delete
+        # might, so the mark is recomputed on the next read.
+        cached = self._write_gens.get(table_name)
+        if cached is not None and any(col == "_write_gen" and op == "lt" and val <= cached[1] for col, op, val in where):
+            self._advance_write_gen(table_name, before, None)
+        else:
+            self._write_gens.pop(table_name, None)
+        self._note_commit(table_name)
         return matching
 
     def max_write_gen(self, table_name: str) -> int:
+        """The highest ``_write_gen``, scanning the column only when the table moved under us.
+
+        The result is remembered against the dataset version it was read at,
+        and this store's own writes carry it forward to the version they
+        commit. A commit by anyone else (another connection, another process)
+        or a crash between the two leaves the remembered version behind the
+        latest one, and the column is scanned again — so the answer is never
+        stale, only sometimes recomputed.
+        """
         tbl = self._readable(table_name)
         if tbl is None:
             return 0
+        cached = self._write_gens.get(table_name)
+        if cached is not None and cached[0] == tbl.version:
+            return cached[1]
         at = self._read_arrow(tbl, ["_write_gen"], extra=[])
-        if len(at) == 0:
-            return 0
-        return pc.max(at.column("_write_gen")).as_py()
+        high = (pc.max(at.column("_write_gen")).as_py() or 0) if len(at) else 0
+        self._write_gens[table_name] = (tbl.version, high)
+        return high
 
     def compare_and_set(
         self,
@@ -333,6 +489,73 @@ class LanceDBStore(TableStore):
             q = q.limit(limit)
         return q.to_list()
 
+    def search_many(
+        self,
+        table_name: str,
+        query_vectors: Sequence[Sequence[float]],
+        *,
+        vector_column: str | None = None,
+        where: RowPredicate | None = None,
+        limit: int | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> pa.Table:
+        """Search every query vector in one LanceDB query.
+
+        The predicate is pushed into Lance as a pre-filter, and only
+        ``columns`` (plus ``_distance``) are read for the hits.
+        """
+        empty = pa.table({"_query": pa.array([], type=pa.int32())})
+        if len(query_vectors) == 0:
+            return empty
+        tbl = self._readable(table_name)
+        if tbl is None:
+            # Absent vs unreadable, exactly as in ``search``.
+            if not self._table_dir_exists(table_name):
+                return empty
+            tbl = self._db.open_table(table_name)
+            self._tables[table_name] = tbl
+        # A NumPy matrix goes to Lance as is; anything else as a list of lists.
+        vectors = query_vectors if isinstance(query_vectors, np.ndarray) else [list(vector) for vector in query_vectors]
+        q = tbl.search(vectors, vector_column_name=vector_column)
+        if where:
+            q = q.where(_build_lance_filter(where), prefilter=True)
+        if columns is not None:
+            q = q.select([*columns, "_distance"])
+        if limit is not None:
+            q = q.limit(limit)
+        hits = q.to_arrow()
+        # A single query vector comes back without Lance's ``query_index``.
+        if "query_index" in hits.column_names:
+            positions = hits.column("query_index").cast(pa.int32())
+            hits = hits.drop_columns(["query_index"])
+        else:
+            positions = pa.array([0] * hits.num_rows, type=pa.int32())
+        return hits.add_column(0, "_query", positions)
+
+    def optimize(self, table_name: str) -> None:
+        """Compact fragments, prune versions older than ``cleanup_older_than`` and optimize indexes."""
+        tbl = self._readable(table_name)
+        if tbl is None:
+            return
+        split = any(tbl.index_stats(index.name).num_unindexed_rows for index in tbl.list_indices())
+        tbl.optimize(cleanup_older_than=self._cleanup_older_than)
+        # Compaction does not merge fragments an index covers with ones it
+        # does not. When rows were unindexed, the first pass brought the index
+        # up to date, so a second merges the fragments that split left.
+        if split and len(tbl.to_lance().get_fragments()) > 1:
+            tbl.optimize(cleanup_older_than=self._cleanup_older_than)
+        tbl.checkout_latest()
+        self._commits[table_name] = 0
+        self._write_gens.pop(table_name, None)
+        if table_name in self._unindexed_rows:
+            self._unindexed_rows[table_name] = 0
+
+    def fragment_count(self, table_name: str) -> int | None:
+        tbl = self._readable(table_name)
+        if tbl is None:
+            return 0
+        return len(tbl.to_lance().get_fragments())
+
     def save_manifest(self, table_name: str, manifest: dict[str, Any]) -> None:
         path = self._manifest_path(table_name)
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -370,8 +593,10 @@ class LanceDBStore(TableStore):
         if not new_columns:
             return [f.name for f in tbl.schema]
         new_fields = [pa.field(name, arrow_type, nullable=True) for name, arrow_type in new_columns.items()]
+        before = tbl.version
         tbl.add_columns(pa.schema(new_fields))
         tbl.checkout_latest()
+        self._advance_write_gen(table_name, before, None)
         # A later schema evolution can add another vector column after this
         # table's first write. Re-run vector specialization on the next row so
         # the new list<float> column becomes queryable as a fixed-size vector.
@@ -392,6 +617,76 @@ class LanceDBStore(TableStore):
         """
         return (self._path / f"{table_name}.lance").exists()
 
+    def _advance_write_gen(self, table_name: str, before: int, written: int | None) -> None:
+        """Carry the write-generation high-water mark across one commit of our own.
+
+        ``before`` is the version the commit started from and ``written`` the
+        highest ``_write_gen`` it added (``None`` when it added no rows). The
+        mark moves forward only when it was current at ``before`` and the
+        commit landed directly on top of it; otherwise another writer got in
+        between, and it is dropped for ``max_write_gen`` to rescan.
+        """
+        cached = self._write_gens.pop(table_name, None)
+        version = self._tables[table_name].version
+        if cached is None or cached[0] != before or version != before + 1:
+            return
+        self._write_gens[table_name] = (version, cached[1] if written is None else max(cached[1], written))
+
+    def _note_commit(self, table_name: str) -> None:
+        """Count one data commit and run ``optimize`` when ``optimize_every`` is reached."""
+        if self._optimize_every is None:
+            return
+        self._commits[table_name] = self._commits.get(table_name, 0) + 1
+        if self._commits[table_name] >= self._optimize_every:
+            self.optimize(table_name)
+
+    def _maintain_identity_index(self, table_name: str, appended: int) -> None:
+        """Build the identity BTree index once the table has rows; fold in new rows in batches.
+
+        Rows appended after the index was built stay correct to look up (Lance
+        scans unindexed fragments), just not indexed, so the index is brought
+        up to date only every ``_INDEX_REFRESH_ROWS`` appended rows rather than
+        on every write. The index is an optimization: a backend that refuses
+        to build it leaves lookups scanning, never failing. A failed build is
+        logged and retried after another ``_INDEX_REFRESH_ROWS`` rows.
+        """
+        identity_column = self._identity_columns.get(table_name)
+        if identity_column is None:
+            return
+        tbl = self._tables[table_name]
+        if table_name in self._unindexed_rows:
+            self._unindexed_rows[table_name] += appended
+            if self._unindexed_rows[table_name] >= _INDEX_REFRESH_ROWS:
+                before = tbl.version
+                tbl.to_lance().optimize.optimize_indices()
+                tbl.checkout_latest()
+                self._advance_write_gen(table_name, before, None)
+                self._unindexed_rows[table_name] = 0
+            return
+        if table_name in self._index_failures:
+            self._index_failures[table_name] += appended
+            if self._index_failures[table_name] < _INDEX_REFRESH_ROWS:
+                return
+        if tbl.count_rows() == 0:
+            return
+        if not any(identity_column in index.columns for index in tbl.list_indices()):
+            before = tbl.version
+            try:
+                tbl.create_index(identity_column, config=BTree())
+            except (ValueError, OSError):  # e.g. an identity type Lance cannot index
+                logger.warning(
+                    "Could not build the identity index on %s.%s; lookups scan until a retry succeeds",
+                    table_name,
+                    identity_column,
+                    exc_info=True,
+                )
+                self._index_failures[table_name] = 0
+                return
+            tbl.checkout_latest()
+            self._advance_write_gen(table_name, before, None)
+        self._index_failures.pop(table_name, None)
+        self._unindexed_rows[table_name] = 0
+
     def _ensure_table(self, spec: TableSpec) -> None:
         try:
             tbl = self._db.open_table(spec.name)
@@ -15,16 +15,19 @@ from typing import Any, Literal
 
 from hypergraph import Graph
 from hypergraph.materialization._fingerprint import (
+    RecipeParts,
     _component_config_hashes,
     _plain_value_payload,
+    child_valid_inputs,
     combine_recipe_fingerprints,
-    compute_child_fingerprint,
     compute_column_provenance,
     compute_node_definition_hash,
     compute_payload_hash,
     compute_recipe_fingerprint,
-    compute_row_fingerprint,
-    compute_table_recipe_fingerprint,
+    fingerprint_batch,
+    fingerprint_inputs,
+    legacy_fingerprint,
+    recipe_parts,
 )
 from hypergraph.materialization._recipe_journal import (
     KIND_BOUND_VALUE,
@@ -179,6 +182,7 @@ class Provenance:
         self.spec = spec
         self.components = components
         self._column_graphs = column_graphs
+        self._recipe_parts: dict[str | None, RecipeParts] = {}
 
     def derived_columns(self, spec: TableSpec | None = None) -> list[Any]:
         target = spec or self.spec
@@ -265,22 +269,80 @@ class Provenance:
             return self.node_recipe(producers[0])
         return combine_recipe_fingerprints([self.node_recipe(producer) for producer in producers])
 
-    def root_fingerprint(self, graph_inputs: Mapping[str, Any]) -> str:
-        return compute_row_fingerprint(self.graph, dict(self.components), dict(graph_inputs))
-
-    def child_fingerprint(self, child_inputs: Mapping[str, Any], child_spec: TableSpec) -> str:
-        return compute_child_fingerprint(child_spec.child_graph, dict(self.components), dict(child_inputs))
+    def recipe_parts(self, child_spec: TableSpec | None = None) -> RecipeParts:
+        """The recipe half of the root's (or ``child_spec``'s) row fingerprints.
+
+        Component configs are read on every call, so a component mutated
+        after analysis still stales rows; node code is re-hashed only when
+        one of those configs has changed.
+        """
+        key = None if child_spec is None else child_spec.name
+        valid_inputs = None if child_spec is None else child_valid_inputs(child_spec.child_graph)
+        component_hashes = _component_config_hashes(dict(self.components), valid_inputs)
+        cached = self._recipe_parts.get(key)
+        if cached is not None and cached.component_hashes == component_hashes:
+            return cached
+        graph = self.graph if child_spec is None else child_spec.child_graph
+        parts = recipe_parts(graph, dict(self.components), valid_inputs)
+        self._recipe_parts[key] = parts
+        return parts
+
+    def _fingerprint(self, parts: RecipeParts, inputs: Mapping[str, Any], stored: Any) -> tuple[str, str | None]:
+        fingerprint = fingerprint_inputs(parts, dict(inputs))
+        # A row stamped before inputs were digested by type keeps its stamp
+        # while its inputs still match it, so upgrading stales nothing; the
+        # current fingerprint comes back alongside for the caller to re-stamp.
+        if isinstance(stored, str) and stored and stored != fingerprint and stored == legacy_fingerprint(parts, dict(inputs)):
+            return stored, fingerprint
+        return fingerprint, None
+
+    def root_fingerprint(self, graph_inputs: Mapping[str, Any], *, stored: Any = None) -> str:
+        return self._fingerprint(self.recipe_parts(), graph_inputs, stored)[0]
+
+    def child_fingerprint(self, child_inputs: Mapping[str, Any], child_spec: TableSpec, *, stored: Any = None) -> str:
+        return self._fingerprint(self.recipe_parts(child_spec), child_inputs, stored)[0]
+
+    def root_stamp(self, graph_inputs: Mapping[str, Any], stored: Any) -> tuple[str, str | None]:
+        """``root_fingerprint``, plus the fingerprint to re-stamp with when ``stored`` matched a legacy stamp."""
+        return self._fingerprint(self.recipe_parts(), graph_inputs, stored)
+
+    def child_stamp(self, child_inputs: Mapping[str, Any], child_spec: TableSpec, stored: Any) -> tuple[str, str | None]:
+        """``child_fingerprint``, plus the fingerprint to re-stamp with when ``stored`` matched a legacy stamp."""
+        return self._fingerprint(self.recipe_parts(child_spec), child_inputs, stored)
+
+    def fingerprint_batch(self, batch: Any, child_spec: TableSpec | None = None) -> list[str]:
+        """``root_fingerprint``/``child_fingerprint`` of every row of an Arrow batch of stored rows.
+
+        ``batch`` holds the source columns and ``_row_fingerprint``; each row's
+        stored stamp plays the part of ``stored``.
+        """
+        spec = child_spec or self.spec
+        names = [
+            column.name
+            for column in spec.columns
+            if column.role == "source" and (child_spec is None or column.content_key) and column.name in batch.schema.names
+        ]
+        parts = self.recipe_parts(child_spec)
+        fingerprints = fingerprint_batch(parts, batch, names)
+        stamps = batch.column("_row_fingerprint").to_pylist() if "_row_fingerprint" in batch.schema.names else []
+        mismatched = [position for position, stored in enumerate(stamps) if isinstance(stored, str) and stored and stored != fingerprints[position]]
+        if mismatched:
+            # Only the rows the current encoding did not match are checked
+            # against the legacy one, converted to Python in one pass.
+            rows = batch.select(names).take(mismatched).to_pylist()
+            for position, row in zip(mismatched, rows, strict=True):
+                if stamps[position] == legacy_fingerprint(parts, {name: normalize_value(value) for name, value in row.items()}):
+                    fingerprints[position] = stamps[position]
+        return fingerprints
 
     def table_stamps_recipe(self) -> bool:
         return bool(self.derived_columns() or self.spec.children)
 
     def current_recipe_fingerprint(self) -> str:
-        return compute_table_recipe_fingerprint(self.graph, dict(self.components))
+        return self.recipe_parts().recipe
 
     def current_child_recipe_fingerprint(self, child_spec: TableSpec) -> str:
-        child_graph = child_spec.child_graph
-        valid_inputs = set(child_graph.inputs.all) if child_graph is not None and hasattr(child_graph.inputs, "all") else set()
-        return compute_table_recipe_fingerprint(child_graph, dict(self.components), valid_inputs)
+        return self.recipe_parts(child_spec).recipe
 
     def row_missing_stamp(self, row: Mapping[str, Any], recipe_column: str) -> bool:
         stamp = row.get(recipe_column)
@@ -366,6 +428,33 @@ class Provenance:
 
         return value is None or (isinstance(value, float) and math.isnan(value))
 
+    def drifted_nodes(self, row: Mapping[str, Any]) -> tuple[Any, ...]:
+        """Nodes whose stamp on ``row`` no longer matches their provenance over the stored values.
+
+        Inputs are the row's own stored values, so a node downstream of a
+        drifted one still matches (its stored input is the value it was derived
+        from): only the nodes whose own recipe changed are returned.
+        """
+        values = self.stored_values(row)
+        drifted: list[Any] = []
+        for node in self.nodes_in_dependency_order():
+            provenance = self.node_provenance(node, values)
+            if provenance is None or not self.node_is_fresh(node, provenance, row):
+                drifted.append(node)
+        return tuple(drifted)
+
+    def row_fully_stamped(self, row: Mapping[str, Any]) -> bool:
+        """Whether every derived column of ``row`` holds a value and a provenance stamp.
+
+        A column comparison, no hashing: such a row was derived whole under
+        its recipe stamp, so it drifted exactly the nodes any other fully
+        stamped row with that recipe stamp drifted.
+        """
+        return all(
+            isinstance(row.get(f"_provenance_{column.name}"), str) and not self.column_is_null(row.get(column.name))
+            for column in self.derived_columns()
+        )
+
     def row_converged(self, row: Mapping[str, Any]) -> bool:
         values = self.stored_values(row)
         for node in self.nodes_in_dependency_order():
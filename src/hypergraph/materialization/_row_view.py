@@ -0,0 +1,173 @@
+"""Arrow-backed public rows: newest-generation batches and a lazy row sequence.
+
+``HyperTable.rows()`` builds one dict per row up front. The readers here keep
+rows in Arrow instead: ``newest_batches`` streams a table's record batches
+with superseded generations dropped, ``public_batch`` strips the internal
+columns, and ``RowView`` is a read-only sequence that converts a row to a dict
+only when it is indexed or iterated.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, overload
+
+from hypergraph.materialization._schema import PARENT_LINK_COLUMN, is_internal_column
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+BatchScan = Callable[[list[str] | None], Iterable["pa.RecordBatch"]]
+
+
+def _keys(data: pa.RecordBatch | pa.Table, key_columns: Sequence[str]) -> pa.Array:
+    """One string key per row, compared the way ``dedup_rows`` compares identities."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    parts = [pc.cast(data.column(name), pa.string()) for name in key_columns]
+    if len(parts) == 1:
+        return parts[0]
+    return pc.binary_join_element_wise(*parts, "\x1f")
+
+
+def newest_batches(scan: BatchScan, key_columns: Sequence[str]) -> Iterator[pa.RecordBatch]:
+    """Stream ``scan`` keeping only the newest ``_write_gen`` of each key.
+
+    A first pass reads just the key columns and ``_write_gen`` to find keys
+    stored at more than one generation, the leftovers of an interrupted
+    cleanup. The second pass streams full batches and drops those keys' older
+    rows. When no key repeats, which is the usual case, batches pass through
+    unchanged.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    stamps = [batch for batch in scan([*key_columns, "_write_gen"]) if len(batch)]
+    if not stamps:
+        return
+    generations = pa.Table.from_batches(stamps)
+    generations = pa.table({"key": _keys(generations, key_columns), "gen": generations.column("_write_gen")})
+    repeated = generations.group_by("key").aggregate([("gen", "max"), ("gen", "count")])
+    repeated = repeated.filter(pc.greater(repeated.column("gen_count"), 1))
+    newest = dict(zip(repeated.column("key").to_pylist(), repeated.column("gen_max").to_pylist(), strict=True))
+    kept: set[str] = set()
+    for batch in scan(None):
+        if not newest:
+            yield batch
+            continue
+        keys = _keys(batch, key_columns)
+        mask = pc.invert(pc.is_in(keys, value_set=pa.array(list(newest), type=pa.string()))).to_pylist()
+        gens = batch.column("_write_gen")
+        for position, is_unique in enumerate(mask):
+            if is_unique:
+                continue
+            key = keys[position].as_py()
+            # Equal generations tie the way dedup_rows breaks ties: first row wins.
+            if gens[position].as_py() == newest[key] and key not in kept:
+                kept.add(key)
+                mask[position] = True
+        yield batch.filter(pa.array(mask, type=pa.bool_()))
+
+
+def public_batch(batch: pa.RecordBatch, *, hidden: set[str], parent_identity: str | None = None) -> pa.RecordBatch:
+    """Drop internal and ``hidden`` columns; a child's parent link takes the parent identity's name."""
+    names = [name for name in batch.schema.names if not (is_internal_column(name) or name in hidden)]
+    if parent_identity is None or PARENT_LINK_COLUMN not in batch.schema.names:
+        return batch.select(names)
+    public = batch.select([PARENT_LINK_COLUMN, *names])
+    return public.rename_columns([parent_identity, *names])
+
+
+def limit_batches(batches: Iterable[pa.RecordBatch], limit: int | None) -> Iterator[pa.RecordBatch]:
+    remaining = limit
+    for batch in batches:
+        if remaining is None:
+            yield batch
+            continue
+        if remaining <= 0:
+            return
+        yield batch.slice(0, remaining)
+        remaining -= min(remaining, len(batch))
+
+
+def arrow_table(batches: Iterable[pa.RecordBatch]) -> pa.Table:
+    """Concatenate batches whose schemas may differ only where a batch inferred a null type."""
+    import pyarrow as pa
+
+    tables = [pa.Table.from_batches([batch]) for batch in batches]
+    if not tables:
+        return pa.table({})
+    return pa.concat_tables(tables, promote_options="default")
+
+
+class RowView(Sequence[dict[str, Any]]):
+    """Public rows held as an Arrow table, converted to dicts only on access.
+
+    Indexing returns one row dict; slicing returns another ``RowView`` without
+    copying. ``to_arrow``, ``to_pandas`` and ``to_numpy`` hand the columns to
+    analytics code without building any dicts.
+    """
+
+    def __init__(self, table: pa.Table) -> None:
+        self._table = table
+
+    def __len__(self) -> int:
+        return self._table.num_rows
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> RowView: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | RowView:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            positions = range(start, stop, step)
+            if step == 1:
+                return RowView(self._table.slice(start, len(positions)))
+            return RowView(self._table.take(list(positions)))
+        position = index + len(self) if index < 0 else index
+        if not 0 <= position < len(self):
+            raise IndexError("RowView index out of range")
+        return self._table.slice(position, 1).to_pylist()[0]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for batch in self._table.to_batches():
+            yield from batch.to_pylist()
+
+    def __repr__(self) -> str:
+        return f"RowView({len(self)} rows, columns={self.column_names})"
+
+    @property
+    def column_names(self) -> list[str]:
+        return list(self._table.column_names)
+
+    def to_arrow(self) -> pa.Table:
+        return self._table
+
+    def to_pandas(self) -> pd.DataFrame:
+        return self._table.to_pandas()
+
+    def to_numpy(self, column: str) -> np.ndarray:
+        """One column as a NumPy array; a vector column becomes a 2-D ``(rows, dim)`` matrix.
+
+        A fixed-size vector column without nulls in a single chunk is a view of
+        the Arrow buffer, not a copy.
+        """
+        import numpy as np
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        values = self._table.column(column).combine_chunks()
+        if pa.types.is_fixed_size_list(values.type) and values.null_count == 0:
+            return values.flatten().to_numpy(zero_copy_only=False).reshape(len(values), values.type.list_size)
+        if (pa.types.is_list(values.type) or pa.types.is_large_list(values.type)) and values.null_count == 0 and len(values):
+            lengths = pc.unique(pc.list_value_length(values))
+            if len(lengths) == 1:
+                return values.flatten().to_numpy(zero_copy_only=False).reshape(len(values), lengths[0].as_py())
+            return np.array(values.to_pylist(), dtype=object)
+        return values.to_numpy(zero_copy_only=False)
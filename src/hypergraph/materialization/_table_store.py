@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 if TYPE_CHECKING:
@@ -12,6 +12,9 @@ if TYPE_CHECKING:
 RowOperator = Literal["eq", "ne", "lt", "lte", "gt", "gte", "in"]
 RowPredicate = Sequence[tuple[str, RowOperator, Any]]
 
+SCAN_BATCH_ROWS = 10_000
+"""Default number of rows per record batch yielded by ``TableStore.scan``."""
+
 
 class TableStore(ABC):
     """Abstract storage backend for HyperTable."""
@@ -79,6 +82,71 @@ class TableStore(ABC):
         dedup-by-generation logic and the caller both rely on it).
         """
 
+    def read_many(
+        self,
+        table_name: str,
+        identity_column: str,
+        identity_values: Sequence[Any],
+        *,
+        columns: list[str] | None = None,
+    ) -> dict[Any, dict[str, Any]]:
+        """Read many rows by identity in one lookup: ``{identity_value: newest row}``.
+
+        Identities with no row are absent from the result. Each row is the
+        newest generation, exactly as ``read_one`` would return it, and
+        ``columns`` projects it the same way.
+
+        The default is one ``read_rows`` with an ``in`` predicate, so every
+        store gets bulk lookups FOR FREE. A store that can find identities
+        without scanning (LanceDB) overrides it.
+        """
+        wanted = set(identity_values)
+        if not wanted:
+            return {}
+        newest: dict[Any, dict[str, Any]] = {}
+        for row in self.read_rows(table_name, [(identity_column, "in", list(wanted))]):
+            identity_value = row.get(identity_column)
+            if identity_value not in wanted:
+                continue
+            current = newest.get(identity_value)
+            if current is None or (row.get("_write_gen") or 0) > (current.get("_write_gen") or 0):
+                newest[identity_value] = row
+        if columns is None:
+            return newest
+        return dict(zip(newest, self._project_rows(list(newest.values()), columns), strict=True))
+
+    def scan(
+        self,
+        table_name: str,
+        where: RowPredicate | None = None,
+        *,
+        columns: list[str] | None = None,
+        batch_rows: int = SCAN_BATCH_ROWS,
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream rows as Arrow record batches of at most ``batch_rows`` rows.
+
+        ``where`` and ``columns`` mean exactly what they mean for ``read_rows``.
+        Every physical row is yielded, older generations included, so a caller
+        that wants the newest row per identity deduplicates as it goes.
+
+        The default slices one ``read_rows`` into batches, which still holds the
+        whole result in memory. A store that can stream from its backend
+        (LanceDB) overrides it, and HyperTable then reads large tables batch by
+        batch instead of all at once.
+        """
+        import pyarrow as pa
+
+        if columns is not None and self.supports_column_projection():
+            rows = self.read_rows(table_name, where, columns=columns)
+        else:
+            rows = self._project_rows(self.read_rows(table_name, where), columns)
+        for start in range(0, len(rows), batch_rows):
+            yield pa.RecordBatch.from_pylist(rows[start : start + batch_rows])
+
+    def supports_scan(self) -> bool:
+        """True when the store overrides ``scan`` to stream rather than read everything first."""
+        return type(self).scan is not TableStore.scan
+
     @abstractmethod
     def write_rows(self, table_name: str, rows: list[dict[str, Any]]) -> None:
         """Append or upsert rows into the physical table."""
@@ -159,6 +227,36 @@ class TableStore(ABC):
         """
         raise NotImplementedError("This store does not support search")
 
+    def search_many(
+        self,
+        table_name: str,
+        query_vectors: Sequence[Sequence[float]],
+        *,
+        vector_column: str | None = None,
+        where: RowPredicate | None = None,
+        limit: int | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> pa.Table:
+        """Run one vector search per query vector; every hit in one Arrow table.
+
+        Each hit carries ``_query``, the position of its query vector, and
+        ``_distance``. ``where`` is applied as a pre-filter and ``columns``, when
+        given, limits the row columns returned. This default calls ``search``
+        once per query; a store with a batched search overrides it.
+        """
+        import pyarrow as pa
+
+        hits: list[dict[str, Any]] = []
+        for position, query_vector in enumerate(query_vectors):
+            rows = self.search(table_name, query_vector=list(query_vector), vector_column=vector_column, where=where, limit=limit)
+            for row in rows:
+                projected = row if columns is None else {name: row.get(name) for name in [*columns, "_distance"]}
+                hits.append({"_query": position, **projected})
+        if not hits:
+            return pa.table({"_query": pa.array([], type=pa.int32())})
+        table = pa.Table.from_pylist(hits)
+        return table.set_column(0, "_query", table.column("_query").cast(pa.int32()))
+
     def save_manifest(self, table_name: str, manifest: dict[str, Any]) -> None:
         """Persist table metadata when the backend supports manifests.
 
@@ -183,6 +281,40 @@ class TableStore(ABC):
         """
         return type(self).save_manifest is not TableStore.save_manifest and type(self).load_manifest is not TableStore.load_manifest
 
+    def optimize(self, table_name: str) -> None:
+        """Compact a table's storage: merge small files, drop superseded versions, refresh indexes.
+
+        Maintenance is OPTIONAL. Append-heavy backends accumulate one file per
+        write and one deletion record per generation cleanup, and reads slow
+        down until they are merged. ``HyperTable.optimize()`` calls this for
+        every table it owns; the base no-op suits a store that has nothing to
+        compact. It must never change what any read returns.
+        """
+        return None
+
+    def fragment_count(self, table_name: str) -> int | None:
+        """How many storage fragments a table spans, ``None`` when the backend has no such notion."""
+        return None
+
+    def supports_optimize(self) -> bool:
+        """True when the store overrides ``optimize`` (the conformance harness checks it)."""
+        return type(self).optimize is not TableStore.optimize
+
+    def identity_index(self, table_name: str) -> str | None:
+        """The identity column this store keeps a point-lookup index on, if any.
+
+        The identity index is OPTIONAL. A store that has one answers
+        ``read_one``/``read_many`` without scanning the table and keeps the
+        index current as rows are written — HyperTable never builds or
+        refreshes it, because only the store knows when that is cheap. ``None``
+        (the base default) means lookups are whatever ``read_one`` does.
+        """
+        return None
+
+    def supports_identity_index(self) -> bool:
+        """True when the store overrides ``identity_index`` (the conformance harness checks it)."""
+        return type(self).identity_index is not TableStore.identity_index
+
     def supports_column_projection(self) -> bool:
         """Whether ``read_rows``/``read_one`` accept the ``columns=`` kwarg.
 
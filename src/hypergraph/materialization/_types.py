@@ -278,6 +278,19 @@ class RecipeDrift:
         return self.drifted + self.unknown + sum(child.stale_total for child in self.children)
 
 
+@dataclass(frozen=True)
+class TableOptimization:
+    """Storage fragment counts around one ``HyperTable.optimize()`` pass.
+
+    Counts are ``None`` when the store does not track fragments.
+    """
+
+    table: str
+    fragments_before: int | None
+    fragments_after: int | None
+    children: tuple[TableOptimization, ...] = ()
+
+
 @dataclass(frozen=True)
 class TableStatus:
     """Dry-run staleness report for one table, returned by ``status()``."""
@@ -291,6 +304,8 @@ class TableStatus:
     errored_ids: tuple[str, ...] = ()
     stale_columns: tuple[tuple[str, int], ...] = ()
     children: tuple[TableStatus, ...] = ()
+    fragments: int | None = None
+    """Storage fragments the table spans, ``None`` when the store does not track them."""
 
     @property
     def is_fresh(self) -> bool:
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator, Mapping
+import threading
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping
 from dataclasses import dataclass, replace
 from typing import Any, Literal
 
@@ -52,7 +53,7 @@ def normalize_to_dict(item: Any) -> dict[str, Any]:
     return dict(item)
 
 
-def dedup_rows(rows: list[dict[str, Any]], identity: str) -> list[dict[str, Any]]:
+def dedup_rows(rows: Iterable[dict[str, Any]], identity: str) -> list[dict[str, Any]]:
     """Keep only the highest write generation for each root identity."""
     best: dict[str, dict[str, Any]] = {}
     for row in rows:
@@ -63,7 +64,7 @@ def dedup_rows(rows: list[dict[str, Any]], identity: str) -> list[dict[str, Any]
     return list(best.values())
 
 
-def dedup_child_rows(rows: list[dict[str, Any]], identity: str) -> list[dict[str, Any]]:
+def dedup_child_rows(rows: Iterable[dict[str, Any]], identity: str) -> list[dict[str, Any]]:
     """Keep only the highest write generation for each parent/child identity."""
     best: dict[tuple[str, str], dict[str, Any]] = {}
     for row in rows:
@@ -74,6 +75,31 @@ def dedup_child_rows(rows: list[dict[str, Any]], identity: str) -> list[dict[str
     return list(best.values())
 
 
+def scan_rows(
+    store: Any,
+    table: str,
+    where: _Predicate | None = None,
+    *,
+    columns: list[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield a table's physical rows, a batch at a time when the store can stream.
+
+    A store that overrides ``scan`` is read through it, so only one record
+    batch of the projected columns is in memory at once. Any other store is
+    read with one ``read_rows``, exactly as before, because round-tripping
+    its Python values through Arrow could change them.
+    """
+    predicate = list(where) if where is not None else None
+    if store.supports_scan():
+        for batch in store.scan(table, predicate, columns=columns):
+            yield from batch.to_pylist()
+        return
+    if columns is None or not store.supports_column_projection():
+        yield from store._project_rows(store.read_rows(table, predicate), columns)
+        return
+    yield from store.read_rows(table, predicate, columns=columns)
+
+
 @dataclass(frozen=True)
 class _PausedConvergence:
     pause: PauseInfo
@@ -112,6 +138,67 @@ class _ChildGenerations:
         return gen
 
 
+INSERT_CHUNK_ROWS = 1000
+"""Rows per ``insert``/``sync`` chunk: one identity lookup and one parent write each."""
+
+
+def _write_chunks(items: list[dict[str, Any]], identity: str) -> Generator[list[dict[str, Any]], None, None]:
+    """Split items into chunks of at most ``INSERT_CHUNK_ROWS`` distinct identities.
+
+    A repeated identity starts a new chunk, so it is looked up only after the
+    earlier occurrence's row has been written — the same outcome as writing
+    the items one at a time.
+    """
+    chunk: list[dict[str, Any]] = []
+    seen: set[Any] = set()
+    for item in items:
+        if len(chunk) == INSERT_CHUNK_ROWS or item[identity] in seen:
+            yield chunk
+            chunk, seen = [], set()
+        chunk.append(item)
+        seen.add(item[identity])
+    if chunk:
+        yield chunk
+
+
+class _ParentRows:
+    """Parent rows of one write chunk, written with a single ``write_rows``.
+
+    Only rows with no physical predecessor are buffered: nothing reads them
+    back before the chunk ends, and they have no older generation to clean
+    up. ``rebuild_drifted`` is the exception; it cleans up its whole chunk
+    after the flush. After ``flush`` the buffer writes through, so a row that
+    finishes after a sibling failed is still stored.
+    """
+
+    def __init__(self, store: Any, table_name: str) -> None:
+        self._store = store
+        self._table_name = table_name
+        self._rows: list[dict[str, Any]] | None = []
+        self._lock = threading.Lock()
+
+    def put(self, row: dict[str, Any]) -> None:
+        with self._lock:
+            if self._rows is not None:
+                self._rows.append(row)
+                return
+        self._store.write_rows(self._table_name, [row])
+
+    def flush(self) -> None:
+        with self._lock:
+            rows, self._rows = self._rows, None
+        if rows:
+            self._store.write_rows(self._table_name, rows)
+
+    def guard(self, operation: WriteOperation) -> WriteOperation:
+        """Flush before a failure leaves the chunk, keeping the rows finished so far."""
+        try:
+            return (yield from operation)
+        except Exception:
+            self.flush()
+            raise
+
+
 def _run_values(result: Any) -> dict[str, Any]:
     if hasattr(result, "values") and isinstance(result.values, dict):
         return result.values
@@ -153,6 +240,7 @@ class WritePlanner:
         self._journal = RecipeJournal(store)
         self._answer_graphs: dict[tuple[str, ...], Graph] = {}
         self._routed_graphs: dict[tuple[str, str], Graph] = {}
+        self._rebuild_graphs: dict[tuple[str, ...], tuple[Graph, tuple[Any, ...]] | None] = {}
 
     @property
     def journal(self) -> RecipeJournal:
@@ -333,9 +421,12 @@ class WritePlanner:
         child_spec: TableSpec | None = None,
         *,
         normalize_values: bool = True,
+        row_fingerprint: str | None = None,
     ) -> dict[str, Any]:
         row = {key: normalize_value(value) for key, value in existing.items()} if normalize_values else dict(existing)
         self._stamp_recipe(row, table, child_spec)
+        if row_fingerprint is not None:
+            row["_row_fingerprint"] = row_fingerprint
         row["_write_gen"] = write_gen
         return row
 
@@ -599,10 +690,12 @@ class WritePlanner:
     def _refresh_missing_stamps(
         self,
         existing: dict[str, Any],
+        row_fingerprint: str | None = None,
     ) -> None:
+        """Re-stamp an unchanged row (and its children) lacking a recipe stamp or carrying a legacy fingerprint."""
         identity_value = existing[self._identity]
         write_gen = self._store.max_write_gen(self._spec.name) + 1
-        new_row = self._stamp_existing_row(self._spec.name, existing, write_gen)
+        new_row = self._stamp_existing_row(self._spec.name, existing, write_gen, row_fingerprint=row_fingerprint)
         self._store.write_rows(self._spec.name, [new_row])
         self._cleanup_parent(identity_value, write_gen)
         for child_spec in self._spec.children:
@@ -611,17 +704,18 @@ class WritePlanner:
             child_gen = self._store.max_write_gen(child_spec.name) + 1
             rows = self._read_rows(child_spec.name, (("_parent_id", "eq", identity_value),))
             for row in dedup_child_rows(rows, child_spec.identity):
-                stamp = row.get(RECIPE_COLUMN)
-                if isinstance(stamp, str) and stamp:
-                    continue
                 inputs = self._provenance.child_source_inputs(row, child_spec)
-                if row.get("_row_fingerprint") != self._provenance.child_fingerprint(inputs, child_spec):
+                fingerprint, upgrade = self._provenance.child_stamp(inputs, child_spec, row.get("_row_fingerprint"))
+                if row.get("_row_fingerprint") != fingerprint:
+                    continue
+                if not self._provenance.row_missing_stamp(row, RECIPE_COLUMN) and upgrade is None:
                     continue
                 new_child = self._stamp_existing_row(
                     child_spec.name,
                     row,
                     child_gen,
                     child_spec,
+                    row_fingerprint=upgrade,
                 )
                 self._store.write_rows(child_spec.name, [new_child])
                 self._store.delete_rows(
@@ -707,7 +801,6 @@ class WritePlanner:
             for column in child_spec.columns
             if column.role == "source" and column.content_key and column.name in child_item
         }
-        fingerprint = self._provenance.child_fingerprint(child_inputs, child_spec)
         existing_rows = self._read_rows(
             child_spec.name,
             (
@@ -716,6 +809,7 @@ class WritePlanner:
             ),
         )
         existing = max(existing_rows, key=lambda row: row.get("_write_gen", 0)) if existing_rows else None
+        fingerprint, upgrade = self._provenance.child_stamp(child_inputs, child_spec, existing.get("_row_fingerprint") if existing else None)
         if existing is not None and existing.get("_row_fingerprint") == fingerprint and existing.get("_status") in (None, "complete"):
             if self._provenance.row_missing_stamp(existing, RECIPE_COLUMN):
                 bumped = self._stamp_existing_row(
@@ -728,6 +822,8 @@ class WritePlanner:
             else:
                 bumped = dict(existing)
                 bumped["_write_gen"] = write_gen
+            if upgrade is not None:
+                bumped["_row_fingerprint"] = upgrade
             self._store.write_rows(child_spec.name, [bumped])
             return
 
@@ -834,6 +930,8 @@ class WritePlanner:
         parent_skipped: bool,
         write_gen: int,
         child_gens: _ChildGenerations,
+        *,
+        restamp: bool = False,
     ) -> Generator[RunGraph, Any, str]:
         outputs = reconciled.output_values()
         provenances = reconciled.provenance_values()
@@ -853,7 +951,7 @@ class WritePlanner:
                 child_gens,
             )
         provenance_changed = any(existing.get(f"_provenance_{name}") != provenance for name, provenance in provenances.items())
-        rewrite_parent = not parent_skipped or provenance_changed or self._provenance.row_missing_stamp(existing, RECIPE_COLUMN)
+        rewrite_parent = not parent_skipped or provenance_changed or restamp or self._provenance.row_missing_stamp(existing, RECIPE_COLUMN)
         if rewrite_parent:
             self._evolve_for_metadata(item)
             row = self._build_parent_row(
@@ -902,6 +1000,12 @@ class WritePlanner:
             )
         return RowReceipt(str(identity_value), outcome, RowStatus.COMPLETE)
 
+    def _put_parent_row(self, row: dict[str, Any], rows: _ParentRows | None) -> None:
+        if rows is None:
+            self._store.write_rows(self._spec.name, [row])
+        else:
+            rows.put(row)
+
     def _write_waiting_parent(
         self,
         item: dict[str, Any],
@@ -914,6 +1018,7 @@ class WritePlanner:
         child_gens: _ChildGenerations,
         existing: dict[str, Any] | None,
         outcome: WriteOutcome,
+        rows: _ParentRows | None = None,
     ) -> RowReceipt:
         identity_value = item[self._identity]
         self._evolve_for_metadata(item)
@@ -927,7 +1032,7 @@ class WritePlanner:
             pause=pause,
             pause_provenance=pause_provenance,
         )
-        self._store.write_rows(self._spec.name, [row])
+        self._put_parent_row(row, rows)
         if existing is not None:
             self._cleanup_parent(identity_value, write_gen)
             self._cleanup_children(identity_value, child_gens)
@@ -940,6 +1045,7 @@ class WritePlanner:
         write_gen: int,
         error: Exception,
         existing: dict[str, Any] | None,
+        rows: _ParentRows | None = None,
     ) -> None:
         self._evolve_for_metadata(item)
         row = self._build_parent_row(
@@ -950,7 +1056,7 @@ class WritePlanner:
             "error",
             error=f"{type(error).__name__}: {error}",
         )
-        self._store.write_rows(self._spec.name, [row])
+        self._put_parent_row(row, rows)
         if existing is not None:
             self._cleanup_parent(item[self._identity], write_gen)
 
@@ -1032,14 +1138,31 @@ class WritePlanner:
         write_gen: int,
         provided: set[str] | None = None,
     ) -> Generator[RunGraph, Any, RowReceipt]:
+        existing = self._store.read_one(self._spec.name, self._identity, item[self._identity])
+        return (yield from self._converge_row(item, existing, write_gen, provided))
+
+    def _converge_row(
+        self,
+        item: dict[str, Any],
+        existing: dict[str, Any] | None,
+        write_gen: int,
+        provided: set[str] | None = None,
+        rows: _ParentRows | None = None,
+    ) -> Generator[RunGraph, Any, RowReceipt]:
+        """Converge one row against ``existing``, its newest stored generation.
+
+        ``rows`` buffers the parent write of a fresh row (see ``_ParentRows``);
+        a row that already exists writes and cleans up immediately.
+        """
         identity_value = item[self._identity]
         child_gens = _ChildGenerations(self._store, write_gen)
         provided_names = provided if provided is not None else set(item) - {self._identity}
         graph_inputs = self._graph_inputs(item, provided_names)
         source_inputs = self._source_inputs(item)
-        existing = self._store.read_one(self._spec.name, self._identity, identity_value)
+        if existing is not None:
+            rows = None
         outcome = WriteOutcome.UPDATED if existing is not None else WriteOutcome.INSERTED
-        fingerprint = self._provenance.root_fingerprint(source_inputs)
+        fingerprint, upgrade = self._provenance.root_stamp(source_inputs, existing.get("_row_fingerprint") if existing else None)
         answer_names = {column.name for column in self._spec.columns if column.role == "answer"}
         provided_answers = answer_names & provided_names
         answer_provided = bool(provided_answers)
@@ -1051,8 +1174,8 @@ class WritePlanner:
         if answer_provided:
             parent_skipped = False
         if parent_skipped and not self._spec.children:
-            if self._provenance.row_missing_stamp(existing, RECIPE_COLUMN):
-                self._refresh_missing_stamps(existing)
+            if upgrade is not None or self._provenance.row_missing_stamp(existing, RECIPE_COLUMN):
+                self._refresh_missing_stamps(existing, upgrade)
             return RowReceipt(str(identity_value), WriteOutcome.SKIPPED, RowStatus.COMPLETE)
 
         if existing is not None and answer_provided and not source_provided:
@@ -1099,6 +1222,7 @@ class WritePlanner:
                     parent_skipped,
                     write_gen,
                     child_gens,
+                    restamp=upgrade is not None,
                 )
                 return RowReceipt(
                     str(identity_value),
@@ -1113,7 +1237,7 @@ class WritePlanner:
                 raise
             if parent_skipped:
                 return RowReceipt(str(identity_value), WriteOutcome.SKIPPED, RowStatus.COMPLETE)
-            self._error_parent(item, source_inputs, write_gen, error, existing)
+            self._error_parent(item, source_inputs, write_gen, error, existing, rows)
             return RowReceipt(str(identity_value), outcome, RowStatus.ERROR, error=f"{type(error).__name__}: {error}")
 
         outputs = _run_values(result)
@@ -1138,6 +1262,7 @@ class WritePlanner:
                 child_gens,
                 existing,
                 outcome,
+                rows,
             )
 
         if parent_skipped:
@@ -1156,17 +1281,48 @@ class WritePlanner:
             write_gen,
             "complete",
         )
-        self._store.write_rows(self._spec.name, [row])
+        self._put_parent_row(row, rows)
         if existing is not None:
             self._cleanup_parent(identity_value, write_gen)
             self._cleanup_children(identity_value, child_gens)
         return RowReceipt(str(identity_value), outcome, RowStatus.COMPLETE)
 
-    def insert(self, items: list[dict[str, Any]]) -> WriteOperation:
-        write_gen = self._store.max_write_gen(self._spec.name) + 1
+    def _write_chunked(
+        self,
+        items: list[dict[str, Any]],
+        plan_row: Callable[[dict[str, Any], dict[str, Any] | None, int, _ParentRows], WriteOperation],
+        *,
+        max_concurrency: int,
+    ) -> Generator[RunOperations, Any, list[RowReceipt]]:
+        """Drive ``plan_row`` over items a chunk at a time.
+
+        Each chunk costs one ``read_many`` for the stored rows it converges
+        against and one ``write_rows`` for its fresh parent rows, instead of
+        a lookup and a write per item. A chunk that revisits an identity an
+        earlier chunk wrote moves to the next generation, so the later write
+        replaces the earlier one instead of tying with it.
+        """
         receipts: list[RowReceipt] = []
-        for item in items:
-            receipts.append((yield from self._insert_one(item, write_gen)))
+        write_gen = self._store.max_write_gen(self._spec.name) + 1
+        written: set[str] = set()
+        for chunk in _write_chunks(items, self._identity):
+            chunk_ids = {str(item[self._identity]) for item in chunk}
+            if not written.isdisjoint(chunk_ids):
+                write_gen += 1
+            written.update(chunk_ids)
+            stored = self._store.read_many(self._spec.name, self._identity, [item[self._identity] for item in chunk])
+            existing_by_id = {str(identity_value): row for identity_value, row in stored.items()}
+            rows = _ParentRows(self._store, self._spec.name)
+            operations = tuple(rows.guard(plan_row(item, existing_by_id.get(str(item[self._identity])), write_gen, rows)) for item in chunk)
+            receipts.extend((yield RunOperations(operations, max_concurrency)))
+            rows.flush()
+        return receipts
+
+    def insert(self, items: list[dict[str, Any]]) -> WriteOperation:
+        def plan_row(item: dict[str, Any], existing: dict[str, Any] | None, write_gen: int, rows: _ParentRows) -> WriteOperation:
+            return self._converge_row(item, existing, write_gen, rows=rows)
+
+        receipts = yield from self._write_chunked(items, plan_row, max_concurrency=self._page_max_concurrency)
         return TableReceipt(tuple(receipts))
 
     def _prepare_update(
@@ -1218,9 +1374,10 @@ class WritePlanner:
             self._store.delete_rows(child_table, [("_parent_id", "eq", identity_value)])
         self._store.delete_rows(self._spec.name, [(self._identity, "eq", identity_value)])
 
-    def _row_unchanged(self, item: dict[str, Any], existing: dict[str, Any]) -> bool:
-        inputs = self._source_inputs(item)
-        return existing.get("_row_fingerprint") == self._provenance.root_fingerprint(inputs)
+    def _row_unchanged(self, item: dict[str, Any], existing: dict[str, Any]) -> tuple[bool, str | None]:
+        """Whether ``item`` matches ``existing``'s fingerprint, and the fingerprint to re-stamp a legacy match with."""
+        fingerprint, upgrade = self._provenance.root_stamp(self._source_inputs(item), existing.get("_row_fingerprint"))
+        return existing.get("_row_fingerprint") == fingerprint, upgrade
 
     def _children_missing(self, existing: dict[str, Any]) -> bool:
         """Read-only completeness probe for the unchanged-parent sync fast path (#204).
@@ -1269,40 +1426,211 @@ class WritePlanner:
             return replace(receipt, outcome=WriteOutcome.HEALED)
         return receipt
 
+    def _sync_row(
+        self,
+        item: dict[str, Any],
+        existing: dict[str, Any] | None,
+        write_gen: int,
+        rows: _ParentRows,
+    ) -> Generator[RunGraph, Any, RowReceipt]:
+        if existing is None:
+            return (yield from self._converge_row(item, None, write_gen, rows=rows))
+        identity_value = str(item[self._identity])
+        unchanged, upgrade = self._row_unchanged(item, existing)
+        if unchanged and existing.get("_status") in (None, "complete"):
+            if upgrade is not None or self._provenance.row_missing_stamp(existing, RECIPE_COLUMN):
+                self._refresh_missing_stamps(existing, upgrade)
+            if self._children_missing(existing):
+                return (yield from self._heal_missing_children(item, write_gen))
+            return RowReceipt(identity_value, WriteOutcome.SKIPPED, RowStatus.COMPLETE)
+        if unchanged:
+            return (yield from self._converge_row(item, existing, write_gen))
+        changes = {key: value for key, value in item.items() if key != self._identity}
+        return (yield from self.update(identity_value, changes))
+
     def sync(self, items: list[dict[str, Any]]) -> WriteOperation:
-        rows = self._read_rows(self._spec.name)
-        existing_by_id = {str(row[self._identity]): row for row in dedup_rows(rows, self._identity) if row.get(self._identity) is not None}
-        incoming_ids: set[str] = set()
-        receipts: list[RowReceipt] = []
-        write_gen = self._store.max_write_gen(self._spec.name) + 1
+        # Only identities are needed to find rows to delete, streamed; full
+        # rows are read per chunk, for just the items being synced.
+        rows = scan_rows(self._store, self._spec.name, columns=[self._identity, "_write_gen"])
+        existing_ids = [str(row[self._identity]) for row in dedup_rows(rows, self._identity) if row.get(self._identity) is not None]
 
-        for item in items:
-            identity_value = str(item[self._identity])
-            incoming_ids.add(identity_value)
-            existing = existing_by_id.get(identity_value)
-            if existing is None:
-                receipts.append((yield from self._insert_one(item, write_gen)))
-            elif self._row_unchanged(item, existing) and existing.get("_status") in (None, "complete"):
-                if self._provenance.row_missing_stamp(existing, RECIPE_COLUMN):
-                    self._refresh_missing_stamps(existing)
-                if self._children_missing(existing):
-                    receipts.append((yield from self._heal_missing_children(item, write_gen)))
-                else:
-                    receipts.append(RowReceipt(identity_value, WriteOutcome.SKIPPED, RowStatus.COMPLETE))
-            else:
-                if self._row_unchanged(item, existing):
-                    receipts.append((yield from self._insert_one(item, write_gen)))
-                else:
-                    changes = {key: value for key, value in item.items() if key != self._identity}
-                    receipts.append((yield from self.update(identity_value, changes)))
+        def plan_row(item: dict[str, Any], existing: dict[str, Any] | None, write_gen: int, rows: _ParentRows) -> WriteOperation:
+            return self._sync_row(item, existing, write_gen, rows)
 
+        # One row at a time: a heal detects its child writes by comparing
+        # child-table generations before and after, which a concurrent sibling
+        # would move.
+        receipts = yield from self._write_chunked(items, plan_row, max_concurrency=1)
+
+        incoming_ids = {str(item[self._identity]) for item in items}
         deleted = 0
-        for identity_value in existing_by_id:
+        for identity_value in existing_ids:
             if identity_value not in incoming_ids:
                 self.delete(identity_value)
                 deleted += 1
         return TableReceipt(tuple(receipts), deleted=deleted)
 
+    def _rows_by_chunk(self, identities: list[Any]) -> Iterator[dict[str, Any]]:
+        """Yield the newest stored row for each identity, reading ``INSERT_CHUNK_ROWS`` at a time."""
+        for start in range(0, len(identities), INSERT_CHUNK_ROWS):
+            chunk = identities[start : start + INSERT_CHUNK_ROWS]
+            rows = self._store.read_many(self._spec.name, self._identity, chunk)
+            yield from (rows[identity_value] for identity_value in chunk if identity_value in rows)
+
+    def _rebuild_graph(self, drifted: tuple[Any, ...]) -> tuple[Graph, tuple[Any, ...]] | None:
+        """The subgraph re-deriving ``drifted`` and everything downstream of it.
+
+        Its entrypoints are the drifted nodes; every other input is a stored
+        column. None when the nodes cannot be rebuilt column by column: nothing
+        drifted (the change is elsewhere), the table has child tables, or a
+        selected node is routed, answers an interrupt, shares its column with
+        another producer, or stores no column at all.
+        """
+        key = tuple(sorted(node.name for node in drifted))
+        if key in self._rebuild_graphs:
+            return self._rebuild_graphs[key]
+        selected = self._node_names_downstream(set(key))
+        nodes = tuple(node for node in self._provenance.nodes_in_dependency_order() if node.name in selected)
+        plan = None
+        if key and not self._spec.children and len(nodes) == len(selected) and all(self._rebuilds_columnwise(node) for node in nodes):
+            graph = Graph(list(nodes), name=f"{self._spec.name}__rebuild")
+            bindings = {name: value for name, value in self._components.items() if name in set(graph.inputs.all)}
+            if bindings:
+                graph = graph.bind(**bindings)
+            plan = (graph, nodes)
+        self._rebuild_graphs[key] = plan
+        return plan
+
+    def _rebuilds_columnwise(self, node: Any) -> bool:
+        columns = self._provenance.node_columns(node)
+        return (
+            bool(columns)
+            and self._routing_gate(node, self._graph) is None
+            and all(column.role == "derived" and len(self._provenance.column_producers(column)) == 1 for column in columns)
+        )
+
+    def _rebuild_plan(self, existing: dict[str, Any]) -> tuple[Graph, tuple[Any, ...]] | None:
+        """The subgraph that rebuilds ``existing``'s drifted nodes, or None to converge it as ``sync`` would.
+
+        Planned from the row's own stored provenance, which re-hashes every
+        node over its values; ``rebuild_drifted`` calls it once per recipe
+        stamp. The subgraph itself is built once per drifted set and shared.
+        """
+        plan = self._rebuild_graph(self._provenance.drifted_nodes(existing))
+        if plan is None or not input_names(plan[0].inputs.required) <= set(self._provenance.stored_values(existing)):
+            return None
+        return plan
+
+    def _stored_item(self, existing: Mapping[str, Any]) -> dict[str, Any]:
+        derived_names = {column.name for column in self._provenance.derived_columns()}
+        values = self._provenance.stored_values(existing)
+        return {name: value for name, value in values.items() if name == self._identity or name not in derived_names}
+
+    def _rebuild_row(
+        self,
+        existing: dict[str, Any],
+        graph: Graph,
+        nodes: tuple[Any, ...],
+        write_gen: int,
+        rows: _ParentRows,
+    ) -> Generator[RunGraph, Any, RowReceipt]:
+        identity_value = existing[self._identity]
+        item = self._stored_item(existing)
+        source_inputs = self._source_inputs(item)
+        values = self._provenance.stored_values(existing)
+        try:
+            result = yield RunGraph(graph, {name: values[name] for name in graph.inputs.all if name in values})
+        except Exception as error:
+            if self._on_error == "raise":
+                raise
+            self._error_parent(item, source_inputs, write_gen, error, existing)
+            return RowReceipt(str(identity_value), WriteOutcome.UPDATED, RowStatus.ERROR, error=f"{type(error).__name__}: {error}")
+        values.update(_run_values(result))
+        derived_columns = self._provenance.derived_columns()
+        provenances = {
+            column.name: existing[f"_provenance_{column.name}"]
+            for column in derived_columns
+            if isinstance(existing.get(f"_provenance_{column.name}"), str)
+        }
+        for node in nodes:
+            provenance = self._provenance.node_provenance(node, values)
+            for column in self._provenance.node_columns(node):
+                if provenance is None:
+                    provenances.pop(column.name, None)
+                else:
+                    provenances[column.name] = provenance
+        outputs = {column.name: values[column.name] for column in derived_columns if column.name in values}
+        rows.put(self._build_parent_row(item, source_inputs, outputs, write_gen, "complete", provenances=provenances))
+        return RowReceipt(str(identity_value), WriteOutcome.UPDATED, RowStatus.COMPLETE)
+
+    def _rebuild_chunk(
+        self,
+        chunk: list[dict[str, Any]],
+        plan: tuple[Graph, tuple[Any, ...]] | None,
+        write_gen: int,
+    ) -> Generator[RunOperations, Any, list[RowReceipt]]:
+        if plan is None:
+            operations = tuple(self._converge_row(self._stored_item(existing), existing, write_gen) for existing in chunk)
+            return (yield RunOperations(operations, self._page_max_concurrency))
+        graph, nodes = plan
+        rows = _ParentRows(self._store, self._spec.name)
+        operations = tuple(rows.guard(self._rebuild_row(existing, graph, nodes, write_gen, rows)) for existing in chunk)
+        receipts = yield RunOperations(operations, self._page_max_concurrency)
+        rows.flush()
+        self._store.delete_rows(
+            self._spec.name,
+            [(self._identity, "in", [existing[self._identity] for existing in chunk]), ("_write_gen", "lt", write_gen)],
+        )
+        return receipts
+
+    def rebuild_drifted(self) -> WriteOperation:
+        """Re-derive only the drifted nodes of rows stamped with an old recipe.
+
+        The nodes a row drifted plus their downstream nodes form one subgraph,
+        fed the stored upstream columns. Rows fully stamped under the same
+        recipe drifted the same nodes, so that set is worked out once per
+        recipe stamp, from the first such row; a row missing its stamp or a
+        column's provenance is planned from its own stored provenance. The
+        table is read a chunk at a time, and the rows of a chunk that share a
+        subgraph run together, with one parent write and one cleanup. A row
+        that cannot be planned converges as ``sync`` would.
+        """
+        if not self._provenance.table_stamps_recipe():
+            return TableReceipt(())
+        current = self._provenance.current_recipe_fingerprint()
+        columns = [self._identity, "_write_gen", "_status"]
+        physical = self._store.column_names(self._spec.name)
+        if not physical or RECIPE_COLUMN in physical:
+            columns.append(RECIPE_COLUMN)
+        # Waiting and errored rows are left to sync(), which owns their resume.
+        identities = [
+            row[self._identity]
+            for row in dedup_rows(scan_rows(self._store, self._spec.name, columns=columns), self._identity)
+            if row.get(RECIPE_COLUMN) != current and row.get("_status") in (None, "complete")
+        ]
+        write_gen = self._store.max_write_gen(self._spec.name) + 1
+        receipts: list[RowReceipt] = []
+        stamp_plans: dict[str, tuple[Graph, tuple[Any, ...]] | None] = {}
+        for start in range(0, len(identities), INSERT_CHUNK_ROWS):
+            chunk_ids = identities[start : start + INSERT_CHUNK_ROWS]
+            stored = self._store.read_many(self._spec.name, self._identity, chunk_ids)
+            planned: dict[int, tuple[tuple[Graph, tuple[Any, ...]] | None, list[dict[str, Any]]]] = {}
+            for identity_value in chunk_ids:
+                existing = stored.get(identity_value)
+                if existing is None:
+                    continue
+                stamp = existing.get(RECIPE_COLUMN)
+                if isinstance(stamp, str) and stamp and self._provenance.row_fully_stamped(existing):
+                    if stamp not in stamp_plans:
+                        stamp_plans[stamp] = self._rebuild_plan(existing)
+                    plan = stamp_plans[stamp]
+                else:
+                    plan = self._rebuild_plan(existing)
+                planned.setdefault(id(plan), (plan, []))[1].append(existing)
+            for plan, chunk in planned.values():
+                receipts.extend((yield from self._rebuild_chunk(chunk, plan, write_gen)))
+        return TableReceipt(tuple(receipts))
+
     def set_rows(self, where: _Predicate, fields: dict[str, Any]) -> int:
         content_keys = {column.name for column in self._spec.columns if column.content_key}
         blocked = sorted(content_keys.intersection(fields))
@@ -1336,11 +1664,15 @@ class WritePlanner:
             self._evolve_for_backfill_column(column)
         node = self._provenance.producing_node(column)
         write_gen = self._store.max_write_gen(self._spec.name) + 1
-        rows = dedup_rows(self._read_rows(self._spec.name), self._identity)
+        # The identities are streamed; full rows are fetched a chunk at a time,
+        # so a large table never has to fit in memory.
+        identities = [
+            row[self._identity] for row in dedup_rows(scan_rows(self._store, self._spec.name, columns=[self._identity, "_write_gen"]), self._identity)
+        ]
         receipts: list[RowReceipt] = []
         derived_columns = self._provenance.derived_columns()
         derived_names = {derived.name for derived in derived_columns}
-        for existing in rows:
+        for existing in self._rows_by_chunk(identities):
             child_gens = _ChildGenerations(self._store, write_gen)
             if backfill and not self._provenance.column_is_null(existing.get(column)):
                 receipts.append(
@@ -5,12 +5,18 @@ from __future__ import annotations
 import hashlib
 import json
 from collections import defaultdict
+from collections.abc import Sequence
 from typing import Any
 
+from hypergraph.checkpointers.protocols import BulkStateProtocol, SyncBulkStateProtocol, probe_seam
 from hypergraph.checkpointers.types import Run
 
 MAP_SIGNATURE_CONFIG_KEY = "map_item_signature"
 
+#: Completed children restored per ``get_states`` round trip — the same
+#: width the SQLite checkpointer chunks its ``IN (...)`` lists to.
+RESTORE_CHUNK_SIZE = 500
+
 
 def normalize_signature_value(value: Any) -> Any:
     """Normalize map inputs into a JSON-stable structure for hashing."""
@@ -108,3 +114,85 @@ def claim_completed_child_run_id(
         return legacy.pop(0)
 
     return None
+
+
+def supports_bulk_states(checkpointer: object | None, *, sync: bool) -> bool:
+    """Whether this checkpointer folds many runs' state in one call.
+
+    Without the seam a resumed map restores each completed child through
+    its own ``get_state``/``state`` call, exactly as before.
+    """
+    if sync:
+        return probe_seam(checkpointer, SyncBulkStateProtocol, ("get_states_sync",))
+    return probe_seam(checkpointer, BulkStateProtocol, ("get_states",))
+
+
+class MapRestorePlan:
+    """Every resumed map item's signature and restore claim, decided up front.
+
+    Claims are made in item order — the order the per-item path made them in
+    — so a plan claims exactly the children that path would have. Deciding
+    them before any item starts is what lets the templates prefetch
+    completed children a chunk at a time instead of one round trip each.
+
+    A fresh map (no completed children) plans nothing: there is nothing to
+    claim, and each item's signature is computed when it runs, as before.
+    """
+
+    def __init__(
+        self,
+        input_variations: Sequence[dict[str, Any]],
+        map_over: list[str],
+        map_mode: str,
+        completed_runs: list[Run],
+        workflow_id: str | None,
+        *,
+        chunk_size: int = RESTORE_CHUNK_SIZE,
+    ) -> None:
+        self._variations = input_variations
+        self._map_over = map_over
+        self._map_mode = map_mode
+        self._signatures: dict[int, str] = {}
+        self._claims: dict[int, str] = {}
+        by_signature, legacy_by_index = index_completed_child_runs(completed_runs, workflow_id)
+        if by_signature or legacy_by_index:
+            for idx, variation_inputs in enumerate(input_variations):
+                signature = compute_map_item_signature(variation_inputs, map_over, map_mode)
+                self._signatures[idx] = signature
+                run_id = claim_completed_child_run_id(idx=idx, signature=signature, by_signature=by_signature, legacy_by_index=legacy_by_index)
+                if run_id is not None:
+                    self._claims[idx] = run_id
+        claimed = sorted(self._claims)
+        self._chunks = [claimed[start : start + chunk_size] for start in range(0, len(claimed), chunk_size)]
+        self._chunk_of = {idx: position // chunk_size for position, idx in enumerate(claimed)}
+        self._loaded: set[int] = set()
+        self._states: dict[int, dict[str, Any]] = {}
+
+    def signature(self, idx: int) -> str:
+        """This item's input signature (computed once)."""
+        signature = self._signatures.get(idx)
+        if signature is None:
+            signature = compute_map_item_signature(self._variations[idx], self._map_over, self._map_mode)
+        return signature
+
+    def restore_run_id(self, idx: int) -> str | None:
+        """The completed child this item restores from, or None to execute it."""
+        return self._claims.get(idx)
+
+    def unloaded_chunk(self, idx: int) -> list[str] | None:
+        """The run ids of ``idx``'s prefetch chunk, or None once it is loaded."""
+        chunk = self._chunk_of[idx]
+        if chunk in self._loaded:
+            return None
+        return [self._claims[member] for member in self._chunks[chunk]]
+
+    def load(self, idx: int, states: dict[str, dict[str, Any]]) -> None:
+        """Hold the folded states of ``idx``'s chunk until each item takes its own."""
+        chunk = self._chunk_of[idx]
+        self._loaded.add(chunk)
+        for member in self._chunks[chunk]:
+            self._states[member] = states.get(self._claims[member], {})
+
+    def take_state(self, idx: int) -> dict[str, Any]:
+        """Hand over (and release) one prefetched state."""
+        return self._states.pop(idx)
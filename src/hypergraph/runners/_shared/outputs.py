@@ -92,6 +92,21 @@ def _resolve_select(select: Any, graph: Graph) -> str | list[str]:
     return select
 
 
+def restore_keys(graph: Graph, select: Any, on_missing: str) -> list[str] | None:
+    """The state keys ``filter_outputs`` will read, or None for the whole state.
+
+    A restored map child only needs these, so the checkpointer can skip
+    decoding the rest. A missing-output warning or error lists every
+    available output, so those policies still read the whole state.
+    """
+    if on_missing != "ignore":
+        return None
+    effective = _resolve_select(select, graph)
+    if effective == "**":
+        return list(graph.outputs)
+    return [effective] if isinstance(effective, str) else list(effective)
+
+
 def _collect_all_outputs(
     state: GraphState,
     graph: Graph,
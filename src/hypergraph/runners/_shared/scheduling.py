@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -341,9 +341,14 @@ def ensure_progress_processor(
     caller owns that merge (and map templates must forward only the call-site
     list into per-item runs).
     """
+    from hypergraph.events.dispatcher import EventDispatcher
     from hypergraph.events.rich_progress import RichProgressProcessor
 
+    def has_rich(candidates: Iterable[Any]) -> bool:
+        # A background EventDispatcher passed as a processor counts by what it wraps.
+        return any(isinstance(p, RichProgressProcessor) or (isinstance(p, EventDispatcher) and has_rich(p.processors)) for p in candidates)
+
     processors = list(event_processors) if event_processors else []
-    if not any(isinstance(p, RichProgressProcessor) for p in (*carried, *processors)):
+    if not has_rich((*carried, *processors)):
         processors.insert(0, RichProgressProcessor())
     return processors
@@ -9,6 +9,7 @@ from collections.abc import AsyncIterator
 from dataclasses import replace
 from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
+from hypergraph.checkpointers.protocols import state_keys_kwargs
 from hypergraph.checkpointers.types import RunTotals, StepStatus
 from hypergraph.exceptions import (
     ExecutionError,
@@ -44,13 +45,13 @@ from hypergraph.runners._shared.lineage import (
 from hypergraph.runners._shared.map_inputs import generate_map_inputs
 from hypergraph.runners._shared.map_resume import (
     MAP_SIGNATURE_CONFIG_KEY,
-    claim_completed_child_run_id,
-    compute_map_item_signature,
-    index_completed_child_runs,
+    MapRestorePlan,
+    supports_bulk_states,
 )
 from hypergraph.runners._shared.outputs import (
     SELECT_UNSET,
     filter_outputs,
+    restore_keys,
     validate_error_handling,
     validate_on_missing,
 )
@@ -1162,7 +1163,10 @@ class AsyncRunnerTemplate(BaseRunner, ABC):
 
             # Resume: find completed child runs to skip by stable input signature.
             completed_runs = await _get_completed_child_runs(checkpointer, workflow_id)
-            completed_by_signature, completed_legacy_by_index = index_completed_child_runs(completed_runs, workflow_id)
+            restore_plan = MapRestorePlan(input_variations, map_over_list, map_mode, completed_runs, workflow_id) if has_checkpointer else None
+            bulk_states = supports_bulk_states(checkpointer, sync=False)
+            restore_kwargs = state_keys_kwargs(checkpointer.get_states, restore_keys(graph, select, on_missing)) if bulk_states else {}
+            restore_lock = asyncio.Lock()
 
             existing_limiter = self._get_concurrency_limiter()
             token = self._set_concurrency_limiter(max_concurrency) if existing_limiter is None and max_concurrency is not None else None
@@ -1203,6 +1207,16 @@ class AsyncRunnerTemplate(BaseRunner, ABC):
                 )
             raise
 
+        async def _restored_state(idx: int, restore_run_id: str) -> dict[str, Any]:
+            """One completed child's folded state, prefetched a chunk at a time when the checkpointer can."""
+            if not bulk_states:
+                return await checkpointer.get_state(restore_run_id)
+            async with restore_lock:
+                chunk = restore_plan.unloaded_chunk(idx)
+                if chunk is not None:
+                    restore_plan.load(idx, await checkpointer.get_states(chunk, **restore_kwargs))
+            return restore_plan.take_state(idx)
+
         async def _run_map_item(idx: int, variation_inputs: dict[str, Any]) -> RunResult:
             """Execute one map variation, or restore from checkpoint if completed."""
             claimed_indexes.add(idx)
@@ -1216,21 +1230,12 @@ class AsyncRunnerTemplate(BaseRunner, ABC):
                 if map_inspection_session is not None
                 else _inspection_session
             )
-            item_signature = compute_map_item_signature(variation_inputs, map_over_list, map_mode) if has_checkpointer else None
+            item_signature = restore_plan.signature(idx) if restore_plan is not None else None
 
             # Skip completed items — restore result from checkpoint.
-            restore_run_id = (
-                claim_completed_child_run_id(
-                    idx=idx,
-                    signature=item_signature,
-                    by_signature=completed_by_signature,
-                    legacy_by_index=completed_legacy_by_index,
-                )
-                if item_signature is not None
-                else None
-            )
-            if restore_run_id is not None and has_checkpointer:
-                state = await checkpointer.get_state(restore_run_id)
+            restore_run_id = restore_plan.restore_run_id(idx) if restore_plan is not None else None
+            if restore_run_id is not None and restore_plan is not None:
+                state = await _restored_state(idx, restore_run_id)
                 restored_state = GraphState(values=dict(state))
                 restored_values = filter_outputs(restored_state, graph, select, on_missing)
                 result = build_restored_run_result(
@@ -1649,8 +1654,9 @@ async def _get_completed_child_runs(
 
     from hypergraph.checkpointers.types import WorkflowStatus
 
-    child_runs = await checkpointer.list_runs(parent_run_id=workflow_id)
-    return [run for run in child_runs if run.status == WorkflowStatus.COMPLETED]
+    # Unbounded: the listing's default page of 100 would silently re-execute
+    # every completed child beyond it.
+    return list(await checkpointer.list_runs(status=WorkflowStatus.COMPLETED, parent_run_id=workflow_id, limit=None))
 
 
 def _validate_pause_options_have_routes(
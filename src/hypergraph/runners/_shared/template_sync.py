@@ -8,6 +8,7 @@ from collections.abc import Iterator
 from dataclasses import replace
 from typing import TYPE_CHECKING, Any, Literal
 
+from hypergraph.checkpointers.protocols import state_keys_kwargs
 from hypergraph.checkpointers.types import RunTotals, StepStatus
 from hypergraph.exceptions import (
     ExecutionError,
@@ -43,13 +44,13 @@ from hypergraph.runners._shared.lineage import (
 from hypergraph.runners._shared.map_inputs import generate_map_inputs
 from hypergraph.runners._shared.map_resume import (
     MAP_SIGNATURE_CONFIG_KEY,
-    claim_completed_child_run_id,
-    compute_map_item_signature,
-    index_completed_child_runs,
+    MapRestorePlan,
+    supports_bulk_states,
 )
 from hypergraph.runners._shared.outputs import (
     SELECT_UNSET,
     filter_outputs,
+    restore_keys,
     validate_error_handling,
     validate_on_missing,
 )
@@ -1074,7 +1075,9 @@ class SyncRunnerTemplate(BaseRunner, ABC):
 
             # Resume: find completed child runs to skip by stable input signature.
             completed_runs = _get_completed_child_runs_sync(sync_cp, workflow_id)
-            completed_by_signature, completed_legacy_by_index = index_completed_child_runs(completed_runs, workflow_id)
+            restore_plan = MapRestorePlan(input_variations, map_over_list, map_mode, completed_runs, workflow_id) if sync_cp is not None else None
+            bulk_states = supports_bulk_states(sync_cp, sync=True)
+            restore_kwargs = state_keys_kwargs(sync_cp.get_states_sync, restore_keys(graph, select, on_missing)) if bulk_states else {}
             map_stop_signal = get_stop_signal()
         except BaseException as error:
             try:
@@ -1126,21 +1129,19 @@ class SyncRunnerTemplate(BaseRunner, ABC):
                     if map_inspection_session is not None
                     else _inspection_session
                 )
-                item_signature = compute_map_item_signature(variation_inputs, map_over_list, map_mode) if sync_cp is not None else None
-
-                # Skip completed items — restore result from checkpoint
-                restore_run_id = (
-                    claim_completed_child_run_id(
-                        idx=idx,
-                        signature=item_signature,
-                        by_signature=completed_by_signature,
-                        legacy_by_index=completed_legacy_by_index,
-                    )
-                    if item_signature is not None
-                    else None
-                )
-                if restore_run_id is not None and sync_cp is not None:
-                    state = sync_cp.state(restore_run_id)
+                item_signature = restore_plan.signature(idx) if restore_plan is not None else None
+
+                # Skip completed items — restore result from checkpoint,
+                # prefetched a chunk at a time when the checkpointer can.
+                restore_run_id = restore_plan.restore_run_id(idx) if restore_plan is not None else None
+                if restore_run_id is not None and restore_plan is not None:
+                    if bulk_states:
+                        chunk = restore_plan.unloaded_chunk(idx)
+                        if chunk is not None:
+                            restore_plan.load(idx, sync_cp.get_states_sync(chunk, **restore_kwargs))
+                        state = restore_plan.take_state(idx)
+                    else:
+                        state = sync_cp.state(restore_run_id)
                     restored_state = GraphState(values=dict(state))
                     restored_values = filter_outputs(restored_state, graph, select, on_missing)
                     result = build_restored_run_result(
@@ -1467,5 +1468,6 @@ def _get_completed_child_runs_sync(
 
     from hypergraph.checkpointers.types import WorkflowStatus
 
-    child_runs = sync_cp.runs(parent_run_id=workflow_id)
-    return [run for run in child_runs if run.status == WorkflowStatus.COMPLETED]
+    # Unbounded: the listing's default page of 100 would silently re-execute
+    # every completed child beyond it.
+    return list(sync_cp.runs(status=WorkflowStatus.COMPLETED, parent_run_id=workflow_id, limit=None))
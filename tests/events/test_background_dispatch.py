@@ -0,0 +1,253 @@
+"""Tests for EventDispatcher(mode="background"): off-thread, bounded-queue delivery."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from hypergraph import AsyncRunner, Graph, SyncRunner, node
+from hypergraph.events import AsyncEventProcessor, EventDispatcher, EventProcessor
+from hypergraph.events.types import NodeStartEvent, RunEndEvent, RunStartEvent, StreamingChunkEvent
+
+
+class _ListProcessor(EventProcessor):
+    def __init__(self, delay: float = 0.0):
+        self.events: list[object] = []
+        self.threads: set[str] = set()
+        self.delay = delay
+        self.shutdown_with: int | None = None
+
+    def on_event(self, event):
+        time.sleep(self.delay)
+        self.threads.add(threading.current_thread().name)
+        self.events.append(event)
+
+    def shutdown(self):
+        self.shutdown_with = len(self.events)
+
+
+class _GatedProcessor(EventProcessor):
+    """Holds the worker inside its first event until released."""
+
+    def __init__(self):
+        self.events: list[object] = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def on_event(self, event):
+        self.entered.set()
+        self.release.wait(timeout=5)
+        self.events.append(event)
+
+
+class _AsyncListProcessor(AsyncEventProcessor):
+    def __init__(self):
+        self.events: list[object] = []
+
+    async def on_event_async(self, event):
+        self.events.append(event)
+
+
+def _chunk(i: int) -> StreamingChunkEvent:
+    return StreamingChunkEvent(run_id="r1", chunk=i, node_name="n")
+
+
+@node(output_name="doubled")
+def double(x: int) -> int:
+    return x * 2
+
+
+class TestBackgroundDispatch:
+    def test_slow_processor_never_stalls_emit(self):
+        slow = _ListProcessor(delay=0.02)
+        dispatcher = EventDispatcher([slow], mode="background")
+        events = [NodeStartEvent(run_id="r1", node_name=f"n{i}") for i in range(10)]
+
+        start = time.perf_counter()
+        for event in events:
+            dispatcher.emit(event)
+        assert time.perf_counter() - start < 0.1
+
+        dispatcher.shutdown()
+        assert slow.events == events
+        assert slow.shutdown_with == len(events), "queued events are delivered before processors shut down"
+        assert slow.threads == {"hypergraph-event-dispatch"}
+        stats = dispatcher.stats()
+        assert (stats.delivered, stats.dropped, stats.queued) == (10, 0, 0)
+        assert stats.max_latency_ms >= stats.mean_latency_ms > 0
+
+    def test_drop_chunks_discards_only_streaming_chunks(self):
+        gated = _GatedProcessor()
+        dispatcher = EventDispatcher([gated], mode="background", queue_size=1, overflow="drop_chunks")
+        dispatcher.emit(_chunk(0))
+        assert gated.entered.wait(timeout=5)
+        for i in range(1, 5):
+            dispatcher.emit(_chunk(i))
+
+        gated.release.set()
+        dispatcher.shutdown()
+        assert [event.chunk for event in gated.events] == [0, 1]
+        assert dispatcher.stats().dropped == 3
+
+    def test_drop_oldest_keeps_the_newest_events(self):
+        gated = _GatedProcessor()
+        dispatcher = EventDispatcher([gated], mode="background", queue_size=2, overflow="drop_oldest")
+        dispatcher.emit(_chunk(0))
+        assert gated.entered.wait(timeout=5)
+        for i in range(1, 6):
+            dispatcher.emit(_chunk(i))
+
+        gated.release.set()
+        dispatcher.shutdown()
+        assert [event.chunk for event in gated.events] == [0, 4, 5]
+        assert dispatcher.stats().dropped == 3
+
+    def test_drop_oldest_never_loses_a_pending_shutdown(self):
+        gated = _GatedProcessor()
+        dispatcher = EventDispatcher([gated], mode="background", queue_size=2, overflow="drop_oldest")
+        dispatcher.emit(_chunk(0))
+        assert gated.entered.wait(timeout=5)
+        dispatcher.emit(_chunk(1))
+        stopper = threading.Thread(target=dispatcher.shutdown)
+        stopper.start()
+        deadline = time.monotonic() + 5
+        while dispatcher.stats().queued < 2 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        # The queue is full with event 1 and the shutdown's wake-up; both are evicted.
+        dispatcher.emit(_chunk(2))
+        dispatcher.emit(_chunk(3))
+
+        gated.release.set()
+        stopper.join(timeout=5)
+        assert not stopper.is_alive(), "shutdown must finish after the worker drains the queue"
+        assert [event.chunk for event in gated.events] == [0, 2, 3]
+        assert dispatcher.stats().dropped == 1
+
+    def test_emits_racing_shutdown_keep_one_worker_and_lose_nothing(self):
+        class OneAtATime(EventProcessor):
+            def __init__(self):
+                self.events: list[object] = []
+                self.active = 0
+                self.overlapped = False
+                self.guard = threading.Lock()
+
+            def on_event(self, event):
+                with self.guard:
+                    self.active += 1
+                    self.overlapped = self.overlapped or self.active > 1
+                time.sleep(0.0001)
+                self.events.append(event)
+                with self.guard:
+                    self.active -= 1
+
+        processor = OneAtATime()
+        dispatcher = EventDispatcher([processor], mode="background", queue_size=8)
+        emitted: dict[int, list[StreamingChunkEvent]] = {source: [] for source in range(4)}
+
+        def emit_from(source: int) -> None:
+            for i in range(200):
+                event = StreamingChunkEvent(run_id=f"r{source}", chunk=i, node_name="n")
+                emitted[source].append(event)
+                dispatcher.emit(event)
+
+        emitters = [threading.Thread(target=emit_from, args=(source,)) for source in emitted]
+        for emitter in emitters:
+            emitter.start()
+        while any(emitter.is_alive() for emitter in emitters):
+            dispatcher.shutdown()
+        for emitter in emitters:
+            emitter.join()
+        # Anything emitted after the last drain is picked up by the next worker.
+        dispatcher.emit(StreamingChunkEvent(run_id="last", chunk=0, node_name="n"))
+        dispatcher.shutdown()
+
+        assert not processor.overlapped, "two workers delivered at once"
+        for source, events in emitted.items():
+            assert [event for event in processor.events if event.run_id == f"r{source}"] == events
+        assert len(processor.events) == 801
+
+    def test_strict_dispatcher_logs_worker_errors_as_they_happen(self, caplog):
+        class Failing(EventProcessor):
+            def on_event(self, event):
+                raise RuntimeError("exporter down")
+
+        dispatcher = EventDispatcher([Failing()], strict=True, mode="background")
+        with caplog.at_level("ERROR", logger="hypergraph.events.dispatcher"):
+            dispatcher.emit(RunStartEvent(run_id="r1"))
+            dispatcher.flush()
+            assert "failed on RunStartEvent" in caplog.text
+        with pytest.raises(RuntimeError, match="exporter down"):
+            dispatcher.shutdown()
+
+    def test_strict_dispatcher_raises_worker_errors_at_shutdown(self):
+        class Failing(EventProcessor):
+            def on_event(self, event):
+                raise RuntimeError("exporter down")
+
+        dispatcher = EventDispatcher([Failing()], strict=True, mode="background")
+        dispatcher.emit(RunStartEvent(run_id="r1"))
+        with pytest.raises(RuntimeError, match="exporter down"):
+            dispatcher.shutdown()
+
+    async def test_async_processors_run_on_the_emitting_loop(self):
+        class LoopBound(AsyncEventProcessor):
+            def __init__(self):
+                self.inbox: asyncio.Queue[object] = asyncio.Queue()
+                self.loops: set[asyncio.AbstractEventLoop] = set()
+
+            async def on_event_async(self, event):
+                self.loops.add(asyncio.get_running_loop())
+                await self.inbox.put(event)
+
+        processor = LoopBound()
+        dispatcher = EventDispatcher([processor], mode="background")
+        events = [_chunk(i) for i in range(20)]
+        for event in events:
+            await dispatcher.emit_async(event)
+        await dispatcher.shutdown_async()
+
+        assert processor.loops == {asyncio.get_running_loop()}
+        assert [processor.inbox.get_nowait() for _ in events] == events
+
+    async def test_a_sync_shutdown_on_the_emitting_loop_does_not_deadlock(self):
+        processor = _AsyncListProcessor()
+        dispatcher = EventDispatcher([processor], mode="background")
+        events = [_chunk(i) for i in range(20)]
+        for event in events:
+            await dispatcher.emit_async(event)
+
+        # Blocks this loop's thread on the worker; the worker falls back to its own loop.
+        dispatcher.shutdown()
+
+        assert processor.events == events
+
+    def test_rejects_unknown_options(self):
+        with pytest.raises(ValueError, match="mode"):
+            EventDispatcher(mode="threaded")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="overflow"):
+            EventDispatcher(mode="background", overflow="drop_newest")  # type: ignore[arg-type]
+
+
+class TestRunnerOptIn:
+    def test_sync_run_delivers_every_event_in_order_by_shutdown(self):
+        processor = _ListProcessor()
+        background = EventDispatcher([processor], mode="background")
+
+        SyncRunner().run(Graph([double]), {"x": 2}, event_processors=[background])
+
+        assert isinstance(processor.events[0], RunStartEvent)
+        assert isinstance(processor.events[-1], RunEndEvent)
+        assert processor.shutdown_with == len(processor.events)
+        assert processor.threads == {"hypergraph-event-dispatch"}
+
+    async def test_async_run_delivers_every_event_by_shutdown(self):
+        processor = _ListProcessor()
+
+        await AsyncRunner().run(Graph([double]), {"x": 2}, event_processors=[EventDispatcher([processor], mode="background")])
+
+        assert isinstance(processor.events[0], RunStartEvent)
+        assert isinstance(processor.events[-1], RunEndEvent)
+        assert processor.shutdown_with == len(processor.events)
@@ -39,7 +39,7 @@ from hypergraph.checkpointers import (
 
 aiosqlite = pytest.importorskip("aiosqlite")
 
-from hypergraph.checkpointers import SqliteCheckpointer  # noqa: E402
+from hypergraph.checkpointers import LogCheckpointer, ShardedSqliteCheckpointer, SqliteCheckpointer  # noqa: E402
 
 FP = "policy-fp-v1"
 RUN = "wf-1"
@@ -150,9 +150,80 @@ class _SqliteBackend:
         self._open.clear()
 
 
-@pytest_asyncio.fixture(params=["memory", "sqlite"])
+class _LogBackend(_MemoryBackend):
+    """Memory's in-process index, made durable by its segment log.
+
+    A failing index write raises before anything is journaled, so the
+    memory persistence cuts apply unchanged; a crash reopens the directory.
+    """
+
+    name = "log"
+
+    def __init__(self, tmp_path):
+        self._tmp_path = tmp_path
+        self._counter = 0
+        self._open: list[LogCheckpointer] = []
+        self._paths: dict[int, str] = {}
+
+    async def make(self, *, retention: str = "full") -> Checkpointer:
+        self._counter += 1
+        path = str(self._tmp_path / f"ledger-{self._counter}")
+        cp = LogCheckpointer(path, retention=None if retention == "full" else retention)
+        self._paths[id(cp)] = path
+        self._open.append(cp)
+        return cp
+
+    async def crash(self, cp: Checkpointer) -> Checkpointer:
+        path = self._paths[id(cp)]
+        await cp.close()
+        self._open.remove(cp)
+        fresh = LogCheckpointer(path)
+        self._paths[id(fresh)] = path
+        self._open.append(fresh)
+        return fresh
+
+    async def close_all(self) -> None:
+        for cp in self._open:
+            await cp.close()
+        self._open.clear()
+
+
+class _ShardedBackend(_SqliteBackend):
+    """SQLite's persistence cuts, aimed at the shard that owns the run or series."""
+
+    name = "sharded"
+
+    async def make(self, *, retention: str = "full") -> Checkpointer:
+        self._counter += 1
+        path = str(self._tmp_path / f"ledger-{self._counter}")
+        cp = ShardedSqliteCheckpointer(path, shards=3, retention=None if retention == "full" else retention)
+        await cp.initialize()
+        self._paths[id(cp)] = path
+        self._open.append(cp)
+        return cp
+
+    async def crash(self, cp: Checkpointer) -> Checkpointer:
+        path = self._paths[id(cp)]
+        await cp.close()
+        self._open.remove(cp)
+        fresh = ShardedSqliteCheckpointer(path, shards=3)
+        self._paths[id(fresh)] = path
+        self._open.append(fresh)
+        return fresh
+
+    def break_reservation_persistence(self, cp, series_id: str, monkeypatch) -> None:
+        self._break_on_sql(cp._series_shards[series_id], "INSERT INTO attempt_records", monkeypatch)
+
+    def break_step_persistence(self, cp, run_id: str, monkeypatch) -> None:
+        self._break_on_sql(cp.shard_for(run_id), "INSERT INTO steps", monkeypatch)
+
+
+_BACKENDS = {"memory": lambda tmp_path: _MemoryBackend(), "sqlite": _SqliteBackend, "log": _LogBackend, "sharded": _ShardedBackend}
+
+
+@pytest_asyncio.fixture(params=["memory", "sqlite", "log", "sharded"])
 async def backend(request, tmp_path):
-    b = _MemoryBackend() if request.param == "memory" else _SqliteBackend(tmp_path)
+    b = _BACKENDS[request.param](tmp_path)
     yield b
     await b.close_all()
 
@@ -294,14 +294,16 @@ async def test_pre_ledger_database_migrates_in_place(tmp_path):
         assert all(step.attempt_series_id is None for step in steps)
 
         # New objects appeared; the column list is the v3 list plus a nullable
-        # attempt_series_id (the v5 rebuild preserves names, order, and rows).
+        # attempt_series_id (the v5 rebuild preserves names, order, and rows)
+        # the nullable value_refs of content-addressed step values, and the
+        # value_keys index keyed state reads skip steps by.
         probe = sqlite3.connect(path)
         try:
             tables = {row[0] for row in probe.execute("SELECT name FROM sqlite_master WHERE type='table'")}
             assert "attempt_series" in tables
             assert "attempt_records" in tables
             step_cols = [row[1] for row in probe.execute("PRAGMA table_info(steps)")]
-            assert step_cols == [*_V3_STEP_COLUMNS, "attempt_series_id"]
+            assert step_cols == [*_V3_STEP_COLUMNS, "attempt_series_id", "value_refs", "value_keys"]
             new_col = next(row for row in probe.execute("PRAGMA table_info(steps)") if row[1] == "attempt_series_id")
             assert new_col[3] == 0  # notnull flag: nullable
             assert new_col[4] is None  # no default
@@ -25,7 +25,7 @@ from hypergraph.checkpointers import (
 
 aiosqlite = pytest.importorskip("aiosqlite")
 
-from hypergraph.checkpointers import SqliteCheckpointer  # noqa: E402
+from hypergraph.checkpointers import LogCheckpointer, ShardedSqliteCheckpointer, SqliteCheckpointer  # noqa: E402
 
 FP = "policy-fp-v1"
 RUN = "wf-1"
@@ -73,9 +73,48 @@ class _SqliteBackend:
         self._open.clear()
 
 
-@pytest_asyncio.fixture(params=["memory", "sqlite"])
+class _LogBackend:
+    name = "log"
+
+    def __init__(self, tmp_path):
+        self._tmp_path = tmp_path
+        self._open: list[LogCheckpointer] = []
+
+    async def make(self):
+        cp = LogCheckpointer(self._tmp_path / f"terminal-close-{len(self._open)}")
+        self._open.append(cp)
+        return cp
+
+    async def close_all(self) -> None:
+        for cp in self._open:
+            await cp.close()
+        self._open.clear()
+
+
+class _ShardedBackend:
+    name = "sharded"
+
+    def __init__(self, tmp_path):
+        self._tmp_path = tmp_path
+        self._open: list[ShardedSqliteCheckpointer] = []
+
+    async def make(self):
+        cp = ShardedSqliteCheckpointer(self._tmp_path / f"terminal-close-{len(self._open)}", shards=3)
+        self._open.append(cp)
+        return cp
+
+    async def close_all(self) -> None:
+        for cp in self._open:
+            await cp.close()
+        self._open.clear()
+
+
+_BACKENDS = {"memory": lambda tmp_path: _MemoryBackend(), "sqlite": _SqliteBackend, "log": _LogBackend, "sharded": _ShardedBackend}
+
+
+@pytest_asyncio.fixture(params=["memory", "sqlite", "log", "sharded"])
 async def backend(request, tmp_path):
-    b = _MemoryBackend() if request.param == "memory" else _SqliteBackend(tmp_path)
+    b = _BACKENDS[request.param](tmp_path)
     yield b
     await b.close_all()
 
@@ -0,0 +1,280 @@
+"""Tests for the append-only, log-structured checkpointer."""
+
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from hypergraph import AsyncRunner, Graph, RunStatus, interrupt, node
+from hypergraph.checkpointers import (
+    AttemptStatus,
+    LogCheckpointer,
+    LogCorruptionError,
+    LogLockedError,
+    PendingNode,
+    StepRecord,
+    StepStatus,
+    WorkflowStatus,
+)
+from tests._interrupt_questions import StringQuestion
+
+
+def _step(run_id="wf-1", superstep=0, node_name="embed", index=0, **kwargs):
+    defaults = {"status": StepStatus.COMPLETED, "input_versions": {"x": 1}, "values": {"embedding": [1, 2, 3]}}
+    defaults.update(kwargs)
+    return StepRecord(run_id=run_id, superstep=superstep, node_name=node_name, index=index, **defaults)
+
+
+def _files(path) -> list[str]:
+    return sorted(item.name for item in path.iterdir())
+
+
+@node(output_name="draft")
+def make_draft(query: str) -> str:
+    return f"Draft for: {query}"
+
+
+@interrupt(answer_name="decision")
+def approval(draft: str) -> StringQuestion:
+    return StringQuestion(prompt="Approve?", evidence=(draft,))
+
+
+@node(output_name="result")
+def finalize(decision: str) -> str:
+    return f"Final: {decision}"
+
+
+class TestReplay:
+    async def test_reopen_rebuilds_every_record(self, tmp_path):
+        cp = LogCheckpointer(tmp_path / "log")
+        await cp.create_run("wf-1", graph_name="g", config={"k": "v"}, inputs={"x": 1})
+        await cp.record_pending_nodes([PendingNode(run_id="wf-1", superstep=0, node_name="embed")])
+        series = await cp.open_attempt_series("wf-1", "embed", policy_fingerprint="fp", max_attempts=2)
+        attempt = await cp.begin_attempt(series.id, policy_fingerprint="fp", scheduled_superstep=0)
+        await cp.close_attempt_series(
+            series.id,
+            attempt.attempt_number,
+            AttemptStatus.SUCCEEDED,
+            step_record=_step(attempt_series_id=series.id, completed_at=datetime.now(timezone.utc)),
+        )
+        await cp.update_run_status("wf-1", WorkflowStatus.COMPLETED, duration_ms=12.5, node_count=1)
+        before = (
+            await cp.get_run_async("wf-1"),
+            await cp.get_steps("wf-1"),
+            await cp.get_node_boundaries("wf-1"),
+            await cp.get_attempt_series(series.id),
+            await cp.get_attempt_records(series.id),
+        )
+        await cp.close()
+
+        reopened = LogCheckpointer(tmp_path / "log")
+        try:
+            after = (
+                await reopened.get_run_async("wf-1"),
+                await reopened.get_steps("wf-1"),
+                await reopened.get_node_boundaries("wf-1"),
+                await reopened.get_attempt_series(series.id),
+                await reopened.get_attempt_records(series.id),
+            )
+            assert after == before
+            assert await reopened.get_state("wf-1") == {"embedding": [1, 2, 3]}
+            assert await reopened.get_run_inputs("wf-1") == {"x": 1}
+        finally:
+            await reopened.close()
+
+    async def test_paused_run_resumes_from_a_fresh_process(self, tmp_path):
+        graph = Graph([make_draft, approval, finalize])
+        first = LogCheckpointer(tmp_path / "log")
+        paused = await AsyncRunner(checkpointer=first).run(graph, {"query": "hello"}, workflow_id="wf-pause")
+        assert paused.status == RunStatus.PAUSED
+        await first.close()
+
+        second = LogCheckpointer(tmp_path / "log")
+        try:
+            slot = (await second.get_run_async("wf-pause")).pause_slot
+            assert slot is not None and slot.is_open
+            resumed = await AsyncRunner(checkpointer=second).run(graph, {paused.pause.response_key: "approved"}, workflow_id="wf-pause")
+            assert resumed.status == RunStatus.COMPLETED
+            assert resumed["result"] == "Final: approved"
+        finally:
+            await second.close()
+
+    async def test_latest_retention_drops_survive_reopen(self, tmp_path):
+        cp = LogCheckpointer(tmp_path / "log", retention="latest")
+        await cp.create_run("wf-1")
+        await cp.save_step(_step(node_name="a", values={"x": 1}))
+        await cp.save_step(_step(superstep=1, node_name="b", index=1, values={"y": 2}))
+        await cp.save_step(_step(superstep=2, node_name="a", index=2, values={"x": 3}))
+        expected = await cp.get_steps("wf-1", show_internal=True)
+        await cp.close()
+
+        reopened = LogCheckpointer(tmp_path / "log", retention="latest")
+        try:
+            assert await reopened.get_steps("wf-1", show_internal=True) == expected
+            assert await reopened.get_state("wf-1") == {"x": 3, "y": 2}
+        finally:
+            await reopened.close()
+
+
+class TestDurability:
+    async def test_torn_tail_is_dropped_and_appends_continue(self, tmp_path):
+        cp = LogCheckpointer(tmp_path / "log")
+        await cp.create_run("wf-1")
+        await cp.save_step(_step(values={"x": 1}))
+        await cp.close()
+        (segment,) = (tmp_path / "log").iterdir()
+        with open(segment, "ab") as handle:
+            handle.write(b"\x40\x00\x00\x00torn")
+
+        reopened = LogCheckpointer(tmp_path / "log")
+        await reopened.save_step(_step(superstep=1, node_name="next", index=1, values={"y": 2}))
+        await reopened.close()
+
+        final = LogCheckpointer(tmp_path / "log")
+        try:
+            assert await final.get_state("wf-1") == {"x": 1, "y": 2}
+        finally:
+            await final.close()
+
+    async def test_corrupt_sealed_segment_refuses_to_open(self, tmp_path):
+        cp = LogCheckpointer(tmp_path / "log", segment_bytes=64)
+        await cp.create_run("wf-1")
+        for superstep in range(3):
+            await cp.save_step(_step(superstep=superstep, node_name=f"n{superstep}", index=superstep))
+        await cp.close()
+        sealed = tmp_path / "log" / _files(tmp_path / "log")[0]
+        data = bytearray(sealed.read_bytes())
+        data[-1] ^= 0xFF
+        sealed.write_bytes(bytes(data))
+
+        with pytest.raises(LogCorruptionError, match="corrupt"):
+            LogCheckpointer(tmp_path / "log")
+
+    async def test_failed_append_leaves_the_index_matching_disk(self, tmp_path, monkeypatch):
+        cp = LogCheckpointer(tmp_path / "log")
+        try:
+            await cp.create_run("wf-1")
+            await cp.save_step(_step(values={"x": 1}))
+
+            def disk_full(data):
+                raise OSError(28, "No space left on device")
+
+            monkeypatch.setattr(cp._file, "write", disk_full)
+            with pytest.raises(OSError, match="No space"):
+                await cp.save_step(_step(superstep=1, node_name="lost", index=1, values={"x": 2}))
+            assert await cp.get_state("wf-1") == {"x": 1}
+            await cp.save_step(_step(superstep=1, node_name="kept", index=1, values={"x": 3}))
+            assert await cp.get_state("wf-1") == {"x": 3}
+        finally:
+            await cp.close()
+
+    async def test_fsync_runs_off_the_event_loop(self, tmp_path, monkeypatch):
+        cp = LogCheckpointer(tmp_path / "log", fsync_interval=0)
+        fsync_threads: list[str] = []
+        ticks = 0
+        fsync = os.fsync
+
+        def slow_fsync(fd):
+            fsync_threads.append(threading.current_thread().name)
+            time.sleep(0.05)
+            fsync(fd)
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        monkeypatch.setattr("hypergraph.checkpointers.log.os.fsync", slow_fsync)
+        beat = asyncio.create_task(heartbeat())
+        try:
+            await cp.create_run("wf-1")
+            await asyncio.gather(*(cp.save_step(_step(superstep=i, node_name=f"n{i}", index=i)) for i in range(4)))
+        finally:
+            beat.cancel()
+            await cp.close()
+
+        assert fsync_threads and all(name.startswith("hypergraph-log-write") for name in fsync_threads)
+        assert ticks >= 10, "the loop kept running while the writer fsynced"
+        reopened = LogCheckpointer(tmp_path / "log")
+        try:
+            assert [step.node_name for step in await reopened.get_steps("wf-1")] == ["n0", "n1", "n2", "n3"]
+        finally:
+            await reopened.close()
+
+    async def test_the_last_frame_of_a_burst_is_fsynced_without_a_later_write(self, tmp_path, monkeypatch):
+        cp = LogCheckpointer(tmp_path / "log", fsync_interval=0.2)
+        synced = threading.Event()
+        fsync = os.fsync
+
+        def recording_fsync(fd):
+            fsync(fd)
+            synced.set()
+
+        try:
+            await cp.create_run("wf-1")
+            # Start the interval now, so the step lands inside it.
+            await asyncio.wrap_future(cp._segment_writer().submit(cp._fsync))
+            monkeypatch.setattr("hypergraph.checkpointers.log.os.fsync", recording_fsync)
+            await cp.save_step(_step())
+            assert await asyncio.to_thread(synced.wait, 5), "the interval passed with no fsync"
+            assert not cp._unsynced
+        finally:
+            await cp.close()
+
+    async def test_a_second_writer_on_the_directory_is_refused(self, tmp_path):
+        cp = LogCheckpointer(tmp_path / "log")
+        try:
+            with pytest.raises(LogLockedError, match="already open for writing"):
+                LogCheckpointer(tmp_path / "log")
+            await cp.create_run("wf-1")
+        finally:
+            await cp.close()
+
+        reopened = LogCheckpointer(tmp_path / "log")
+        try:
+            assert await reopened.get_run_async("wf-1") is not None
+        finally:
+            await reopened.close()
+
+
+class TestCompaction:
+    async def test_compact_reclaims_retention_garbage(self, tmp_path):
+        cp = LogCheckpointer(tmp_path / "log", retention="latest", segment_bytes=512, compact_min_bytes=None)
+        await cp.create_run("wf-1")
+        for superstep in range(50):
+            await cp.save_step(_step(superstep=superstep, node_name="loop", index=superstep, values={"n": superstep}))
+        grown = cp.log_bytes
+        assert len(_files(tmp_path / "log")) > 2
+
+        reclaimed = await cp.compact()
+        assert reclaimed > 0
+        assert cp.log_bytes < grown - reclaimed + 64, "only the fresh segment's header is new"
+        assert [name.rsplit(".", 1)[1] for name in _files(tmp_path / "log")] == ["snapshot", "log"]
+        await cp.save_step(_step(superstep=50, node_name="loop", index=50, values={"n": 50}))
+        await cp.close()
+
+        reopened = LogCheckpointer(tmp_path / "log", retention="latest")
+        try:
+            assert await reopened.get_state("wf-1") == {"n": 50}
+            assert [step.superstep for step in await reopened.get_steps("wf-1")] == [50]
+        finally:
+            await reopened.close()
+
+    async def test_log_compacts_itself_in_the_background(self, tmp_path):
+        cp = LogCheckpointer(tmp_path / "log", retention="latest", segment_bytes=1024, compact_min_bytes=4096)
+        await cp.create_run("wf-1")
+        for superstep in range(200):
+            await cp.save_step(_step(superstep=superstep, node_name="loop", index=superstep, values={"n": superstep}))
+        await cp.close()
+
+        assert any(name.endswith(".snapshot") for name in _files(tmp_path / "log"))
+        assert sum(item.stat().st_size for item in (tmp_path / "log").iterdir()) < 4096 * 2
+        reopened = LogCheckpointer(tmp_path / "log")
+        try:
+            assert await reopened.get_state("wf-1") == {"n": 199}
+        finally:
+            await reopened.close()
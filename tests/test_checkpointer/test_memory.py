@@ -1,5 +1,7 @@
 """Tests for the backend-neutral in-memory checkpointer."""
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
 from hypergraph import AsyncRunner, Graph, RunStatus, interrupt, node
@@ -226,3 +228,86 @@ class TestMemoryCheckpointer:
 
         state = await checkpointer.get_state("wf-retained-baseline")
         assert state == {"x": 1, "y": 2}
+
+
+def _step(run_id, superstep, node_name="a", *, values, at=None):
+    at = at or datetime.now(timezone.utc)
+    return StepRecord(
+        run_id=run_id,
+        superstep=superstep,
+        node_name=node_name,
+        index=superstep,
+        status=StepStatus.COMPLETED,
+        input_versions={},
+        values=values,
+        created_at=at,
+        completed_at=at,
+    )
+
+
+async def _finished_run(checkpointer, run_id, *, children=0, payload="x"):
+    await checkpointer.create_run(run_id)
+    await checkpointer.save_step(_step(run_id, 0, values={"payload": payload}))
+    for i in range(children):
+        await checkpointer.create_run(f"{run_id}/child-{i}", parent_run_id=run_id)
+        await checkpointer.update_run_status(f"{run_id}/child-{i}", WorkflowStatus.COMPLETED)
+    await checkpointer.update_run_status(run_id, WorkflowStatus.COMPLETED)
+
+
+class TestIndexedSteps:
+    async def test_cached_state_follows_out_of_order_saves_and_upserts(self, checkpointer):
+        base = datetime.now(timezone.utc)
+        await checkpointer.create_run("wf-1")
+        await checkpointer.save_step(_step("wf-1", 0, "a", values={"x": 1, "y": 1}, at=base))
+        await checkpointer.save_step(_step("wf-1", 2, "c", values={"x": 3}, at=base + timedelta(seconds=2)))
+        assert await checkpointer.get_state("wf-1") == {"x": 3, "y": 1}
+
+        await checkpointer.save_step(_step("wf-1", 1, "b", values={"x": 2, "y": 2}, at=base + timedelta(seconds=1)))
+        assert await checkpointer.get_state("wf-1") == {"x": 3, "y": 2}, "a late arrival folds in its own place"
+        await checkpointer.save_step(_step("wf-1", 2, "c", values={"z": 0}, at=base + timedelta(seconds=2)))
+        assert await checkpointer.get_state("wf-1") == {"x": 2, "y": 2, "z": 0}, "an upsert replaces what it wrote"
+        assert await checkpointer.get_state("wf-1", superstep=0) == {"x": 1, "y": 1}
+        assert await checkpointer.get_state("wf-1", keys=["z", "x"]) == {"z": 0, "x": 2}
+        assert [step.node_name for step in await checkpointer.get_steps("wf-1")] == ["a", "b", "c"]
+
+        state = await checkpointer.get_state("wf-1")
+        state["x"] = "mutated"
+        assert (await checkpointer.get_state("wf-1"))["x"] == 2
+
+
+class TestEviction:
+    async def test_max_runs_evicts_least_recently_used_finished_trees(self):
+        checkpointer = MemoryCheckpointer(max_runs=2)
+        await checkpointer.create_run("wf-active")
+        for run_id in ("wf-1", "wf-2"):
+            await _finished_run(checkpointer, run_id, children=2)
+        await checkpointer.get_state("wf-1")  # wf-2 is now the least recently used
+
+        await _finished_run(checkpointer, "wf-3")
+
+        assert await checkpointer.get_run_async("wf-2") is None
+        assert await checkpointer.list_runs(parent_run_id="wf-2") == []
+        assert {run.id for run in await checkpointer.list_runs(parent_run_id=None)} == {"wf-active", "wf-1", "wf-3"}
+        assert checkpointer.footprint().evicted_runs == 3, "the root and both children"
+
+    async def test_ttl_evicts_finished_runs_but_never_paused_ones(self):
+        checkpointer = MemoryCheckpointer(ttl=timedelta(0))
+        graph = Graph([double])
+        runner = AsyncRunner(checkpointer=checkpointer)
+        await runner.run(graph, {"x": 1}, workflow_id="wf-done")
+        assert await checkpointer.get_run_async("wf-done") is None
+
+        await checkpointer.create_run("wf-paused")
+        await checkpointer.update_run_status("wf-paused", WorkflowStatus.PAUSED)
+        assert (await checkpointer.get_run_async("wf-paused")).status == WorkflowStatus.PAUSED
+
+    async def test_max_bytes_bounds_the_footprint(self):
+        checkpointer = MemoryCheckpointer(max_bytes=200_000)
+        for i in range(50):
+            await _finished_run(checkpointer, f"wf-{i}", payload="x" * 10_000)
+
+        footprint = checkpointer.footprint()
+        assert footprint.bytes <= 200_000
+        assert 0 < footprint.runs < 50
+        assert footprint.runs + footprint.evicted_runs == 50
+        assert await checkpointer.get_state("wf-49") == {"payload": "x" * 10_000}
@@ -367,6 +367,47 @@ class TestAsyncMapResume:
         assert parent is not None
         assert parent.status == WorkflowStatus.COMPLETED
 
+    async def test_map_resume_restores_every_child_in_bulk(self, checkpointer, monkeypatch):
+        """Past the listing's default page, and one get_states per chunk — never one get_state per child."""
+        runner = AsyncRunner(checkpointer=checkpointer)
+        graph = Graph([double])
+        values = list(range(150))
+        await runner.map(graph, {"x": values}, map_over="x", workflow_id="bulk-batch")
+
+        bulk_calls: list[tuple[int, list[str] | None]] = []
+        get_states = checkpointer.get_states
+
+        async def counting_get_states(run_ids, **kwargs):
+            bulk_calls.append((len(run_ids), kwargs.get("keys")))
+            return await get_states(run_ids, **kwargs)
+
+        async def refuse_get_state(run_id, **kwargs):
+            raise AssertionError("restored one child at a time")
+
+        monkeypatch.setattr(checkpointer, "get_states", counting_get_states)
+        monkeypatch.setattr(checkpointer, "get_state", refuse_get_state)
+        result = await runner.map(graph, {"x": values}, map_over="x", workflow_id="bulk-batch", max_concurrency=8)
+
+        assert result.restored_count == 150
+        assert [r["doubled"] for r in result.results] == [value * 2 for value in values]
+        assert bulk_calls == [(150, ["doubled"])], "one chunk, decoding only the graph's outputs"
+
+    async def test_map_resume_keeps_calling_get_states_without_keys(self, checkpointer, monkeypatch):
+        """A checkpointer whose get_states predates ``keys`` is called the old way."""
+        runner = AsyncRunner(checkpointer=checkpointer)
+        graph = Graph([double])
+        await runner.map(graph, {"x": [1, 2, 3]}, map_over="x", workflow_id="old-shape")
+        get_states = checkpointer.get_states
+
+        async def get_states_without_keys(run_ids):
+            return await get_states(run_ids)
+
+        monkeypatch.setattr(checkpointer, "get_states", get_states_without_keys)
+        result = await runner.map(graph, {"x": [1, 2, 3]}, map_over="x", workflow_id="old-shape")
+
+        assert result.restored_count == 3
+        assert [r["doubled"] for r in result.results] == [2, 4, 6]
+
     async def test_map_reruns_failed_items(self, checkpointer):
         """Failed items are re-executed on resume (only COMPLETED are skipped)."""
         should_fail = True
@@ -764,6 +805,31 @@ class TestSyncMapResume:
         assert parent is not None
         assert parent.status == WorkflowStatus.COMPLETED
 
+    def test_map_resume_restores_every_child_in_bulk(self, sync_checkpointer, monkeypatch):
+        """Sync mirror: every completed child restores, a chunk per round trip."""
+        runner = SyncRunner(checkpointer=sync_checkpointer)
+        graph = Graph([double])
+        values = list(range(150))
+        runner.map(graph, {"x": values}, map_over="x", workflow_id="sync-bulk-batch")
+
+        bulk_calls: list[int] = []
+        get_states_sync = sync_checkpointer.get_states_sync
+
+        def counting_get_states_sync(run_ids, **kwargs):
+            bulk_calls.append(len(run_ids))
+            return get_states_sync(run_ids, **kwargs)
+
+        def refuse_state(run_id, **kwargs):
+            raise AssertionError("restored one child at a time")
+
+        monkeypatch.setattr(sync_checkpointer, "get_states_sync", counting_get_states_sync)
+        monkeypatch.setattr(sync_checkpointer, "state", refuse_state)
+        result = runner.map(graph, {"x": values}, map_over="x", workflow_id="sync-bulk-batch")
+
+        assert result.restored_count == 150
+        assert [r["doubled"] for r in result.results] == [value * 2 for value in values]
+        assert bulk_calls == [150]
+
     def test_map_reruns_failed_items(self, sync_checkpointer):
         """Sync mirror: failed items are re-executed on resume."""
         should_fail = True
@@ -44,3 +44,138 @@ class TestPickleSerializer:
         data = {"key": [1, 2, 3], "set": {4, 5}}
         result = s.deserialize(s.serialize(data))
         assert result == data
+
+
+class TestMsgpackSerializer:
+    @pytest.fixture(autouse=True)
+    def _requires_msgpack(self):
+        pytest.importorskip("msgpack")
+
+    def test_roundtrip_plain_values(self):
+        from hypergraph.checkpointers import MsgpackSerializer
+
+        s = MsgpackSerializer()
+        data = {"key": "value", "nested": [1, 2.5, None, True], "blob": b"\x00\xff", 3: "int key"}
+        assert s.deserialize(s.serialize(data)) == data
+        assert s.deserialize(s.serialize(None)) is None
+
+    def test_numpy_arrays_roundtrip_as_read_only_views(self):
+        np = pytest.importorskip("numpy")
+        from hypergraph.checkpointers import MsgpackSerializer
+
+        s = MsgpackSerializer()
+        embeddings = np.random.default_rng(0).random((8, 16), dtype=np.float32)
+        fortran = np.asfortranarray(np.arange(6).reshape(2, 3))
+        data = {"embeddings": embeddings, "fortran": fortran, "empty": np.zeros((0, 4)), "scalar": np.int64(7)}
+
+        blob = s.serialize(data)
+        result = s.deserialize(blob)
+
+        np.testing.assert_array_equal(result["embeddings"], embeddings)
+        assert result["embeddings"].dtype == np.float32
+        np.testing.assert_array_equal(result["fortran"], fortran)
+        assert result["empty"].shape == (0, 4)
+        assert result["scalar"] == 7
+        # Decoded in place from the stored bytes, not copied out of them.
+        assert not result["embeddings"].flags.writeable
+        assert len(blob) < embeddings.nbytes + fortran.nbytes + 512
+
+    @pytest.mark.parametrize("zstd_level", [None, 3])
+    def test_array_buffers_sit_on_64_byte_boundaries_of_the_blob(self, zstd_level):
+        np = pytest.importorskip("numpy")
+        if zstd_level is not None:
+            pytest.importorskip("zstandard")
+        from hypergraph.checkpointers import MsgpackSerializer
+
+        s = MsgpackSerializer(zstd_level=zstd_level, compress_min_bytes=0)
+        data = {"a": np.arange(3, dtype=np.int8), "b": np.ones((5, 7)), "c": np.arange(33, dtype=np.float32)}
+        blob = s.serialize(data)
+        # Copy the blob to a 64-byte-aligned address, as a page-aligned read would land it.
+        backing = np.zeros(len(blob) + 64, dtype=np.uint8)
+        offset = -backing.ctypes.data % 64
+        backing[offset : offset + len(blob)] = np.frombuffer(blob, dtype=np.uint8)
+
+        result = s.deserialize(memoryview(backing[offset : offset + len(blob)]))
+
+        for key, array in data.items():
+            np.testing.assert_array_equal(result[key], array)
+            assert result[key].flags.aligned
+            if zstd_level is None:
+                assert result[key].ctypes.data % 64 == 0, f"{key} is not 64-byte aligned"
+            else:
+                # Decompressed into a fresh buffer: aligned relative to its start.
+                assert (result[key].ctypes.data - result["a"].ctypes.data) % 64 == 0
+
+    def test_arrow_tables_roundtrip(self):
+        pa = pytest.importorskip("pyarrow")
+        from hypergraph.checkpointers import MsgpackSerializer
+
+        s = MsgpackSerializer()
+        table = pa.table({"id": [1, 2, 3], "text": ["a", "b", "c"]})
+        result = s.deserialize(s.serialize({"table": table, "batch": table.to_batches()[0]}))
+        assert result["table"].equals(table)
+        assert result["batch"].equals(table.to_batches()[0])
+
+    def test_dataclasses_and_models_are_stored_as_dicts(self):
+        from dataclasses import dataclass
+
+        from hypergraph.checkpointers import MsgpackSerializer
+
+        @dataclass
+        class Chunk:
+            text: str
+            score: float
+
+        s = MsgpackSerializer()
+        assert s.deserialize(s.serialize({"chunk": Chunk("hi", 0.5)})) == {"chunk": {"text": "hi", "score": 0.5}}
+
+    def test_zstd_compresses_large_blobs_only(self):
+        pytest.importorskip("zstandard")
+        from hypergraph.checkpointers import MsgpackSerializer
+
+        s = MsgpackSerializer(zstd_level=3)
+        large = {"text": "lorem ipsum " * 10_000}
+        small = {"x": 1}
+        assert len(s.serialize(large)) < len(MsgpackSerializer().serialize(large)) // 10
+        assert s.serialize(small) == MsgpackSerializer().serialize(small)
+        assert s.deserialize(s.serialize(large)) == large
+        # A reader without compression configured still decodes compressed rows.
+        assert MsgpackSerializer().deserialize(s.serialize(large)) == large
+
+    def test_reads_rows_written_by_json_serializer(self):
+        from hypergraph.checkpointers import MsgpackSerializer
+
+        assert MsgpackSerializer().deserialize(JsonSerializer().serialize({"a": [1, 2]})) == {"a": [1, 2]}
+
+    def test_unsupported_types_raise_unless_lossy(self):
+        from hypergraph.checkpointers import MsgpackSerializer
+
+        with pytest.raises(TypeError, match="not msgpack serializable"):
+            MsgpackSerializer().serialize({"s": {1, 2}})
+        s = MsgpackSerializer(lossy=True)
+        assert s.deserialize(s.serialize({"s": {1}})) == {"s": "{1}"}
+
+    async def test_sqlite_checkpointer_folds_array_steps(self, tmp_path):
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("aiosqlite")
+        from hypergraph.checkpointers import MsgpackSerializer, SqliteCheckpointer, StepRecord, StepStatus
+
+        checkpointer = SqliteCheckpointer(str(tmp_path / "msgpack.db"), serializer=MsgpackSerializer(zstd_level=3))
+        embeddings = np.arange(4096, dtype=np.float32).reshape(64, 64)
+        await checkpointer.create_run("wf-arrays", inputs={"doc": "d-1"})
+        await checkpointer.save_step(
+            StepRecord(
+                run_id="wf-arrays",
+                superstep=0,
+                node_name="embed",
+                index=0,
+                status=StepStatus.COMPLETED,
+                input_versions={},
+                values={"embeddings": embeddings},
+            )
+        )
+
+        state = await checkpointer.get_state("wf-arrays")
+        np.testing.assert_array_equal(state["embeddings"], embeddings)
+        assert await checkpointer.get_run_inputs("wf-arrays") == {"doc": "d-1"}
+        await checkpointer.close()
@@ -0,0 +1,148 @@
+"""Tests for the sharded SQLite checkpointer."""
+
+import pytest
+import pytest_asyncio
+
+from hypergraph import AsyncRunner, Graph, RunStatus, interrupt, node
+from hypergraph.checkpointers import ShardedSqliteCheckpointer, StepRecord, StepStatus, WorkflowStatus
+from tests._interrupt_questions import StringQuestion
+
+aiosqlite = pytest.importorskip("aiosqlite")
+
+
+@pytest_asyncio.fixture
+async def sharded(tmp_path):
+    cp = ShardedSqliteCheckpointer(tmp_path / "runs", shards=4)
+    yield cp
+    await cp.close()
+
+
+def _step(run_id, superstep=0, node_name="embed", **kwargs):
+    defaults = {"status": StepStatus.COMPLETED, "input_versions": {"x": 1}, "values": {"n": superstep}}
+    defaults.update(kwargs)
+    return StepRecord(run_id=run_id, superstep=superstep, node_name=node_name, index=superstep, **defaults)
+
+
+@node(output_name="doubled")
+def double(x: int) -> int:
+    return x * 2
+
+
+@node(output_name="draft")
+def make_draft(query: str) -> str:
+    return f"Draft for: {query}"
+
+
+@interrupt(answer_name="decision")
+def approval(draft: str) -> StringQuestion:
+    return StringQuestion(prompt="Approve?", evidence=(draft,))
+
+
+@node(output_name="result")
+def finalize(decision: str) -> str:
+    return f"Final: {decision}"
+
+
+class TestRouting:
+    async def test_runs_spread_across_shards_and_route_back(self, sharded):
+        run_ids = [f"wf-{i}" for i in range(40)]
+        for run_id in run_ids:
+            await sharded.create_run(run_id, graph_name="g")
+            await sharded.save_step(_step(run_id))
+
+        per_shard = [len(await shard.list_runs(limit=None)) for shard in sharded.shards]
+        assert sum(per_shard) == 40
+        assert all(per_shard), "every shard holds some runs"
+        for run_id in run_ids:
+            assert (await sharded.get_run_async(run_id)).id == run_id
+            assert await sharded.shard_for(run_id).get_run_async(run_id) is not None
+        assert await sharded.get_states(run_ids) == {run_id: {"n": 0} for run_id in run_ids}
+
+    async def test_list_runs_merges_newest_first_across_shards(self, sharded):
+        for i in range(12):
+            await sharded.create_run(f"wf-{i}", graph_name="even" if i % 2 == 0 else "odd")
+
+        runs = await sharded.list_runs(limit=5)
+        assert [run.id for run in runs] == [f"wf-{i}" for i in range(11, 6, -1)]
+        evens = await sharded.list_runs(graph_name="even", limit=None)
+        assert [run.id for run in evens] == [f"wf-{i}" for i in range(10, -1, -2)]
+        assert await sharded.count_runs() == 12
+
+    async def test_search_merges_shard_results(self, sharded):
+        for i in range(6):
+            await sharded.create_run(f"wf-{i}")
+            await sharded.save_step(_step(f"wf-{i}", node_name="fetch", status=StepStatus.FAILED, error="TimeoutError"))
+
+        results = await sharded.search_async("TimeoutError", limit=4)
+        assert len(results) == 4
+        assert results.lag == 0
+
+    async def test_open_instances_see_each_others_fork_placements(self, sharded, tmp_path):
+        other = ShardedSqliteCheckpointer(tmp_path / "runs", shards=4)
+        try:
+            await sharded.create_run("wf-source")
+            source_shard = sharded.shards.index(sharded.shard_for("wf-source"))
+            fork_id = next(f"wf-fork-{i}" for i in range(100) if sharded._hash_index(f"wf-fork-{i}") != source_shard)
+            # Looked up before the fork exists: the miss must not stick.
+            assert await other.get_run_async(fork_id) is None
+
+            await sharded.create_run(fork_id, forked_from="wf-source", fork_superstep=0)
+            await sharded.save_step(_step(fork_id, values={"n": 7}))
+
+            assert (await other.get_run_async(fork_id)).forked_from == "wf-source"
+            assert await other.get_states([fork_id]) == {fork_id: {"n": 7}}
+            assert other.shard_for(fork_id) is other.shards[source_shard]
+        finally:
+            await other.close()
+
+    async def test_reopening_with_another_shard_count_is_refused(self, tmp_path):
+        cp = ShardedSqliteCheckpointer(tmp_path / "runs", shards=2)
+        await cp.create_run("wf-1")
+        await cp.close()
+
+        with pytest.raises(ValueError, match="2-shard checkpointer"):
+            ShardedSqliteCheckpointer(tmp_path / "runs", shards=3)
+        reopened = ShardedSqliteCheckpointer(tmp_path / "runs", shards=2)
+        try:
+            assert (await reopened.get_run_async("wf-1")).id == "wf-1"
+        finally:
+            await reopened.close()
+
+
+class TestRunners:
+    async def test_map_children_spread_and_resume_restores_them(self, sharded):
+        runner = AsyncRunner(checkpointer=sharded)
+        graph = Graph([double])
+        values = list(range(30))
+        await runner.map(graph, {"x": values}, map_over="x", workflow_id="batch")
+
+        children = await sharded.list_runs(parent_run_id="batch", limit=None)
+        assert len(children) == 30
+        assert len({sharded.shard_for(child.id) for child in children}) > 1
+
+        result = await runner.map(graph, {"x": values}, map_over="x", workflow_id="batch")
+        assert result.restored_count == 30
+        assert [r["doubled"] for r in result.results] == [value * 2 for value in values]
+
+    async def test_pause_resume_and_fork_lineage(self, sharded, tmp_path):
+        graph = Graph([make_draft, approval, finalize])
+        runner = AsyncRunner(checkpointer=sharded)
+        paused = await runner.run(graph, {"query": "hello"}, workflow_id="wf-pause")
+        assert paused.status == RunStatus.PAUSED
+        resumed = await runner.run(graph, {paused.pause.response_key: "approved"}, workflow_id="wf-pause")
+        assert resumed["result"] == "Final: approved"
+
+        for i in range(3):
+            forked = await runner.run(graph, {"decision": f"v{i}"}, workflow_id=f"wf-fork-{i}", fork_from="wf-pause")
+            assert forked.status == RunStatus.COMPLETED
+        view = await sharded.lineage_async("wf-fork-1")
+        assert view.root_run_id == "wf-pause"
+        assert [row.run.id for row in view] == ["wf-pause", "wf-fork-0", "wf-fork-1", "wf-fork-2"]
+        assert {sharded.shard_for(row.run.id) for row in view} == {sharded.shard_for("wf-pause")}, "forks sit with their source"
+
+        reopened = ShardedSqliteCheckpointer(tmp_path / "runs", shards=4)
+        try:
+            assert (await reopened.get_run_async("wf-fork-1")).status == WorkflowStatus.COMPLETED
+            assert await reopened.get_steps("wf-fork-1") == await sharded.get_steps("wf-fork-1")
+        finally:
+            await reopened.close()
@@ -1,6 +1,7 @@
 """Tests for SqliteCheckpointer."""
 
 import asyncio
+import json
 import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -858,6 +859,591 @@ class TestRetentionPolicyBehavior:
             cp._sync_conn.close()
 
 
+class TestReadConnections:
+    """Pure reads borrow read-only connections instead of queuing behind the writer."""
+
+    async def test_sync_read_does_not_wait_for_an_open_write_transaction(self, checkpointer):
+        await checkpointer.create_run("wf-1")
+        seen: list[list[str]] = []
+        reader = threading.Thread(target=lambda: seen.append([run.id for run in checkpointer.runs()]))
+
+        with checkpointer._sync_lock:
+            db = checkpointer._sync_db()
+            db.execute("BEGIN IMMEDIATE")
+            db.execute("INSERT INTO runs (id, status, created_at) VALUES ('wf-uncommitted', 'active', '2024-01-01')")
+            reader.start()
+            reader.join(timeout=5)
+            db.rollback()
+
+        assert not reader.is_alive(), "the read queued behind the writer lock"
+        assert seen == [["wf-1"]], "a read sees committed rows only"
+
+    async def test_async_read_does_not_wait_for_the_transaction_lock(self, checkpointer):
+        await checkpointer.create_run("wf-1")
+        await checkpointer.save_step(_make_step(run_id="wf-1", values={"x": 1}))
+
+        async with checkpointer._txn_lock():
+            state = await asyncio.wait_for(checkpointer.get_state("wf-1"), timeout=5)
+            runs = await asyncio.wait_for(checkpointer.list_runs(), timeout=5)
+
+        assert state == {"x": 1}
+        assert [run.id for run in runs] == ["wf-1"]
+
+    async def test_read_connections_refuse_writes(self, checkpointer):
+        import sqlite3
+
+        await checkpointer.initialize()
+        with checkpointer._read_db_sync() as db, pytest.raises(sqlite3.OperationalError, match="readonly"):
+            db.execute("DELETE FROM runs")
+        async with checkpointer._read_db() as db:
+            with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                await db.execute("DELETE FROM runs")
+
+    async def test_writer_lock_holder_reads_its_own_uncommitted_rows(self, checkpointer):
+        await checkpointer.create_run("wf-1")
+
+        with checkpointer._sync_lock:
+            db = checkpointer._sync_db()
+            db.execute("BEGIN IMMEDIATE")
+            db.execute("INSERT INTO runs (id, status, created_at) VALUES ('wf-uncommitted', 'active', '2024-01-01')")
+            try:
+                assert sorted(run.id for run in checkpointer.runs()) == ["wf-1", "wf-uncommitted"]
+            finally:
+                db.rollback()
+        assert not checkpointer._sync_lock.held_by_current_thread()
+
+    async def test_connection_that_fails_to_begin_is_dropped(self):
+        from hypergraph.checkpointers._read_pool import AsyncReadPool, SyncReadPool
+
+        class _Conn:
+            def __init__(self, fail: bool) -> None:
+                self.fail = fail
+                self.closed = False
+
+            def execute(self, sql):
+                if self.fail:
+                    raise RuntimeError("disk I/O error")
+
+            def rollback(self):
+                pass
+
+            def close(self):
+                self.closed = True
+
+        broken, healthy = _Conn(fail=True), _Conn(fail=False)
+        pool = SyncReadPool(iter([broken, healthy]).__next__, 1)
+        with pytest.raises(RuntimeError), pool.connection():
+            pass
+        assert broken.closed and pool.idle_connections() == []
+        with pool.connection() as conn:
+            assert conn is healthy, "the slot was released for a fresh connection"
+
+        class _AsyncConn(_Conn):
+            async def execute(self, sql):
+                super().execute(sql)
+
+            async def rollback(self):
+                pass
+
+            async def close(self):
+                super().close()
+
+        conns = iter([_AsyncConn(fail=True), _AsyncConn(fail=False)])
+
+        async def connect():
+            return next(conns)
+
+        async_pool = AsyncReadPool(connect, 1)
+        with pytest.raises(RuntimeError):
+            async with async_pool.connection():
+                pass
+        assert async_pool.idle_connections() == []
+        async with async_pool.connection() as conn:
+            assert not conn.fail
+
+    async def test_pool_is_bounded_and_reused(self, tmp_path):
+        cp = SqliteCheckpointer(str(tmp_path / "pool.db"), read_connections=2)
+        try:
+            await cp.create_run("wf-1")
+            await asyncio.gather(*(cp.get_run_async("wf-1") for _ in range(10)))
+            assert len(cp._async_read_pool.idle_connections()) == 2
+        finally:
+            await cp.close()
+
+    async def test_zero_read_connections_reads_through_the_writer(self, tmp_path):
+        cp = SqliteCheckpointer(str(tmp_path / "writer-only.db"), read_connections=0)
+        try:
+            await cp.create_run("wf-1")
+            assert cp.get_run("wf-1") is not None
+            assert (await cp.get_run_async("wf-1")) is not None
+            assert cp._sync_read_pool is None and cp._async_read_pool is None
+        finally:
+            await cp.close()
+
+    async def test_memory_store_keeps_reads_on_the_writer(self):
+        cp = SqliteCheckpointer(":memory:")
+        try:
+            await cp.create_run("wf-1")
+            assert [run.id for run in cp.runs()] == ["wf-1"]
+            assert cp._sync_read_pool is None
+        finally:
+            await cp.close()
+
+    @pytest.mark.parametrize("size", [-1, 1.5, True])
+    def test_rejects_invalid_pool_size(self, tmp_path, size):
+        with pytest.raises(ValueError, match="read_connections"):
+            SqliteCheckpointer(str(tmp_path / "bad.db"), read_connections=size)
+
+
+class TestTtlCompaction:
+    """compact() enforces CheckpointPolicy.ttl on whole, terminal runs."""
+
+    async def _finished_run(self, cp, run_id, *, status=WorkflowStatus.COMPLETED, **kwargs):
+        await cp.create_run(run_id, **kwargs)
+        await cp.save_step(_make_step(run_id=run_id, values={"blob": "x" * 4000}))
+        await cp.update_run_status(run_id, status)
+
+    async def test_without_ttl_nothing_expires(self, checkpointer):
+        await self._finished_run(checkpointer, "wf-old")
+
+        report = await checkpointer.compact(now=datetime.now(timezone.utc) + timedelta(days=365))
+
+        assert report.runs_deleted == 0
+        assert report.transactions == 0
+        assert checkpointer.get_run("wf-old") is not None
+
+    async def test_expires_terminal_runs_with_nested_runs_and_keeps_live_ones(self, checkpointer):
+        checkpointer.policy = CheckpointPolicy(ttl=timedelta(hours=1))
+        await self._finished_run(checkpointer, "wf-done")
+        await self._finished_run(checkpointer, "wf-done/child", parent_run_id="wf-done")
+        await self._finished_run(checkpointer, "wf-failed", status=WorkflowStatus.FAILED)
+        await checkpointer.create_run("wf-active")
+        await checkpointer.save_step(_make_step(run_id="wf-active"))
+
+        assert (await checkpointer.compact()).runs_deleted == 0, "nothing is an hour old yet"
+        report = await checkpointer.compact(now=datetime.now(timezone.utc) + timedelta(hours=2))
+
+        assert report.runs_deleted == 3
+        assert report.steps_deleted == 3
+        assert report.complete
+        assert [run.id for run in checkpointer.runs()] == ["wf-active"]
+        assert checkpointer.steps("wf-done/child") == []
+        assert report.bytes_reclaimed > 0, "a fresh store is incremental auto-vacuum"
+
+    async def test_fork_source_outlives_its_fork_then_expires_leaf_first(self, checkpointer):
+        checkpointer.policy = CheckpointPolicy(ttl=timedelta(hours=1))
+        await self._finished_run(checkpointer, "wf-source")
+        await checkpointer.create_run("wf-fork", forked_from="wf-source")
+        later = datetime.now(timezone.utc) + timedelta(hours=2)
+
+        await checkpointer.compact(now=later)
+        assert checkpointer.get_run("wf-source") is not None, "a live fork pins its source"
+
+        await checkpointer.update_run_status("wf-fork", WorkflowStatus.COMPLETED)
+        report = await checkpointer.compact(now=later)
+        assert report.runs_deleted == 2
+        assert checkpointer.runs() == []
+
+    async def test_max_batches_bounds_one_call(self, checkpointer):
+        checkpointer.policy = CheckpointPolicy(ttl=timedelta(hours=1))
+        for index in range(5):
+            await self._finished_run(checkpointer, f"wf-{index}")
+        later = datetime.now(timezone.utc) + timedelta(hours=2)
+
+        first = await checkpointer.compact(now=later, batch_size=2, max_batches=1)
+        assert (first.runs_deleted, first.complete) == (2, False)
+        rest = checkpointer.compact_sync(now=later, batch_size=2)
+        assert (rest.runs_deleted, rest.complete) == (3, True)
+        assert checkpointer.runs() == []
+
+    async def test_archive_keeps_expired_runs_readable(self, tmp_path):
+        doc = "lorem ipsum " * 200
+        cp = SqliteCheckpointer(tmp_path / "hot.db", policy=CheckpointPolicy(ttl=timedelta(hours=1)), dedupe_values=True)
+        try:
+            await self._finished_run(cp, "wf-done")
+            await cp.save_step(_make_step(run_id="wf-done", superstep=1, node_name="echo", index=1, values={"doc": doc}))
+            await self._finished_run(cp, "wf-done/child", parent_run_id="wf-done")
+            await cp.create_run("wf-active")
+            later = datetime.now(timezone.utc) + timedelta(hours=2)
+
+            report = await cp.compact(now=later, archive=tmp_path / "cold.db")
+            assert (report.runs_deleted, report.runs_archived) == (2, 2)
+            assert [run.id for run in cp.runs()] == ["wf-active"]
+        finally:
+            await cp.close()
+
+        cold = SqliteCheckpointer(tmp_path / "cold.db")
+        try:
+            assert sorted(run.id for run in cold.runs()) == ["wf-done", "wf-done/child"]
+            assert cold.state("wf-done") == {"blob": "x" * 4000, "doc": doc}
+            assert cold.get_run("wf-done").status == WorkflowStatus.COMPLETED
+        finally:
+            await cold.close()
+
+    async def test_sync_archive_appends_across_calls(self, tmp_path):
+        import sqlite3
+
+        cp = SqliteCheckpointer(tmp_path / "hot.db", policy=CheckpointPolicy(ttl=timedelta(hours=1)))
+        later = datetime.now(timezone.utc) + timedelta(hours=2)
+        try:
+            for run_id in ("wf-1", "wf-2"):
+                cp.create_run_sync(run_id)
+                cp.update_run_status_sync(run_id, WorkflowStatus.COMPLETED)
+                assert cp.compact_sync(now=later, archive=tmp_path / "cold.db").runs_archived == 1
+        finally:
+            await cp.close()
+
+        probe = sqlite3.connect(tmp_path / "cold.db")
+        try:
+            assert [row[0] for row in probe.execute("SELECT id FROM runs ORDER BY id")] == ["wf-1", "wf-2"]
+        finally:
+            probe.close()
+
+    async def test_compaction_leaves_an_older_store_to_an_explicit_conversion(self, tmp_path):
+        import sqlite3
+
+        path = tmp_path / "legacy.db"
+        cp = SqliteCheckpointer(path, policy=CheckpointPolicy(ttl=timedelta(hours=1)))
+        try:
+            await cp.create_run("wf-1")
+        finally:
+            await cp.close()
+        probe = sqlite3.connect(path)
+        try:
+            probe.execute("PRAGMA auto_vacuum = NONE")
+            probe.execute("VACUUM")
+            assert probe.execute("PRAGMA auto_vacuum").fetchone() == (0,)
+        finally:
+            probe.close()
+
+        cp = SqliteCheckpointer(path, policy=CheckpointPolicy(ttl=timedelta(hours=1)))
+        try:
+            await cp.create_run("wf-old")
+            await cp.save_step(_make_step(run_id="wf-old", values={"blob": "x" * 40_000}))
+            await cp.update_run_status("wf-old", WorkflowStatus.COMPLETED)
+            report = await cp.compact(now=datetime.now(timezone.utc) + timedelta(hours=2))
+            assert report.runs_deleted == 1
+            assert report.bytes_reclaimed == 0, "no full rewrite behind the caller's back"
+            assert report.free_bytes > 0
+
+            assert await cp.convert_to_incremental() is True
+            assert await cp.convert_to_incremental() is False
+            assert (await cp.compact()).free_bytes == 0
+        finally:
+            await cp.close()
+        probe = sqlite3.connect(path)
+        try:
+            assert probe.execute("PRAGMA auto_vacuum").fetchone() == (2,)
+        finally:
+            probe.close()
+
+    async def test_vacuum_returns_pages_in_a_bounded_number_of_slices(self, checkpointer, monkeypatch):
+        import hypergraph.checkpointers.sqlite as sqlite_module
+
+        monkeypatch.setattr(sqlite_module, "_VACUUM_PAGE_BUDGET", 1)
+        monkeypatch.setattr(sqlite_module, "_VACUUM_MAX_SLICES", 2)
+        checkpointer.policy = CheckpointPolicy(ttl=timedelta(hours=1))
+        await self._finished_run(checkpointer, "wf-old")
+        await checkpointer.save_step(_make_step(run_id="wf-old", superstep=1, node_name="big", index=1, values={"blob": "y" * 40_000}))
+
+        report = await checkpointer.compact(now=datetime.now(timezone.utc) + timedelta(hours=2))
+
+        page_size = checkpointer._sync_db().execute("PRAGMA page_size").fetchone()[0]
+        assert report.bytes_reclaimed == 2 * page_size
+        assert report.free_bytes > 0, "the rest waits for the next call"
+
+    @pytest.mark.parametrize("kwargs", [{"batch_size": 0}, {"batch_size": True}, {"max_batches": 0}])
+    def test_rejects_invalid_bounds(self, kwargs):
+        cp = SqliteCheckpointer(":memory:", policy=CheckpointPolicy(ttl=timedelta(hours=1)))
+        with pytest.raises(ValueError, match="must be an int >= 1"):
+            cp.compact_sync(**kwargs)
+
+
+class _CountingSerializer(Serializer):
+    def __init__(self) -> None:
+        self.decoded = 0
+        self._json = JsonSerializer()
+
+    def serialize(self, value: Any) -> bytes:
+        return self._json.serialize(value)
+
+    def deserialize(self, data: bytes) -> Any:
+        self.decoded += 1
+        return self._json.deserialize(data)
+
+
+class TestKeyedStateReads:
+    """keys=[...] decodes only the steps that wrote a requested output."""
+
+    async def _three_steps(self, cp, run_id="wf-1"):
+        await cp.create_run(run_id)
+        await cp.save_step(_make_step(run_id=run_id, node_name="a", values={"a": 1, "shared": "old"}))
+        await cp.save_step(_make_step(run_id=run_id, superstep=1, node_name="b", index=1, values={"b": [2] * 100}))
+        await cp.save_step(_make_step(run_id=run_id, superstep=2, node_name="c", index=2, values={"shared": "new"}))
+
+    async def test_keyed_read_matches_the_full_fold(self, checkpointer):
+        await self._three_steps(checkpointer)
+
+        assert await checkpointer.get_state("wf-1", keys=["shared", "a", "nope"]) == {"shared": "new", "a": 1}
+        assert list(await checkpointer.get_state("wf-1", keys=["shared", "a"])) == ["shared", "a"], "requested order"
+        assert await checkpointer.get_state("wf-1", superstep=1, keys=["shared"]) == {"shared": "old"}
+        assert checkpointer.state("wf-1", keys=["b"]) == {"b": [2] * 100}
+        assert checkpointer.values("wf-1", key="shared") == {"shared": "new"}
+        assert checkpointer.values("wf-1", key="nope") == {}
+        assert await checkpointer.get_state("wf-1", keys=[]) == {}
+
+    async def test_steps_without_a_requested_key_are_never_decoded(self, tmp_path):
+        serializer = _CountingSerializer()
+        cp = SqliteCheckpointer(tmp_path / "keyed.db", serializer=serializer)
+        try:
+            await self._three_steps(cp)
+            serializer.decoded = 0
+            assert await cp.get_state("wf-1", keys=["shared"]) == {"shared": "new"}
+            assert serializer.decoded == 1, "newest step answers; the scan stops there"
+            serializer.decoded = 0
+            assert cp.state("wf-1", keys=["a"]) == {"a": 1}
+            assert serializer.decoded == 1, "the 'b' and 'c' steps are skipped by their key index"
+        finally:
+            await cp.close()
+
+    async def test_deduplicated_outputs_beside_a_requested_key_stay_encoded(self, tmp_path):
+        serializer = _CountingSerializer()
+        cp = SqliteCheckpointer(tmp_path / "keyed-split.db", serializer=serializer, dedupe_values=True)
+        try:
+            await cp.create_run("wf-1")
+            await cp.save_step(_make_step(values={"answer": "x" * 200, "context": ["y" * 200] * 50, "score": 1}))
+            serializer.decoded = 0
+            assert await cp.get_state("wf-1", keys=["answer"]) == {"answer": "x" * 200}
+            assert serializer.decoded == 2, "the inline blob and the answer's own blob; context is never decoded"
+        finally:
+            await cp.close()
+
+    async def test_bulk_keyed_read_keeps_runs_without_the_key(self, checkpointer):
+        await self._three_steps(checkpointer, "wf-1")
+        await checkpointer.create_run("wf-2")
+        await checkpointer.save_step(_make_step(run_id="wf-2", values={"other": 1}))
+
+        expected = {"wf-1": {"b": [2] * 100}, "wf-2": {}}
+        assert await checkpointer.get_states(["wf-1", "wf-2", "wf-none"], keys=["b"]) == expected
+        assert checkpointer.get_states_sync(["wf-1", "wf-2", "wf-none"], keys=["b"]) == expected
+
+    async def test_steps_written_before_the_key_index_are_still_read(self, tmp_path):
+        import sqlite3
+
+        path = tmp_path / "legacy.db"
+        cp = SqliteCheckpointer(path)
+        try:
+            await self._three_steps(cp)
+            probe = sqlite3.connect(path)
+            try:
+                probe.execute("UPDATE steps SET value_keys = NULL")
+                probe.commit()
+            finally:
+                probe.close()
+            assert await cp.get_state("wf-1", keys=["a", "shared"]) == {"a": 1, "shared": "new"}
+            assert cp.get_states_sync(["wf-1"], keys=["b"]) == {"wf-1": {"b": [2] * 100}}
+        finally:
+            await cp.close()
+
+    async def test_keyed_read_resolves_deduplicated_values(self, tmp_path):
+        doc = "lorem ipsum " * 200
+        cp = SqliteCheckpointer(tmp_path / "keyed-dedupe.db", dedupe_values=True)
+        try:
+            await cp.create_run("wf-1")
+            await cp.save_step(_make_step(values={"doc": doc, "n": 1}))
+            assert await cp.get_state("wf-1", keys=["doc"]) == {"doc": doc}
+            assert await cp.get_states(["wf-1"], keys=["n"]) == {"wf-1": {"n": 1}}
+        finally:
+            await cp.close()
+
+
+class TestValueDedupe:
+    """dedupe_values=True stores each large step value once, by content."""
+
+    DOC = "lorem ipsum " * 200
+
+    @staticmethod
+    def _blobs(path) -> list[tuple[int, int]]:
+        """``(size, refs)`` per stored blob, largest first."""
+        import sqlite3
+
+        probe = sqlite3.connect(path)
+        try:
+            return probe.execute("SELECT length(data), refs FROM value_blobs ORDER BY length(data) DESC").fetchall()
+        finally:
+            probe.close()
+
+    async def test_repeated_values_are_stored_once_and_read_back_transparently(self, tmp_path):
+        path = tmp_path / "dedupe.db"
+        cp = SqliteCheckpointer(path, dedupe_values=True)
+        try:
+            for run_id in ("wf-1", "wf-2"):
+                await cp.create_run(run_id)
+                await cp.save_step(_make_step(run_id=run_id, node_name="load", values={"doc": self.DOC, "n": 1}))
+                await cp.save_step(_make_step(run_id=run_id, superstep=1, node_name="echo", index=1, values={"copy": self.DOC}))
+
+            assert self._blobs(path) == [(len(json.dumps(self.DOC)), 4)], "one blob, four referencing steps; n stays inline"
+            assert await cp.get_state("wf-1") == {"doc": self.DOC, "n": 1, "copy": self.DOC}
+            assert cp.state("wf-2", superstep=0) == {"doc": self.DOC, "n": 1}
+            assert list(cp.steps("wf-1")[0].values) == ["doc", "n"], "key order survives"
+            assert [step.values for step in await cp.get_steps("wf-2")] == [{"doc": self.DOC, "n": 1}, {"copy": self.DOC}]
+            assert cp.get_states_sync(["wf-1", "wf-2"]) == await cp.get_states(["wf-1", "wf-2"])
+            assert cp.search("echo")[0].values == {"copy": self.DOC}
+        finally:
+            await cp.close()
+
+    async def test_latest_retention_collects_blobs_nothing_references(self, tmp_path):
+        path = tmp_path / "dedupe-latest.db"
+        cp = SqliteCheckpointer(path, retention="latest", dedupe_values=True)
+        try:
+            await cp.create_run("wf-chat")
+            messages: list[str] = []
+            for superstep in range(5):
+                messages = [*messages, f"turn {superstep}: " + "x" * 100]
+                step = _make_step(run_id="wf-chat", superstep=superstep, node_name="chat", index=superstep, values={"messages": messages})
+                await cp.save_step(step)
+                await cp.save_step(step)  # an upsert of the same value must not leak a reference
+
+            assert [refs for _, refs in self._blobs(path)] == [1, 1], "the kept step and the retention baseline"
+            assert await cp.get_state("wf-chat") == {"messages": messages}
+        finally:
+            await cp.close()
+
+    async def test_shared_blob_expires_with_the_last_run_that_names_it(self, tmp_path):
+        path = tmp_path / "dedupe-ttl.db"
+        cp = SqliteCheckpointer(path, policy=CheckpointPolicy(ttl=timedelta(hours=1)), dedupe_values=True)
+        try:
+            for run_id in ("wf-old", "wf-live"):
+                await cp.create_run(run_id)
+                await cp.save_step(_make_step(run_id=run_id, values={"doc": self.DOC}))
+            await cp.update_run_status("wf-old", WorkflowStatus.COMPLETED)
+            later = datetime.now(timezone.utc) + timedelta(hours=2)
+
+            report = await cp.compact(now=later)
+            assert (report.runs_deleted, report.blobs_deleted) == (1, 0)
+            assert cp.state("wf-live") == {"doc": self.DOC}
+
+            await cp.update_run_status("wf-live", WorkflowStatus.COMPLETED)
+            assert cp.compact_sync(now=later).blobs_deleted == 1
+            assert self._blobs(path) == []
+        finally:
+            await cp.close()
+
+    async def test_store_switches_dedupe_on_and_off_in_place(self, tmp_path):
+        path = tmp_path / "dedupe-switch.db"
+        inline = SqliteCheckpointer(path)
+        await inline.create_run("wf-1")
+        await inline.save_step(_make_step(run_id="wf-1", values={"doc": self.DOC}))
+        await inline.close()
+
+        deduped = SqliteCheckpointer(path, dedupe_values=True)
+        await deduped.save_step(_make_step(run_id="wf-1", superstep=1, node_name="echo", index=1, values={"copy": self.DOC}))
+        await deduped.close()
+
+        reader = SqliteCheckpointer(path)
+        try:
+            assert await reader.get_state("wf-1") == {"doc": self.DOC, "copy": self.DOC}
+        finally:
+            await reader.close()
+
+
+class TestDeltaValues:
+    """delta_values stores a list that only grew as its appended tail."""
+
+    @staticmethod
+    def _delta_steps(path) -> int:
+        import sqlite3
+
+        probe = sqlite3.connect(path)
+        try:
+            (count,) = probe.execute("SELECT COUNT(*) FROM steps WHERE value_refs LIKE '%\"base\"%'").fetchone()
+            return count
+        finally:
+            probe.close()
+
+    @staticmethod
+    async def _chat(cp, turns: int, run_id="wf-chat") -> list[list[dict[str, str]]]:
+        """Save one growing ``messages`` list per superstep, appended in place like a chat loop does."""
+        await cp.create_run(run_id)
+        messages: list[dict[str, str]] = []
+        history = []
+        for turn in range(turns):
+            messages.append({"role": "user", "text": f"turn {turn}"})
+            await cp.save_step(_make_step(run_id=run_id, superstep=turn, node_name="chat", index=turn, values={"messages": messages, "turn": turn}))
+            history.append(list(messages))
+        return history
+
+    async def test_grown_lists_store_tails_and_read_back_whole(self, tmp_path):
+        path = tmp_path / "delta.db"
+        cp = SqliteCheckpointer(path, delta_values=["messages"])
+        try:
+            history = await self._chat(cp, 40)
+
+            assert self._delta_steps(path) == 37, "full values at turns 0, 17 and 34; every other turn is a delta"
+            assert await cp.get_state("wf-chat") == {"messages": history[-1], "turn": 39}
+            assert await cp.get_state("wf-chat", superstep=20) == {"messages": history[20], "turn": 20}
+            assert await cp.get_state("wf-chat", keys=["messages"]) == {"messages": history[-1]}
+            steps = await cp.get_steps("wf-chat")
+            assert [step.values["messages"] for step in steps] == history
+            assert steps[1].values["messages"][0] is not steps[2].values["messages"][0], "each step decodes its own copy"
+            assert [step.values for step in cp.steps("wf-chat")] == [step.values for step in steps]
+            assert cp.get_states_sync(["wf-chat"]) == await cp.get_states(["wf-chat"])
+        finally:
+            await cp.close()
+
+    async def test_rewritten_lists_and_unselected_outputs_stay_whole(self, tmp_path):
+        path = tmp_path / "delta-rewrite.db"
+        cp = SqliteCheckpointer(path, delta_values=lambda name, value: name != "log")
+        try:
+            await cp.create_run("wf-1")
+            await cp.save_step(_make_step(run_id="wf-1", values={"items": [1, 2, 3], "log": ["a"]}))
+            await cp.save_step(_make_step(run_id="wf-1", superstep=1, node_name="sort", index=1, values={"items": [3, 2, 1, 0], "log": ["a", "b"]}))
+            await cp.save_step(_make_step(run_id="wf-1", superstep=2, node_name="grow", index=2, values={"items": [3, 2, 1, 0, -1]}))
+
+            assert self._delta_steps(path) == 1, "only the append to [3, 2, 1, 0] is a delta"
+            assert cp.state("wf-1") == {"items": [3, 2, 1, 0, -1], "log": ["a", "b"]}
+        finally:
+            await cp.close()
+
+    async def test_store_reads_back_without_the_option_and_after_a_restart(self, tmp_path):
+        path = tmp_path / "delta-reopen.db"
+        writer = SqliteCheckpointer(path, delta_values=True)
+        history = await self._chat(writer, 5)
+        await writer.close()
+
+        resumed = SqliteCheckpointer(path, delta_values=True)
+        await resumed.save_step(
+            _make_step(run_id="wf-chat", superstep=5, node_name="chat", index=5, values={"messages": [*history[-1], {"role": "bot"}]})
+        )
+        await resumed.close()
+        assert self._delta_steps(path) == 4, "a new process writes the full list before extending it"
+
+        reader = SqliteCheckpointer(path)
+        try:
+            assert (await reader.get_state("wf-chat"))["messages"] == [*history[-1], {"role": "bot"}]
+        finally:
+            await reader.close()
+
+    async def test_rewritten_base_is_reported_not_guessed(self, tmp_path):
+        cp = SqliteCheckpointer(tmp_path / "delta-broken.db", delta_values=True)
+        try:
+            await self._chat(cp, 3)
+            other = SqliteCheckpointer(tmp_path / "delta-broken.db")
+            other.save_step_sync(_make_step(run_id="wf-chat", superstep=1, node_name="chat", index=1, values={"messages": [{"role": "edited"}] * 2}))
+            await other.close()
+
+            with pytest.raises(RuntimeError, match="no longer holds the value it extended"):
+                await cp.get_state("wf-chat")
+        finally:
+            await cp.close()
+
+    def test_delta_values_needs_full_retention(self, tmp_path):
+        with pytest.raises(ValueError, match='needs retention="full"'):
+            SqliteCheckpointer(tmp_path / "delta.db", retention="latest", delta_values=True)
+        with pytest.raises(ValueError, match="collection of output names"):
+            SqliteCheckpointer(tmp_path / "delta.db", delta_values="messages")
+
+
 class TestSearch:
     async def test_search_by_node_name(self, checkpointer):
         """FTS5 search finds steps by node name."""
@@ -918,6 +1504,106 @@ class TestSearch:
         assert [r.superstep for r in async_results][:2] == [1, 0]
 
 
+def _fts_integrity_check(path) -> None:
+    import sqlite3
+
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("INSERT INTO steps_fts(steps_fts) VALUES ('integrity-check')")
+    finally:
+        conn.close()
+
+
+class TestSearchIndexModes:
+    async def test_off_leaves_writes_unindexed_until_asked(self, tmp_path):
+        path = str(tmp_path / "test.db")
+        cp = SqliteCheckpointer(path, search_index="off")
+        try:
+            await cp.create_run("wf-1")
+            await cp.save_step(_make_step(node_name="embed", index=0))
+            await cp.save_step(_make_step(node_name="retrieve", index=1, superstep=1))
+
+            results = await cp.search_async("embed")
+            assert list(results) == []
+            assert results.lag == 2
+
+            assert await cp.index_search() == 2
+            results = cp.search("embed")
+            assert [step.node_name for step in results] == ["embed"]
+            assert results.lag == 0
+        finally:
+            await cp.close()
+        _fts_integrity_check(path)
+
+    async def test_indexed_rows_stay_exact_through_updates_and_deletes(self, tmp_path):
+        path = str(tmp_path / "test.db")
+        cp = SqliteCheckpointer(path, search_index="off", retention="latest")
+        try:
+            await cp.create_run("wf-1")
+            await cp.save_step(_make_step(node_name="fetch", index=0, status=StepStatus.FAILED, error="TimeoutError"))
+            await cp.index_search()
+            # Re-saving the same step rewrites an indexed row; the next
+            # "fetch" under latest retention deletes it.
+            await cp.save_step(_make_step(node_name="fetch", index=0, status=StepStatus.FAILED, error="ConnectionReset"))
+            assert [step.error for step in cp.search("ConnectionReset")] == ["ConnectionReset"]
+            assert list(cp.search("TimeoutError")) == []
+            await cp.save_step(_make_step(node_name="fetch", index=1, superstep=1))
+            assert cp.search("fetch").lag == 1
+        finally:
+            await cp.close()
+        _fts_integrity_check(path)
+
+    async def test_deferred_index_catches_up_in_the_background(self, tmp_path):
+        cp = SqliteCheckpointer(str(tmp_path / "test.db"), search_index="deferred")
+        # Far longer than the test: only the explicit catch-up indexes.
+        cp._search_index_interval = 3600
+        try:
+            await cp.create_run("wf-1")
+            for superstep in range(5):
+                await cp.save_step(_make_step(node_name=f"node{superstep}", index=superstep, superstep=superstep))
+            assert cp.search("node3").lag == 5
+
+            assert await asyncio.to_thread(cp._search_indexer.catch_up, 30)
+            results = cp.search("node3")
+            assert [step.node_name for step in results] == ["node3"]
+            assert results.lag == 0
+        finally:
+            await cp.close()
+
+    async def test_mode_belongs_to_the_store(self, tmp_path):
+        path = str(tmp_path / "test.db")
+        cp = SqliteCheckpointer(path)
+        await cp.create_run("wf-1")
+        await cp.save_step(_make_step(node_name="embed", index=0))
+        await cp.close()
+
+        deferred = SqliteCheckpointer(path, search_index="off")
+        await deferred.save_step(_make_step(node_name="embed", index=1, superstep=1))
+        assert deferred.search("embed").lag == 1
+        await deferred.close()
+
+        adopted = SqliteCheckpointer(path)
+        await adopted.save_step(_make_step(node_name="embed", index=2, superstep=2))
+        assert adopted.search_index == "off"
+        assert len(adopted.search("embed")) == 1
+        await adopted.close()
+
+        eager = SqliteCheckpointer(path, search_index="eager")
+        try:
+            results = eager.search("embed")
+            assert results.lag == 0
+            assert [step.superstep for step in results] == [2, 1, 0]
+            await eager.save_step(_make_step(node_name="embed", index=3, superstep=3))
+            assert len(eager.search("embed")) == 4
+        finally:
+            await eager.close()
+        _fts_integrity_check(path)
+
+    def test_rejects_unknown_mode(self, tmp_path):
+        with pytest.raises(ValueError, match="search_index must be one of"):
+            SqliteCheckpointer(str(tmp_path / "test.db"), search_index="lazy")
+
+
 class TestMigration:
     def test_fresh_db_gets_v6_schema(self, tmp_path):
         """A new database gets v6 schema automatically."""
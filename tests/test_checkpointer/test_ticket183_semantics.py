@@ -11,6 +11,7 @@ from hypergraph import AsyncRunner, Graph, SyncRunner, node
 from hypergraph.checkpointers import (
     Checkpointer,
     CheckpointPolicy,
+    LogCheckpointer,
     MemoryCheckpointer,
     SqliteCheckpointer,
     SqliteRunInspector,
@@ -22,9 +23,14 @@ from hypergraph.exceptions import WorkflowForkError
 from hypergraph.runners import RunStatus
 
 
-@pytest.fixture(params=["memory", "sqlite"])
+@pytest.fixture(params=["memory", "sqlite", "log"])
 async def async_checkpointer(request: pytest.FixtureRequest, tmp_path):
-    checkpointer = MemoryCheckpointer() if request.param == "memory" else SqliteCheckpointer(str(tmp_path / "runs.db"))
+    if request.param == "memory":
+        checkpointer = MemoryCheckpointer()
+    elif request.param == "sqlite":
+        checkpointer = SqliteCheckpointer(str(tmp_path / "runs.db"))
+    else:
+        checkpointer = LogCheckpointer(tmp_path / "runs")
 
     try:
         yield checkpointer
@@ -228,9 +228,10 @@ def test_hypertable_docs_pin_graph_backed_receipt_contract() -> None:
     human = _read("docs/03-patterns/07-human-in-the-loop.md")
 
     parameters = inspect.signature(Graph.as_table).parameters
-    assert tuple(parameters) == ("self", "identity", "store", "runner", "page_max_concurrency", "on_error", "name")
+    assert tuple(parameters) == ("self", "identity", "store", "runner", "page_max_concurrency", "max_workers", "on_error", "name")
     assert parameters["runner"].default is None
     assert parameters["page_max_concurrency"].default == 16
+    assert parameters["max_workers"].default == 1
     assert parameters["on_error"].default == "raise"
     assert parameters["name"].default is None
     assert isinstance(HyperTable.store, property)
@@ -1113,6 +1114,10 @@ def test_durable_host_docs_pin_public_contract() -> None:
         "serializer",
         "max_active_runs",
         "max_admission_units",
+        "read_connections",
+        "dedupe_values",
+        "search_index",
+        "delta_values",
     )
     assert tuple(inspect.signature(serve).parameters) == ("graphs", "home", "deployment_version", "accepts")
     from hypergraph.host import Host
@@ -1239,6 +1244,7 @@ def test_durable_host_docs_pin_public_contract() -> None:
 
     assert "max_active_runs" in host_api
     assert "ADMISSION_LIMITED" in host_api
+    assert "read_connections" in host_api
     assert "ProcessLocalLimiter" in host_api
     assert "provider_limit" in host_api
     assert isinstance(RunHome.max_active_runs, property)
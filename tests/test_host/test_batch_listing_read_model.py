@@ -129,3 +129,73 @@ def test_the_listing_writes_nothing_to_the_run_home(home, ledger):
     read.get_batch_sync(read.list_batches_sync()[0].batch_ref)
 
     assert home._sync_db().total_changes == before
+
+
+async def test_a_batch_summary_reports_the_census_get_batch_folds(home, ledger):
+    graph = ingestion_graph()
+    host = serve(graph, home=home, deployment_version="v1")
+    receipt = await submit_ids(host, graph, ["work-clean", "work-two", "work-three"], "sweep-summary")
+    read = RunHomeReadModel(host.client)
+
+    summary = await read.get_batch_summary(receipt.batch_ref)
+    detail = await read.get_batch(receipt.batch_ref)
+
+    assert summary is not None and detail is not None
+    assert summary.counts == detail.counts
+    assert summary.item_count == 3
+    assert summary.settled == detail.settled
+
+    async with worker(host):
+        await batch_where(host.client, receipt.batch_ref, lambda view: view.settled)
+
+    settled = await read.get_batch_summary(receipt.batch_ref)
+    assert settled.counts == (await read.get_batch(receipt.batch_ref)).counts
+    assert settled.settled
+    assert settled == read.get_batch_summary_sync(receipt.batch_ref)
+
+
+async def test_batch_items_page_in_manifest_order_with_the_words_get_batch_reports(home, ledger):
+    graph = ingestion_graph()
+    host = serve(graph, home=home, deployment_version="v1")
+    ids = [f"work-{index}" for index in range(5)]
+    receipt = await submit_ids(host, graph, ids, "sweep-pages")
+    read = RunHomeReadModel(host.client)
+    detail = await read.get_batch(receipt.batch_ref)
+
+    first = await read.list_batch_items(receipt.batch_ref, limit=2)
+    second = await read.list_batch_items(receipt.batch_ref, after=first[-1].item_key, limit=2)
+    third = read.list_batch_items_sync(receipt.batch_ref, after=second[-1].item_key, limit=2)
+
+    paged = [*first, *second, *third]
+    assert [item.item_key for item in paged] == list(detail.items)
+    assert paged == list(detail.items.values())
+    assert await read.list_batch_items(receipt.batch_ref, after=third[-1].item_key) == []
+
+    with pytest.raises(ValueError, match="has no item 'never-listed'"):
+        await read.list_batch_items(receipt.batch_ref, after="never-listed")
+    with pytest.raises(ValueError, match="limit must be a positive int"):
+        await read.list_batch_items(receipt.batch_ref, limit=0)
+
+
+async def test_a_home_opened_before_the_census_existed_backfills_it(tmp_path, ledger):
+    from hypergraph import RunHome
+
+    uri = f"file:{tmp_path / 'runs.db'}"
+    home = RunHome.open(uri)
+    graph = ingestion_graph()
+    host = serve(graph, home=home, deployment_version="v1")
+    receipt = await submit_ids(host, graph, ["work-clean", "work-two"], "sweep-backfill")
+    expected = (await RunHomeReadModel(host.client).get_batch(receipt.batch_ref)).counts
+    db = home._sync_db()
+    db.execute("DROP TABLE host_batch_children")
+    db.execute("DROP TABLE host_batch_census")
+    db.commit()
+    await home.close()
+
+    reopened = RunHome.open(uri)
+    try:
+        summary = await RunHomeReadModel(serve(graph, home=reopened, deployment_version="v1").client).get_batch_summary(receipt.batch_ref)
+        assert summary is not None
+        assert summary.counts == expected
+    finally:
+        await reopened.close()
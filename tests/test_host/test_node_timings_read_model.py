@@ -218,3 +218,80 @@ def test_the_timing_read_writes_nothing_to_the_run_home(home, ledger):
     read.node_timings_sync(definition=graph.name, limit=5)
 
     assert home._sync_db().total_changes == before
+
+
+async def test_node_latencies_agree_with_the_fold_and_outlive_the_step_rows(home, ledger):
+    """The rollup is maintained at step commit, so its read never walks history."""
+    graph = fan_out_graph()
+    other = ingestion_graph()
+    host = serve(graph, home=home, deployment_version="v1")
+    other_host = serve(other, home=home, deployment_version="v1")
+    await settled_sweep(host, graph, ["doc-1", "doc-2"], "sweep-rollup")
+    await settled_sweep(other_host, other, ["work-clean"], "sweep-rollup-other")
+    read = RunHomeReadModel(host.client)
+
+    folded = {timing.node_name: timing for timing in (await read.node_timings(definition=graph.name)).nodes}
+    latencies = await read.node_latencies(definition=graph.name)
+
+    assert latencies.definition == graph.name
+    by_name = {latency.node_name: latency for latency in latencies.nodes}
+    assert set(by_name) == set(folded)
+    # Nested map items are attributed to the Definition that drove them.
+    assert by_name["derive_page"].executions == 6
+    for name, latency in by_name.items():
+        assert (latency.executions, latency.cached, latency.errors) == (folded[name].executions, folded[name].cached, folded[name].errors)
+        assert latency.total_seconds == pytest.approx(folded[name].total_seconds)
+        assert latency.min_ms <= latency.p50_ms <= latency.p95_ms <= latency.p99_ms <= latency.max_ms
+
+    merged = {latency.node_name for latency in (await read.node_latencies()).nodes}
+    assert merged == set(folded) | {timing.node_name for timing in (await read.node_timings(definition=other.name)).nodes}
+    assert (await read.node_latencies(definition="never-served")).nodes == ()
+    with pytest.raises(TypeError, match="definition must be a Definition name string"):
+        await read.node_latencies(definition=object())
+    json.dumps(latencies.to_dict())
+
+    # Retention drops step rows, not the executions they already counted.
+    db = home._sync_db()
+    db.execute("DELETE FROM steps")
+    db.commit()
+    assert (await read.node_timings(definition=graph.name)).nodes == ()
+    assert {latency.node_name: latency.executions for latency in (await read.node_latencies(definition=graph.name)).nodes} == {
+        name: latency.executions for name, latency in by_name.items()
+    }
+
+
+async def test_node_latency_percentiles_sit_within_the_sketch_s_relative_error(home, ledger):
+    graph = ingestion_graph()
+    host = serve(graph, home=home, deployment_version="v1")
+    await settled_sweep(host, graph, ["work-0"], "sweep-percentiles")
+    # Give a synthetic node a known latency distribution: 1ms, 2ms, …, 100ms,
+    # first written at half that so the rewrite has a contribution to swap.
+    db = home._sync_db()
+    (run_id,) = db.execute("SELECT run_id FROM host_run_definitions WHERE definition_name = ? LIMIT 1", (graph.name,)).fetchone()
+    db.executemany(
+        "INSERT INTO steps (run_id, step_index, superstep, node_name, status, duration_ms) VALUES (?, ?, ?, 'synthetic', 'completed', ?)",
+        [(run_id, 10_000 + k, 10_000 + k, k / 2) for k in range(1, 101)],
+    )
+    db.executemany("UPDATE steps SET duration_ms = ? WHERE run_id = ? AND superstep = ?", [(float(k), run_id, 10_000 + k) for k in range(1, 101)])
+    db.commit()
+
+    latency = next(n for n in RunHomeReadModel(host.client).node_latencies_sync(definition=graph.name).nodes if n.node_name == "synthetic")
+
+    assert latency.executions == 100, "a rewrite swaps its contribution, never double-counts"
+    # Extremes are the fastest/slowest ever OBSERVED — the rewrite cannot
+    # un-observe the first, faster timing.
+    assert (latency.min_ms, latency.max_ms) == (0.5, 100.0)
+    assert latency.average_ms == pytest.approx(50.5)
+    assert latency.p50_ms == pytest.approx(50.5, rel=0.02)
+    assert latency.p95_ms == pytest.approx(95.05, rel=0.02)
+    assert latency.p99_ms == pytest.approx(99.01, rel=0.02)
+
+
+async def test_sketch_bucket_lookup_seeks_the_bound_index(home):
+    from hypergraph.checkpointers._migrate import _timing_bucket_sql
+
+    db = home._sync_db()
+    plan = " ".join(row[3] for row in db.execute(f"EXPLAIN QUERY PLAN SELECT {_timing_bucket_sql('s')} FROM steps s"))
+    assert "USING COVERING INDEX idx_host_timing_buckets_upper" in plan
+    triggers = " ".join(row[0] for row in db.execute("SELECT sql FROM sqlite_master WHERE name LIKE 'host_node_timing_step_%'"))
+    assert "MIN(bucket)" not in triggers
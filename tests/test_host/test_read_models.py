@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 
 import pytest
@@ -84,6 +85,24 @@ async def test_list_runs_keeps_query_order_and_the_closed_status_vocabulary(home
     assert TERMINAL_STATUS_VALUES <= RUN_READ_STATUS_VALUES
 
 
+async def test_dashboard_reads_never_queue_behind_a_held_write_transaction(home, ledger):
+    graph = ingestion_graph()
+    host = serve(graph, home=home, deployment_version="v1")
+    receipt = await submit_ids(host, graph, ["work-b", "work-a"], "drop-busy-writer")
+    read = RunHomeReadModel(host.client)
+
+    # A worker mid-commit holds the writer for the length of its transaction;
+    # listing, a Batch census, and a run view read beside it, not after it.
+    async with home._txn_lock():
+        rows = await asyncio.wait_for(read.list_runs(RunQuery(definition=graph.name)), timeout=5)
+        batch = await asyncio.wait_for(read.get_batch(receipt.batch_ref), timeout=5)
+        run = await asyncio.wait_for(read.get_run(rows[0].run_ref), timeout=5)
+
+    assert len(rows) == 2
+    assert batch is not None and batch.counts["queued"] == 2
+    assert run is not None and run.status == "queued"
+
+
 async def test_a_settled_unstarted_item_never_looks_queued(home, ledger):
     graph = ingestion_graph()
     host = serve(graph, home=home, deployment_version="v1")
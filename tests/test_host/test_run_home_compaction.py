@@ -0,0 +1,126 @@
+"""CheckpointPolicy.ttl on a Run Home — host rows expire with their runs.
+
+A Home's coordination tables grow with every accepted Run: the submission,
+its run_updates log, its commands, and for a Batch the manifest, its
+batch_updates log, and the census projection. ``compact()`` removes them in
+the same transaction as the runs they describe, so no read ever meets a
+finished submission whose run vanished, and a Batch only ever expires whole.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from hypergraph import RunHomeReadModel, serve
+from hypergraph.checkpointers import CheckpointPolicy
+from tests.test_host._batch_interrupt import batch_where, submit_ids, until, worker
+from tests.test_host._ingestion_fixture import ingestion_graph
+
+pytest.importorskip("aiosqlite")
+
+_LATER = timedelta(hours=2)
+
+
+def _row_count(home, table: str) -> int:
+    with home._sync_lock:
+        (count,) = home._sync_db().execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+    return count
+
+
+async def test_a_finished_run_expires_with_its_submission_and_update_log(home, ledger):
+    home.policy = CheckpointPolicy(durability="sync", ttl=timedelta(hours=1))
+    graph = ingestion_graph()
+    host = serve(graph, home=home, deployment_version="v1")
+    receipt = await host.submit(graph, {"work_item_id": "work-clean"}, workflow_id="one-run")
+
+    async def settled():
+        view = await host.client.get(receipt.run_ref)
+        return view is not None and view.status is not None and view.status.value == "completed"
+
+    async with worker(host):
+        await until(settled)
+    assert _row_count(home, "run_updates") > 0
+
+    assert (await home.compact()).runs_deleted == 0, "nothing is an hour old yet"
+    report = await home.compact(now=datetime.now(timezone.utc) + _LATER)
+
+    assert report.runs_deleted == 1
+    assert report.log_rows_deleted > 0
+    assert await host.client.get(receipt.run_ref) is None
+    for table in ("runs", "steps", "host_submissions", "run_updates"):
+        assert _row_count(home, table) == 0, table
+
+
+async def test_a_batch_expires_only_whole_and_only_once_every_child_settled(home, ledger):
+    home.policy = CheckpointPolicy(durability="sync", ttl=timedelta(hours=1))
+    graph = ingestion_graph()
+    host = serve(graph, home=home, deployment_version="v1")
+    done = await submit_ids(host, graph, ["work-clean", "work-two"], "sweep-done")
+    async with worker(host):
+        await batch_where(host.client, done.batch_ref, lambda view: view.settled)
+    waiting = await submit_ids(host, graph, ["work-three"], "sweep-waiting")
+
+    report = home.compact_sync(now=datetime.now(timezone.utc) + _LATER)
+
+    assert report.batches_deleted == 1
+    assert report.runs_deleted == 2
+    read = RunHomeReadModel(host.client)
+    assert [row.workflow_id for row in await read.list_batches()] == ["sweep-waiting"]
+    assert await host.client.get(done.batch_ref) is None
+    # The queued Batch is untouched — its manifest, children, and census.
+    summary = await read.get_batch_summary(waiting.batch_ref)
+    assert summary is not None and summary.item_count == 1
+    assert _row_count(home, "host_batch_children") == 1
+    assert _row_count(home, "host_batches") == 1
+
+
+def test_without_a_ttl_compaction_only_reports(home):
+    report = home.compact_sync(now=datetime.now(timezone.utc) + timedelta(days=3650))
+
+    assert (report.runs_deleted, report.batches_deleted, report.transactions) == (0, 0, 0)
+    assert report.complete
+
+
+async def test_a_large_batch_drains_its_children_over_several_transactions(home, ledger):
+    home.policy = CheckpointPolicy(durability="sync", ttl=timedelta(hours=1))
+    graph = ingestion_graph()
+    host = serve(graph, home=home, deployment_version="v1")
+    done = await submit_ids(host, graph, ["work-clean", "work-two", "work-three"], "sweep-large")
+    async with worker(host):
+        await batch_where(host.client, done.batch_ref, lambda view: view.settled)
+    later = datetime.now(timezone.utc) + _LATER
+
+    first = await home.compact(now=later, batch_size=2, max_batches=1)
+
+    assert (first.runs_deleted, first.batches_deleted) == (2, 0)
+    assert not first.complete
+    assert _row_count(home, "host_batches") == 1, "the Batch row outlives its children"
+    rest = await home.compact(now=later, batch_size=2)
+    assert (rest.runs_deleted, rest.batches_deleted) == (1, 1)
+    for table in ("runs", "host_submissions", "host_batches", "host_batch_census"):
+        assert _row_count(home, table) == 0, table
+
+
+async def test_a_failing_compaction_is_logged_and_the_worker_keeps_claiming(home, ledger, monkeypatch, caplog):
+    home.policy = CheckpointPolicy(durability="sync", ttl=timedelta(hours=1))
+    graph = ingestion_graph()
+    host = serve(graph, home=home, deployment_version="v1")
+
+    async def broken(**kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(home, "compact", broken)
+    receipt = await host.submit(graph, {"work_item_id": "work-clean"}, workflow_id="after-failure")
+
+    async def settled():
+        view = await host.client.get(receipt.run_ref)
+        return view is not None and view.status is not None and view.status.value == "completed"
+
+    with caplog.at_level("ERROR", logger="hypergraph.host"):
+        async with worker(host):
+            await until(settled)
+
+    assert "Compaction of Run Home" in caplog.text
+    assert host.worker_errors == []
@@ -121,6 +121,14 @@ class TestChildRows:
         rows = table.child("utterance").rows(where=[("clean_text", "eq", "nonexistent")])
         assert rows == []
 
+    def test_row_view_names_parent_link_and_stacks_vectors(self, table):
+        view = table.child("utterance").row_view(where=[("video_id", "eq", "v1")])
+        assert sorted(row["utterance_id"] for row in view) == ["u0", "u1"]
+        assert {row["video_id"] for row in view} == {"v1"}
+        assert view.to_numpy("vector").shape == (2, 3)
+        assert not [name for name in view.column_names if name.startswith("_")]
+        assert table.child("utterance").rows_arrow(where=[("path", "eq", "/missing")]).num_rows == 0
+
     def test_filter_with_limit(self, table):
         rows = table.child("utterance").rows(where=[("clean_text", "eq", "hello")], limit=1)
         assert len(rows) == 1
@@ -135,6 +135,43 @@ class TestSearch:
             table.search([1.0, 0.0, 0.0], index="nope")
 
 
+class TestSearchMany:
+    def test_search_many_matches_one_search_per_query(self, table):
+        table.create_index("main", vector="vec")
+        queries = [[0.9, 0.1, 0.0], [0.0, 0.1, 0.9], [0.1, 0.9, 0.0]]
+
+        hits = table.search_many(queries, index="main", limit=2, where={"active": True})
+
+        assert hits.column_names[0] == "_query" and hits.column_names[-1] == "_distance"
+        for position, query in enumerate(queries):
+            expected = [hit["doc_id"] for hit in table.search(query, index="main", limit=2, where={"active": True})]
+            got = [row["doc_id"] for row in hits.to_pylist() if row["_query"] == position]
+            assert got == expected
+        assert "d3" not in hits.column("doc_id").to_pylist()
+
+    def test_search_many_projects_columns_and_accepts_a_numpy_matrix(self, table):
+        np = pytest.importorskip("numpy")
+        table.create_index("main", vector="vec")
+
+        hits = table.search_many(np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], dtype="float32"), index="main", limit=1, columns=["doc_id"])
+
+        assert hits.column_names == ["_query", "doc_id", "_distance"]
+        assert hits.column("doc_id").to_pylist() == ["d1", "d2"]
+        assert hits.column("_query").to_numpy().tolist() == [0, 1]
+
+    def test_search_many_on_a_child_index_names_the_parent(self, tmp_path):
+        table = make_child_table(LanceDBStore(str(tmp_path / "child_many_store")))
+        table.insert([{"doc_id": "d1", "text": "alpha|beta"}, {"doc_id": "d2", "text": "gamma"}])
+        table.create_index("pages_idx", on="page", vector="page_vector")
+
+        hits = table.search_many([[0.0, 0.95, 0.05], [0.0, 0.0, 1.0]], index="pages_idx", limit=1, columns=["doc_id", "page_text"])
+
+        assert hits.select(["doc_id", "page_text"]).to_pylist() == [
+            {"doc_id": "d1", "page_text": "beta"},
+            {"doc_id": "d2", "page_text": "gamma"},
+        ]
+
+
 class Page(TypedDict):
     page_id: str
     page_text: str
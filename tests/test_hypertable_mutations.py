@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from typing import TypedDict
 
 import pytest
@@ -392,6 +393,113 @@ class TestIncrementality:
         assert table.count() == 1  # still one row
         assert table.get("d1")["word_count"] == 2  # re-derived
 
+    def test_list_insert_writes_parent_rows_once_per_chunk(self, store, monkeypatch):
+        """A list insert looks up and writes its rows in chunks, never per row."""
+        from hypergraph.materialization import _writes
+
+        monkeypatch.setattr(_writes, "INSERT_CHUNK_ROWS", 4)
+        table = Graph([clean, count_words]).as_table(identity="doc_id", store=store, runner=SyncRunner())
+        table.insert(doc_id="d0", text="before")
+        calls = {"read_one": 0, "read_many": 0, "write_rows": 0}
+        for name in calls:
+            method = getattr(store, name)
+
+            def counted(*args, _name=name, _method=method, **kwargs):
+                calls[_name] += 1
+                return _method(*args, **kwargs)
+
+            monkeypatch.setattr(store, name, counted)
+
+        rows = [dict(doc_id=f"d{i}", text=f"text {i}") for i in range(10)]
+        receipt = table.insert(rows)
+
+        assert calls == {"read_one": 0, "read_many": 3, "write_rows": 3 + 1}  # three chunks; d0 re-derives on its own
+        assert receipt.inserted == 9 and receipt.updated == 1
+        assert [row.id for row in receipt.receipts] == [f"d{i}" for i in range(10)]
+        assert table.count() == 10
+
+    def test_repeated_identity_in_one_insert_converges_on_the_last(self, store):
+        """A repeated identity sees the row its earlier occurrence wrote."""
+
+        table = Graph([clean, count_words]).as_table(identity="doc_id", store=store, runner=SyncRunner())
+
+        receipt = table.insert([dict(doc_id="d1", text="hello"), dict(doc_id="d1", text="hello world")])
+
+        assert [row.outcome.value for row in receipt.receipts] == ["inserted", "updated"]
+        assert table.count() == 1
+        assert table.get("d1")["word_count"] == 2
+
+
+# ---------------------------------------------------------------------------
+# Parallel synchronous derivation
+# ---------------------------------------------------------------------------
+
+
+class TestParallelSyncDerivation:
+    """max_workers spreads graph runs over threads; store calls stay on the caller."""
+
+    def test_rows_derive_concurrently_with_ordered_receipts(self, store, monkeypatch):
+        pairs = threading.Barrier(2, timeout=5)
+
+        @node(output_name="word_count")
+        def paired_count(clean_text: str) -> int:
+            pairs.wait()  # times out unless two rows derive at once
+            return len(clean_text.split())
+
+        table = Graph([clean, paired_count]).as_table(identity="doc_id", store=store, runner=SyncRunner(), max_workers=2)
+        store_threads: set[int] = set()
+        write_rows = store.write_rows
+
+        def recording_write_rows(*args, **kwargs):
+            store_threads.add(threading.get_ident())
+            return write_rows(*args, **kwargs)
+
+        monkeypatch.setattr(store, "write_rows", recording_write_rows)
+        receipt = table.insert([dict(doc_id=f"d{i}", text=" ".join(["w"] * (i + 1))) for i in range(6)])
+
+        assert [row.id for row in receipt.receipts] == [f"d{i}" for i in range(6)]
+        assert receipt.inserted == 6
+        assert {row["doc_id"]: row["word_count"] for row in table.rows()} == {f"d{i}": i + 1 for i in range(6)}
+        assert store_threads == {threading.get_ident()}
+
+    def test_child_pages_derive_concurrently(self, store):
+        pairs = threading.Barrier(2, timeout=5)
+
+        @node(output_name="vector")
+        def paired_embed(clean_text: str, embedder: Embedder) -> list[float]:
+            pairs.wait()
+            return embedder.embed(clean_text)
+
+        utterance = Graph([clean, paired_embed], name="process_utterance").as_node().map_over("utterances", identity="utterance_id")
+        table = (
+            Graph([extract_audio, transcribe, split_utterances, utterance])
+            .bind(embedder=Embedder())
+            .as_table(identity="episode_id", store=store, runner=SyncRunner(), max_workers=2)
+        )
+
+        table.insert(episode_id="e1", path="/audio/e1.mp3")
+
+        assert len(table.child("utterance").rows(parent="e1")) == 2
+
+    def test_failed_row_raises_like_the_serial_driver(self, store):
+        @node(output_name="word_count")
+        def fragile_count(clean_text: str) -> int:
+            if clean_text == "boom":
+                raise ValueError("boom row")
+            return len(clean_text.split())
+
+        table = Graph([clean, fragile_count]).as_table(identity="doc_id", store=store, runner=SyncRunner(), max_workers=4)
+
+        with pytest.raises(ValueError, match="boom row"):
+            table.insert([dict(doc_id="ok", text="fine"), dict(doc_id="bad", text="boom")])
+
+    @pytest.mark.parametrize("max_workers", [0, -1, True, 1.5])
+    def test_invalid_max_workers_is_rejected(self, store, max_workers):
+        from hypergraph.graph import GraphConfigError
+
+        with pytest.raises(GraphConfigError, match="max_workers"):
+            Graph([clean, count_words]).as_table(identity="doc_id", store=store, max_workers=max_workers)
+
 
 # ---------------------------------------------------------------------------
 # Recompute
@@ -423,6 +531,27 @@ class TestRecompute:
         # recompute should still run and produce valid output)
         assert isinstance(new_vec, list)
 
+    def test_rederive_reads_full_rows_one_chunk_at_a_time(self, store, monkeypatch):
+        """Rederive streams identities and fetches full rows per chunk, never the whole table."""
+        from hypergraph.materialization import _writes
+
+        monkeypatch.setattr(_writes, "INSERT_CHUNK_ROWS", 4)
+        table = Graph([clean, count_words]).as_table(identity="doc_id", store=store, runner=SyncRunner())
+        table.insert([dict(doc_id=f"d{i}", text=f"text {i}") for i in range(10)])
+        chunks: list[int] = []
+        read_many = store.read_many
+
+        def counted(table_name, identity_column, identity_values, **kwargs):
+            chunks.append(len(identity_values))
+            return read_many(table_name, identity_column, identity_values, **kwargs)
+
+        monkeypatch.setattr(store, "read_many", counted)
+        receipt = table.rederive("word_count")
+
+        assert chunks == [4, 4, 2]
+        assert sorted(row.id for row in receipt.receipts) == [f"d{i}" for i in range(10)]
+        assert table.get("d3")["word_count"] == 2
+
 
 # ---------------------------------------------------------------------------
 # Backfill
@@ -59,3 +59,34 @@ def test_set_rejects_content_key_fields(table) -> None:
 
     with pytest.raises(ValueError, match="content-key"):
         table.set([("doc_id", "eq", "d1")], text="new source")
+
+
+def test_rows_arrow_matches_rows_without_internal_columns(table) -> None:
+    """rows_arrow()/row_view() return the same public rows as rows(), kept in Arrow."""
+
+    table.insert(doc_id="d1", text="hello world", station="NICU")
+    table.insert(doc_id="d2", text="cardiology", station="PICU")
+
+    arrow = table.rows_arrow(where=[("station", "eq", "NICU")])
+    view = table.row_view()
+
+    assert arrow.to_pylist() == table.rows(where=[("station", "eq", "NICU")])
+    assert not [name for name in arrow.column_names if name.startswith("_")]
+    assert len(view) == 2
+    assert sorted(row["doc_id"] for row in view) == ["d1", "d2"]
+    assert view[0] == view[0:1][0]
+    assert len(table.row_view(limit=1)) == 1
+    assert table.rows_arrow(where=[("station", "eq", "ICU")]).num_rows == 0
+
+
+def test_iter_batches_drops_superseded_generations(table) -> None:
+    """A stale generation left behind by an interrupted cleanup never reaches a batch."""
+
+    table.insert(doc_id="d1", text="hello world")
+    table.insert(doc_id="d2", text="second row")
+    [stored] = table._store.read_rows(table._spec.name, [("doc_id", "eq", "d1")])
+    table._store.write_rows(table._spec.name, [{**stored, "word_count": 99, "_write_gen": stored["_write_gen"] - 1}])
+
+    rows = [row for batch in table.iter_batches(batch_rows=1) for row in batch.to_pylist()]
+
+    assert sorted((row["doc_id"], row["word_count"]) for row in rows) == [("d1", 2), ("d2", 2)]
@@ -275,3 +275,140 @@ def test_sync_stamps_unstamped_child_rows_via_the_bump_path(tmp_path):
     build().sync([{"doc_id": "d1", "text": "alpha beta"}])
     drift = build().recipe_drift()
     assert drift.stale_total == 0, f"sync must stamp what it proves current, got {drift}"
+
+
+def test_rebuild_drifted_reruns_only_the_drifted_node_and_its_dependents(tmp_path, monkeypatch):
+    calls: list[str] = []
+
+    @node(output_name="upper")
+    def upper(text: str, mode: str) -> str:
+        calls.append("upper")
+        return text.upper() if mode == "loud" else text
+
+    @node(output_name="exclaimed")
+    def exclaim(upper: str) -> str:
+        calls.append("exclaim")
+        return upper + "!"
+
+    @node(output_name="length")
+    def length(text: str) -> int:
+        calls.append("length")
+        return len(text)
+
+    def build(mode: str) -> HyperTable:
+        return Graph([upper, exclaim, length]).bind(mode=mode).as_table(identity="doc_id", store=LanceDBStore(str(tmp_path)), runner=SyncRunner())
+
+    build("loud").insert([{"doc_id": "d1", "text": "hello"}, {"doc_id": "d2", "text": "hi"}])
+    table = build("quiet")
+    writes: list[str] = []
+    write_rows = table.store.write_rows
+
+    def counted(table_name, rows):
+        writes.append(table_name)
+        return write_rows(table_name, rows)
+
+    monkeypatch.setattr(table.store, "write_rows", counted)
+
+    calls.clear()
+    receipt = table.rebuild_drifted()
+
+    assert receipt.updated == 2
+    assert sorted(calls) == ["exclaim", "exclaim", "upper", "upper"]
+    assert writes.count("doc") == 1
+    assert table.get("d1") == {"doc_id": "d1", "text": "hello", "upper": "hello", "exclaimed": "hello!", "length": 5}
+    drift = table.recipe_drift()
+    assert (drift.current, drift.drifted) == (2, 0)
+
+    calls.clear()
+    assert table.rebuild_drifted().receipts == ()
+    assert calls == []
+    assert table.sync([{"doc_id": "d1", "text": "hello"}, {"doc_id": "d2", "text": "hi"}]).skipped == 2
+
+
+def test_rebuild_drifted_plans_each_row_from_its_own_provenance(tmp_path):
+    calls: list[str] = []
+
+    @node(output_name="upper")
+    def upper(text: str, mode: str) -> str:
+        calls.append("upper")
+        return text.upper() if mode == "loud" else text
+
+    @node(output_name="exclaimed")
+    def exclaim(upper: str) -> str:
+        calls.append("exclaim")
+        return upper + "!"
+
+    @node(output_name="length")
+    def length(text: str) -> int:
+        calls.append("length")
+        return len(text)
+
+    def build(mode: str) -> HyperTable:
+        return Graph([upper, exclaim, length]).bind(mode=mode).as_table(identity="doc_id", store=LanceDBStore(str(tmp_path)), runner=SyncRunner())
+
+    build("loud").insert([{"doc_id": "d1", "text": "hello"}, {"doc_id": "d2", "text": "hi"}])
+    # Same recipe stamp as d1, but d2's length lost its provenance stamp.
+    store = LanceDBStore(str(tmp_path))
+    row = store.read_one("doc", "doc_id", "d2")
+    store.write_rows("doc", [{**row, "_provenance_length": None, "_write_gen": row["_write_gen"] + 1}])
+    store.delete_rows("doc", [("doc_id", "eq", "d2"), ("_write_gen", "lt", row["_write_gen"] + 1)])
+    table = build("quiet")
+
+    calls.clear()
+    assert table.rebuild_drifted().updated == 2
+
+    assert sorted(calls) == ["exclaim", "exclaim", "length", "upper", "upper"]
+    assert table.sync([{"doc_id": "d1", "text": "hello"}, {"doc_id": "d2", "text": "hi"}]).skipped == 2
+
+
+def test_rebuild_drifted_works_out_the_drifted_nodes_once_per_recipe_stamp(tmp_path, monkeypatch):
+    @node(output_name="upper")
+    def upper(text: str, mode: str) -> str:
+        return text.upper() if mode == "loud" else text
+
+    @node(output_name="length")
+    def length(text: str) -> int:
+        return len(text)
+
+    def build(mode: str) -> HyperTable:
+        return Graph([upper, length]).bind(mode=mode).as_table(identity="doc_id", store=LanceDBStore(str(tmp_path)), runner=SyncRunner())
+
+    build("loud").insert([{"doc_id": f"d{i}", "text": f"text {i}"} for i in range(5)])
+    table = build("quiet")
+    table.recipe_drift()
+    planned: list[str] = []
+    drifted_nodes = table._provenance_policy.drifted_nodes
+
+    def counting(row):
+        planned.append(row["doc_id"])
+        return drifted_nodes(row)
+
+    monkeypatch.setattr(table._provenance_policy, "drifted_nodes", counting)
+
+    assert table.rebuild_drifted().updated == 5
+
+    assert len(planned) == 1
+    assert [row["upper"] for row in table.rows()] == [f"text {i}" for i in range(5)]
+
+
+def test_rebuild_drifted_converges_child_tables_row_by_row(tmp_path):
+    @node(output_name="pages")
+    def split(text: str) -> list[dict]:
+        return [{"page_id": f"p{i}", "page_text": part} for i, part in enumerate(text.split(), start=1)]
+
+    @node(output_name="tagged")
+    def tag(page_text: str, tag_value: str) -> str:
+        return f"{tag_value}:{page_text}"
+
+    per_page = Graph([tag], name="per_page").as_node(name="pages").map_over("pages", identity="page_id")
+
+    def build(tag_value: str) -> HyperTable:
+        return Graph([split, per_page]).bind(tag_value=tag_value).as_table(identity="doc_id", store=LanceDBStore(str(tmp_path)), runner=SyncRunner())
+
+    build("v1").insert(doc_id="d1", text="alpha beta")
+    table = build("v2")
+
+    table.rebuild_drifted()
+
+    assert table.recipe_drift().stale_total == 0
+    assert sorted(row["tagged"] for row in table.child("page").rows(parent="d1")) == ["v2:alpha", "v2:beta"]
@@ -80,6 +80,19 @@ def embedder():
     return Embedder()
 
 
+class Tagger:
+    def __init__(self, model: str):
+        self.model = model
+
+    def _config(self):
+        return {"model": self.model}
+
+
+@node(output_name="tagged")
+def tag(text: str, tagger: Tagger) -> str:
+    return tagger.model + text
+
+
 def make_table(store, embedder):
 
     return Graph([clean, embed_text]).bind(embedder=embedder).as_table(identity="doc_id", store=store, runner=SyncRunner())
@@ -152,6 +165,18 @@ class TestStatusRoot:
         table.set({"doc_id": "d1"}, station="south")
         assert table.status().is_fresh
 
+    def test_mutating_a_component_after_analysis_marks_rows_stale(self, store):
+        tagger = Tagger("a")
+        table = Graph([tag]).bind(tagger=tagger).as_table(identity="doc_id", store=store, runner=SyncRunner())
+        table.insert(doc_id="d1", text="x")
+        assert table.status().is_fresh
+
+        tagger.model = "b"
+        assert not table.status().is_fresh
+        table.sync([{"doc_id": "d1", "text": "x"}])
+        assert table.get("d1")["tagged"] == "bx"
+        assert table.status().is_fresh
+
 
 # ---------------------------------------------------------------------------
 # Child-table staleness
@@ -182,3 +207,105 @@ class TestStatusChildren:
         child = rebound.status().children[0]
         assert (child.fresh, child.stale) == (0, 2)
         assert not rebound.status().is_fresh
+
+
+# ---------------------------------------------------------------------------
+# Rows stamped with the str()-based fingerprint
+# ---------------------------------------------------------------------------
+
+
+class TestLegacyFingerprints:
+    def test_legacy_stamp_stays_fresh_until_inputs_change(self, store, embedder):
+        from hypergraph.materialization._fingerprint import legacy_fingerprint
+        from hypergraph.materialization._types import WriteOutcome
+
+        table = make_table(store, embedder)
+        table.insert(doc_id="d1", text="hello")
+        [row] = store.read_rows("doc")
+        parts = table._provenance_policy.recipe_parts()
+        legacy = legacy_fingerprint(parts, {"text": "hello"})
+        assert legacy != row["_row_fingerprint"]
+        store.write_rows("doc", [{**row, "_row_fingerprint": legacy, "_write_gen": row["_write_gen"] + 1}])
+
+        assert table.status().is_fresh
+        assert table.insert(doc_id="d1", text="hello").outcome == WriteOutcome.SKIPPED
+        assert table.insert(doc_id="d1", text="changed").outcome == WriteOutcome.UPDATED
+        assert table.status().is_fresh
+
+    def test_unchanged_sync_restamps_a_legacy_row(self, store, embedder):
+        from hypergraph.materialization._fingerprint import legacy_fingerprint
+
+        table = make_table(store, embedder)
+        table.insert(doc_id="d1", text="hello")
+        [row] = store.read_rows("doc")
+        legacy = legacy_fingerprint(table._provenance_policy.recipe_parts(), {"text": "hello"})
+        store.write_rows("doc", [{**row, "_row_fingerprint": legacy, "_write_gen": row["_write_gen"] + 1}])
+
+        assert table.sync([{"doc_id": "d1", "text": "hello"}]).skipped == 1
+        [restamped] = store.read_rows("doc")
+        assert restamped["_row_fingerprint"] == row["_row_fingerprint"]
+        assert table.status().is_fresh
+
+
+# ---------------------------------------------------------------------------
+# Streaming reads
+# ---------------------------------------------------------------------------
+
+
+class TestStatusStreaming:
+    @pytest.fixture
+    def scanned(self, monkeypatch):
+        """Record the projection of every scan the store serves."""
+        projections: list[list[str] | None] = []
+        scan = LanceDBStore.scan
+
+        def recording_scan(self, table_name, where=None, *, columns=None, **kwargs):
+            projections.append(columns)
+            return scan(self, table_name, where, columns=columns, **kwargs)
+
+        monkeypatch.setattr(LanceDBStore, "scan", recording_scan)
+        return projections
+
+    def test_fresh_table_never_reads_derived_columns(self, store, embedder, scanned):
+        table = make_table(store, embedder)
+        table.insert([{"doc_id": "d1", "text": "hello"}, {"doc_id": "d2", "text": "world"}])
+        scanned.clear()
+
+        assert table.status().is_fresh
+        assert len(scanned) == 1
+        assert "vector" not in scanned[0] and "clean_text" not in scanned[0]
+
+    def test_stale_rows_are_rescanned_in_full_for_column_attribution(self, store, embedder, scanned):
+        make_table(store, embedder).insert([{"doc_id": "d1", "text": "hello"}, {"doc_id": "d2", "text": "world"}])
+        rebound = Graph([clean, embed_text]).bind(embedder=Embedder(model_name="new-embed")).as_table(identity="doc_id", store=store)
+        scanned.clear()
+
+        report = rebound.status()
+        assert report.stale_ids == ("d1", "d2")
+        assert report.stale_columns == (("vector", 2),)
+        assert len(scanned) == 2 and scanned[1] is None
+
+
+# ---------------------------------------------------------------------------
+# Storage fragments and optimize()
+# ---------------------------------------------------------------------------
+
+
+class TestOptimize:
+    def test_optimize_compacts_every_table_and_status_reports_fragments(self, store, embedder):
+        pages_node = process_page.as_node().map_over("pages", identity="page_id")
+        table = Graph([split_pages, pages_node]).bind(embedder=embedder).as_table(identity="doc_id", store=store, runner=SyncRunner())
+        for i in range(3):
+            table.insert(doc_id=f"d{i}", text="alpha|beta")
+        rows_before = sorted(row["doc_id"] for row in table.rows())
+        report = table.status()
+        assert report.fragments >= 3, "one insert at a time leaves a fragment per write"
+        assert report.children[0].fragments >= 3
+
+        result = table.optimize()
+
+        assert (result.table, result.fragments_before, result.fragments_after) == ("doc", report.fragments, 1)
+        assert [(child.fragments_before, child.fragments_after) for child in result.children] == [(report.children[0].fragments, 1)]
+        assert table.status().fragments == 1
+        assert sorted(row["doc_id"] for row in table.rows()) == rows_before
+        assert len(table.child(table.child_table_names[0]).rows(parent="d1")) == 2
@@ -22,6 +22,7 @@ from hypergraph.runners._shared.lineage import (
 )
 from hypergraph.runners._shared.map_resume import (
     MAP_SIGNATURE_CONFIG_KEY,
+    MapRestorePlan,
     claim_completed_child_run_id,
     compute_map_item_signature,
     index_completed_child_runs,
@@ -110,6 +111,31 @@ def test_map_resume_signed_child_claimed_once_across_pools() -> None:
     assert _claim(pools, idx=0, signature="other") is None
 
 
+def test_map_restore_plan_claims_in_item_order_and_prefetches_by_chunk() -> None:
+    variations = [{"x": value} for value in (10, 20, 30, 40)]
+    signatures = [compute_map_item_signature(inputs, ["x"], "zip") for inputs in variations]
+    # Item 2 was never completed; item 3's child is signed for item 0's inputs.
+    child_runs = [_signed_run("batch/0", signatures[0]), _signed_run("batch/1", signatures[1]), _signed_run("batch/3", signatures[3])]
+
+    plan = MapRestorePlan(variations, ["x"], "zip", child_runs, "batch", chunk_size=2)
+
+    assert [plan.signature(idx) for idx in range(4)] == signatures
+    assert [plan.restore_run_id(idx) for idx in range(4)] == ["batch/0", "batch/1", None, "batch/3"]
+    assert plan.unloaded_chunk(1) == ["batch/0", "batch/1"]
+    plan.load(1, {"batch/0": {"doubled": 20}})
+    assert plan.unloaded_chunk(0) is None
+    # A child with no step rows is absent from a bulk fold: it restores empty.
+    assert (plan.take_state(0), plan.take_state(1)) == ({"doubled": 20}, {})
+    assert plan.unloaded_chunk(3) == ["batch/3"]
+
+
+def test_map_restore_plan_for_a_fresh_map_claims_nothing() -> None:
+    plan = MapRestorePlan([{"x": 1}], ["x"], "zip", [], "batch")
+
+    assert plan.restore_run_id(0) is None
+    assert plan.signature(0) == compute_map_item_signature({"x": 1}, ["x"], "zip")
+
+
 @pytest.mark.parametrize("invalid", [None, 123, ["sig"], {"sig": "x"}, ""])
 def test_map_resume_invalid_signature_metadata_is_fresh_execution(invalid: object) -> None:
     """Matrix #6: present-but-invalid signature metadata joins neither pool."""
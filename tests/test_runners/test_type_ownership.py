@@ -116,6 +116,8 @@ ROOT_EXPORTS = (
     "PauseReadModel",
     "NodeTimingsReadModel",
     "NodeTimingReadModel",
+    "NodeLatenciesReadModel",
+    "NodeLatencyReadModel",
     "RunTimingReadModel",
     "StepTimingReadModel",
     "RUN_READ_STATUS_VALUES",
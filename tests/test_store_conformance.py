@@ -18,6 +18,7 @@ from __future__ import annotations
 from typing import Any
 
 import pyarrow as pa
+import pytest
 
 from hypergraph.materialization import check_store_conformance
 from hypergraph.materialization._lancedb_store import LanceDBStore
@@ -280,3 +281,258 @@ def test_minimal_store_conforms_via_base_projection() -> None:
     store = DictTableStore()
     assert store.supports_column_projection(), "the minimal store accepts columns= and should advertise projection support"
     check_store_conformance(store)
+
+
+def test_lancedb_write_rows_builds_columns_from_dicts_and_arrow(tmp_path) -> None:
+    """Dict rows and ready-made Arrow input land the same rows, vectors included.
+
+    A vector column is specialized to a fixed-size list on the first write; later
+    dict writes take the NumPy fast path when every vector is present and the
+    general path when one is null. Arrow input may omit columns (written as null)
+    and order them differently from the table schema.
+    """
+    from hypergraph.materialization._schema import ColumnSpec, TableSpec
+
+    store = LanceDBStore(str(tmp_path / "columnar_store"))
+    spec = TableSpec(
+        name="t",
+        identity="cid",
+        columns=[
+            ColumnSpec("cid", role="identity", arrow_type=pa.utf8()),
+            ColumnSpec("vec", role="derived", arrow_type=pa.list_(pa.float64())),
+            ColumnSpec("_write_gen", role="internal", arrow_type=pa.int64()),
+            ColumnSpec("_status", role="internal", arrow_type=pa.utf8()),
+            ColumnSpec("_row_fingerprint", role="internal", arrow_type=pa.utf8()),
+            ColumnSpec("_error", role="internal", arrow_type=pa.utf8()),
+        ],
+    )
+    store.open(spec, [])
+    base = {"_status": "complete", "_row_fingerprint": "fp"}
+    store.write_rows("t", [{"cid": "a", "vec": [1.0, 2.0, 3.0], "_write_gen": 1, **base}])
+    store.write_rows("t", [{"cid": "b", "vec": [4.0, 5.0, 6.0], "_write_gen": 1, **base}, {"cid": "c", "vec": [7, 8, 9], "_write_gen": 1}])
+    store.write_rows("t", [{"cid": "d", "vec": None, "_write_gen": 1, **base}, {"cid": "e", "vec": [0.5, 0.5, 0.5], "_write_gen": 1}])
+    store.write_rows("t", pa.table({"_write_gen": [2], "cid": ["a"], "vec": [[9.0, 9.0, 9.0]]}))
+    store.write_rows("t", pa.record_batch({"cid": ["f"], "_write_gen": [1]}))
+
+    assert pa.types.is_fixed_size_list(store._tables["t"].schema.field("vec").type)
+    vectors = {cid: row["vec"] for cid, row in store.read_many("t", "cid", ["a", "b", "c", "d", "e", "f"]).items()}
+    assert vectors == {
+        "a": [9.0, 9.0, 9.0],
+        "b": [4.0, 5.0, 6.0],
+        "c": [7.0, 8.0, 9.0],
+        "d": None,
+        "e": [0.5, 0.5, 0.5],
+        "f": None,
+    }
+    assert store.read_one("t", "cid", "c")["_status"] is None, "a field a dict row lacks is written as null"
+
+
+def test_lancedb_max_write_gen_scans_only_after_foreign_commits(tmp_path, monkeypatch) -> None:
+    """``max_write_gen`` follows this store's own commits without rescanning ``_write_gen``.
+
+    Writes, generation cleanup and schema evolution carry the high-water mark
+    forward; a commit from another connection, or a delete that may remove the
+    newest row, forces the next call to scan again.
+    """
+    from hypergraph.materialization._schema import ColumnSpec, TableSpec
+
+    path = str(tmp_path / "write_gen_store")
+    spec = TableSpec(
+        name="t",
+        identity="cid",
+        columns=[
+            ColumnSpec("cid", role="identity", arrow_type=pa.utf8()),
+            ColumnSpec("_write_gen", role="internal", arrow_type=pa.int64()),
+            ColumnSpec("_status", role="internal", arrow_type=pa.utf8()),
+            ColumnSpec("_row_fingerprint", role="internal", arrow_type=pa.utf8()),
+            ColumnSpec("_error", role="internal", arrow_type=pa.utf8()),
+        ],
+    )
+    store = LanceDBStore(path)
+    store.open(spec, [])
+    scans: list[str] = []
+    read_arrow = LanceDBStore._read_arrow
+
+    def counting_read_arrow(self, tbl, columns, **kwargs):
+        if columns == ["_write_gen"]:
+            scans.append(tbl.name)
+        return read_arrow(self, tbl, columns, **kwargs)
+
+    monkeypatch.setattr(LanceDBStore, "_read_arrow", counting_read_arrow)
+
+    assert store.max_write_gen("t") == 0
+    store.write_rows("t", [{"cid": "a", "_write_gen": 1}, {"cid": "b", "_write_gen": 2}])
+    store.write_rows("t", [{"cid": "a", "_write_gen": 3}])
+    store.delete_rows("t", [("cid", "eq", "a"), ("_write_gen", "lt", 3)])
+    store.evolve_schema("t", {"note": pa.utf8()})
+    assert store.max_write_gen("t") == 3
+    assert scans == ["t"], "the store's own commits must not trigger a rescan"
+
+    other = LanceDBStore(path)
+    other.open(spec, [])
+    other.write_rows("t", [{"cid": "c", "_write_gen": 7}])
+    assert store.max_write_gen("t") == 7, "another connection's commit must be seen"
+    assert len(scans) == 2
+
+    store.delete_rows("t", [("cid", "eq", "c")])
+    assert store.max_write_gen("t") == 3, "deleting the newest row lowers the maximum"
+    assert len(scans) == 3
+
+
+def test_lancedb_optimize_every_compacts_fragments_inline(tmp_path) -> None:
+    """With ``optimize_every=N`` the store compacts a table itself after N commits."""
+    from hypergraph.materialization._schema import ColumnSpec, TableSpec
+
+    spec = TableSpec(
+        name="t",
+        identity="cid",
+        columns=[
+            ColumnSpec("cid", role="identity", arrow_type=pa.utf8()),
+            ColumnSpec("_write_gen", role="internal", arrow_type=pa.int64()),
+            ColumnSpec("_status", role="internal", arrow_type=pa.utf8()),
+            ColumnSpec("_row_fingerprint", role="internal", arrow_type=pa.utf8()),
+            ColumnSpec("_error", role="internal", arrow_type=pa.utf8()),
+        ],
+    )
+    store = LanceDBStore(str(tmp_path / "optimize_store"), optimize_every=4)
+    store.open(spec, [])
+    for i in range(3):
+        store.write_rows("t", [{"cid": f"r{i}", "_write_gen": 1}])
+    assert store.fragment_count("t") == 3
+
+    store.delete_rows("t", [("cid", "eq", "r0")])
+
+    assert store.fragment_count("t") == 1, "the fourth commit must trigger compaction"
+    assert sorted(row["cid"] for row in store.read_rows("t")) == ["r1", "r2"]
+    assert store.max_write_gen("t") == 1
+
+
+@pytest.mark.parametrize("optimize_every", [0, -3, True, 2.0])
+def test_lancedb_rejects_invalid_optimize_every(tmp_path, optimize_every) -> None:
+    with pytest.raises(ValueError, match="optimize_every"):
+        LanceDBStore(str(tmp_path / "bad"), optimize_every=optimize_every)
+
+
+def _identity_spec():
+    from hypergraph.materialization._schema import ColumnSpec, TableSpec
+
+    return TableSpec(
+        name="t",
+        identity="cid",
+        columns=[
+            ColumnSpec("cid", role="identity", arrow_type=pa.utf8()),
+            ColumnSpec("_write_gen", role="internal", arrow_type=pa.int64()),
+            ColumnSpec("_status", role="internal", arrow_type=pa.utf8()),
+            ColumnSpec("_row_fingerprint", role="internal", arrow_type=pa.utf8()),
+            ColumnSpec("_error", role="internal", arrow_type=pa.utf8()),
+        ],
+    )
+
+
+def _identity_index_stats(store: LanceDBStore):
+    tbl = store._tables["t"]
+    (index,) = [index for index in tbl.list_indices() if index.columns == ["cid"]]
+    return index.index_type, tbl.index_stats(index.name)
+
+
+def test_lancedb_identity_index_is_built_and_refreshed_in_batches(tmp_path, monkeypatch) -> None:
+    """The BTree index appears with the first rows and catches up every ``_INDEX_REFRESH_ROWS``."""
+    monkeypatch.setattr("hypergraph.materialization._lancedb_store._INDEX_REFRESH_ROWS", 5)
+    store = LanceDBStore(str(tmp_path / "identity_index_store"))
+    store.open(_identity_spec(), [])
+    assert store.identity_index("t") is None, "an empty table has nothing to index yet"
+
+    store.write_rows("t", [{"cid": "a", "_write_gen": 1}])
+    index_type, stats = _identity_index_stats(store)
+    assert store.identity_index("t") == "cid"
+    assert index_type == "BTree"
+    assert stats.num_unindexed_rows == 0
+
+    store.write_rows("t", [{"cid": f"b{i}", "_write_gen": 1} for i in range(4)])
+    assert _identity_index_stats(store)[1].num_unindexed_rows == 4, "below the threshold, new rows stay unindexed"
+    store.write_rows("t", [{"cid": "c", "_write_gen": 1}])
+    assert _identity_index_stats(store)[1].num_unindexed_rows == 0, "reaching the threshold folds them in"
+
+
+def test_lancedb_optimize_runs_a_second_pass_only_after_an_index_split(tmp_path, monkeypatch) -> None:
+    """The extra compaction pass runs when rows were unindexed, not on every multi-fragment table."""
+    from lancedb.table import LanceTable
+
+    passes: list[str] = []
+    optimize = LanceTable.optimize
+
+    def counting_optimize(self, **kwargs):
+        passes.append(self.name)
+        return optimize(self, **kwargs)
+
+    monkeypatch.setattr(LanceTable, "optimize", counting_optimize)
+    store = LanceDBStore(str(tmp_path / "optimize_passes_store"))
+    store.open(_identity_spec(), [])
+    store.write_rows("t", [{"cid": "a", "_write_gen": 1}])
+    for i in range(3):
+        store.write_rows("t", [{"cid": f"b{i}", "_write_gen": 1}])
+
+    store.optimize("t")
+    assert len(passes) == 2, "the index lagged, so a second pass merges what the first split"
+    assert store.fragment_count("t") == 1
+
+    monkeypatch.setattr("hypergraph.materialization._lancedb_store._INDEX_REFRESH_ROWS", 1)
+    for i in range(3):
+        store.write_rows("t", [{"cid": f"c{i}", "_write_gen": 1}])
+    assert store.fragment_count("t") > 1
+    passes.clear()
+    store.optimize("t")
+    assert len(passes) == 1, "every fragment was indexed, so one pass merges them all"
+    assert store.fragment_count("t") == 1
+
+
+def test_lancedb_identity_index_failure_is_logged_and_retried(tmp_path, monkeypatch, caplog) -> None:
+    """A failed build leaves lookups scanning, is logged once, and is retried after the threshold."""
+    from lancedb.table import LanceTable
+
+    monkeypatch.setattr("hypergraph.materialization._lancedb_store._INDEX_REFRESH_ROWS", 3)
+    attempts: list[str] = []
+    create_index = LanceTable.create_index
+
+    def flaky_create_index(self, column, **kwargs):
+        attempts.append(column)
+        if len(attempts) == 1:
+            raise OSError("disk hiccup")
+        return create_index(self, column, **kwargs)
+
+    monkeypatch.setattr(LanceTable, "create_index", flaky_create_index)
+    store = LanceDBStore(str(tmp_path / "identity_retry_store"))
+    store.open(_identity_spec(), [])
+
+    with caplog.at_level("WARNING", logger="hypergraph.materialization._lancedb_store"):
+        store.write_rows("t", [{"cid": "a", "_write_gen": 1}])
+    assert store.identity_index("t") is None
+    assert "Could not build the identity index on t.cid" in caplog.text
+    assert store.read_one("t", "cid", "a") is not None, "lookups still work without the index"
+
+    store.write_rows("t", [{"cid": "b", "_write_gen": 1}, {"cid": "c", "_write_gen": 1}])
+    assert attempts == ["cid"], "no retry before another _INDEX_REFRESH_ROWS rows"
+    store.write_rows("t", [{"cid": "d", "_write_gen": 1}])
+    assert attempts == ["cid", "cid"]
+    assert store.identity_index("t") == "cid"
+    assert _identity_index_stats(store)[0] == "BTree"
+
+
+def test_lancedb_unindexable_identity_type_is_not_retried_every_write(tmp_path, caplog) -> None:
+    from hypergraph.materialization._schema import ColumnSpec, TableSpec
+
+    spec = TableSpec(
+        name="t",
+        identity="cid",
+        columns=[
+            ColumnSpec("cid", role="identity", arrow_type=pa.struct([("n", pa.int64())])),
+            ColumnSpec("_write_gen", role="internal", arrow_type=pa.int64()),
+        ],
+    )
+    store = LanceDBStore(str(tmp_path / "unindexable_store"))
+    store.open(spec, [])
+    with caplog.at_level("WARNING", logger="hypergraph.materialization._lancedb_store"):
+        for i in range(3):
+            store.write_rows("t", [{"cid": {"n": i}, "_write_gen": 1}])
+    assert store.identity_index("t") is None
+    assert caplog.text.count("Could not build the identity index") == 1
@@ -105,7 +105,7 @@ def test_invalid_lancedb_batch_leaves_no_committed_prefix(tmp_path) -> None:
     fresh = LanceDBStore(path)
     fresh.open(spec, [])
     assert fresh.read_rows("t") == []
-    assert ["content" in row for row in rows] == [True, True, False]
+    assert ["content" in row for row in rows] == [True, True, True]
 
 
 def test_failed_lancedb_add_leaves_no_committed_rows(tmp_path, monkeypatch) -> None: